@@ -110,8 +110,18 @@ AGREEMENT.
 # Standard library modules
 import os
 
-# Import classes and methods from the submodules
-from .cntl import Cntl
+# Local imports
+from ._lazy import lazy_getattr
+
+# Classes imported from submodules on first access
+_LAZY_ATTRS = {
+    "Cntl": "cntl",
+}
+
+
+# Import classes and submodules only when needed
+def __getattr__(name):
+    return lazy_getattr(__name__, _LAZY_ATTRS, name)
 
 
 # Save version number
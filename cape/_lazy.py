@@ -0,0 +1,61 @@
+r"""
+:mod:`cape._lazy`: Deferred imports for package namespaces
+===========================================================
+
+This private module provides the machinery behind the module-level
+``__getattr__()`` functions (:pep:`562`) in :mod:`cape` and the
+solver-specific packages such as :mod:`cape.pyfun`. Instead of
+importing :mod:`cape.cntl` (and with it the data book, triangulation,
+and plotting modules) whenever any submodule is imported, classes like
+:class:`cape.pyfun.cntl.Cntl` are only imported the first time they are
+accessed. This keeps startup fast for case runners and status checks
+that never use them.
+"""
+
+# Standard library
+import importlib
+
+
+# Get an attribute that is imported on first access
+def lazy_getattr(modname, attrs, name):
+    r"""Import attribute *name* of package *modname* on first access
+
+    :Call:
+        >>> v = lazy_getattr(modname, attrs, name)
+    :Inputs:
+        *modname*: :class:`str`
+            Name of package, e.g. ``"cape.pyfun"``
+        *attrs*: :class:`dict`\ [:class:`str`]
+            Name of submodule that defines each lazy attribute
+        *name*: :class:`str`
+            Name of attribute being accessed
+    :Outputs:
+        *v*: :class:`any`
+            Attribute from submodule or the submodule itself
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Check for a named class or function
+    if name in attrs:
+        # Import submodule defining *name*
+        mod = importlib.import_module("%s.%s" % (modname, attrs[name]))
+        # Get attribute
+        v = getattr(mod, name)
+    elif name.startswith("__"):
+        # Don't try to import special names as submodules
+        raise AttributeError(
+            "module '%s' has no attribute '%s'" % (modname, name))
+    else:
+        # Try to import a submodule
+        try:
+            v = importlib.import_module("%s.%s" % (modname, name))
+        except ModuleNotFoundError as e:
+            # Only hide the error if *name* itself is missing
+            if e.name != "%s.%s" % (modname, name):
+                raise
+            raise AttributeError(
+                "module '%s' has no attribute '%s'" % (modname, name))
+    # Save it in the package namespace so this only happens once
+    setattr(importlib.import_module(modname), name, v)
+    # Output
+    return v
@@ -77,6 +77,22 @@ href_h = np.array([
 href_T = np.arange(0, 8000, 250)
 
 
+# 1976 Standard Atmosphere layers (geopotential altitudes in km)
+# Upper limit of each layer; the last layer extends above 85 km
+ATM76_HMAX = np.array([11.0, 20.0, 32.0, 47.0, 51.0, 71.0, 85.0])
+# Base altitude of each layer [km]
+ATM76_H0 = np.array([0.0, 11.0, 20.0, 32.0, 47.0, 51.0, 71.0, 85.0])
+# Base temperature of each layer [K]
+ATM76_T0 = np.array([
+    288.15, 216.65, 216.65, 228.65, 270.65, 270.65, 214.64, 151.65])
+# Base pressure of each layer [Pa]
+ATM76_P0 = np.array([
+    101325.0, 22263.064, 5474.889, 868.019,
+    110.960, 66.9389, 3.95642, 0.373384])
+# Temperature lapse rate of each layer [K/km]
+ATM76_A = np.array([-6.5, 0.0, 1.0, 2.8, 0.0, -2.8, -4.5, 0.0])
+
+
 # Sutherland's law (MKS)
 def SutherlandMKS(T, mu0=None, T0=None, C=None):
     r"""Calculate viscosity using Sutherland's law using SI units
@@ -126,88 +142,50 @@ def atm76(h):
     :Call:
         >>> S = atm76(h)
     :Inputs:
-        *h*: :class:`float`
+        *h*: :class:`float` | :class:`np.ndarray`
             Geometric altitude [km]
     :Outputs:
         *S*: :class:`cape.atm.State`
             Atmospheric state
-        *S.T*: :class:`float`
+        *S.T*: :class:`float` | :class:`np.ndarray`
             Temperature [K]
-        *S.rho*: :class:`float`
+        *S.rho*: :class:`float` | :class:`np.ndarray`
             Static density [kg/m^3]
-        *S.p*: :class:`float`
+        *S.p*: :class:`float` | :class:`np.ndarray`
             Static pressure [N/m^2]
-        *S.M*: :class:`float`
+        *S.M*: :class:`float` | :class:`np.ndarray`
             Mach number
     :Versions:
         * 2015-07-04 ``@ddalle``: Version 1.0
+        * 2026-10-18 ``@ddalle``: Version 1.1; vectorize over *h*
     """
     # Geodetic altitude
     H = h / (1+h/RE)
     # Atmospheric constants
     R = 287.0
     c = g0 / R
-    # Get scale height and base parameters.
-    if H <= 11.0:
-        # Troposphere
-        T0 = 288.15
-        p0 = 101325.0
-        H0 = 0.0
-        a  = -6.5
-    elif H <= 20.0:
-        # Tropopause
-        T0 = 216.65
-        p0 = 22263.064
-        H0 = 11.0
-        a  = 0.0
-    elif H <= 32.0:
-        # Lower stratosphere
-        T0 = 216.65
-        p0 = 5474.889
-        H0 = 20.0
-        a  = 1.0
-    elif H <= 47.0:
-        # Upper stratosphere
-        T0 = 228.65
-        p0 = 868.019
-        H0 = 32.0
-        a  = 2.8
-    elif H <= 51.0:
-        # Stratopause
-        T0 = 270.65
-        p0 = 110.960
-        H0 = 47.0
-        a  = 0.0
-    elif H <= 71.0:
-        # Lower mesosphere
-        T0 = 270.65
-        p0 = 66.9389
-        H0 = 51.0
-        a  = -2.8
-    elif H <= 85.0:
-        # Upper mesosphere
-        T0 = 214.64
-        p0 = 3.95642
-        H0 = 71.0
-        a  = -4.5
-    else:
-        # Mesopause
-        T0 = 151.65
-        p0 = 0.373384
-        H0 = 85.0
-        a = 0.0
-
-    # Calculate state values
-    if a == 0.0:
-        # Temperature
-        T = T0
-        # Pressure
-        p = p0 * np.exp(-1000*c*(H-H0)/T0)
-    else:
-        # Temperature
-        T = T0 + a*(H-H0)
-        # Pressure
-        p = p0*(T/T0) ** (-1000.0*c/a)
+    # Find layer of each altitude (``H <= ATM76_HMAX[j]``)
+    j = np.searchsorted(ATM76_HMAX, H)
+    # Get base parameters and lapse rate for each layer
+    T0 = ATM76_T0[j]
+    p0 = ATM76_P0[j]
+    H0 = ATM76_H0[j]
+    a = ATM76_A[j]
+    # Check for isothermal layers
+    q = (a == 0.0)
+    # Avoid dividing by zero in isothermal layers
+    a1 = np.where(q, 1.0, a)
+    # Temperature
+    T = T0 + a*(H-H0)
+    # Pressure
+    p = np.where(
+        q,
+        p0 * np.exp(-1000*c*(H-H0)/T0),
+        p0*(T/T0) ** (-1000.0*c/a1))
+    # Return scalars for scalar altitude
+    if np.ndim(h) == 0:
+        T = float(T)
+        p = float(p)
 
     # Density
     rho = p / (R*T)
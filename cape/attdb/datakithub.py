@@ -81,6 +81,9 @@ Here is a description of the JSON parameters
         Name of function(s) from imported module that return datakit
     *module_regex*: :class:`dict`\ [:class:`str`]
         Rules for converting a regular expression to module names
+    *lazy*: ``true`` | {``false``}
+        Option to map numeric arrays of ``.mat`` files and read each
+        column of ``.csv`` files on first access
 
 """
 
@@ -92,6 +95,7 @@ import sys
 
 # CAPE modules
 from cape.cfdx.options.util import loadJSONFile
+from .ftypes import basefile
 
 # Version-dependent standard library
 if sys.version_info.major > 2:
@@ -104,12 +108,14 @@ DEFAULT_REPO = None
 DEFAULT_TYPE = "module"
 DEFAULT_ATTRIBUTE = None
 DEFAULT_FUNCTION = ["read_db"]
+DEFAULT_LAZY = False
 # Combined efaults
 DEFAULT_SECTION = {
     "repo": DEFAULT_REPO,
     "type": DEFAULT_TYPE,
     "module_attribute": DEFAULT_ATTRIBUTE,
     "module_function": DEFAULT_FUNCTION,
+    "lazy": DEFAULT_LAZY,
 }
 
 # Error codes
@@ -366,6 +372,9 @@ class DataKitHub(dict):
                 Option to report all attempts in matching sections
             *vvv*, *veryveryverbose*: ``True`` | {``False``}
                 Option to report all attempts
+            *lazy*: {``None``} | ``True`` | ``False``
+                Option to map ``.mat`` arrays and read ``.csv``
+                columns on first access; default from section
         :Outputs:
             *db*: ``None`` | :class:`DataKit`
                 Data interface if successful
@@ -375,6 +384,7 @@ class DataKitHub(dict):
                 - better regex and fallback support
                 - verbosity options
                 - calls :func:`read_dbname`
+            * 2026-10-18 ``@ddalle``: Version 2.1; *lazy* option
         """
         # Use read_dbname()
         return self.read_dbname(dbname, **kw)
@@ -397,11 +407,15 @@ class DataKitHub(dict):
                 Option to report all attempts in matching sections
             *vvv*, *veryveryverbose*: ``True`` | {``False``}
                 Option to report all attempts
+            *lazy*: {``None``} | ``True`` | ``False``
+                Option to map ``.mat`` arrays and read ``.csv``
+                columns on first access; default from section
         :Outputs:
             *db*: ``None`` | :class:`DataKit`
                 Data interface if successful
         :Versions:
             * 2021-08-18 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 1.1; *lazy* option
         """
         # Initialize error
         ierr = 0
@@ -436,6 +450,9 @@ class DataKitHub(dict):
                 Option to report all attempts in matching sections
             *vvv*, *veryveryverbose*: ``True`` | {``False``}
                 Option to report all attempts
+            *lazy*: {``None``} | ``True`` | ``False``
+                Option to map ``.mat`` arrays and read ``.csv``
+                columns on first access; default from section
         :Outputs:
             *ierr*: ``0`` | :class:`int`
                 Exit code
@@ -453,6 +470,7 @@ class DataKitHub(dict):
                 Data interface if successful
         :Versions:
             * 2021-08-18 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 1.1; *lazy* option
         """
         # Verbosity flags
         v = kw.get("verbose", kw.get("v", False))
@@ -473,23 +491,34 @@ class DataKitHub(dict):
             print(MSG_SECTION % sec)
         # Otherwise get candidate module name rules
         module_regex_dict = self.get_section_opt(sec, "module_regex", {})
+        # Option to read data on first access
+        lazy = kw.get("lazy")
+        # Use section option by default
+        if lazy is None:
+            lazy = self.get_section_opt(sec, "lazy")
         # Initial error (in case "module_regex" is empty)
         ierr = ERROR_NOMATCH_DBNAME
+        # Set default *Lazy* option for data files read by modules
+        lazy0 = basefile.set_lazy(lazy)
         # Loop through candidates
-        for regex, templates in module_regex_dict.items():
-            # Ensure we have a list of templates
-            modname_template_list = _listify(templates)
-            # Loop through module templates
-            for template in modname_template_list:
-                # Attempt to load it
-                jerr, db = self._read_dbname(
-                    dbname, sec, regex, template, **kw)
-                # Check for success
-                if jerr == 0:
-                    # Success
-                    return jerr, db
-                # Update error code (higher means it got farther)
-                ierr = max(ierr, jerr)
+        try:
+            for regex, templates in module_regex_dict.items():
+                # Ensure we have a list of templates
+                modname_template_list = _listify(templates)
+                # Loop through module templates
+                for template in modname_template_list:
+                    # Attempt to load it
+                    jerr, db = self._read_dbname(
+                        dbname, sec, regex, template, **kw)
+                    # Check for success
+                    if jerr == 0:
+                        # Success
+                        return jerr, db
+                    # Update error code (higher means it got farther)
+                    ierr = max(ierr, jerr)
+        finally:
+            # Restore default *Lazy* option
+            basefile.set_lazy(lazy0)
         # If reaching this point, return the best error code
         return ierr, None
 
@@ -70,6 +70,8 @@ class _LL3XOpts(dbfm._FMEvalOpts):
         "mask",
         "method",
         "nPOD",
+        "PODEnergy",
+        "PODMethod",
         "xcol"
     }
 
@@ -78,11 +80,15 @@ class _LL3XOpts(dbfm._FMEvalOpts):
         "CompBasisCols": "CompLLBasisCols",
         "Method": "method",
         "NPOD": "nPOD",
+        "SVDMethod": "PODMethod",
         "acols": "CompLLAdjustedCols",
         "bcols": "CompLLBasisCols",
+        "energy": "PODEnergy",
         "icols": "FMCols",
         "llcols": "CompLLCols",
         "npod": "nPOD",
+        "pod_energy": "PODEnergy",
+        "pod_method": "PODMethod",
     }
 
     # Sections
@@ -118,11 +124,15 @@ class _LL3XOpts(dbfm._FMEvalOpts):
             "mask",
             "method",
             "nPOD",
+            "PODEnergy",
+            "PODMethod",
             "xcol"
         },
         "basis_": {
             "method",
             "nPOD",
+            "PODEnergy",
+            "PODMethod",
             "xcol"
         },
         "basis_make": {
@@ -130,6 +140,8 @@ class _LL3XOpts(dbfm._FMEvalOpts):
             "mask",
             "method",
             "nPOD",
+            "PODEnergy",
+            "PODMethod",
             "xcol"
         },
         "fractions": {
@@ -214,6 +226,8 @@ class _LL3XOpts(dbfm._FMEvalOpts):
         "SliceColSave": typeutils.strlike,
         "method": typeutils.strlike,
         "nPOD": int,
+        "PODEnergy": float,
+        "PODMethod": typeutils.strlike,
         "xcol": typeutils.strlike,
     }
 
@@ -222,6 +236,7 @@ class _LL3XOpts(dbfm._FMEvalOpts):
     _rc = {
         "method": "left",
         "nPOD": 10,
+        "PODMethod": "full",
     }
   # >
 
@@ -231,45 +246,178 @@ _LL3XOpts.combine_optdefs()
 
 
 # Improvised SVD with fallback for too-dense data
-def svd(C):
+def svd(C, nPOD=None, method="full", energy=None, **kw):
     r"""Calculate an SVD with a fallback to skipping every other column
-    
+
+    The row-wise mean of *C* is subtracted before decomposing. Only the
+    leading modes are returned, and there are three methods:
+
+        * ``"full"``: thin SVD of the whole mean-centered matrix
+        * ``"randomized"``: randomized range finder (Halko, Martinsson,
+          & Tropp) that only decomposes a small projection of *C*
+        * ``"streaming"``: eigenvectors of the *m*\ x*m* covariance
+          matrix, accumulated a block of columns at a time so that no
+          mean-centered copy of *C* is created
+
     :Call:
-        >>> U, s, V = svd(C)
+        >>> U, s, V = svd(C, nPOD=None, method="full", energy=None)
     :Inputs:
-        *C*: :class:`np.ndarray`\ [:class:`float`
+        *C*: :class:`np.ndarray`\ [:class:`float`]
             * shape=(*m*, *n*)
             Input data array
+        *nPOD*: {``None``} | :class:`int` > 0
+            Maximum number of modes to return
+        *method*: {``"full"``} | ``"randomized"`` | ``"streaming"``
+            SVD algorithm
+        *energy*: {``None``} | 0 < :class:`float` <= 1
+            Only keep enough modes to capture this fraction of the
+            total energy (sum of squared singular values)
+        *oversample*: {``10``} | :class:`int` >= 0
+            Extra random samples for ``"randomized"`` method
+        *niter*: {``2``} | :class:`int` >= 0
+            Power iterations for ``"randomized"`` method
+        *seed*: {``0``} | ``None`` | :class:`int`
+            Random seed for ``"randomized"`` method
+        *nblock*: {``256``} | :class:`int` > 0
+            Number of columns per block for ``"streaming"`` method
     :Outputs:
         *U*: :class:`np.ndarray`
-            * shape=(*m*, *m*)
+            * shape=(*m*, *k*)
             Singular column vectors
         *s*: :class:`np.ndarray`
-            * shape=(*m*, *n*) or shape=(*m*, *n*\ /2)
-            Diagonal matrix of singular values
+            * shape=(*k*,)
+            Singular values, in descending order
         *V*: :class:`np.ndarray`
-            * shape=(*n*, *n*) or shape=(*n*\ /2, *n*\ /2)
+            * shape=(*k*, *n*) or shape=(*k*, *n*\ /2)
             Singular row vectors
     :Versions:
         * 2017-09-25 ``@ddalle``: First version
+        * 2026-10-18 ``@ddalle``: Version 2.0; thin SVD, *method*
     """
+    # Check method
+    if method == "streaming":
+        return _svd_streaming(C, nPOD, energy, **kw)
+    elif method not in ("full", "randomized"):
+        raise ValueError("Unrecognized SVD method '%s'" % method)
     # Calculate row-wise mean
     c = np.mean(C, axis=1)
-    # Number of columns
-    nC = C.shape[1]
     # Create array
-    B = C - np.repeat(np.transpose([c]), nC, axis=1)
-    # First attempt
-    try:
-        # Use all columns
-        U, s, V = np.linalg.svd(B)
-    except Exception:
-        # Skip every other column
-        U, s, V = np.linalg.svd(B[:,::2])
+    B = C - c[:, None]
+    # Check method
+    if method == "randomized":
+        # Decompose random projection
+        U, s, V, e = _svd_randomized(B, nPOD, energy, **kw)
+    else:
+        # First attempt
+        try:
+            # Use all columns
+            U, s, V = np.linalg.svd(B, full_matrices=False)
+        except Exception:
+            # Skip every other column
+            U, s, V = np.linalg.svd(B[:,::2], full_matrices=False)
+        # Total energy
+        e = np.sum(s**2)
+    # Number of modes to keep
+    k = _svd_nmode(s, e, nPOD, energy)
+    # Output
+    return U[:, :k], s[:k], V[:k]
+
+
+# Randomized SVD
+def _svd_randomized(B, nPOD=None, energy=None, **kw):
+    # Options
+    p = kw.get("oversample", 10)
+    q = kw.get("niter", 2)
+    # Random number generator
+    rng = np.random.RandomState(kw.get("seed", 0))
+    # Dimensions
+    m, n = B.shape
+    # Total energy
+    e = np.sum(B**2)
+    # Initial number of modes to find
+    k = 10 if nPOD is None else nPOD
+    # Loop until enough energy is captured
+    while True:
+        # Number of samples
+        l = min(k + p, m, n)
+        # Sample range of *B*
+        Q, _ = np.linalg.qr(np.dot(B, rng.standard_normal((n, l))))
+        # Power iterations to sharpen decaying spectrum
+        for _ in range(q):
+            Z, _ = np.linalg.qr(np.dot(B.T, Q))
+            Q, _ = np.linalg.qr(np.dot(B, Z))
+        # Decompose small projected matrix
+        Ub, s, V = np.linalg.svd(np.dot(Q.T, B), full_matrices=False)
+        # Check if done
+        if energy is None or l == min(m, n):
+            break
+        elif np.sum(s[:k]**2) >= energy*e:
+            break
+        elif nPOD is not None and k >= nPOD:
+            # More modes would be truncated anyway
+            break
+        # Find more modes
+        k *= 2
+    # Output
+    return np.dot(Q, Ub), s, V, e
+
+
+# SVD using covariance accumulated one block at a time
+def _svd_streaming(C, nPOD=None, energy=None, **kw):
+    # Number of columns in each block
+    nblock = kw.get("nblock", 256)
+    # Dimensions
+    m, n = C.shape
+    # Calculate row-wise mean
+    c = np.zeros(m)
+    for j in range(0, n, nblock):
+        c += np.sum(C[:, j:j+nblock], axis=1)
+    c /= n
+    # Accumulate covariance
+    G = np.zeros((m, m))
+    for j in range(0, n, nblock):
+        # Mean-centered block
+        Bj = C[:, j:j+nblock] - c[:, None]
+        # Add to covariance
+        G += np.dot(Bj, Bj.T)
+    # Eigenvectors, in descending order
+    lam, U = np.linalg.eigh(G)
+    lam = np.fmax(lam[::-1], 0.0)
+    U = U[:, ::-1]
+    # Singular values
+    s = np.sqrt(lam)
+    # Number of modes to keep
+    k = _svd_nmode(s, np.sum(lam), nPOD, energy)
+    # Remove modes with no energy
+    k = min(k, np.count_nonzero(s > s[0]*1e-12))
+    U = U[:, :k]
+    s = s[:k]
+    # Calculate right singular vectors one block at a time
+    V = np.zeros((k, n))
+    for j in range(0, n, nblock):
+        V[:, j:j+nblock] = np.dot(U.T, C[:, j:j+nblock] - c[:, None])
+    V /= s[:, None]
     # Output
     return U, s, V
 
 
+# Number of SVD modes to keep
+def _svd_nmode(s, e, nPOD=None, energy=None):
+    # Default: all modes
+    k = s.size
+    # Apply energy threshold
+    if energy is not None and e > 0:
+        # Cumulative energy fraction of each mode
+        f = np.cumsum(s**2) / e
+        # Number of modes needed
+        k = min(k, int(np.searchsorted(f, energy*(1 - 1e-12))) + 1)
+    # Apply mode limit
+    if nPOD is not None:
+        k = min(k, nPOD)
+    # Output
+    return k
+
+
 # DBFM options
 class _DBLLOpts(dbfm._DBFMOpts):
     pass
@@ -2722,6 +2870,12 @@ class DBLL(dbfm.DBFM):
                 *db.bkpts[scol]*
             *nPOD*: {``10``} | ``None`` | :class:`int` > 0
                 Number of POD/SVD modes to use during optimization
+            *PODEnergy*: {``None``} | 0 < :class:`float` <= 1
+                Use fewer than *nPOD* modes if they capture this
+                fraction of the energy of the line load variations
+            *PODMethod*: {``"full"``} | ``"randomized"`` |
+            ``"streaming"``
+                SVD algorithm; see :func:`svd`
             *mask*: {``None``} | :class:`np.ndarray`
                 Mask or indices of which cases to include in POD
                 calculation
@@ -2840,6 +2994,12 @@ class DBLL(dbfm.DBFM):
                 *db.bkpts[scol]*
             *nPOD*: {``10``} | ``None`` | :class:`int` > 0
                 Number of POD/SVD modes to use during optimization
+            *PODEnergy*: {``None``} | 0 < :class:`float` <= 1
+                Use fewer than *nPOD* modes if they capture this
+                fraction of the energy of the line load variations
+            *PODMethod*: {``"full"``} | ``"randomized"`` |
+            ``"streaming"``
+                SVD algorithm; see :func:`svd`
             *mask*: {``None``} | :class:`np.ndarray`
                 Mask or indices of which cases to include in POD
                 calculation
@@ -2937,6 +3097,12 @@ class DBLL(dbfm.DBFM):
                 *db.bkpts[scol]*
             *nPOD*: {``10``} | ``None`` | :class:`int` > 0
                 Number of POD/SVD modes to use during optimization
+            *PODEnergy*: {``None``} | 0 < :class:`float` <= 1
+                Use fewer than *nPOD* modes if they capture this
+                fraction of the energy of the line load variations
+            *PODMethod*: {``"full"``} | ``"randomized"`` |
+            ``"streaming"``
+                SVD algorithm; see :func:`svd`
             *mask*: {``None``} | :class:`np.ndarray`
                 Mask or indices of which cases to include in POD
                 calculation
@@ -3028,6 +3194,12 @@ class DBLL(dbfm.DBFM):
                 *db.bkpts[scol]*
             *nPOD*: {``10``} | ``None`` | :class:`int` > 0
                 Number of POD/SVD modes to use during optimization
+            *PODEnergy*: {``None``} | 0 < :class:`float` <= 1
+                Use fewer than *nPOD* modes if they capture this
+                fraction of the energy of the line load variations
+            *PODMethod*: {``"full"``} | ``"randomized"`` |
+            ``"streaming"``
+                SVD algorithm; see :func:`svd`
             *mask*: {``None``} | :class:`np.ndarray`
                 Mask or indices of which cases to include in POD
                 calculation
@@ -3166,6 +3338,12 @@ class DBLL(dbfm.DBFM):
                 line loads
             *nPOD*: {``10``} | ``None`` | :class:`int` > 0
                 Number of POD/SVD modes to use during optimization
+            *PODEnergy*: {``None``} | 0 < :class:`float` <= 1
+                Use fewer than *nPOD* modes if they capture this
+                fraction of the energy of the line load variations
+            *PODMethod*: {``"full"``} | ``"randomized"`` |
+            ``"streaming"``
+                SVD algorithm; see :func:`svd`
             *mask*: {``None``} | :class:`np.ndarray`
                 Mask or indices of which cases to include in POD
                 calculation
@@ -3204,6 +3382,9 @@ class DBLL(dbfm.DBFM):
                 raise KeyError("Adjust col '%s' not in database" % col)
         # Other options
         method = kw.get("method", "trapz")
+        # SVD options
+        svdmethod = kw.get("PODMethod", "full")
+        energy = kw.get("PODEnergy")
         # Get *xcol*
         xcol = kw.get("xcol")
         # Default *xcol*
@@ -3248,22 +3429,14 @@ class DBLL(dbfm.DBFM):
         dCN = self.get_values(col3, mask)
         # Dimensions
         nx, ny = dCA.shape
-        # Calculate SVD
-        UCA, sCA, VCA = svd(dCA)
-        UCY, sCY, VCY = svd(dCY)
-        UCN, sCN, VCN = svd(dCN)
-        # Downselect
-        if nPOD is not None:
-            # Select first *nPOD* mode shapes
-            UCA = UCA[:, :nPOD]
-            UCY = UCY[:, :nPOD]
-            UCN = UCN[:, :nPOD]
-            # Select the first *nPOD* singular values
-            sCA = sCA[:nPOD]
-            sCY = sCY[:nPOD]
-            sCN = sCN[:nPOD]
-        # Number of modes
-        nmode = sCA.size
+        # Calculate SVD, keeping only first *nPOD* modes
+        UCA, sCA, VCA = svd(dCA, nPOD, svdmethod, energy)
+        UCY, sCY, VCY = svd(dCY, nPOD, svdmethod, energy)
+        UCN, sCN, VCN = svd(dCN, nPOD, svdmethod, energy)
+        # Number of modes (can differ if using *PODEnergy*)
+        nCA = sCA.size
+        nCY = sCY.size
+        nCN = sCN.size
         # Calculate *L2* norm of each basis vector
         L2CA = np.sqrt(np.sum(UCA**2, axis=0))
         L2CY = np.sqrt(np.sum(UCY**2, axis=0))
@@ -3306,21 +3479,23 @@ class DBLL(dbfm.DBFM):
         ACY = np.vstack((A1CY, A2CY))
         ACN = np.vstack((A1CN, A2CN))
         # Right-hand sides of equations
-        bCA = np.hstack(([1.0], np.zeros(nmode)))
-        bCF = np.hstack(([1.0, 0.0], np.zeros(nmode)))
-        bCM = np.hstack(([0.0, 1.0], np.zeros(nmode)))
+        bCA = np.hstack(([1.0], np.zeros(nCA)))
+        bCY = np.hstack(([1.0, 0.0], np.zeros(nCY)))
+        bCN = np.hstack(([1.0, 0.0], np.zeros(nCN)))
+        bCm = np.hstack(([0.0, 1.0], np.zeros(nCN)))
+        bCn = np.hstack(([0.0, 1.0], np.zeros(nCY)))
         # Solve linear systems
         xCA = np.linalg.solve(ACA, bCA)
-        xCY = np.linalg.solve(ACY, bCF)
-        xCN = np.linalg.solve(ACN, bCF)
-        xCm = np.linalg.solve(ACN, bCM)
-        xCn = np.linalg.solve(ACY, bCM)
+        xCY = np.linalg.solve(ACY, bCY)
+        xCN = np.linalg.solve(ACN, bCN)
+        xCm = np.linalg.solve(ACN, bCm)
+        xCn = np.linalg.solve(ACY, bCn)
         # Calculate linear combination of SVD modes
-        phiCA = np.dot(UCA, xCA[:nmode])
-        phiCY = np.dot(UCY, xCY[:nmode])
-        phiCN = np.dot(UCN, xCN[:nmode])
-        phiCm = np.dot(UCN, xCm[:nmode])
-        phiCn = np.dot(UCY, xCn[:nmode])
+        phiCA = np.dot(UCA, xCA[:nCA])
+        phiCY = np.dot(UCY, xCY[:nCY])
+        phiCN = np.dot(UCN, xCN[:nCN])
+        phiCm = np.dot(UCN, xCm[:nCN])
+        phiCn = np.dot(UCY, xCn[:nCY])
         # Basis
         return {
             "dCA.CA": phiCA,
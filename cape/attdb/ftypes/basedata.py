@@ -402,6 +402,109 @@ class BaseDataDefn(kwutils.KwargHandler):
 BaseDataOpts.set_defncls(BaseDataDefn)
 
 
+# Dictionary methods for data containers with lazy columns
+class LazyDataMixin(object):
+    r"""Dictionary methods for data containers with unread columns
+
+    Instances of :class:`BaseData` are switched to a subclass that
+    also inherits from this class by :func:`BaseData.set_lazy_col`, so
+    that unread columns behave like regular keys.  Containers without
+    lazy columns use the regular :class:`dict` methods.
+
+    :Versions:
+        * 2026-10-19 ``@ddalle``: Version 1.0
+    """
+    # Read a lazy column on first access
+    def __missing__(self, col):
+        # Get lazy columns
+        lazy = self.__dict__.get("_lazy_cols", {})
+        # Check for lazy column
+        if col not in lazy:
+            raise KeyError(col)
+        # Read it
+        return self.read_lazy_col(col)
+
+    # Check for column, including unread lazy columns
+    def __contains__(self, col):
+        # Check for data
+        if dict.__contains__(self, col):
+            return True
+        # Check for lazy column
+        return col in self.__dict__.get("_lazy_cols", {})
+
+    # Save data, overriding unread lazy column
+    def __setitem__(self, col, v):
+        # Remove unread column
+        self.__dict__.get("_lazy_cols", {}).pop(col, None)
+        # Save data
+        dict.__setitem__(self, col, v)
+
+    # Delete data or unread lazy column
+    def __delitem__(self, col):
+        # Get lazy columns
+        lazy = self.__dict__.get("_lazy_cols", {})
+        # Check for unread column
+        if col in lazy:
+            # Remove it
+            lazy.pop(col)
+            # Delete any (stale) data
+            dict.pop(self, col, None)
+            return
+        # Delete data
+        dict.__delitem__(self, col)
+
+    # Iterate through data and lazy columns
+    def __iter__(self):
+        # Loop through data
+        for col in dict.__iter__(self):
+            yield col
+        # Loop through unread lazy columns
+        for col in list(self.__dict__.get("_lazy_cols", {})):
+            yield col
+
+    # Count data and lazy columns
+    def __len__(self):
+        return dict.__len__(self) + len(self.__dict__.get("_lazy_cols", {}))
+
+    # Get data, including lazy columns
+    def get(self, col, vdef=None):
+        # Check for data or lazy column
+        if col in self:
+            return self[col]
+        # Default
+        return vdef
+
+    # Remove a column, reading it first if needed
+    def pop(self, col, *a):
+        # Read lazy column if needed
+        if col in self.__dict__.get("_lazy_cols", {}):
+            self.read_lazy_col(col)
+        # Remove data
+        return dict.pop(self, col, *a)
+
+    # List of columns
+    def keys(self):
+        return list(self)
+
+    # Values of all columns
+    def values(self):
+        # Read all lazy columns
+        self.read_lazy_cols()
+        # Use regular dict values
+        return dict.values(self)
+
+    # Names and values of all columns
+    def items(self):
+        # Read all lazy columns
+        self.read_lazy_cols()
+        # Use regular dict items
+        return dict.items(self)
+
+
+# Subclasses with lazy columns
+_LAZY_CLASSES = {}
+
+
 # Declare basic class
 class BaseData(dict):
     r"""Generic class for storing data from a data-style file
@@ -562,6 +665,111 @@ class BaseData(dict):
         return lbl
   # >
 
+  # ==============
+  # Lazy Columns
+  # ==============
+  # <
+    # Save a column to be read on first access
+    def set_lazy_col(self, col, fn):
+        r"""Declare a column whose data is read on first access
+
+        The first time this is called, *db* is switched to a subclass
+        of its class that also inherits from :class:`LazyDataMixin`.
+
+        :Call:
+            >>> db.set_lazy_col(col, fn)
+        :Inputs:
+            *db*: :class:`cape.attdb.ftypes.basedata.BaseData`
+                Data container
+            *col*: :class:`str`
+                Name of column
+            *fn*: :class:`callable`
+                Function with no inputs that returns the data for *col*
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; switch class
+        """
+        # Current class
+        cls = self.__class__
+        # Check for lazy column support
+        if not issubclass(cls, LazyDataMixin):
+            # Get (or create) subclass with lazy columns
+            lazycls = _LAZY_CLASSES.get(cls)
+            if lazycls is None:
+                lazycls = type(
+                    cls.__name__, (LazyDataMixin, cls),
+                    {"__module__": cls.__module__})
+                _LAZY_CLASSES[cls] = lazycls
+            # Switch class
+            self.__class__ = lazycls
+        # Remove any existing data
+        dict.pop(self, col, None)
+        # Save reader
+        self.__dict__.setdefault("_lazy_cols", {})[col] = fn
+
+    # Check for unread lazy column
+    def check_lazy_col(self, col):
+        r"""Check if *col* is a lazy column that has not been read
+
+        :Call:
+            >>> q = db.check_lazy_col(col)
+        :Inputs:
+            *db*: :class:`cape.attdb.ftypes.basedata.BaseData`
+                Data container
+            *col*: :class:`str`
+                Name of column
+        :Outputs:
+            *q*: ``True`` | ``False``
+                Whether *col* has a reader but no data yet
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        return col in self.__dict__.get("_lazy_cols", {})
+
+    # Read a lazy column
+    def read_lazy_col(self, col):
+        r"""Read the data for a lazy column
+
+        :Call:
+            >>> v = db.read_lazy_col(col)
+        :Inputs:
+            *db*: :class:`cape.attdb.ftypes.basedata.BaseData`
+                Data container
+            *col*: :class:`str`
+                Name of column
+        :Outputs:
+            *v*: :class:`np.ndarray` | :class:`list`
+                Data for *col*, which is also saved in *db*
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Get lazy columns
+        lazy = self.__dict__["_lazy_cols"]
+        # Read data
+        v = lazy[col]()
+        # Save data and remove reader
+        lazy.pop(col, None)
+        dict.__setitem__(self, col, v)
+        # Output
+        return v
+
+    # Read all lazy columns
+    def read_lazy_cols(self):
+        r"""Read the data for all unread lazy columns
+
+        :Call:
+            >>> db.read_lazy_cols()
+        :Inputs:
+            *db*: :class:`cape.attdb.ftypes.basedata.BaseData`
+                Data container
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Loop through unread columns
+        for col in list(self.__dict__.get("_lazy_cols", {})):
+            self.read_lazy_col(col)
+  # >
+
   # =================
   # Inputs & Kwargs
   # =================
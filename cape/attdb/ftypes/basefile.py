@@ -37,6 +37,9 @@ from .basedata import BaseData, BaseDataDefn, BaseDataOpts
 # Fixed parameter for size of new chunks
 NUM_ARRAY_CHUNK = 5000
 
+# Default for *Lazy* option
+LAZY = False
+
 
 # Options
 class BaseFileOpts(BaseDataOpts):
@@ -47,6 +50,7 @@ class BaseFileOpts(BaseDataOpts):
    # --- Global Options ---
     # List of options
     _optlist = {
+        "Lazy",
         "Prefix",
         "Suffix",
         "Translators"
@@ -54,6 +58,7 @@ class BaseFileOpts(BaseDataOpts):
 
     # Alternate names
     _optmap = {
+        "lazy": "Lazy",
         "prefix": "Prefix",
         "suffix": "Suffix",
         "translators": "Translators",
@@ -62,6 +67,7 @@ class BaseFileOpts(BaseDataOpts):
    # --- Types ---
     # Types allowed
     _opttypes = {
+        "Lazy": bool,
         "Prefix": (typeutils.strlike, dict),
         "Suffix": (typeutils.strlike, dict),
         "Translators": dict,
@@ -145,6 +151,37 @@ class BaseFile(BaseData):
         self.process_kw_values()
   # >
   
+  # =================
+  # Options
+  # =================
+  # <
+    # Check for lazy reading
+    def get_lazy(self):
+        r"""Check if data should be read on first access
+
+        If the *Lazy* option is not set, the module-level default
+        :data:`LAZY` is used; see :func:`set_lazy`.
+
+        :Call:
+            >>> lazy = db.get_lazy()
+        :Inputs:
+            *db*: :class:`cape.attdb.ftypes.basefile.BaseFile`
+                Data file interface
+        :Outputs:
+            *lazy*: ``True`` | ``False``
+                Whether to defer reading column data
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Get option
+        lazy = self.opts.get_option("Lazy")
+        # Use default if not set
+        if lazy is None:
+            return LAZY
+        # Output
+        return lazy
+  # >
+
   # =================
   # Data Columns
   # =================
@@ -680,3 +717,28 @@ class TextInterpreter(object):
             raise ValueError("Invalid integer subtype '%s'" % clsname)
         # Attempt conversion
         return cls(txt)
+
+
+# Set default for *Lazy* option
+def set_lazy(lazy):
+    r"""Set default for *Lazy* option of data file interfaces
+
+    :Call:
+        >>> lazy0 = set_lazy(lazy)
+    :Inputs:
+        *lazy*: ``True`` | ``False``
+            New default for whether to defer reading column data
+    :Outputs:
+        *lazy0*: ``True`` | ``False``
+            Previous default, so that it can be restored
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Global setting
+    global LAZY
+    # Save previous value
+    lazy0 = LAZY
+    # Set new value
+    LAZY = bool(lazy)
+    # Output
+    return lazy0
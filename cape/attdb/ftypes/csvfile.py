@@ -12,6 +12,7 @@ final comment before the beginning of data.
 """
 
 # Standard library
+import functools
 import os
 import re
 import sys
@@ -229,11 +230,15 @@ class CSVFile(BaseFile, TextInterpreter):
                 File open for reading
             *fname*: :class:`str`
                 Name of file to read
+            *Lazy*, *lazy*: ``True`` | {``False``}
+                Option to read each column on first access
         :See Also:
             * :func:`read_csv_header`
             * :func:`read_csv_data`
+            * :func:`read_csv_lazy`
         :Versions:
             * 2019-11-25 ``@ddalle``: Version 1.0
+            * 2026-10-19 ``@ddalle``: Version 1.1; *Lazy* option
         """
         # Check type
         if typeutils.isfile(fname):
@@ -241,6 +246,11 @@ class CSVFile(BaseFile, TextInterpreter):
             self.fname = fname.name
             # Already a file
             self._read_csv(fname)
+        elif self.get_lazy():
+            # Save file name
+            self.fname = fname
+            # Read header and locate data rows
+            self.read_csv_lazy(fname)
         else:
             # Save file name
             self.fname = fname
@@ -273,6 +283,133 @@ class CSVFile(BaseFile, TextInterpreter):
         # Loop through lines
         self.read_csv_data(f)
 
+    # Reader: header and row offsets only
+    def read_csv_lazy(self, fname):
+        r"""Read CSV header, deferring data until each col is used
+
+        This reads the header and saves the byte offset of each data
+        row.  The first time any column is accessed, the text of all
+        rows is split into columns by :func:`read_csv_lazytext`, and
+        each column is converted by :func:`read_csv_lazycol` when it
+        is accessed.
+
+        :Call:
+            >>> db.read_csv_lazy(fname)
+        :Inputs:
+            *db*: :class:`cape.attdb.ftypes.csvfile.CSVFile`
+                CSV file interface
+            *fname*: :class:`str`
+                Name of file to read
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Open file
+        with open(fname, 'r') as f:
+            # Process column names
+            self.read_csv_header(f)
+            # Process column types
+            self.finish_defns()
+            # Save start of data section
+            pos = f.tell()
+        # Initialize offsets of data rows
+        rows = []
+        # Open file as bytes to get offsets
+        with open(fname, 'rb') as f:
+            # Go to start of data section
+            f.seek(pos)
+            # Loop through remaining lines
+            for line in f:
+                # Save offset of data row
+                if not (line.startswith(b"#") or line.strip() == b""):
+                    rows.append(pos)
+                # Offset of next line
+                pos += len(line)
+        # Save row offsets; text is read on first access
+        self._lazy_rows = np.array(rows, dtype="int64")
+        self._lazy_text = None
+        # Number of rows
+        self.n = len(rows)
+        # Loop through columns
+        for (j, col) in enumerate(self.cols):
+            # Read data for this column on first access
+            self.set_lazy_col(
+                col, functools.partial(self.read_csv_lazycol, j))
+
+    # Split data rows into text of each column
+    def read_csv_lazytext(self):
+        r"""Read text of each column from data rows of a lazy CSV file
+
+        :Call:
+            >>> db.read_csv_lazytext()
+        :Inputs:
+            *db*: :class:`cape.attdb.ftypes.csvfile.CSVFile`
+                CSV file interface
+        :Effects:
+            *db._lazy_text*: :class:`dict`\ [:class:`list`]
+                Text of each row for each column index
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Row offsets
+        rows = self._lazy_rows
+        # Initialize text for each column
+        self._lazy_text = {j: [] for j in range(len(self.cols))}
+        # Check for empty file
+        if rows.size == 0:
+            return
+        # Read entire data section
+        with open(self.fname, 'rb') as f:
+            # Go to first row
+            f.seek(rows[0])
+            # Read the rest of the file
+            buf = f.read()
+        # Loop through rows
+        for pos in rows - rows[0]:
+            # Find end of line
+            iend = buf.find(b"\n", pos)
+            if iend == -1:
+                iend = len(buf)
+            # Split line
+            coltxts = buf[pos:iend].decode().split(",")
+            # Save text for each column
+            for (j, V) in self._lazy_text.items():
+                V.append(coltxts[j].strip())
+
+    # Read one column
+    def read_csv_lazycol(self, j):
+        r"""Convert text of one column from a lazy CSV file
+
+        :Call:
+            >>> v = db.read_csv_lazycol(j)
+        :Inputs:
+            *db*: :class:`cape.attdb.ftypes.csvfile.CSVFile`
+                CSV file interface
+            *j*: :class:`int`
+                Index of column to read
+        :Outputs:
+            *v*: :class:`np.ndarray` | :class:`list`
+                Numeric array or list of strings for column *j*
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Read text of all columns if needed
+        if self._lazy_text is None:
+            self.read_csv_lazytext()
+        # Column name
+        col = self.cols[j]
+        # Data type
+        clsname = self.get_col_type(col)
+        # Convert text; release it once converted
+        V = [
+            self.fromtext_val(txt, clsname)
+            for txt in self._lazy_text.pop(j)
+        ]
+        # Check for list of strings
+        if clsname == "str":
+            return V
+        # Convert to array
+        return np.array(V, dtype=self.get_col_dtype(col))
+
     # Reader: C only
     def c_read_csv(self, fname, **kw):
         r"""Read an entire CSV file, including header using C
@@ -22,8 +22,18 @@ internet, this module does not raise an ``ImportError`` in the case that
 these third-party modules are not available.  However, the module will
 provide no functionality if these modules are not available.
 
+Numeric arrays in uncompressed ``.mat`` files can also be read lazily
+using :func:`loadmat_lazy`, which maps each large array directly from
+the file using :class:`numpy.memmap`. The data for such an array is not
+read from disk until it is first used.
+
 """
 
+# Standard library
+import mmap
+import os
+import struct
+
 # Third-party modules
 import numpy as np
 
@@ -44,6 +54,52 @@ import cape.tnakit.typeutils as typeutils
 from .basefile import BaseFile, BaseFileDefn, BaseFileOpts
 
 
+# MATLAB array classes
+MX_CELL = 1
+MX_STRUCT = 2
+MX_CHAR = 4
+# MATLAB data types
+MI_MATRIX = 14
+MI_UTF8 = 16
+# Data types for numeric MATLAB array classes
+MX_DTYPES = {
+    6: "f8",
+    7: "f4",
+    8: "i1",
+    9: "u1",
+    10: "i2",
+    11: "u2",
+    12: "i4",
+    13: "u4",
+    14: "i8",
+    15: "u8",
+}
+# Data types for numeric MATLAB storage types
+MI_DTYPES = {
+    1: "i1",
+    2: "u1",
+    3: "i2",
+    4: "u2",
+    5: "i4",
+    6: "u4",
+    7: "f4",
+    9: "f8",
+    12: "i8",
+    13: "u8",
+    16: "u1",
+    17: "u2",
+    18: "u4",
+}
+# Smallest numeric array (in bytes) to map instead of read
+MMAP_MIN_BYTES = 4096
+
+
+# Error for MAT file features that need the full reader
+class _MatLazyUnsupported(Exception):
+    r"""MAT file feature that :func:`loadmat_lazy` cannot map"""
+    pass
+
+
 # Options
 class MATFileOpts(BaseFileOpts):
     pass
@@ -146,9 +202,12 @@ class MATFile(BaseFile):
                 File open for reading (at position ``0``)
             *fname*: :class:`str`
                 Name of file to read
+            *Lazy*, *lazy*: ``True`` | {``False``}
+                Option to map numeric arrays instead of reading them
         :Versions:
             * 2019-11-25 ``@ddalle``: First version
             * 2020-02-07 ``@ddalle``: Utilize :class:`KwargHandler`
+            * 2026-10-18 ``@ddalle``: Add *Lazy* option
         """
         # Check modules
         _check_sio()
@@ -166,7 +225,12 @@ class MATFile(BaseFile):
             self.fname = fname
 
         # Read MAT file
-        db = sio.loadmat(fname, struct_as_record=False, squeeze_me=True)
+        if self.get_lazy() and not typeutils.isfile(fname):
+            # Map numeric arrays; read on first use
+            db = loadmat_lazy(fname)
+        else:
+            # Read everything
+            db = sio.loadmat(fname, struct_as_record=False, squeeze_me=True)
 
         # Loop through database
         for (field, V) in db.items():
@@ -415,11 +479,22 @@ class MATFile(BaseFile):
             * :func:`genr8_mat`
         :Versions:
             * 2019-12-17 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Version 1.1; replace *fname*
         """
         # Create database
         dbmat = self.genr8_mat(**kw)
+        # Check for open file
+        if typeutils.isfile(fname):
+            # Write it
+            sio.savemat(fname, dbmat, oned_as="column")
+            return
+        # Write to temporary file so arrays mapped from *fname* stay valid
+        ftmp = "%s.%i.tmp" % (fname, os.getpid())
         # Write it
-        sio.savemat(fname, dbmat, oned_as="column")
+        with open(ftmp, "wb") as fp:
+            sio.savemat(fp, dbmat, oned_as="column")
+        # Replace original file
+        os.replace(ftmp, fname)
 
     # Create MAT file
     def genr8_mat(self, **kw):
@@ -736,6 +811,255 @@ def merge_structs(DB1, DB2):
             DB1._fieldnames.append(col)
 
 
+# Read a MAT file, mapping numeric arrays
+def loadmat_lazy(fname):
+    r"""Read a ``.mat`` file, mapping large numeric arrays from disk
+
+    The output matches :func:`scipy.io.loadmat` with the options
+    *struct_as_record* = ``False`` and *squeeze_me* = ``True``, except
+    that each real, numeric array with at least :data:`MMAP_MIN_BYTES`
+    bytes is a copy-on-write :class:`numpy.memmap` of the file. Only
+    the element headers are read here; the data for each array is read
+    from disk when it is first used.
+
+    Files with compressed variables, complex or sparse arrays, or struct
+    arrays are read normally using :func:`scipy.io.loadmat`.
+
+    :Call:
+        >>> db = loadmat_lazy(fname)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of ``.mat`` file to read
+    :Outputs:
+        *db*: :class:`dict`
+            Variables from ``.mat`` file
+    :Versions:
+        * 2026-10-18 ``@ddalle``: First version
+    """
+    # Check modules
+    _check_sio()
+    # Try to index the file
+    try:
+        return _loadmat_lazy(fname)
+    except _MatLazyUnsupported:
+        # Unsupported feature; read everything
+        return sio.loadmat(fname, struct_as_record=False, squeeze_me=True)
+
+
+# Read MAT file, mapping arrays, w/o fallback
+def _loadmat_lazy(fname):
+    # Open the file
+    with open(fname, "rb") as fp:
+        # Map it so that only headers get read
+        buf = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+    # Initialize output
+    db = {}
+    # Read from mapped file
+    try:
+        # Check for version 5 file
+        if len(buf) < 128:
+            raise _MatLazyUnsupported("Not a version 5 MAT file")
+        # Get byte order from endian indicator
+        if buf[126:128] == b"IM":
+            bo = "<"
+        elif buf[126:128] == b"MI":
+            bo = ">"
+        else:
+            raise _MatLazyUnsupported("Not a version 5 MAT file")
+        # Skip the text header
+        pos = 128
+        # Loop through variables
+        while pos + 8 <= len(buf):
+            # Read tag
+            mtype, nbytes, pos0, pos = _read_mat_tag(buf, pos, bo)
+            # Only uncompressed arrays are supported
+            if mtype != MI_MATRIX:
+                raise _MatLazyUnsupported(
+                    "Unsupported MAT data type %i" % mtype)
+            # Read the array
+            name, v = _read_mat_matrix(fname, buf, pos0, nbytes, bo)
+            # Save it
+            db[name] = v
+    finally:
+        # Unmap the file
+        buf.close()
+    # Output
+    return db
+
+
+# Read the tag of a MAT file data element
+def _read_mat_tag(buf, pos, bo):
+    # Read data type and number of bytes
+    mtype, nbytes = struct.unpack_from(bo + "II", buf, pos)
+    # Check for small data element format
+    if mtype >> 16:
+        return mtype & 0xffff, mtype >> 16, pos + 4, pos + 8
+    # Data elements are padded to 64-bit boundaries
+    return mtype, nbytes, pos + 8, pos + 8 + 8*((nbytes + 7) // 8)
+
+
+# Read a MAT array starting after its tag
+def _read_mat_matrix(fname, buf, pos, nbytes, bo):
+    # Check for empty array
+    if nbytes == 0:
+        raise _MatLazyUnsupported("Empty MAT array element")
+    # Array flags
+    _, _, pos0, pos = _read_mat_tag(buf, pos, bo)
+    flags, = struct.unpack_from(bo + "I", buf, pos0)
+    # Array class
+    mxcls = flags & 0xff
+    # Dimensions
+    _, n, pos0, pos = _read_mat_tag(buf, pos, bo)
+    dims = struct.unpack_from(bo + "%ii" % (n // 4), buf, pos0)
+    # Array name
+    _, n, pos0, pos = _read_mat_tag(buf, pos, bo)
+    name = bytes(buf[pos0:pos0 + n]).decode("ascii")
+    # Check for complex data
+    if flags & 0x800:
+        raise _MatLazyUnsupported("Complex MAT array '%s'" % name)
+    # Process data based on class
+    if mxcls in MX_DTYPES:
+        # Numeric array
+        v = _read_mat_numeric(fname, buf, pos, bo, dims)
+    elif mxcls == MX_CHAR:
+        # Character array
+        v = _read_mat_char(buf, pos, bo, dims)
+    elif mxcls == MX_CELL:
+        # Cell array
+        v = _read_mat_cell(fname, buf, pos, bo, dims)
+    elif mxcls == MX_STRUCT:
+        # Scalar struct
+        v = _read_mat_struct(fname, buf, pos, bo, dims)
+    else:
+        raise _MatLazyUnsupported(
+            "Unsupported MAT array class %i for '%s'" % (mxcls, name))
+    # Output
+    return name, v
+
+
+# Read numeric MAT array data
+def _read_mat_numeric(fname, buf, pos, bo, dims):
+    # Read tag
+    mtype, nbytes, pos0, _ = _read_mat_tag(buf, pos, bo)
+    # Check for valid storage type
+    if mtype not in MI_DTYPES:
+        raise _MatLazyUnsupported("Unsupported MAT data type %i" % mtype)
+    # Data type
+    dtype = np.dtype(bo + MI_DTYPES[mtype])
+    # Number of entries
+    n = int(np.prod(dims))
+    # Check size
+    if nbytes != n * dtype.itemsize:
+        raise ValueError("Inconsistent MAT array size")
+    # Check for empty array
+    if n == 0:
+        return np.array([], dtype=dtype)
+    # Check size of array
+    if nbytes >= MMAP_MIN_BYTES:
+        # Map the data from the file; read on first use
+        v = np.memmap(
+            fname, dtype=dtype, mode="c",
+            offset=pos0, shape=dims, order="F")
+    else:
+        # Read small array now
+        v = np.frombuffer(buf, dtype, n, pos0).reshape(dims, order="F")
+        # Copy it out of the mapped file
+        v = v.copy(order="F")
+    # Output
+    return _squeeze_mat(v)
+
+
+# Read MAT character array
+def _read_mat_char(buf, pos, bo, dims):
+    # Read tag
+    mtype, nbytes, pos0, _ = _read_mat_tag(buf, pos, bo)
+    # Number of characters
+    n = int(np.prod(dims))
+    # Check for empty array
+    if n == 0:
+        return np.array([], dtype="U1")
+    # Check for valid storage type
+    if mtype not in MI_DTYPES:
+        raise _MatLazyUnsupported("Unsupported MAT data type %i" % mtype)
+    # Data type for character codes
+    dtype = np.dtype(bo + MI_DTYPES[mtype])
+    # Check for one code per character (not true for non-ASCII UTF-8)
+    if nbytes != n * dtype.itemsize:
+        raise _MatLazyUnsupported("Multibyte characters in MAT array")
+    # Read character codes, last dimension is along each string
+    codes = np.frombuffer(buf, dtype, n, pos0).reshape(dims, order="F")
+    # Convert to native 32-bit codes, which are the same as "U1"
+    codes = np.ascontiguousarray(codes, dtype="u4")
+    # Join characters of each string
+    v = codes.view("U%i" % dims[-1]).reshape(dims[:-1])
+    # Output
+    return _squeeze_mat(v)
+
+
+# Read MAT cell array
+def _read_mat_cell(fname, buf, pos, bo, dims):
+    # Number of cells
+    n = int(np.prod(dims))
+    # Initialize output
+    v = np.empty(n, dtype="object")
+    # Loop through cells
+    for j in range(n):
+        # Read tag
+        mtype, nbytes, pos0, pos = _read_mat_tag(buf, pos, bo)
+        # Check type
+        if mtype != MI_MATRIX:
+            raise ValueError("Invalid MAT cell type %i" % mtype)
+        # Read cell
+        _, v[j] = _read_mat_matrix(fname, buf, pos0, nbytes, bo)
+    # Output
+    return _squeeze_mat(v.reshape(dims, order="F"))
+
+
+# Read MAT struct
+def _read_mat_struct(fname, buf, pos, bo, dims):
+    # Only scalar structs are supported
+    if int(np.prod(dims)) != 1:
+        raise _MatLazyUnsupported("MAT struct arrays not supported")
+    # Maximum length of field names
+    _, _, pos0, pos = _read_mat_tag(buf, pos, bo)
+    nname, = struct.unpack_from(bo + "i", buf, pos0)
+    # Field names
+    _, nbytes, pos0, pos = _read_mat_tag(buf, pos, bo)
+    # Initialize struct
+    v = siom.mat_struct()
+    v._fieldnames = []
+    # Loop through names
+    for j in range(0, nbytes, nname):
+        # Get name, padded with NULLs
+        fld = bytes(buf[pos0 + j:pos0 + j + nname]).split(b"\0")[0]
+        v._fieldnames.append(fld.decode("ascii"))
+    # Loop through fields
+    for fld in v._fieldnames:
+        # Read tag
+        mtype, nbytes, pos0, pos = _read_mat_tag(buf, pos, bo)
+        # Check type
+        if mtype != MI_MATRIX:
+            raise ValueError("Invalid MAT field type %i" % mtype)
+        # Read field
+        _, v.__dict__[fld] = _read_mat_matrix(fname, buf, pos0, nbytes, bo)
+    # Output
+    return v
+
+
+# Squeeze an array the way scipy.io.loadmat() does
+def _squeeze_mat(v):
+    # Check for empty array
+    if v.size == 0:
+        return np.array([], dtype=v.dtype)
+    # Remove singleton dimensions
+    v = np.squeeze(v)
+    # Convert scalars and single strings
+    if v.ndim == 0 and (v.dtype.isbuiltin or v.dtype.kind == "U"):
+        return v.item()
+    # Output
+    return v
+
+
 # Check modules
 def _check_sio():
     r"""Check if needed :mod:`scipy.io` modules are present
@@ -25,6 +25,8 @@ interfaces to several different file types.
 # Standard library modules
 import copy
 import difflib
+import functools
+import multiprocessing
 import os
 import re
 import sys
@@ -78,6 +80,11 @@ RBF_FUNCS = [
 ]
 # Names of parameters needed to describe an RBF network
 RBF_SUFFIXES = ["method", "rbf", "func", "eps", "smooth", "N", "xcols"]
+# Max number of entries in padded array of windows for batch UQ stats
+UQ_BATCH_SIZE = 2**22
+
+# Databases used by UQ worker processes
+_UQ_WORKER_DBS = None
 
 
 # Options for RDBNull
@@ -5881,6 +5888,8 @@ class DataKit(ftypes.BaseData):
                 Candidate values of each *col* for comparison
             *test_bkpts*: {``{}``} | :class:`dict`
                 Candidate break points (1D unique) for *col*
+            *nproc*: {``1``} | :class:`int` > 0
+                Number of processes for independent *col*, *ucol* pairs
         :Required Attributes:
             *db1.uq_cols*: :class:`dict`\ [:class:`list`]
                 Names of UQ col for each *col*, if any
@@ -5900,10 +5909,11 @@ class DataKit(ftypes.BaseData):
             * 2019-02-15 ``@ddalle``: Version 1.0
             * 2020-04-02 ``@ddalle``: Version 2.0
                 - was :func:`EstimateUQ_DB`
+            * 2026-10-18 ``@ddalle``: Version 2.1; add *nproc*
         """
        # --- Inputs ---
-        # Get minimum number of points in statistical window
-        nmin = kw.get("nmin", 30)
+        # Number of processes
+        nproc = kw.pop("nproc", 1)
         # Get columns
         if cols is None:
             # Initialize (use any col with a *ucol*)
@@ -5916,6 +5926,8 @@ class DataKit(ftypes.BaseData):
                 if ucols:
                     cols.append(col)
        # --- Column Loop ---
+        # List of *col*, *ucol* pairs
+        jobs = []
         # Loop through data coefficients
         for col in cols:
             # Get UQ col list
@@ -5929,22 +5941,87 @@ class DataKit(ftypes.BaseData):
                 ucols = [ucols]
             # Loop through them
             for ucol in ucols:
+                jobs.append((col, ucol))
+       # --- Estimation ---
+        # Estimate each *ucol*, possibly in parallel
+        results = self._map_est_uq(db2, jobs, nproc, **kw)
+        # Loop through results
+        for (col, ucol), (A, U) in zip(jobs, results):
+            # Process "extra" keys
+            uq_ecols = self.get_uq_ecol(ucol)
+            # Save primary key
+            self.save_col(ucol, U[:,0])
+            # Save additional keys
+            for (j, acol) in enumerate(uq_ecols):
+                # Save additional key values
+                self.save_col(acol, U[:,j+1])
+        # Clean up prompt
+        sys.stdout.write("%60s\r" % "")
+
+    # Estimate several *ucols*, possibly in parallel
+    def _map_est_uq(self, db2, jobs, nproc=1, **kw):
+        r"""Call :func:`est_uq_col` for each *col*, *ucol* pair
+
+        If *nproc* is greater than one, the pairs are divided among
+        that many worker processes, each of which starts as a fork of
+        the current process so that neither database needs to be
+        pickled.
+
+        :Call:
+            >>> results = db1._map_est_uq(db2, jobs, nproc=1, **kw)
+        :Inputs:
+            *db1*: :class:`DataKit`
+                Database with scalar output functions
+            *db2*: :class:`DataKit`
+                Target database (UQ based on difference)
+            *jobs*: :class:`list`\ [:class:`tuple`]
+                List of (*col*, *ucol*) pairs
+            *nproc*: {``1``} | :class:`int` > 0
+                Number of processes
+        :Outputs:
+            *results*: :class:`list`\ [:class:`tuple`]
+                Output (*A*, *U*) of :func:`est_uq_col` for each job
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        global _UQ_WORKER_DBS
+        # Number of processes
+        nproc = min(int(nproc or 1), len(jobs))
+        # Get "fork" context; workers need a copy of both databases
+        try:
+            ctx = multiprocessing.get_context("fork")
+        except (AttributeError, ValueError):
+            ctx = None
+        # Check for serial
+        if nproc <= 1 or ctx is None:
+            # Initialize output
+            results = []
+            # Loop through pairs
+            for col, ucol in jobs:
                 # Status update
                 sys.stdout.write("%-60s\r" %
                     ("Estimating UQ: %s --> %s" % (col, ucol)))
                 sys.stdout.flush()
-                # Process "extra" keys
-                uq_ecols = self.get_uq_ecol(ucol)
                 # Call particular method
-                A, U = self.est_uq_col(db2, col, ucol, **kw)
-                # Save primary key
-                self.save_col(ucol, U[:,0])
-                # Save additional keys
-                for (j, acol) in enumerate(uq_ecols):
-                    # Save additional key values
-                    self.save_col(acol, U[:,j+1])
-        # Clean up prompt
-        sys.stdout.write("%60s\r" % "")
+                results.append(self.est_uq_col(db2, col, ucol, **kw))
+            # Output
+            return results
+        # Status update
+        sys.stdout.write("%-60s\r" %
+            ("Estimating UQ: %i cols on %i processes" % (len(jobs), nproc)))
+        sys.stdout.flush()
+        # Make databases available to forked workers
+        _UQ_WORKER_DBS = (self, db2, kw)
+        # Create pool of workers
+        pool = ctx.Pool(nproc)
+        try:
+            # Run jobs; output is in order of *jobs*
+            return pool.map(_est_uq_worker, jobs, chunksize=1)
+        finally:
+            # Clean up workers
+            pool.close()
+            pool.join()
+            _UQ_WORKER_DBS = None
 
     # UQ estimates for each condition in a col
     def est_uq_col(self, db2, col, ucol, **kw):
@@ -5996,35 +6073,21 @@ class DataKit(ftypes.BaseData):
         :Versions:
             * 2019-02-15 ``@ddalle``: Version 1.0
             * 2020-04-02 ``@ddalle``: v2.0, from ``EstimateUQ_coeff()``
+            * 2026-10-18 ``@ddalle``: v3.0, all windows at once
         """
        # --- Inputs ---
         # Get eval arguments for input coeff and UQ coeff
         uargs = self.get_response_args(ucol)
         # Get minimum number of points in statistical window
         nmin = kw.get("nmin", 30)
-        # Additional information
-        uq_ecols = self.get_uq_ecol(ucol)
-        # Check length
-        if uq_ecols is None:
-            # No extra ecols
-            nu = 1
-        else:
-            # Total number of cols
-            nu = 1 + len(uq_ecols)
        # --- Windowing ---
         # Break up possible run matrix into window centers
         A = self._genr8_uq_conditions(uargs, **kw)
-        # Number of windows
-        nx = len(A)
-        # Initialize output
-        U = np.zeros((nx, nu))
+        # Get all windows
+        windows = self.genr8_windows(nmin, uargs, A, **kw)
        # --- Evaluation ---
-        # Loop through conditions
-        for (i, a) in enumerate(A):
-            # Get window
-            I = self.genr8_window(nmin, uargs, *a, **kw)
-            # Estimate UQ for this window
-            U[i] = self._est_uq_point(db2, col, ucol, I, **kw)
+        # Estimate UQ for each window
+        U = self._est_uq_windows(db2, col, ucol, windows, **kw)
        # --- Output ---
         # Return conditions and values
         return A, U
@@ -6137,33 +6200,163 @@ class DataKit(ftypes.BaseData):
         :Versions:
             * 2019-02-15 ``@ddalle``: Version 1.0
             * 2020-03-20 ``@ddalle``: Mods from :mod:`tnakit.db.db1`
+            * 2026-10-18 ``@ddalle``: Split into deltas and stats
+        """
+        # Evaluate deltas in window
+        DV, DV_aux = self._est_uq_deltas(db2, col, ucol, mask, **kw)
+        # Calculate statistics
+        return self._est_uq_stats(ucol, DV, *DV_aux, **kw)
+
+    # Estimate UQ for many windows of *ucol*
+    def _est_uq_windows(self, db2, col, ucol, windows, **kw):
+        r"""Quantify uncertainty interval for several windows
+
+        The deltas between the two databases are evaluated only once at
+        every test point. If *ucol* has no aux cols, extra cols, or aux
+        function, the statistics for all windows are calculated together
+        using :func:`statutils.get_cov_interval_batch`.
+
+        :Call:
+            >>> U = db1._est_uq_windows(db2, col, ucol, windows, **kw)
+        :Inputs:
+            *db1*: :class:`DataKit`
+                Database with scalar output functions
+            *db2*: :class:`DataKit`
+                Target database (UQ based on difference)
+            *col*: :class:`str`
+                Name of data column to analyze
+            *ucol*: :class:`str`
+                Name of UQ column to estimate
+            *windows*: :class:`list`\ [:class:`np.ndarray`]
+                Indices of test points in each window
+        :Outputs:
+            *U*: :class:`np.ndarray` size=(*nx*\ ,*nu*\ +1)
+                Values of *ucol* and any *nu* "extra" *uq_ecols* for
+                each window
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
         """
+       # --- Deltas ---
+        # Evaluate deltas at all test points
+        DV, DV_aux = self._est_uq_deltas(db2, col, ucol, **kw)
+        # Extra cols
+        ecols = self.get_uq_ecol(ucol)
+        # Number of windows
+        nx = len(windows)
+        # Initialize output
+        U = np.zeros((nx, 1 + len(ecols)))
+        # Check for any cols that need per-window functions
+        if DV_aux or ecols or (self.get_uq_afunc(ucol) is not None):
+            # Loop through windows
+            for (i, I) in enumerate(windows):
+                # Estimate UQ for this window
+                U[i] = self._est_uq_stats(
+                    ucol, DV[I], *[DVk[I] for DVk in DV_aux], **kw)
+            # Output
+            return U
        # --- Statistics Options ---
         # Probability
         cov = kw.get("Coverage", kw.get("cov", 0.99865))
         cdf = kw.get("CoverageCDF", kw.get("cdf", cov))
         # Outlier cutoff
         osig_kw = kw.get('OutlierSigma', kw.get("osig"))
-       # --- Attributes ---
-        # Unpack useful attributes for additional functions
-        uq_funcs_extra = getattr(self, "uq_funcs_extra", {})
-        uq_funcs_shift = getattr(self, "uq_funcs_shift", {})
-        # Additional information
-        uq_keys_extra = getattr(self, "uq_keys_extra", {})
-        uq_keys_shift = getattr(self, "uq_keys_shift", {})
-        # Get eval arguments for input coeff and UQ coeff
-        argsc = self.response_args[col]
-        argsu = self.response_args[ucol]
+       # --- Batches ---
+        # Size of each window
+        nI = np.array([I.size for I in windows], dtype="int")
+        # Sort windows by size to minimize padding
+        order = np.argsort(nI, kind="stable")
+        # Start of first batch
+        ia = 0
+        # Loop through batches
+        while ia < nx:
+            # Include windows until padded array is too large
+            ib = ia + 1
+            while ib < nx and (ib + 1 - ia)*nI[order[ib]] <= UQ_BATCH_SIZE:
+                ib += 1
+            # Windows in this batch
+            K = order[ia:ib]
+            # Padded array of deltas
+            nk = max(1, nI[K[-1]])
+            DX = np.zeros((K.size, nk))
+            M = np.zeros((K.size, nk), dtype="bool")
+            # Fill in each window
+            for (j, k) in enumerate(K):
+                DX[j, :nI[k]] = DV[windows[k]]
+                M[j, :nI[k]] = True
+            # Degrees of freedom
+            df = nI[K]
+            # Ignore degenerate windows here; rechecked below
+            with np.errstate(divide="ignore", invalid="ignore"):
+                # Outlier cutoff
+                if osig_kw is None:
+                    # Default
+                    osig = 1.5*statutils.student.ppf(0.5+0.5*cdf, df)
+                else:
+                    # User-supplied value
+                    osig = osig_kw
+                # Check outliers on deltas
+                J = statutils.check_outliers_batch(
+                    DX, M, cov, cdf=cdf, osig=osig)
+                # New degrees of freedom
+                df = np.count_nonzero(J, axis=1)
+                # Outlier cutoff
+                if osig_kw is None:
+                    # Default
+                    osig = 1.5*statutils.student.ppf(0.5+0.5*cdf, df)
+                # Calculate coverage intervals
+                vmin, vmax = statutils.get_cov_interval_batch(
+                    DX, J, cov, cdf=cdf, osig=osig)
+            # Max value
+            U[K, 0] = np.maximum(np.abs(vmin), np.abs(vmax))
+            # Move to next batch
+            ia = ib
+       # --- Degenerate windows ---
+        # Recalculate any windows w/o valid result one at a time
+        for i in np.where(np.logical_not(np.isfinite(U[:, 0])))[0]:
+            U[i] = self._est_uq_stats(ucol, DV[windows[i]], **kw)
+       # --- Output ---
+        return U
+
+    # Evaluate deltas for UQ estimates
+    def _est_uq_deltas(self, db2, col, ucol, mask=None, **kw):
+        r"""Evaluate deltas between two databases at UQ test points
+
+        :Call:
+            >>> DV, DV_aux = db1._est_uq_deltas(db2, col, ucol, mask)
+        :Inputs:
+            *db1*: :class:`DataKit`
+                Database with scalar output functions
+            *db2*: :class:`DataKit`
+                Target database (UQ based on difference)
+            *col*: :class:`str`
+                Name of data column to analyze
+            *ucol*: :class:`str`
+                Name of UQ column to estimate
+            *mask*: {``None``} | :class:`np.ndarray`
+                Mask or indices of test points to evaluate {all}
+        :Outputs:
+            *DV*: :class:`np.ndarray`\ [:class:`float`]
+                Deltas of *col*, *db2* minus *db1*
+            *DV_aux*: :class:`list`\ [:class:`np.ndarray`]
+                Deltas of each aux col of *ucol*
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
        # --- Test Conditions ---
+        # Get eval arguments for input coeff
+        argsc = self.response_args[col]
         # Get test values and test break points
         vals, bkpts = self._get_test_values(argsc, **kw)
-        # --- Evaluation ---
+       # --- Evaluation ---
         # Initialize input values for comparison evaluation
         A = []
         # Get dictionary values
         for k in argsc:
             # Apply mask
-            A.append(vals[k][mask])
+            if mask is None:
+                A.append(vals[k])
+            else:
+                A.append(vals[k][mask])
         # Evaluate both databases
         V1 = self(col, *A)
         V2 = db2(col, *A)
@@ -6173,14 +6366,47 @@ class DataKit(ftypes.BaseData):
         # Get aux cols require to estimate *ucol*
         acols = self.get_uq_acol(ucol)
         # Deltas of co-keys
-        DV0_aux = []
+        DV_aux = []
         # Loop through shift keys
         for acol in acols:
             # Evaluate both databases
             V1 = self(acol, *A)
             V2 = db2(acol, *A)
             # Append deltas
-            DV0_aux.append(V2-V1)
+            DV_aux.append(V2-V1)
+       # --- Output ---
+        return DV, DV_aux
+
+    # Estimate UQ from deltas in one window
+    def _est_uq_stats(self, ucol, DV, *DV0_aux, **kw):
+        r"""Quantify uncertainty interval from deltas in one window
+
+        :Call:
+            >>> u, a = db1._est_uq_stats(ucol, DV, *DV_aux, **kw)
+        :Inputs:
+            *db1*: :class:`DataKit`
+                Database with scalar output functions
+            *ucol*: :class:`str`
+                Name of UQ column to estimate
+            *DV*: :class:`np.ndarray`\ [:class:`float`]
+                Deltas of *col* in window
+            *DV_aux*: :class:`tuple`\ [:class:`np.ndarray`]
+                Deltas of each aux col of *ucol* in window
+        :Outputs:
+            *u*: :class:`float`
+                Single uncertainty estimate for window
+            *a*: :class:`tuple`\ [:class:`float`]
+                Values of any "extra" *uq_ecols*
+        :Versions:
+            * 2019-02-15 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Split from :func:`_est_uq_point`
+        """
+       # --- Statistics Options ---
+        # Probability
+        cov = kw.get("Coverage", kw.get("cov", 0.99865))
+        cdf = kw.get("CoverageCDF", kw.get("cdf", cov))
+        # Outlier cutoff
+        osig_kw = kw.get('OutlierSigma', kw.get("osig"))
        # --- Outliers ---
         # Degrees of freedom
         df = DV.size
@@ -6386,6 +6612,135 @@ class DataKit(ftypes.BaseData):
         # Output
         return np.where(I)[0]
 
+    # Find windows for many centers
+    def genr8_windows(self, n, args, A, **kw):
+        r"""Get indices of neighboring points for many window centers
+
+        This produces the same windows as calling :func:`genr8_window`
+        for each row of *A*, but the test values are only sorted once,
+        and each window is found using binary searches instead of
+        masks over the entire database.
+
+        :Call:
+            >>> windows = db.genr8_windows(n, args, A, **kw)
+        :Inputs:
+            *db*: :class:`DataKit`
+                Database with evaluation tools
+            *n*: :class:`int`
+                Minimum number of points in window
+            *args*: :class:`list`\ [:class:`str`]
+                List of arguments to use for windowing
+            *A*: :class:`np.ndarray`\ [:class:`float`]\ (*nx*, *narg*)
+                Values of each arg for *nx* window centers
+        :Keyword Arguments:
+            *test_values*: {*db*} | :class:`DBCoeff` | :class:`dict`
+                Specify values of each *arg* in *args* that are the
+                candidate points for the window; default is from *db*
+            *test_bkpts*: {*db.bkpts*} | :class:`dict`
+                Specify candidate window boundaries; must be ascending
+                array of unique values for each *arg*
+        :Outputs:
+            *windows*: :class:`list`\ [:class:`np.ndarray`]
+                Indices of cases (relative to *test_values*) in each
+                window
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+       # --- Init ---
+        # Check inputs
+        if not isinstance(args, (list, tuple)):
+            raise TypeError("Arg list must be 'list' (got '%s')" % type(args))
+        # Number of args
+        narg = len(args)
+        # Check inputs
+        if narg == 0:
+            # No windowing arguments
+            raise ValueError("At least one named argument required")
+        # Ensure 2D array of centers
+        A = np.asarray(A, dtype="float").reshape(-1, narg)
+       # --- Lookup values ---
+        # Get test values and test break points
+        vals, bkpts = self._get_test_values(args, **kw)
+        # Sorted test values and break points for each arg
+        order = []
+        vsort = []
+        xsort = []
+        # Loop through args
+        for k in args:
+            # Sort test values once
+            Vk = np.asarray(vals[k])
+            Ik = np.argsort(Vk, kind="stable")
+            # Save
+            vals[k] = Vk
+            order.append(Ik)
+            vsort.append(Vk[Ik])
+            xsort.append(np.sort(bkpts[k]))
+       # --- Window search ---
+        def find_window(vmin, vmax):
+            # Range of sorted test values within bounds of each arg
+            ia = np.zeros(narg, dtype="int")
+            ib = np.zeros(narg, dtype="int")
+            for i in range(narg):
+                ia[i] = np.searchsorted(vsort[i], vmin[i], "left")
+                ib[i] = np.searchsorted(vsort[i], vmax[i], "right")
+            # Use arg with fewest candidates
+            i0 = np.argmin(ib - ia)
+            I = order[i0][ia[i0]:ib[i0]]
+            # Apply bounds of other args
+            for i, k in enumerate(args):
+                # Skip first arg
+                if i == i0:
+                    continue
+                # Values of candidates
+                Vk = vals[k][I]
+                # Check bounds
+                I = I[np.logical_and(Vk >= vmin[i], Vk <= vmax[i])]
+            # Output
+            return I
+       # --- Tolerances ---
+        # Default tolerance
+        tol = kw.get("tol", 1e-8)
+        # Tolerance for each arg
+        tols = np.array([kw.get("%stol" % k, tol) for k in args])
+        # Maximum loop
+        maxloops = kw.get("nmax", kw.get("maxloops", 10))
+       # --- Expansion ---
+        # Initialize windows
+        windows = []
+        # Loop through centers
+        for a in A:
+            # Initial bounds
+            vmin = a - tols
+            vmax = a + tols
+            # Initial window
+            I = find_window(vmin, vmax)
+            # Loop until enough points are included
+            for nloop in range(maxloops):
+                # Check count
+                if I.size >= n:
+                    break
+                # Expand each argument in order
+                for i in range(narg):
+                    # Break points
+                    Xk = xsort[i]
+                    # Next break point outside each bound
+                    ja = np.searchsorted(Xk, vmin[i] - tols[i], "left")
+                    jb = np.searchsorted(Xk, vmax[i] + tols[i], "right")
+                    # Expand bounds if possible
+                    if ja > 0:
+                        vmin[i] = Xk[ja - 1]
+                    if jb < Xk.size:
+                        vmax[i] = Xk[jb]
+                    # Check new window
+                    I = find_window(vmin, vmax)
+                    # Check count
+                    if I.size >= n:
+                        break
+            # Save indices in ascending order
+            windows.append(np.sort(I))
+       # --- Output ---
+        return windows
+
     # Get dictionary of test values
     def _get_test_values(self, args, **kw):
         r"""Get test values for creating windows or comparing databases
@@ -8758,6 +9113,7 @@ class DataKit(ftypes.BaseData):
         :Versions:
             * 2019-12-06 ``@ddalle``: Version 1.0
             * 2021-09-10 ``@ddalle``: Version 1.1; *prefix* and *suffix*
+            * 2026-10-18 ``@ddalle``: Version 1.2; keep lazy cols lazy
         """
         # Check type of data set
         if not isinstance(dbsrc, dict):
@@ -8791,8 +9147,6 @@ class DataKit(ftypes.BaseData):
             # Check if data is present
             if col not in dbsrc:
                 raise KeyError("No column '%s'" % col)
-            # Candidate data
-            v = dbsrc[col]
             # Add prefix and suffix to output column (col in *self*)
             if prefix:
                 col1 = prefix + col
@@ -8800,6 +9154,19 @@ class DataKit(ftypes.BaseData):
                 col1 = col
             if suffix:
                 col1 = col1 + suffix
+            # Check for column that hasn't been read yet
+            if isinstance(dbsrc, ftypes.BaseData) and (
+                    dbsrc.check_lazy_col(col)
+                    and not (append and col1 in self)):
+                # Add to column list
+                if col1 not in self.cols:
+                    self.cols.append(col1)
+                # Read from *dbsrc* when first accessed from *self*
+                self.set_lazy_col(
+                    col1, functools.partial(dbsrc.__getitem__, col))
+                continue
+            # Candidate data
+            v = dbsrc[col]
             # Get data to save
             if append and col1 in self:
                 # Get current values
@@ -12607,4 +12974,30 @@ class DataKit(ftypes.BaseData):
 # Combine options
 kwutils._combine_val(DataKit._tagmap, ftypes.BaseData._tagmap)
 
+
+# Worker function to estimate one UQ col
+def _est_uq_worker(job):
+    r"""Estimate UQ for one *col*, *ucol* pair in a worker process
+
+    :Call:
+        >>> A, U = _est_uq_worker((col, ucol))
+    :Inputs:
+        *col*: :class:`str`
+            Name of data column to analyze
+        *ucol*: :class:`str`
+            Name of UQ column to estimate
+    :Outputs:
+        *A*: :class:`np.ndarray`
+            Conditions for each *ucol* window
+        *U*: :class:`np.ndarray`
+            Values of *ucol* and any "extra" *uq_ecols* for each window
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Unpack job and shared databases
+    col, ucol = job
+    db1, db2, kw = _UQ_WORKER_DBS
+    # Estimate UQ
+    return db1.est_uq_col(db2, col, ucol, **kw)
+
 # %%
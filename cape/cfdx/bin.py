@@ -41,11 +41,12 @@ def check_output(cmdi):
 
 
 # Function to call commands with a different STDOUT
-def calli(cmdi, f=None, e=None, shell=None, v=True):
+def calli(cmdi, f=None, e=None, shell=None, v=True, monitor=None):
     r"""Call a command with alternate STDOUT by filename
 
     :Call:
-        >>> ierr = calli(cmdi, f=None, e=None, shell=None, v=True)
+        >>> ierr = calli(cmdi, f=None, e=None, shell=None, v=True,
+            monitor=None)
     :Inputs:
         *cmdi*: :class:`list`\ [:class:`str`]
             List of strings as for :func:`subprocess.call`
@@ -57,14 +58,18 @@ def calli(cmdi, f=None, e=None, shell=None, v=True):
             Whether or not a shell is needed
         *v*: {``True``} | :class:`False`
             Verbose option; display *PWD* and *STDOUT* values
+        *monitor*: {``None``} | :class:`cape.cfdx.monitor.CaseMonitor`
+            Convergence monitor to run beside the command
     :Outputs:
         *ierr*: :class:`int`
-            Return code, ``0`` for successful execution
+            Return code, ``0`` for successful execution or if stopped
+            by *monitor*
     :Versions:
         * 2014-08-30 ``@ddalle``: Version 1.0
         * 2015-02-13 ``@ddalle``: Version 2.0; return code
         * 2017-03-12 ``@ddalle``: Version 2.1; Add *v* option
         * 2019-06-10 ``@ddalle``: Version 2.2; Add *e* option
+        * 2026-10-18 ``@ddalle``: Version 2.3; Add *monitor* option
     """
     # Process the shell option
     shell = bool(shell)
@@ -103,22 +108,44 @@ def calli(cmdi, f=None, e=None, shell=None, v=True):
             # Open separate file
             fe = open(e, 'w')
         # Call the command.
-        ierr = sp.call(cmdi, stdout=fid, stderr=fe, shell=shell)
+        ierr = _call(
+            cmdi, stdout=fid, stderr=fe, shell=shell, monitor=monitor)
         # Close the file.
         fid.close()
     else:
         # Call the command.
-        ierr = sp.call(cmdi, shell=shell)
+        ierr = _call(cmdi, shell=shell, monitor=monitor)
     # Output
     return ierr
 
 
+# Call a command, optionally with a convergence monitor
+def _call(cmdi, stdout=None, stderr=None, shell=False, monitor=None):
+    # Check for monitor
+    if monitor is None:
+        return sp.call(cmdi, stdout=stdout, stderr=stderr, shell=shell)
+    # Start the process
+    proc = sp.Popen(cmdi, stdout=stdout, stderr=stderr, shell=shell)
+    # Monitor it while it runs
+    monitor.Start(proc)
+    try:
+        ierr = proc.wait()
+    finally:
+        monitor.Stop()
+    # Solver killed by monitor is not a failure
+    if monitor.stopped:
+        return 0
+    # Otherwise use actual status
+    return ierr
+
+
 # Function to call commands with a different STDOUT
-def callf(cmdi, f=None, e=None, shell=None, v=True, check=True):
+def callf(cmdi, f=None, e=None, shell=None, v=True, check=True, monitor=None):
     r"""Call a command with alternate STDOUT by filename
 
     :Call:
-        >>> callf(cmdi, f=None, e=None, shell=None, v=True, check=True)
+        >>> callf(cmdi, f=None, e=None, shell=None, v=True, check=True,
+            monitor=None)
     :Inputs:
         *cmdi*: :class:`list` (:class:`str`)
             List of strings as for :func:`subprocess.call`
@@ -130,14 +157,19 @@ def callf(cmdi, f=None, e=None, shell=None, v=True, check=True):
             Whether or not a shell is needed
         *v*: {``True``} | :class:`False`
             Verbose option; display *PWD* and *STDOUT* values
+        *check*: {``True``} | ``False``
+            Whether or not to raise an exception for nonzero status
+        *monitor*: {``None``} | :class:`cape.cfdx.monitor.CaseMonitor`
+            Convergence monitor to run beside the command
     :Versions:
         * 2014-08-30 ``@ddalle``: Version 1.0
         * 2015-02-13 ``@ddalle``: Version 2.0; rely on :func:`calli`
         * 2017-03-12 ``@ddalle``: Version 2.1; add *v* option
         * 2019-06-10 ``@ddalle``: Version 2.2; add *e* option
+        * 2026-10-18 ``@ddalle``: Version 2.3; add *monitor* option
     """
     # Call the command with output status
-    ierr = calli(cmdi, f, e, shell, v=v)
+    ierr = calli(cmdi, f, e, shell, v=v, monitor=monitor)
     # Check the status.
     if ierr and check:
         # Remove RUNNING file.
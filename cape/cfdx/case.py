@@ -41,7 +41,6 @@ from numpy import nan, isnan, argmax
 from . import queue
 from . import bin
 from .options.runControl import RunControl
-from ..tri import Tri, Triq
 
 
 # Function to intersect geometry if appropriate
@@ -117,6 +116,8 @@ def CaseIntersect(rc, proj='Components', n=0, fpre='run'):
     # Run intersect
     if not os.path.isfile(fotri):
         bin.intersect(opts=rc)
+    # Import triangulation module only when needed (slow to import)
+    from ..tri import Tri
     # Read the original triangulation.
     tric = Tri(fctri)
     # Read the intersected triangulation.
@@ -286,6 +287,8 @@ def CaseAFLR3(rc, proj='Components', fmt='lb8.ugrid', n=0):
             raise ValueError("User has requested AFLR3 volume mesh.\n" +
                 ("But found neither Cart3D tri file '%s' " % ftri) +
                 ("nor AFLR3 surf file '%s'" % fsurf))
+        # Import triangulation module only when needed (slow to import)
+        from ..tri import Tri
         # Read the triangulation
         if os.path.isfile(fxml):
             # Read with configuration
@@ -115,6 +115,9 @@ functionality from this script is also accessible from the
     --report RP --no-compile
         Create images for a report but don't compile into PDF
 
+    --report RP --nproc N
+        Update report using *N* worker processes for case/sweep pages
+
     --report RP --rm
         Delete existing caches of report subfigure images instead of
         creating them
@@ -3005,6 +3005,11 @@ class DBBase(dict):
         if fname is None: fname = self.fname
         # Process converters
         self.ProcessConverters()
+        # Check for binary columns
+        if self.opts.get_DataBookFormat(self.comp) != "csv":
+            # Use memory-mapped columns if they are up-to-date
+            if self.ReadBinary(fname):
+                return
         # Check for the readability of the file
         try:
             # Estimate length of file and find first data row
@@ -3276,6 +3281,110 @@ class DBBase(dict):
             self.wflag.append('%.12g')
    # ]
 
+   # --------------
+   # Binary Readers
+   # --------------
+   # [
+    # Get name of binary folder
+    def GetBinaryDir(self, fname=None):
+        """Get the name of the folder for binary data book columns
+
+        :Call:
+            >>> fnpy = DBc.GetBinaryDir(fname=None)
+        :Inputs:
+            *DBc*: :class:`cape.cfdx.dataBook.DBBase`
+                Data book base object
+            *fname*: {*DBc.fname*} | :class:`str`
+                Name of CSV data book file
+        :Outputs:
+            *fnpy*: :class:`str`
+                Folder with ``header.json`` and one ``.npy`` per column
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Check for default file name
+        if fname is None:
+            fname = self.fname
+        # Replace extension
+        return os.path.splitext(fname)[0] + ".npydb"
+
+    # Read binary columns
+    def ReadBinary(self, fname=None):
+        """Read data book columns from memory-mapped binary files
+
+        Columns are mapped copy-on-write, so they can be modified in
+        memory without changing the files.  Nothing is read if the
+        header is missing, older than the CSV file, or missing any run
+        matrix key.
+
+        :Call:
+            >>> q = DBc.ReadBinary(fname=None)
+        :Inputs:
+            *DBc*: :class:`cape.cfdx.dataBook.DBBase`
+                Data book base object
+            *fname*: {*DBc.fname*} | :class:`str`
+                Name of CSV data book file
+        :Outputs:
+            *q*: ``True`` | ``False``
+                Whether or not binary columns were read
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Check for default file name
+        if fname is None:
+            fname = self.fname
+        # Binary folder and header file
+        fnpy = self.GetBinaryDir(fname)
+        fjson = os.path.join(fnpy, "header.json")
+        # Check for header
+        if not os.path.isfile(fjson):
+            return False
+        # Check if CSV file is newer
+        if os.path.isfile(fname):
+            if os.path.getmtime(fname) > os.path.getmtime(fjson):
+                return False
+        # Read header
+        try:
+            with open(fjson) as fp:
+                hdr = json.load(fp)
+        except ValueError:
+            return False
+        # Columns and number of rows
+        cols = hdr.get("Columns", [])
+        n = hdr.get("n", 0)
+        # Run matrix keys are required
+        for k in self.xCols:
+            if k not in cols:
+                return False
+        # Map columns
+        data = {}
+        for k in self.cols:
+            # Check for missing data column
+            if k not in cols:
+                continue
+            # Map the file
+            try:
+                v = np.load(os.path.join(fnpy, "%s.npy" % k), mmap_mode="c")
+            except (IOError, ValueError):
+                return False
+            # Check size
+            if v.shape[0] != n:
+                return False
+            # Save
+            data[k] = v
+        # Save columns
+        for k in self.xCols:
+            self[k] = data[k]
+        # Data columns, which may be missing if definition changed
+        for k in self.fCols:
+            self[k] = data.get(k, np.nan*np.ones(n))
+        for k in self.iCols:
+            self[k] = data.get(k, np.zeros(n, dtype="int"))
+        # Save number of rows
+        self.n = n
+        return True
+   # ]
+
    # ----
    # Lock
    # ----
@@ -3444,6 +3553,16 @@ class DBBase(dict):
         # Check for default file name
         if fname is None:
             fname = self.fname
+        # Storage format
+        fmt = self.opts.get_DataBookFormat(self.comp)
+        # Check if CSV file is needed
+        if fmt == "npy":
+            # Write binary columns only
+            self.WriteBinary(fname)
+            # Unlock
+            if unlock:
+                self.Unlock()
+            return
         # check for a previous old file.
         if os.path.isfile(fname + ".old"):
             # Remove it
@@ -3497,11 +3616,69 @@ class DBBase(dict):
                 f.write((fmtj % vj) + ending)
         # Close the file.
         f.close()
+        # Write binary columns after CSV so they are newer
+        if fmt == "both":
+            self.WriteBinary(fname)
         # Unlock
         if unlock:
             self.Unlock()
         # Return to original location
         os.chdir(fpwd)
+
+    # Write binary columns
+    def WriteBinary(self, fname=None):
+        """Write data book as a folder of binary NumPy columns
+
+        Each column is saved to its own ``.npy`` file so that it can be
+        memory-mapped when read, and a ``header.json`` file is written
+        last.  Files are replaced rather than overwritten so that any
+        arrays still mapped from the previous version remain valid.
+
+        :Call:
+            >>> DBi.WriteBinary(fname=None)
+        :Inputs:
+            *DBi*: :class:`cape.cfdx.dataBook.DBBase`
+                An individual item data book
+            *fname*: {*DBi.fname*} | :class:`str`
+                Name of CSV data book file
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Binary folder
+        fnpy = self.GetBinaryDir(fname)
+        # Create folder if necessary
+        if not os.path.isdir(fnpy):
+            self.mkdir(fnpy)
+        # Header file
+        fjson = os.path.join(fnpy, "header.json")
+        # Initialize header
+        hdr = {
+            "Name": self.name,
+            "Columns": [],
+            "Types": {},
+            "n": int(self.n),
+        }
+        # Loop through columns
+        for k in self.cols:
+            # Get values
+            v = np.asarray(self[k])[:self.n]
+            # Object arrays cannot be mapped
+            if v.dtype.kind == "O":
+                v = v.astype("U")
+            # Write to temporary file
+            fk = os.path.join(fnpy, "%s.npy" % k)
+            with open(fk + ".tmp", "wb") as fp:
+                np.save(fp, v)
+            # Replace original
+            if os.path.isfile(fk):
+                os.remove(fk)
+            os.rename(fk + ".tmp", fk)
+            # Save to header
+            hdr["Columns"].append(k)
+            hdr["Types"][k] = v.dtype.str
+        # Write the header
+        with open(fjson, "w") as fp:
+            json.dump(hdr, fp, indent=1)
   # >
 
   # ======
@@ -0,0 +1,475 @@
+r"""
+:mod:`cape.cfdx.monitor`: Convergence-driven early termination
+================================================================
+
+This module provides a monitor that runs beside a CFD solver while it
+is iterating. The monitor periodically rereads the iterative force &
+moment histories (:class:`cape.cfdx.dataBook.CaseFM`) and the residual
+history (:class:`cape.cfdx.dataBook.CaseResid`) and applies the tests
+specified in the ``"Monitor"`` section of ``"RunControl"``:
+
+    * *Tol*: the means of the last two windows of *nStats* iterations
+      must differ by no more than *Tol* for each coefficient
+    * *StdTol*: the standard deviation of each coefficient over the last
+      *nStats* iterations must not exceed *StdTol*
+    * *nOrders*: the L1 residual must have dropped by at least *nOrders*
+      orders of magnitude
+
+Once all of the requested tests pass, the phase number, the target
+iteration count, and the reason are written to a file called
+``CONVERGED`` in the case folder. The solver is then asked to stop,
+either by creating the solver's own stop file (e.g. ``STOP`` for
+OVERFLOW) or by interrupting it, and it is only terminated if it has
+not exited after :data:`STOP_TIMEOUT` seconds.
+
+A ``CONVERGED`` file from an earlier phase only marks that phase as
+complete, and the runners remove the file whenever a phase starts. The
+case as a whole is treated as finished only if the file comes from the
+last phase and the target iteration count has not since been raised,
+for example by ``--extend``.
+
+The solver-specific modules (e.g. :mod:`cape.pyfun.case`) provide the
+functions that read the histories for that solver.
+"""
+
+# Standard library
+import os
+import signal
+import subprocess as sp
+import threading
+
+# Third-party modules
+import numpy as np
+
+
+# Name of file that marks a case as converged
+CONVERGED_FILE = "CONVERGED"
+# Time to wait for solver to exit after stop request [s]
+STOP_TIMEOUT = 300.0
+
+
+# Check for convergence marker
+def CheckConverged(rc, fname=CONVERGED_FILE):
+    r"""Check if the convergence monitor stopped the last phase
+
+    :Call:
+        >>> q = CheckConverged(rc, fname="CONVERGED")
+    :Inputs:
+        *rc*: :class:`cape.cfdx.options.runControl.RunControl`
+            Options interface from ``case.json``
+        *fname*: {``"CONVERGED"``} | :class:`str`
+            Name of convergence marker file
+    :Outputs:
+        *q*: ``True`` | ``False``
+            Whether ``CONVERGED`` file exists, is from the last phase,
+            and the case's target iteration has not increased
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+        * 2026-10-18 ``@ddalle``: Version 2.0; only for last phase
+    """
+    # Read marker
+    info = _read_converged(fname)
+    # Check for file
+    if info is None:
+        return False
+    # Only the last phase ends the case
+    if info["phase"] != rc.get_PhaseSequence(-1):
+        return False
+    # Check for iterations added since (e.g. ``--extend``)
+    return info["LastIter"] >= rc.get_LastIter()
+
+
+# Get phase from convergence marker
+def GetConvergedPhase(fname=CONVERGED_FILE):
+    r"""Get the phase that was stopped by the convergence monitor
+
+    :Call:
+        >>> j = GetConvergedPhase(fname="CONVERGED")
+    :Inputs:
+        *fname*: {``"CONVERGED"``} | :class:`str`
+            Name of convergence marker file
+    :Outputs:
+        *j*: :class:`int` | ``None``
+            Phase number from ``CONVERGED`` file, if any
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Read marker
+    info = _read_converged(fname)
+    # Output
+    if info is not None:
+        return info["phase"]
+
+
+# Read convergence marker
+def ReadConverged(fname=CONVERGED_FILE):
+    r"""Read the reason the convergence monitor stopped the solver
+
+    :Call:
+        >>> reason = ReadConverged(fname="CONVERGED")
+    :Inputs:
+        *fname*: {``"CONVERGED"``} | :class:`str`
+            Name of convergence marker file
+    :Outputs:
+        *reason*: :class:`str` | ``None``
+            Description of passed tests from ``CONVERGED`` file, if any
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Read marker
+    info = _read_converged(fname)
+    # Output
+    if info is not None:
+        return info["reason"]
+
+
+# Write convergence marker
+def WriteConverged(j, nIter, reason, fname=CONVERGED_FILE):
+    r"""Mark phase *j* as stopped by the convergence monitor
+
+    :Call:
+        >>> WriteConverged(j, nIter, reason, fname="CONVERGED")
+    :Inputs:
+        *j*: :class:`int`
+            Phase number
+        *nIter*: :class:`int`
+            Target iteration count for the case when stopped
+        *reason*: :class:`str`
+            Description of passed tests
+        *fname*: {``"CONVERGED"``} | :class:`str`
+            Name of convergence marker file
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    with open(fname, 'w') as fp:
+        fp.write("phase %i\n" % j)
+        fp.write("LastIter %i\n" % nIter)
+        fp.write(reason + "\n")
+
+
+# Remove convergence marker
+def ClearConverged(fname=CONVERGED_FILE):
+    r"""Remove convergence marker, e.g. when starting a new phase
+
+    :Call:
+        >>> ClearConverged(fname="CONVERGED")
+    :Inputs:
+        *fname*: {``"CONVERGED"``} | :class:`str`
+            Name of convergence marker file
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    if os.path.isfile(fname):
+        os.remove(fname)
+
+
+# Read phase, target iteration, and reason from marker
+def _read_converged(fname=CONVERGED_FILE):
+    # Check for file
+    if not os.path.isfile(fname):
+        return None
+    # Read it
+    with open(fname, 'r') as fp:
+        lines = fp.read().split("\n", 2)
+    # Parse header lines
+    try:
+        j = int(lines[0].split()[1])
+        nIter = int(lines[1].split()[1])
+    except Exception:
+        return None
+    # Output
+    return {
+        "phase": j,
+        "LastIter": nIter,
+        "reason": lines[2].strip() if len(lines) > 2 else "",
+    }
+
+
+# Convergence monitor
+class CaseMonitor(object):
+    r"""Monitor for statistical convergence of a running case
+
+    :Call:
+        >>> mon = CaseMonitor(rc, j=0, fm=None, resid=None, **kw)
+    :Inputs:
+        *rc*: :class:`cape.cfdx.options.runControl.RunControl`
+            Options interface from ``case.json``
+        *j*: {``0``} | :class:`int`
+            Phase number
+        *fm*: {``None``} | :class:`callable`
+            Function such that ``fm(comp)`` reads the iterative history
+            for component *comp*, a :class:`CaseFM` instance
+        *resid*: {``None``} | :class:`callable`
+            Function such that ``resid()`` reads the residual history,
+            a :class:`CaseResid` instance
+        *stopfile*: {``None``} | :class:`str`
+            Default solver stop file if *StopFile* option is not set
+    :Outputs:
+        *mon*: :class:`CaseMonitor`
+            Convergence monitor
+    :Attributes:
+        *mon.stopped*: ``True`` | ``False``
+            Whether or not the monitor stopped the solver
+        *mon.reason*: :class:`str` | ``None``
+            Description of tests that passed
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Initialization method
+    def __init__(self, rc, j=0, fm=None, resid=None, **kw):
+        r"""Initialization method
+
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Save options
+        self.rc = rc
+        self.j = j
+        # History readers
+        self.fm = fm
+        self.resid = resid
+        # Stop file
+        fstop = kw.get("stopfile")
+        # Check options
+        if rc.get_Monitor_StopFile():
+            fstop = rc.get_Monitor_StopFile()
+        self.stopfile = fstop
+        # Status
+        self.stopped = False
+        self.reason = None
+        # Whether or not this monitor created *stopfile*
+        self._stopfile = False
+        # Process handle and polling thread
+        self.proc = None
+        self._thread = None
+        self._event = threading.Event()
+
+   # --- Tests ---
+    def CheckConvergence(self):
+        r"""Apply convergence tests to the current histories
+
+        :Call:
+            >>> q, reason = mon.CheckConvergence()
+        :Inputs:
+            *mon*: :class:`CaseMonitor`
+                Convergence monitor
+        :Outputs:
+            *q*: ``True`` | ``False``
+                Whether or not all tests passed
+            *reason*: :class:`str` | ``None``
+                Description of passed tests if *q*
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Options
+        rc = self.rc
+        nStats = rc.get_Monitor_nStats()
+        nMin = rc.get_Monitor_nMin()
+        nOrders = rc.get_Monitor_nOrders()
+        # Messages describing tests that passed
+        msgs = []
+        # Last iteration (for report)
+        iLast = None
+        # Force & moment tests
+        if self.fm is not None:
+            # Loop through components
+            for comp in rc.get_Monitor_Components():
+                # Read history
+                try:
+                    fm = self.fm(comp)
+                except Exception:
+                    return False, None
+                # Check for enough iterations
+                if fm.i.size == 0:
+                    return False, None
+                # Last iteration
+                iLast = int(fm.i[-1])
+                # Need two full windows after *nMin*
+                if iLast < nMin + 2*nStats:
+                    return False, None
+                # Statistics for last two windows
+                try:
+                    s1 = fm.GetStatsN(nStats, iLast)
+                    s0 = fm.GetStatsN(nStats, iLast - nStats)
+                except Exception:
+                    return False, None
+                # Loop through coefficients
+                for coeff in rc.get_Monitor_Coeffs():
+                    # Skip coefficients not in this history
+                    if coeff not in s1:
+                        continue
+                    # Mean drift test
+                    tol = rc.get_Monitor_Tol(coeff)
+                    if tol is not None:
+                        # Change in mean between windows
+                        dc = abs(s1[coeff] - s0[coeff])
+                        # Test
+                        if not (dc <= tol):
+                            return False, None
+                        msgs.append(
+                            "%s.%s mean drift %.3e <= %.3e"
+                            % (comp, coeff, dc, tol))
+                    # Standard deviation test
+                    tol = rc.get_Monitor_StdTol(coeff)
+                    if tol is not None:
+                        # Standard deviation over last window
+                        sc = s1[coeff + "_std"]
+                        # Test
+                        if not (sc <= tol):
+                            return False, None
+                        msgs.append(
+                            "%s.%s std %.3e <= %.3e"
+                            % (comp, coeff, sc, tol))
+        # Residual test
+        if (nOrders is not None) and (self.resid is not None):
+            # Read history
+            try:
+                hist = self.resid()
+                # Check for enough iterations
+                if hist.nIter == 0 or hist.nIter < nMin:
+                    return False, None
+                # Residual drop
+                nOrd = hist.GetNOrders(max(1, nStats // 10))
+                # Last iteration in residual history
+                iResid = int(np.max(hist.i))
+            except Exception:
+                return False, None
+            # Test
+            if not (nOrd >= nOrders):
+                return False, None
+            msgs.append("L1 residual drop %.2f >= %.2f" % (nOrd, nOrders))
+            # Save iteration
+            if iLast is None:
+                iLast = iResid
+        # Check for at least one test
+        if len(msgs) == 0:
+            return False, None
+        # Create reason
+        reason = "iteration %s: " % iLast + "; ".join(msgs)
+        # Output
+        return True, reason
+
+    def Poll(self):
+        r"""Check convergence and mark case if converged
+
+        :Call:
+            >>> q = mon.Poll()
+        :Inputs:
+            *mon*: :class:`CaseMonitor`
+                Convergence monitor
+        :Outputs:
+            *q*: ``True`` | ``False``
+                Whether or not case is converged
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 1.1; record phase
+        """
+        # Apply tests
+        q, reason = self.CheckConvergence()
+        # Check for convergence
+        if not q:
+            return False
+        # Save reason
+        self.reason = reason
+        # Write marker file for this phase
+        WriteConverged(self.j, self.rc.get_LastIter(), reason)
+        # Output
+        return True
+
+   # --- Process control ---
+    def Start(self, proc):
+        r"""Start monitoring a running solver in a background thread
+
+        :Call:
+            >>> mon.Start(proc)
+        :Inputs:
+            *mon*: :class:`CaseMonitor`
+                Convergence monitor
+            *proc*: :class:`subprocess.Popen`
+                Running solver process
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Save process
+        self.proc = proc
+        # Reset stop event
+        self._event.clear()
+        # Create polling thread
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def Stop(self):
+        r"""Stop the background polling thread
+
+        Any stop file created by the monitor is also removed.
+
+        :Call:
+            >>> mon.Stop()
+        :Inputs:
+            *mon*: :class:`CaseMonitor`
+                Convergence monitor
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 1.1; remove stop file
+        """
+        # Signal thread
+        self._event.set()
+        # Wait for it
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        # Remove stop file so it doesn't stop the next run
+        if self._stopfile and os.path.isfile(self.stopfile):
+            os.remove(self.stopfile)
+        self._stopfile = False
+
+    def StopSolver(self):
+        r"""Ask the solver to stop, terminating it only as a fallback
+
+        The solver is asked to stop by creating the stop file, if any,
+        or otherwise by sending ``SIGINT``. If it is still running
+        after :data:`STOP_TIMEOUT` seconds, it is sent ``SIGTERM``.
+
+        :Call:
+            >>> mon.StopSolver()
+        :Inputs:
+            *mon*: :class:`CaseMonitor`
+                Convergence monitor
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 1.1; SIGTERM as fallback
+        """
+        # Set flag
+        self.stopped = True
+        # Check if solver is still running
+        if self.proc is None or self.proc.poll() is not None:
+            return
+        # Check for stop file
+        if self.stopfile:
+            # Create empty stop file; solver exits cleanly
+            open(self.stopfile, 'w').close()
+            self._stopfile = True
+        else:
+            # Interrupt, as from the keyboard
+            self.proc.send_signal(signal.SIGINT)
+        # Wait for solver to exit
+        try:
+            self.proc.wait(STOP_TIMEOUT)
+        except sp.TimeoutExpired:
+            # Send SIGTERM
+            self.proc.terminate()
+
+    # Polling loop
+    def _run(self):
+        # Polling interval
+        dt = self.rc.get_Monitor_dt()
+        # Loop until stopped or solver exits
+        while not self._event.wait(dt):
+            # Check if solver already finished
+            if self.proc.poll() is not None:
+                break
+            # Check convergence
+            if self.Poll():
+                self.StopSolver()
+                break
@@ -621,6 +621,54 @@ class DataBook(odict):
             * 2014-12-21 ``@ddalle``: Version 1.0
         """
         self['Delimiter'] = delim
+
+    # Get the storage format
+    def get_DataBookFormat(self, comp=None):
+        """Get the storage format(s) for data book files
+
+        The ``"npy"`` format is a folder with one binary NumPy array per
+        column plus a JSON header; it can be memory-mapped for fast
+        reads.  The CSV file remains the interchange format.
+
+        :Call:
+            >>> fmt = opts.get_DataBookFormat()
+            >>> fmt = opts.get_DataBookFormat(comp)
+        :Inputs:
+            *opts*: :class:`cape.options.Options`
+                Options interface
+            *comp*: :class:`str`
+                Name of specific data book to query
+        :Outputs:
+            *fmt*: {``"csv"``} | ``"npy"`` | ``"both"``
+                Format(s) to write; ``"npy"`` skips the CSV file
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Global option
+        db_fmt = self.get('Format', rc0('db_fmt'))
+        # Process request type
+        if comp is None:
+            # Global data book setting
+            return db_fmt
+        else:
+            # Return specific setting
+            return self.get(comp, {}).get('Format', db_fmt)
+
+    # Set the storage format
+    def set_DataBookFormat(self, fmt=rc0('db_fmt')):
+        """Set the storage format(s) for data book files
+
+        :Call:
+            >>> opts.set_DataBookFormat(fmt)
+        :Inputs:
+            *opts*: :class:`cape.options.Options`
+                Options interface
+            *fmt*: {``"csv"``} | ``"npy"`` | ``"both"``
+                Format(s) to write; ``"npy"`` skips the CSV file
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        self['Format'] = fmt
         
     # Get the key on which to sort
     def get_SortKey(self):
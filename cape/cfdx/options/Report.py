@@ -862,6 +862,30 @@ class Report(odict):
         # Get the value
         return R.get("MinIter", 1)
 
+    # Number of processes for figure generation
+    def get_ReportNProc(self, rep):
+        """Get number of worker processes used to create case figures
+
+        :Call:
+            >>> nProc = opts.get_ReportNProc(rep)
+        :Inputs:
+            *opts*: :class:`Report`
+                Options interface
+            *rep*: :class:`str`
+                Name of report
+        :Outputs:
+            *nProc*: {``1``} | :class:`int`
+                Number of case/sweep pages to update simultaneously
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Get the overall option
+        nProc = self.get("NProc", 1)
+        # Get the report
+        R = self.get_Report(rep)
+        # Get the report-specific option
+        return R.get("NProc", nProc)
+
     # Get report title
     def get_ReportTitle(self, rep):
         """Get the title of a report
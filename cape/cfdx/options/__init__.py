@@ -2947,6 +2947,16 @@ class Options(odict):
         self._DataBook()
         self['DataBook'].set_Delimiter(delim)
         
+    # Data book file format
+    def get_DataBookFormat(self, comp=None):
+        self._DataBook()
+        return self['DataBook'].get_DataBookFormat(comp)
+
+    # Set data book file format
+    def set_DataBookFormat(self, fmt=rc0('db_fmt')):
+        self._DataBook()
+        self['DataBook'].set_DataBookFormat(fmt)
+        
     # Key to use for sorting the data book
     def get_SortKey(self):
         self._DataBook()
@@ -2959,7 +2969,7 @@ class Options(odict):
         
     # Copy over the documentation.
     for k in ['nStats', 'dnStats', 'nMin', 'nMaxStats', 'nLastStats', 
-            'DataBookDir', 'Delimiter', 'SortKey']:
+            'DataBookDir', 'Delimiter', 'DataBookFormat', 'SortKey']:
         # Get the documentation for the "get" and "set" functions
         eval('get_'+k).__doc__ = getattr(DataBook,'get_'+k).__doc__
         eval('set_'+k).__doc__ = getattr(DataBook,'set_'+k).__doc__
@@ -3040,6 +3050,11 @@ class Options(odict):
         self._Report()
         return self['Report'].get_ReportMinIter(rep)
         
+    # Get number of processes for a report
+    def get_ReportNProc(self, rep):
+        self._Report()
+        return self['Report'].get_ReportNProc(rep)
+        
     # Get list of figures in a sweep
     def get_SweepFigList(self, rep):
         self._Report()
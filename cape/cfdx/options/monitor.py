@@ -0,0 +1,291 @@
+"""
+:mod:`cape.cfdx.options.monitor`: Convergence monitor options
+==============================================================
+
+This module provides a class to access options for the optional
+convergence monitor that runs beside the CFD solver. The monitor
+periodically reads the iterative force & moment and residual histories
+and stops the solver once user-specified statistical tests pass.
+
+The options are specified in the ``"Monitor"`` subsection of the
+``"RunControl"`` section of the JSON file.
+
+    .. code-block:: javascript
+
+        "RunControl": {
+            "Monitor": {
+                "Run": true,
+                "Components": ["wing", "fuselage"],
+                "Coeffs": ["CA", "CN", "CLM"],
+                "nStats": 200,
+                "nMin": 500,
+                "Tol": {"CA": 1e-4, "CN": 1e-3},
+                "StdTol": 5e-3,
+                "nOrders": 4.0,
+                "dt": 60.0,
+                "StopFile": null
+            }
+        }
+
+The class provided in this module, :class:`Monitor`, is loaded in the
+``"RunControl"`` section of the JSON file and the
+:class:`cape.cfdx.options.runControl.RunControl` class.
+"""
+
+# Import options-specific utilities
+from .util import odict, getel
+
+
+# Convergence monitor class
+class Monitor(odict):
+    """Class for convergence monitor options
+
+    :Call:
+        >>> opts = Monitor(**kw)
+    :Inputs:
+        *kw*: :class:`dict`
+            Dictionary of convergence monitor options
+    :Outputs:
+        *opts*: :class:`cape.cfdx.options.monitor.Monitor`
+            Convergence monitor options interface
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+
+    # Whether or not to use the monitor
+    def get_Monitor(self, j=0):
+        """Return whether or not to run the convergence monitor
+
+        :Call:
+            >>> q = opts.get_Monitor(j=0)
+        :Inputs:
+            *opts*: :class:`cape.cfdx.options.Options`
+                Options interface
+            *j*: :class:`int` | ``None``
+                Phase number
+        :Outputs:
+            *q*: ``True`` | {``False``}
+                Whether or not to monitor convergence in phase *j*
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Get the flag
+        q = self.get("Run")
+        # Check for explicit setting
+        if q is None:
+            # Use monitor if there are any convergence tests
+            for k in ("Tol", "StdTol", "nOrders"):
+                if self.get(k) is not None:
+                    return True
+            # No tests
+            return False
+        # Return the flag for phase *j*
+        return bool(getel(q, j))
+
+    # Components
+    def get_Monitor_Components(self):
+        """Get list of components whose histories are monitored
+
+        :Call:
+            >>> comps = opts.get_Monitor_Components()
+        :Inputs:
+            *opts*: :class:`cape.cfdx.options.Options`
+                Options interface
+        :Outputs:
+            *comps*: :class:`list`\\ [:class:`str`]
+                List of component names; empty to skip force checks
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Get value
+        comps = self.get_key("Components", rck="monitor_Components")
+        # Ensure list
+        if comps is None:
+            return []
+        elif isinstance(comps, (list, tuple)):
+            return list(comps)
+        else:
+            return [comps]
+
+    # Coefficients
+    def get_Monitor_Coeffs(self):
+        """Get list of coefficients tested by the convergence monitor
+
+        If *Tol* is a :class:`dict` and *Coeffs* is not set, the keys
+        of *Tol* (and *StdTol*) are used.
+
+        :Call:
+            >>> coeffs = opts.get_Monitor_Coeffs()
+        :Inputs:
+            *opts*: :class:`cape.cfdx.options.Options`
+                Options interface
+        :Outputs:
+            *coeffs*: :class:`list`\\ [:class:`str`]
+                List of coefficients, e.g. ``["CA", "CY", "CN"]``
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Check for explicit list
+        coeffs = self.get("Coeffs")
+        # Check for explicit value
+        if coeffs is not None:
+            # Ensure list
+            if isinstance(coeffs, (list, tuple)):
+                return list(coeffs)
+            else:
+                return [coeffs]
+        # Collect coefficients from tolerance dicts
+        coeffs = []
+        for k in ("Tol", "StdTol"):
+            # Get tolerance
+            tol = self.get(k)
+            # Check for dictionary
+            if not isinstance(tol, dict):
+                continue
+            # Append any new coefficients
+            for coeff in tol:
+                if coeff not in coeffs:
+                    coeffs.append(coeff)
+        # Use default if no dictionaries
+        if len(coeffs) == 0:
+            coeffs = list(self.get_key("Coeffs", rck="monitor_Coeffs"))
+        # Output
+        return coeffs
+
+    # Window size
+    def get_Monitor_nStats(self):
+        """Get number of iterations in each monitor averaging window
+
+        :Call:
+            >>> nStats = opts.get_Monitor_nStats()
+        :Inputs:
+            *opts*: :class:`cape.cfdx.options.Options`
+                Options interface
+        :Outputs:
+            *nStats*: :class:`int`
+                Number of iterations in each window
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        return self.get_key("nStats", rck="monitor_nStats")
+
+    # Minimum iterations
+    def get_Monitor_nMin(self):
+        """Get minimum iteration before convergence tests start
+
+        :Call:
+            >>> nMin = opts.get_Monitor_nMin()
+        :Inputs:
+            *opts*: :class:`cape.cfdx.options.Options`
+                Options interface
+        :Outputs:
+            *nMin*: :class:`int`
+                Iteration before which the case is never stopped
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        return self.get_key("nMin", rck="monitor_nMin")
+
+    # Mean drift tolerance
+    def get_Monitor_Tol(self, coeff=None):
+        """Get tolerance for drift of windowed mean of a coefficient
+
+        The test passes if the means of the last two windows of *nStats*
+        iterations differ by no more than this tolerance.
+
+        :Call:
+            >>> tol = opts.get_Monitor_Tol(coeff=None)
+        :Inputs:
+            *opts*: :class:`cape.cfdx.options.Options`
+                Options interface
+            *coeff*: :class:`str` | ``None``
+                Name of coefficient
+        :Outputs:
+            *tol*: :class:`float` | ``None``
+                Mean drift tolerance; ``None`` to skip test
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        return self._get_coeff_tol("Tol", coeff)
+
+    # Standard deviation tolerance
+    def get_Monitor_StdTol(self, coeff=None):
+        """Get max standard deviation of a coefficient in last window
+
+        :Call:
+            >>> tol = opts.get_Monitor_StdTol(coeff=None)
+        :Inputs:
+            *opts*: :class:`cape.cfdx.options.Options`
+                Options interface
+            *coeff*: :class:`str` | ``None``
+                Name of coefficient
+        :Outputs:
+            *tol*: :class:`float` | ``None``
+                Standard deviation tolerance; ``None`` to skip test
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        return self._get_coeff_tol("StdTol", coeff)
+
+    # Residual drop
+    def get_Monitor_nOrders(self):
+        """Get required residual drop in orders of magnitude
+
+        :Call:
+            >>> nOrders = opts.get_Monitor_nOrders()
+        :Inputs:
+            *opts*: :class:`cape.cfdx.options.Options`
+                Options interface
+        :Outputs:
+            *nOrders*: :class:`float` | ``None``
+                Orders of magnitude; ``None`` to skip test
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        return self.get_key("nOrders", rck="monitor_nOrders")
+
+    # Polling interval
+    def get_Monitor_dt(self):
+        """Get time between convergence checks
+
+        :Call:
+            >>> dt = opts.get_Monitor_dt()
+        :Inputs:
+            *opts*: :class:`cape.cfdx.options.Options`
+                Options interface
+        :Outputs:
+            *dt*: :class:`float`
+                Polling interval [s]
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        return self.get_key("dt", rck="monitor_dt")
+
+    # Stop file
+    def get_Monitor_StopFile(self):
+        """Get name of file that instructs the solver to stop
+
+        If ``None``, the solver is interrupted with ``SIGINT``.
+
+        :Call:
+            >>> fstop = opts.get_Monitor_StopFile()
+        :Inputs:
+            *opts*: :class:`cape.cfdx.options.Options`
+                Options interface
+        :Outputs:
+            *fstop*: :class:`str` | ``None``
+                Name of stop file to create in case folder
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        return self.get_key("StopFile", rck="monitor_StopFile")
+
+    # Get tolerance that may be a dict
+    def _get_coeff_tol(self, k, coeff=None):
+        # Get value
+        tol = self.get_key(k, rck="monitor_" + k)
+        # Check for coefficient-specific value
+        if isinstance(tol, dict):
+            return tol.get(coeff, tol.get("_"))
+        else:
+            return tol
@@ -19,6 +19,7 @@ from . import Archive
 from . import ulimit
 from . import aflr3
 from . import intersect
+from . import monitor
 
 # Environment class
 class Environ(odict):
@@ -117,6 +118,7 @@ class RunControl(odict):
         self._aflr3()
         self._intersect()
         self._verify()
+        self._Monitor()
     
    # ===========
    # Environment
@@ -839,6 +841,91 @@ class RunControl(odict):
         eval('set_'+k).__doc__ = getattr(intersect.verify,'set_'+k).__doc__
    # >
    
+   # ===================
+   # Convergence Monitor
+   # ===================
+   # <
+   
+    # Convergence monitor interface
+    def _Monitor(self):
+        """Initialize convergence monitor settings if necessary"""
+        # Get the value and type
+        v = self.get('Monitor')
+        t = type(v).__name__
+        # Check inputs
+        if t == 'Monitor':
+            # Already initialized
+            return
+        elif v is None:
+            # Empty/default
+            self['Monitor'] = monitor.Monitor()
+        elif t == 'dict':
+            # Convert to special class
+            self['Monitor'] = monitor.Monitor(**v)
+        else:
+            # Initialize with just a flag
+            self['Monitor'] = monitor.Monitor(Run=bool(v))
+    
+    # Whether or not to use monitor
+    def get_Monitor(self, j=0):
+        self._Monitor()
+        return self['Monitor'].get_Monitor(j)
+        
+    # Monitored components
+    def get_Monitor_Components(self):
+        self._Monitor()
+        return self['Monitor'].get_Monitor_Components()
+        
+    # Monitored coefficients
+    def get_Monitor_Coeffs(self):
+        self._Monitor()
+        return self['Monitor'].get_Monitor_Coeffs()
+        
+    # Window size
+    def get_Monitor_nStats(self):
+        self._Monitor()
+        return self['Monitor'].get_Monitor_nStats()
+        
+    # Minimum iteration
+    def get_Monitor_nMin(self):
+        self._Monitor()
+        return self['Monitor'].get_Monitor_nMin()
+        
+    # Mean drift tolerance
+    def get_Monitor_Tol(self, coeff=None):
+        self._Monitor()
+        return self['Monitor'].get_Monitor_Tol(coeff)
+        
+    # Standard deviation tolerance
+    def get_Monitor_StdTol(self, coeff=None):
+        self._Monitor()
+        return self['Monitor'].get_Monitor_StdTol(coeff)
+        
+    # Residual drop
+    def get_Monitor_nOrders(self):
+        self._Monitor()
+        return self['Monitor'].get_Monitor_nOrders()
+        
+    # Polling interval
+    def get_Monitor_dt(self):
+        self._Monitor()
+        return self['Monitor'].get_Monitor_dt()
+        
+    # Stop file
+    def get_Monitor_StopFile(self):
+        self._Monitor()
+        return self['Monitor'].get_Monitor_StopFile()
+        
+    # Copy documentation
+    for k in [
+        'Monitor', 'Monitor_Components', 'Monitor_Coeffs',
+        'Monitor_nStats', 'Monitor_nMin', 'Monitor_Tol', 'Monitor_StdTol',
+        'Monitor_nOrders', 'Monitor_dt', 'Monitor_StopFile'
+    ]:
+        # Get the documentation for the "get" functions
+        eval('get_'+k).__doc__ = getattr(monitor.Monitor,'get_'+k).__doc__
+   # >
+   
    # =================
    # Folder management
    # =================
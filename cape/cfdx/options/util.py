@@ -15,6 +15,7 @@ important role in the entire CAPE coding strategy.
 # Standard library modules
 import copy
 import functools
+import hashlib
 import io
 import json
 import os
@@ -71,6 +72,7 @@ rc = {
     "db_max": 0,
     "db_dir": "data",
     "db_nCut": 200,
+    "db_fmt": "csv",
     "Delimiter": ",",
     "binaryIO": True,
     "tecO": True,
@@ -123,6 +125,15 @@ rc = {
     "ulimit_u": 127812,
     "ulimit_v": "unlimited",
     "ulimit_x": "unlimited",
+    "monitor_Components": [],
+    "monitor_Coeffs": ["CA", "CY", "CN", "CLL", "CLM", "CLN"],
+    "monitor_nStats": 100,
+    "monitor_nMin": 0,
+    "monitor_Tol": None,
+    "monitor_StdTol": None,
+    "monitor_nOrders": None,
+    "monitor_dt": 60.0,
+    "monitor_StopFile": None,
     "ArchiveFolder": "",
     "ArchiveFormat": "tar",
     "ArchiveAction": "full",
@@ -323,12 +334,27 @@ regex = re.compile(
     r'(?P<before>.*)' +
     r'(?P<cmd>JSONFile\("(?P<json>[-\w.+= /\\]+)"\))' +
     r'(?P<after>.*)')
+# Regular expression for each JSON file inclusion in a line
+regex_include = re.compile(r'JSONFile\("(?P<json>[-\w.+= /\\]+)"\)')
+
+
+# Cache of expanded JSON files; see :func:`expandJSONFile`
+_JSON_CACHE = {}
+
+# Environment variable naming folder for on-disk JSON cache
+JSON_CACHE_ENV = "CAPE_JSON_CACHE"
 
 
 # Function to expand CSV file inputs
 def expandJSONFile(fname):
     r"""Expand contents of other JSON files
     
+    Results are cached using the path, modification time, and size of
+    *fname* and each file it includes, so reading the same unchanged
+    file again skips the expansion. If the environment variable
+    ``CAPE_JSON_CACHE`` names a folder, the cache is also saved there
+    so that other processes can use it.
+    
     :Call:
         >>> txt, fnames, linenos = expandJSONFile(fname)
     :Inputs:
@@ -347,90 +373,192 @@ def expandJSONFile(fname):
             from file *j*
     :Versions:
         * 2015-12-10 ``@ddalle``: Version 1.0
+        * 2026-10-18 ``@ddalle``: Version 2.0; linear pass and cache
     """
-    # Read the input file.
-    txt = io.open(fname, mode="r", encoding="utf-8").read()
-    # Split lines
-    lines = txt.rstrip().split('\n')
-    # Number of lines
-    n = len(lines)
-    # Initialize line numbers
-    linenos = np.zeros((n,1), dtype="int")
-    linenos[:,0] = 1 + np.arange(n)
+    # Cache key; relative includes depend on working directory
+    key = (os.getcwd(), os.path.abspath(fname))
+    # Check in-memory cache, then on-disk cache
+    v = _JSON_CACHE.get(key)
+    if v is None or not _check_json_deps(v[0]):
+        v = _read_json_cache(key)
+    # Use cached value if valid
+    if v is not None:
+        # Save (possibly from disk) in memory
+        _JSON_CACHE[key] = v
+        # Unpack; copy mutable outputs
+        _, txt, fnames, linenos = v
+        return txt, list(fnames), linenos.copy()
     # Initialize list of file names
-    fnames = [fname]
-    # Number of JSON files read (can read same file more than once)
-    nf = 1
-    # Start with the first line.
-    i = 0
-    # Loop through lines.
-    while i < len(lines):
-        # Get the line
-        line = lines[i]
-        # Check if line starts with a comment
-        if line.lstrip().startswith("//"):
-            # Javascript-style comment
-            lines[i] = ""
-            continue
-        elif line.lstrip().startswith("#"):
-            # Python-style comment
-            lines[i] = ""
-            continue
-        # Check for an inclusion
-        match = regex.search(line)
-        # If no match, move along
-        if match is None:
-            # Go to next line
-            i += 1
-            continue
-        # Extract the file name.
-        fjson = match.group("json")
-        # Expand that JSON file
-        t_j, F_j, ln_j = expandJSONFile(fjson)
-        # Split text to lines
-        lines_j = t_j.rstrip().split("\n")
-        # Number of lines
-        n_j = len(lines_j)
-        # Number of included files
-        nf_j = len(F_j)
-        # Pad line counts with zeros for lines of new file
-        if n_j > 1:
-            # Split current line and insert n_j-1 zeros
-            linenos = np.vstack((
-                linenos[:i+1,:], np.zeros((n_j-2,nf), dtype="int"),
-                linenos[i:,:]))
-        # Create line counts for new file
-        linenos_json = np.vstack((
-            np.zeros((i,nf_j), dtype="int"), ln_j,
-            np.zeros((n-i-1,nf_j), dtype="int")))
-        # Accumulate line numbers and file list
-        fnames += F_j
-        linenos = np.hstack((linenos, linenos_json))
-        # Modify line count and file count
-        n  += (n_j-1)
-        nf += nf_j
-        # Update first and last line of expansion
-        if n_j == 1:
-            # One-line inclusion
-            lines[i] = line.replace(match.group("cmd"), lines_j[0])
-        else:
-            # Update first line
-            lines[i] = match.group("before") + lines_j[0]
-            # Update last line of inclusion
-            lines_j[-1] = lines_j[-1].rstrip() + match.group("after")
-            # Update line set
-            lines = lines[:i+1] + lines_j[1:] + lines[i+1:]
-        # Check for multiple inclusions
-        if regex.search(lines[i]):
-            # Remain on this line
-            pass
-        else:
-            # Move past expanded file
-            i += n_j
+    fnames = []
+    # Expand recursively; *src* lists (file index, line no) of each line
+    lines, src = _expand_json_lines(fname, fnames)
     # Return the lines as one string.
     txt = "\n".join(lines) + "\n"
+    # Convert source lines to matrix of line numbers
+    linenos = np.zeros((len(lines), len(fnames)), dtype="int")
+    for i, srci in enumerate(src):
+        for j, lnj in srci:
+            linenos[i, j] = lnj
+    # Save to cache
+    deps = _get_json_deps(fnames)
+    if deps is not None:
+        v = (deps, txt, fnames, linenos)
+        _JSON_CACHE[key] = v
+        _write_json_cache(key, v)
+    # Output
+    return txt, list(fnames), linenos.copy()
+
+
+# Expand one JSON file into lines
+def _expand_json_lines(fname, fnames):
+    # Index of this file
+    jf = len(fnames)
+    fnames.append(fname)
+    # Read the input file.
+    with io.open(fname, mode="r", encoding="utf-8") as fp:
+        txt = fp.read()
+    # Initialize output lines and source (file, line number) of each
+    lines = []
+    src = []
+    # Loop through lines.
+    for k, line in enumerate(txt.rstrip().split('\n')):
+        # Check if line starts with a comment
+        if line.lstrip().startswith(("//", "#")):
+            # Javascript-style or Python-style comment
+            line = ""
+        # Start output line; record source line
+        txtk = ""
+        srck = [(jf, k + 1)]
+        # Position in line
+        pos = 0
+        # Loop through inclusions in this line
+        for match in regex_include.finditer(line):
+            # Append text before inclusion
+            txtk += line[pos:match.start()]
+            pos = match.end()
+            # Expand that JSON file
+            lines_j, src_j = _expand_json_lines(match.group("json"), fnames)
+            # First line of inclusion continues current line
+            txtk += lines_j[0]
+            srck += src_j[0]
+            # Check for multi-line inclusion
+            if len(lines_j) > 1:
+                # Finish current line
+                lines.append(txtk)
+                src.append(srck)
+                # Middle lines of inclusion
+                lines.extend(lines_j[1:-1])
+                src.extend(src_j[1:-1])
+                # Last line of inclusion starts new line
+                txtk = lines_j[-1].rstrip()
+                srck = src_j[-1] + [(jf, k + 1)]
+        # Save remainder of line
+        lines.append(txtk + line[pos:])
+        src.append(srck)
     # Output
-    return txt, fnames, linenos
+    return lines, src
+
+
+# Get modification times and sizes of files
+def _get_json_deps(fnames):
+    # Initialize
+    deps = []
+    # Loop through unique files
+    for fname in set(fnames):
+        # Get file stats
+        try:
+            st = os.stat(fname)
+        except OSError:
+            return None
+        # Save path, time, and size
+        deps.append((os.path.abspath(fname), st.st_mtime_ns, st.st_size))
+    # Output
+    return sorted(deps)
+
+
+# Check if cached files are unchanged
+def _check_json_deps(deps):
+    # Loop through files
+    for fabs, mtime, size in deps:
+        # Get file stats
+        try:
+            st = os.stat(fabs)
+        except OSError:
+            return False
+        # Compare
+        if st.st_mtime_ns != mtime or st.st_size != size:
+            return False
+    # All files unchanged
+    return True
+
+
+# Name of on-disk cache file
+def _get_json_cache_file(key):
+    # Get cache folder
+    fdir = os.environ.get(JSON_CACHE_ENV)
+    # Check if on-disk caching is on
+    if not fdir:
+        return
+    # Hash the key for a file name
+    h = hashlib.sha1("\n".join(key).encode("utf-8")).hexdigest()
+    # Output
+    return os.path.join(fdir, h + ".json")
+
+
+# Read expanded JSON file from on-disk cache
+def _read_json_cache(key):
+    # Get cache file
+    fcache = _get_json_cache_file(key)
+    # Check for file
+    if fcache is None or not os.path.isfile(fcache):
+        return
+    # Read it
+    try:
+        with io.open(fcache, mode="r", encoding="utf-8") as fp:
+            d = json.load(fp)
+        # Unpack
+        deps = [tuple(dep) for dep in d["deps"]]
+        fnames = d["fnames"]
+        linenos = np.array(d["linenos"], dtype="int")
+        linenos = linenos.reshape((-1, len(fnames)))
+    except Exception:
+        # Ignore corrupt or incompatible cache file
+        return
+    # Check if any of the files changed
+    if not _check_json_deps(deps):
+        return
+    # Output
+    return deps, d["txt"], fnames, linenos
+
+
+# Write expanded JSON file to on-disk cache
+def _write_json_cache(key, v):
+    # Get cache file
+    fcache = _get_json_cache_file(key)
+    # Check if on-disk caching is on
+    if fcache is None:
+        return
+    # Unpack
+    deps, txt, fnames, linenos = v
+    # Write to temporary file, then replace
+    ftmp = "%s.%i.tmp" % (fcache, os.getpid())
+    try:
+        # Create folder if needed
+        if not os.path.isdir(os.path.dirname(fcache)):
+            os.makedirs(os.path.dirname(fcache))
+        # Write
+        with io.open(ftmp, mode="w", encoding="utf-8") as fp:
+            json.dump({
+                "deps": deps,
+                "txt": txt,
+                "fnames": fnames,
+                "linenos": linenos.tolist(),
+            }, fp)
+        os.replace(ftmp, fcache)
+    except (OSError, IOError):
+        # Caching is optional
+        if os.path.isfile(ftmp):
+            os.remove(ftmp)
 
 
 # Function to read JSON file with all the works
@@ -55,8 +55,11 @@ example :func:`cape.cfdx.report.Report.SubfigPlotCoeff` for ``"PlotCoeff"``  or
 
 # Standard library modules
 import ast
+import copy
 import glob
+import hashlib
 import json
+import multiprocessing
 import os
 import re
 import shutil
@@ -76,6 +79,82 @@ from .bin import pvpython
 from cape.filecntl.tecplot import ExportLayout, Tecscript
 import cape.plt as plt
 
+
+# Case subfigure types that do not depend on iteration history
+ITER_INDEPENDENT_SUBFIG_TYPES = (
+    "Conditions",
+)
+
+
+# Update a hash with arbitrary data
+def _update_hash(h, v):
+    r"""Add a value (arrays, lists, dicts, scalars) to a hash
+
+    :Call:
+        >>> _update_hash(h, v)
+    :Inputs:
+        *h*: :class:`hashlib.sha1`
+            Hash object, updated in place
+        *v*: :class:`object`
+            Value to add; NumPy arrays are hashed by their raw bytes
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Check for arrays
+    if isinstance(v, np.ndarray) and v.dtype.kind in "biufc":
+        # Include type and shape so e.g. int/float don't collide
+        h.update(("%s%s" % (v.dtype.str, v.shape)).encode())
+        h.update(np.ascontiguousarray(v).tobytes())
+    elif isinstance(v, np.ndarray):
+        # Strings, objects, etc.
+        h.update(json.dumps(v.tolist(), default=str).encode())
+    else:
+        # Use JSON with sorted keys for stable output
+        h.update(json.dumps(v, sort_keys=True, default=str).encode())
+
+
+# Report instance used by worker processes (inherited by fork)
+_WORKER_REPORT = None
+
+
+# Worker function to update one case page
+def _render_case_worker(i):
+    r"""Create figures and LaTeX file for one case in a worker process
+
+    :Call:
+        >>> line = _render_case_worker(i)
+    :Inputs:
+        *i*: :class:`int`
+            Case index
+    :Outputs:
+        *line*: ``None`` | :class:`str`
+            Line to add to main LaTeX file, if any
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    return _WORKER_REPORT.RenderCase(i)
+
+
+# Worker function to update one sweep page
+def _render_sweep_worker(job):
+    r"""Create figures and LaTeX file for one sweep page in a worker
+
+    :Call:
+        >>> line = _render_sweep_worker((fswp, I))
+    :Inputs:
+        *fswp*: :class:`str`
+            Name of sweep
+        *I*: :class:`np.ndarray`\ [:class:`int`]
+            List of cases in this sweep page
+    :Outputs:
+        *line*: :class:`str`
+            Line to add to main LaTeX file
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    return _WORKER_REPORT.RenderSweepPage(*job)
+
+
 # Class to interface with report generation and updating.
 class Report(object):
     """Interface for automated report generation
@@ -102,10 +181,13 @@ class Report(object):
             Dictionary of LaTeX handles for each single-sweep page
         *R.tex*: :class:`cape.tex.Tex`
             Handle to main LaTeX file
+        *R.nProc*: :class:`int`
+            Number of worker processes for case and sweep pages
     :Versions:
         * 2015-03-07 ``@ddalle``: Started
         * 2015-03-10 ``@ddalle``: First version
         * 2015-10-15 ``@ddalle``: Basis version
+        * 2026-10-18 ``@ddalle``: Added parallel page updates
     """
   # ==================
   # Standard Functions
@@ -139,6 +221,13 @@ class Report(object):
         self.OpenMain()
         # Set force update
         self.force_update = False
+        # Number of worker processes
+        self.nProc = cntl.opts.get_ReportNProc(rep)
+        # Lock for folders shared by worker processes
+        self._lock = None
+        # Caches of data read for the current case and report pass
+        self._case_cache = {}
+        self._db_cache = {}
         # Return
         os.chdir(fpwd)
 
@@ -173,9 +262,17 @@ class Report(object):
                 Name of folder to make
         :Versions:
             * 2015-10-15 ``@ddalle``: First versoin
+            * 2026-10-18 ``@ddalle``: Lock when using workers
         """
-        # Make the directory.
-        self.cntl.mkdir(fdir)
+        # Check for worker processes
+        if self._lock is None:
+            # Make the directory.
+            self.cntl.mkdir(fdir)
+            return
+        # Another worker may create the same folder
+        with self._lock:
+            if not os.path.isdir(fdir):
+                self.cntl.mkdir(fdir)
 
     # Function to go into a folder, respecting archive option
     def cd(self, fdir):
@@ -207,6 +304,64 @@ class Report(object):
         else:
             # Untar if necessary
             tar.chdir_in(fdir)
+
+    # Run page updates, possibly in parallel
+    def MapPages(self, worker, func, jobs):
+        r"""Apply a page update function to each job, in order
+
+        If *R.nProc* is greater than one, the jobs are divided among
+        that many worker processes, each of which starts as a fork of
+        the current process. The outputs are still returned in the
+        order of *jobs* so that the main LaTeX file is assembled the
+        same way as in serial.
+
+        :Call:
+            >>> lines = R.MapPages(worker, func, jobs)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *worker*: :class:`function`
+                Module-level function to call in worker processes
+            *func*: :class:`function`
+                Function to call for each job when running in serial
+            *jobs*: :class:`list`
+                List of inputs to *worker* or *func*
+        :Outputs:
+            *lines*: :class:`list`
+                Output of *func* for each job
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        global _WORKER_REPORT
+        # Number of processes
+        nProc = min(int(self.nProc or 1), len(jobs))
+        # Get "fork" context; workers need a copy of this instance
+        try:
+            ctx = multiprocessing.get_context("fork")
+        except (AttributeError, ValueError):
+            ctx = None
+        # Check for serial
+        if nProc <= 1 or ctx is None:
+            return [func(job) for job in jobs]
+        # Save current location
+        fpwd = os.getcwd()
+        # Make this instance available to forked workers
+        _WORKER_REPORT = self
+        self._lock = ctx.Lock()
+        # Create pool of workers
+        pool = ctx.Pool(nProc)
+        try:
+            # Run jobs; output is in order of *jobs*
+            lines = pool.map(worker, jobs, chunksize=1)
+        finally:
+            # Clean up workers
+            pool.close()
+            pool.join()
+            _WORKER_REPORT = None
+            self._lock = None
+            os.chdir(fpwd)
+        # Output
+        return lines
   # >
 
   # ===========
@@ -556,9 +711,18 @@ class Report(object):
                 List of case indices
             *cons*: :class:`list` (:class:`str`)
                 List of constraints to define what cases to update
+            *nproc*: {*R.nProc*} | :class:`int`
+                Number of worker processes for case and sweep pages
         :Versions:
             * 2015-05-22 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Added *nproc*
         """
+        # Number of worker processes
+        if kw.get("nproc") is not None:
+            self.nProc = int(kw["nproc"])
+        # Start with empty data caches
+        self.ClearCaseCache()
+        self._db_cache.clear()
         # Get list of indices.
         I = self.cntl.x.GetIndices(**kw)
         # Update any sweep figures.
@@ -662,15 +826,18 @@ class Report(object):
         :Versions:
             * 2015-03-10 ``@ddalle``: First version
             * 2015-05-22 ``@ddalle``: Moved compilation portion to UpdateReport
+            * 2026-10-18 ``@ddalle``: Use :func:`MapPages`
         """
         # Check for use of constraints instead of direct list.
         I = self.cntl.x.GetIndices(I=I, **kw)
         # Clear out the lines.
         del self.tex.Section['Cases'][1:-1]
-        # Loop through those cases.
-        for i in I:
-            # Update the case
-            self.UpdateCase(i)
+        # Update each case page (possibly in parallel)
+        lines = self.MapPages(_render_case_worker, self.RenderCase, list(I))
+        # Add lines to main LaTeX file in original order
+        for line in lines:
+            if line:
+                self.tex.Section['Cases'].insert(-1, line)
         # Update the text.
         self.tex._updated_sections = True
         self.tex.UpdateLines()
@@ -701,6 +868,7 @@ class Report(object):
         :Versions:
             * 2015-05-29 ``@ddalle``: First version
             * 2015-06-11 ``@ddalle``: Added minimum cases per page
+            * 2026-10-18 ``@ddalle``: Use :func:`MapPages`
         """
         # Divide the cases into sweeps.
         J = self.GetSweepIndices(fswp, I, cons)
@@ -722,12 +890,15 @@ class Report(object):
             self.mkdir(fdir)
         # Enter the sweep folder.
         os.chdir(fdir)
-        # Loop through pages.
-        for i in range(len(J)):
-            # Check for enough cases to report a sweep.
-            if len(J[i]) < nMin: continue
-            # Update the sweep page.
-            self.UpdateSweepPage(fswp, J[i])
+        # Pages with enough cases to report a sweep
+        jobs = [(fswp, j) for j in J if len(j) >= nMin]
+        # Update each page (possibly in parallel)
+        lines = self.MapPages(
+            _render_sweep_worker, lambda job: self.RenderSweepPage(*job),
+            jobs)
+        # Add lines to the master document in original order
+        for line in lines:
+            self.tex.Section['Sweeps'].insert(-1, line)
         # Return to original directory
         os.chdir(fpwd)
 
@@ -748,12 +919,42 @@ class Report(object):
                 List of correspond indices for each target
         :Versions:
             * 2015-05-29 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Moved work to :func:`RenderSweepPage`
+        """
+        # Create the figures and page
+        line = self.RenderSweepPage(fswp, I)
+        # Add a line to the master document.
+        self.tex.Section['Sweeps'].insert(-1, line)
+
+    # Create figures and LaTeX file for a single sweep page
+    def RenderSweepPage(self, fswp, I):
+        r"""Create figures and LaTeX file for one page of a sweep
+
+        This does not modify the main LaTeX file, so it can be called
+        from a worker process.
+
+        :Call:
+            >>> line = R.RenderSweepPage(fswp, I)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *fswp*: :class:`str`
+                Name of sweep to update
+            *I*: :class:`numpy.ndarray`\ [:class:`int`]
+                List of cases in this sweep
+        :Outputs:
+            *line*: :class:`str`
+                Line to add to the main LaTeX file
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0; from UpdateSweepPage()
         """
         # --------
         # Checking
         # --------
         # Save location
         fpwd = os.getcwd()
+        # Go to the sweep folder (absolute path)
+        os.chdir(os.path.join(self.cntl.RootDir, 'report', 'sweep-%s' % fswp))
         # Get the case names in this sweep.
         fdirs = self.cntl.DataBook.x.GetFullFolderNames(I)
         # Split group and case name for first case in the sweep.
@@ -771,9 +972,8 @@ class Report(object):
             self.mkdir(fdir)
         # Go into the folder.
         self.cd(fdir)
-        # Add a line to the master document.
-        self.tex.Section['Sweeps'].insert(-1,
-            '\\input{sweep-%s/%s/%s}\n' % (fswp, frun, self.fname))
+        # Line for the master document
+        line = '\\input{sweep-%s/%s/%s}\n' % (fswp, frun, self.fname)
         # -------------
         # Initial setup
         # -------------
@@ -799,6 +999,8 @@ class Report(object):
         self.sweeps[fswp][I[0]].Write()
         # Go home.
         os.chdir(fpwd)
+        # Output
+        return line
 
     # Get appropriate list of figures
     def GetFigureList(self, i, fswp=None):
@@ -865,7 +1067,36 @@ class Report(object):
                 Case index
         :Versions:
             * 2015-03-08 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Moved work to :func:`RenderCase`
         """
+        # Create the figures and page
+        line = self.RenderCase(i)
+        # Add the line to the master LaTeX file.
+        if line:
+            self.tex.Section['Cases'].insert(-1, line)
+
+    # Create figures and LaTeX file for a case
+    def RenderCase(self, i):
+        """Create figures and LaTeX file for a case
+
+        This does not modify the main LaTeX file, so it can be called
+        from a worker process.
+
+        :Call:
+            >>> line = R.RenderCase(i)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *i*: :class:`int`
+                Case index
+        :Outputs:
+            *line*: ``None`` | :class:`str`
+                Line to add to main LaTeX file, if any
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0; from UpdateCase()
+        """
+        # Histories from previous case are no longer needed
+        self.ClearCaseCache()
         # --------
         # Checking
         # --------
@@ -918,9 +1149,8 @@ class Report(object):
             # Go home and quit.
             os.chdir(fpwd)
             return
-        # Add the line to the master LaTeX file.
-        self.tex.Section['Cases'].insert(-1,
-            '\\input{%s/%s/%s}\n' % (fgrp, fdir, self.fname))
+        # Line for the master LaTeX file.
+        line = '\\input{%s/%s/%s}\n' % (fgrp, fdir, self.fname)
         # Status update
         print('%s/%s' % (fgrp, fdir))
         # -------------
@@ -949,6 +1179,8 @@ class Report(object):
         self.cases[i].Write()
         # Go home.
         os.chdir(fpwd)
+        # Output
+        return line
    # ]
 
    # -------------------------
@@ -1130,6 +1362,7 @@ class Report(object):
                 List of lines for LaTeX file
         :Versions:
             * 2015-05-29 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Added content hashes
         """
         # Get list of subfigures.
         sfigs = self.cntl.opts.get_FigSubfigList(fig)
@@ -1141,24 +1374,27 @@ class Report(object):
         rc = self.ReadCaseJSON()
         # Loop through subfigs.
         for sfig in sfigs:
+            # Get content hash
+            h = self.GetCaseSubfigHash(sfig, i, n)
             # Check the status (also prints status update)
-            q = self.CheckSubfigStatus(sfig, rc, n)
+            q = self.CheckSubfigStatus(sfig, rc, n, h)
             # Use a separate function to find the right updater
             lines = self.SubfigSwitch(sfig, i, lines, q)
             # Update the settings
             rc["Status"][sfig] = n
             rc["Subfigures"][sfig] = self.cntl.opts.get_SubfigCascade(sfig)
+            rc["Hashes"][sfig] = h
         # Write the new settings
         self.WriteCaseJSON(rc)
         # Output
         return lines
 
     # Check status of a subfigure and give status update
-    def CheckSubfigStatus(self, sfig, rc, n):
+    def CheckSubfigStatus(self, sfig, rc, n, h=None):
         """Check whether or not to update a subfigure and print status
 
         :Call:
-            >>> q = R.CheckSubfigStatus(sfig, rc, n)
+            >>> q = R.CheckSubfigStatus(sfig, rc, n, h=None)
         :Inputs:
             *R*: :class:`cape.cfdx.report.Report`
                 Automated report interface
@@ -1168,11 +1404,14 @@ class Report(object):
                 Dictionary from ``report.json``
             *n*: :class:`int` | ``None``
                 Current iteration number
+            *h*: {``None``} | :class:`str`
+                Content hash from :func:`GetCaseSubfigHash`
         :Outputs:
             *q*: ``True`` | ``False``
                 Whether or not to update the subfigure
         :Versions:
             * 2016-10-25 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Added *h*
         """
         # Get the status options
         stsr = rc.get("Status", {})
@@ -1181,6 +1420,9 @@ class Report(object):
             # New subfigure
             print("  %s: New subfig at iteration %s" % (sfig, n))
             return True
+        # Check for unchanged content
+        if self.CheckSubfigHash(sfig, rc, h):
+            return False
         # Get the iteration status
         nr = stsr.get(sfig)
         # Check the iteration
@@ -1289,6 +1531,7 @@ class Report(object):
         :Versions:
             * 2015-05-29 ``@ddalle``: First version
             * 2016-10-25 ``@ddalle``: Passed handling to *SweepSubfigSwitch*
+            * 2026-10-18 ``@ddalle``: Added content hashes
         """
         # Get list of subfigures.
         sfigs = self.cntl.opts.get_FigSubfigList(fig)
@@ -1313,8 +1556,10 @@ class Report(object):
             fruns = DBc.x.GetFullFolderNames(J)
             # Get current iteration number
             nIter = list(DBc['nIter'][J])
+            # Get content hash
+            h = self.GetSweepSubfigHash(sfig, fruns, DBc, J)
             # Check the status (also prints status update)
-            q = self.CheckSweepSubfigStatus(sfig, rc, fruns, nIter)
+            q = self.CheckSweepSubfigStatus(sfig, rc, fruns, nIter, h)
             # Process the subfigure
             lines = self.SweepSubfigSwitch(sfig, fswp, I, lines, q)
             # Save the status
@@ -1324,6 +1569,7 @@ class Report(object):
             }
             # Save the definition
             rc["Subfigures"][sfig] = self.cntl.opts.get_SubfigCascade(sfig)
+            rc["Hashes"][sfig] = h
         # Write the new settings
         self.WriteCaseJSON(rc)
         # Output
@@ -1354,10 +1600,10 @@ class Report(object):
             return self.cntl.DataBook.GetRefComponent()
         elif type(comp).__name__ in ["list", "ndarray"]:
             # List... use the first component in list
-            return self.ReadDBComp(comp[0])
+            return self.GetDBComp(comp[0])
         else:
             # Use single component
-            return self.ReadDBComp(comp)
+            return self.GetDBComp(comp)
 
     # Point to the correct subfigure updater
     def SweepSubfigSwitch(self, sfig, fswp, I, lines, q):
@@ -1417,16 +1663,14 @@ class Report(object):
         return lines
 
     # Check status of a subfigure and give status update
-    def CheckSweepSubfigStatus(self, sfig, rc, fruns, nIter):
+    def CheckSweepSubfigStatus(self, sfig, rc, fruns, nIter, h=None):
         """Check whether or not to update a subfigure and print status
 
         :Call:
-            >>> q = R.CheckSweepSubfigStatus(sfig, I, rc, fruns, nIter)
+            >>> q = R.CheckSweepSubfigStatus(sfig, rc, fruns, nIter, h)
         :Inputs:
             *R*: :class:`cape.cfdx.report.Report`
                 Automated report interface
-            *I*: :class:`list`\ [:class:`int`]
-                List of case indices
             *sfig*: :class:`str`
                 Name of subfigure to check
             *rc*: :class:`dict`
@@ -1435,11 +1679,14 @@ class Report(object):
                 List of cases in the sweep
             *nIter*: :class:`list`\ [:class:`int`]
                 List of iterations for each case
+            *h*: {``None``} | :class:`str`
+                Content hash from :func:`GetSweepSubfigHash`
         :Outputs:
             *q*: ``True`` | ``False``
                 Whether or not to update the subfigure
         :Versions:
             * 2016-10-25 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Added *h*
         """
         # Get the status options
         stsr = rc.get("Status", {})
@@ -1448,6 +1695,9 @@ class Report(object):
             # New subfigure
             print("  %s: New subfig" % sfig)
             return True
+        # Check for unchanged content
+        if self.CheckSubfigHash(sfig, rc, h):
+            return False
         # Get the iteration status
         stsf = stsr.get(sfig)
         # Get the list of cases and current iterations
@@ -2598,7 +2848,7 @@ class Report(object):
             for comp in comps:
                 # Component label
                 # Read the Aero history.
-                FM = self.ReadCaseFM(comp)
+                FM = self.GetCaseFM(comp)
                 # Check for trivial
                 if FM.i.size == 0:
                     # Warning
@@ -2927,7 +3177,7 @@ class Report(object):
             os.chdir(self.cntl.RootDir)
             os.chdir(frun)
             # Read the Aero history.
-            FM = self.ReadCaseFM(comp)
+            FM = self.GetCaseFM(comp)
             # Check for missing history
             if not hasattr(FM, "i") or FM.i.size == 0:
                 raise AttributeError(
@@ -3072,7 +3322,7 @@ class Report(object):
             # Try to read the line loads
             try:
                 # Read line loads
-                self.ReadLineLoad(comp, i, targ=targ, update=False)
+                self.GetLineLoad(comp, i, targ=targ, update=False)
                 # If read successfully, duplicate data book target
                 targ_types[targ] = 'cape'
             except Exception:
@@ -3136,7 +3386,7 @@ class Report(object):
             # Auto-update flag
             q_auto = opts.get_SubfigOpt(sfig, "AutoUpdate", k)
             # Read the line load data book and read case *i* if possible
-            LL = self.ReadLineLoad(comp, i, update=True)
+            LL = self.GetLineLoad(comp, i, update=True)
             # Check for case
             if LL is None:
                 continue
@@ -3193,7 +3443,7 @@ class Report(object):
                 # Check for generic target
                 if targ_types[targ] != 'cape': continue
                 # Read the line load data book and read case *i* if possible
-                LLT = self.ReadLineLoad(comp, i, targ=targ, update=False)
+                LLT = self.GetLineLoad(comp, i, targ=targ, update=False)
                 # Check for a find.
                 if LLT is None: continue
                 # Get target plot label.
@@ -3292,7 +3542,7 @@ class Report(object):
        # Plotting
        # ---------
         # # Read the data book component
-        # DBc = self.ReadDBComp(comp)
+        # DBc = self.GetDBComp(comp)
         # # Sweep constraints
         # EqCons = opts.get_SweepOpt(fswp, 'EqCons')
         # TolCons = opts.get_SweepOpt(fswp, 'TolCons')
@@ -3311,7 +3561,7 @@ class Report(object):
             # Auto-update flag
             q_auto = opts.get_SubfigOpt(sfig, "AutoUpdate", k)
             # Read the line load data book and read case *i* if possible
-            LL = self.ReadLineLoad(comp, i, update=q_auto)
+            LL = self.GetLineLoad(comp, i, update=q_auto)
             # Check for case
             if LL is None: continue
             # Get figure dimensions.
@@ -3538,7 +3788,7 @@ class Report(object):
                 compo = comp
                 patch = None
             # Read the component
-            DBc = self.ReadDBComp(comp)
+            DBc = self.GetDBComp(comp)
             # Get matches
             Jj = DBc.FindCoSweep(x, J[j][0], EqCons, TolCons, GlobCons)
             # Plot label (for legend)
@@ -3597,7 +3847,7 @@ class Report(object):
             # Loop through targets
             for targ in targs:
                 # Get the target handle.
-                DBTc = self.ReadDBComp(comp, targ=targ)
+                DBTc = self.GetDBComp(comp, targ=targ)
                 # Exit if not found
                 if DBTc is None:
                     print(
@@ -3919,7 +4169,7 @@ class Report(object):
             compo = comp
             patch = None
         # Read the component
-        DBc = self.ReadDBComp(comp)
+        DBc = self.GetDBComp(comp)
         # Get the targets
         targs = self.SubfigTargets(sfig)
         # Number of targets
@@ -3938,7 +4188,7 @@ class Report(object):
                 # Select the target
                 targ = targs[i]
                 # Get the target handle.
-                DBT = self.ReadDBComp(comp, targ=targ)
+                DBT = self.GetDBComp(comp, targ=targ)
                 # Get the target co-sweep
                 jt = DBc.FindTargetMatch(DBT, I[0], {}, keylist="tol")
                 # Check for match
@@ -3955,7 +4205,7 @@ class Report(object):
                 ("without one or more target (received %s)" % ntarg))
         else:
             # Read the target
-            DBT = [self.ReadDBComp(comp, targ=targ) for targ in targs]
+            DBT = [self.GetDBComp(comp, targ=targ) for targ in targs]
         # Form and set universal options for histogram
         kw_h = {
             # Reference values
@@ -4122,7 +4372,7 @@ class Report(object):
        # Plotting
        # --------
         # Read the data book component
-        DBc = self.ReadDBComp(comp)
+        DBc = self.GetDBComp(comp)
         # Sweep constraints
         EqCons = opts.get_SweepOpt(fswp, 'EqCons')
         TolCons = opts.get_SweepOpt(fswp, 'TolCons')
@@ -4330,7 +4580,7 @@ class Report(object):
             figw = opts.get_SubfigOpt(sfig, "FigWidth")
             figh = opts.get_SubfigOpt(sfig, "FigHeight")
             # Read the Aero history.
-            H = self.ReadCaseResid(sfig)
+            H = self.GetCaseResid(sfig)
             # Options dictionary
             kw_n = {
                 "nFirst": nPlotFirst, "nLast": nPlotLast,
@@ -4692,7 +4942,9 @@ class Report(object):
                     # First read the first line of the layout to get plt name
                     fplt =  tec.ReadKey(1)[1].strip("'\'\"")
                     # Now we have to read the plt file to get field map
-                    tecplt = plt.Plt(fplt)
+                    tecplt = plt.Plt()
+                    # Only the zone headers are needed
+                    tecplt.ReadIndex(fplt)
                     # Append last zone to
                     fieldmaps.append(tecplt.nZone)
                     # Parse slices, just adds the n+1 zone
@@ -5074,6 +5326,217 @@ class Report(object):
             tec.EditColorMap(cname, cme, nContour=ncont, nColorMap=ncmap)
   # >
 
+  # ===============
+  # Case Data Cache
+  # ===============
+  # <
+    # Clear cached data for a case
+    def ClearCaseCache(self):
+        r"""Clear iterative histories saved for the current case
+
+        :Call:
+            >>> R.ClearCaseCache()
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        self._case_cache.clear()
+
+    # Get modification status of current folder
+    def _get_case_mtime(self):
+        r"""Get newest modification time and file count of current folder
+
+        :Call:
+            >>> mtime = R._get_case_mtime()
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+        :Outputs:
+            *mtime*: :class:`tuple`\ (:class:`float`, :class:`int`)
+                Latest modification time and number of files
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Initialize with folder itself
+        tmax = os.path.getmtime(".")
+        # List of files
+        fnames = os.listdir(".")
+        # Loop through files
+        for fname in fnames:
+            try:
+                tmax = max(tmax, os.path.getmtime(fname))
+            except OSError:
+                # File removed while checking
+                continue
+        # Output
+        return tmax, len(fnames)
+
+    # Get iterative history, reading only once
+    def GetCaseFM(self, comp):
+        r"""Get iterative history for a component of the current case
+
+        This calls :func:`ReadCaseFM` the first time each component is
+        requested for a case folder and then reuses the result until a
+        file in the folder is modified. If *comp* has any data book
+        transformations, a copy is returned so that the cached version
+        is not transformed more than once.
+
+        :Call:
+            >>> FM = R.GetCaseFM(comp)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *comp*: :class:`str`
+                Name of component to read
+        :Outputs:
+            *FM*: ``None`` or :class:`cape.cfdx.dataBook.CaseFM` derivative
+                Case iterative force & moment history for one component
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Cache key
+        key = ("FM", os.path.realpath(os.getcwd()), comp)
+        # Modification status
+        mtime = self._get_case_mtime()
+        # Check cache
+        v = self._case_cache.get(key)
+        # Read if needed
+        if v is None or v[0] != mtime:
+            v = (mtime, self.ReadCaseFM(comp))
+            self._case_cache[key] = v
+        # Unpack
+        FM = v[1]
+        # Protect cached version from in-place transformations
+        if FM is not None and self.cntl.opts.get_DataBookTransformations(comp):
+            FM = copy.deepcopy(FM)
+        # Output
+        return FM
+
+    # Get residual history, reading only once
+    def GetCaseResid(self, sfig=None):
+        r"""Get iterative residual history for the current case
+
+        This calls :func:`ReadCaseResid` the first time for each case
+        folder (and each value of :func:`GetCaseResidKey`) and then
+        reuses the result until a file in the folder is modified.
+
+        :Call:
+            >>> hist = R.GetCaseResid(sfig=None)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *sfig*: {``None``} | :class:`str`
+                Name of subfigure
+        :Outputs:
+            *hist*: ``None`` | :class:`cape.cfdx.dataBook.CaseResid`
+                Case iterative residual history for one case
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Cache key
+        key = (
+            "Resid", os.path.realpath(os.getcwd()),
+            self.GetCaseResidKey(sfig))
+        # Modification status
+        mtime = self._get_case_mtime()
+        # Check cache
+        v = self._case_cache.get(key)
+        # Read if needed
+        if v is None or v[0] != mtime:
+            v = (mtime, self.ReadCaseResid(sfig))
+            self._case_cache[key] = v
+        # Output
+        return v[1]
+
+    # Get the part of a residual subfigure definition that affects reads
+    def GetCaseResidKey(self, sfig=None):
+        r"""Get key for subfigure options that affect residual reads
+
+        Residual histories are shared by all subfigures that have the
+        same key. This function needs to be customized for solvers whose
+        :func:`ReadCaseResid` depends on *sfig*.
+
+        :Call:
+            >>> key = R.GetCaseResidKey(sfig=None)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *sfig*: {``None``} | :class:`str`
+                Name of subfigure
+        :Outputs:
+            *key*: ``None`` | :class:`tuple`
+                Hashable description of which residuals are read
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        return None
+
+    # Get data book component, reading only once
+    def GetDBComp(self, comp, targ=None):
+        r"""Get a data book component, using :func:`ReadDBComp` once
+
+        :Call:
+            >>> DBc = R.GetDBComp(comp, targ=None)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *comp*: :class:`str`
+                Name of data book component
+            *targ*: {``None``} | :class:`str`
+                Name of target, if any
+        :Outputs:
+            *DBc*: ``None`` | :class:`cape.cfdx.dataBook.DBBase`
+                Individual component data book or ``None`` if not found
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Make sure the data book is present
+        self.ReadDataBook()
+        # Handle to data book; reread if source changes
+        DB = self.cntl.DataBook
+        # Cache key
+        key = ("DBComp", id(DB), DB.source, comp, targ)
+        # Read if necessary
+        if key not in self._db_cache:
+            self._db_cache[key] = self.ReadDBComp(comp, targ=targ)
+        # Output
+        return self._db_cache[key]
+
+    # Get line load for a case, reading only once
+    def GetLineLoad(self, comp, i, targ=None, update=False):
+        r"""Get line load for a case, using :func:`ReadLineLoad` once
+
+        :Call:
+            >>> LL = R.GetLineLoad(comp, i, targ=None, update=False)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *comp*: :class:`str`
+                Name of line load component
+            *i*: :class:`int`
+                Case number
+            *targ*: {``None``} | :class:`str`
+                Name of target data book to read, if not ``None``
+            *update*: ``True`` | {``False``}
+                Whether or not to attempt an update if case not in data book
+        :Outputs:
+            *LL*: :class:`cape.cfdx.lineLoad.CaseLL`
+                Individual case line load interface
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Cache key
+        key = ("LineLoad", comp, i, targ)
+        # Read if necessary (always if updating)
+        if update or key not in self._db_cache:
+            self._db_cache[key] = self.ReadLineLoad(
+                comp, i, targ=targ, update=update)
+        # Output
+        return self._db_cache[key]
+  # >
+
   # ============
   # Data Loaders
   # ============
@@ -5507,7 +5970,8 @@ class Report(object):
             # Default output
             return {
                 "Status": {},
-                "Subfigures": {}
+                "Subfigures": {},
+                "Hashes": {},
             }
         # Open the file
         f = open('report.json')
@@ -5523,6 +5987,7 @@ class Report(object):
         # Ensure the existence of main sections
         rc.setdefault("Status", {})
         rc.setdefault("Subfigures", {})
+        rc.setdefault("Hashes", {})
         # Return the settings
         return rc
 
@@ -5548,6 +6013,241 @@ class Report(object):
         f.close()
   # >
 
+  # ===============
+  # Subfigure Cache
+  # ===============
+  # <
+    # Get hash of subfigure definition, data, and style
+    def GetSubfigHash(self, sfig, *data):
+        r"""Get a content hash for a subfigure
+
+        The hash combines the full subfigure definition (including
+        templates), the image style options (*Format* and *DPI*), and
+        any data that is used to draw the subfigure. If it matches the
+        hash saved the last time the subfigure was made, the existing
+        image can be reused.
+
+        :Call:
+            >>> h = R.GetSubfigHash(sfig, *data)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *sfig*: :class:`str`
+                Name of subfigure
+            *data*: :class:`tuple`
+                Arrays or other JSON-compatible data drawn in *sfig*
+        :Outputs:
+            *h*: :class:`str`
+                SHA-1 hex digest
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Options interface
+        opts = self.cntl.opts
+        # Initialize hash
+        h = hashlib.sha1()
+        # Subfigure definition
+        _update_hash(h, opts.get_SubfigCascade(sfig))
+        # Style
+        _update_hash(h, [
+            opts.get_SubfigOpt(sfig, "Format"),
+            opts.get_SubfigOpt(sfig, "DPI")])
+        # Data
+        for v in data:
+            _update_hash(h, v)
+        # Output
+        return h.hexdigest()
+
+    # Get hash for a case subfigure
+    def GetCaseSubfigHash(self, sfig, i, n):
+        r"""Get a content hash for a case subfigure
+
+        For subfigures that only show run matrix conditions, the
+        iteration number is not part of the hash, so these are not
+        redrawn just because the case has run further.
+
+        :Call:
+            >>> h = R.GetCaseSubfigHash(sfig, i, n)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *sfig*: :class:`str`
+                Name of subfigure
+            *i*: :class:`int`
+                Case index
+            *n*: :class:`int` | ``None``
+                Current iteration number
+        :Outputs:
+            *h*: :class:`str`
+                SHA-1 hex digest
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Run matrix interface
+        x = self.cntl.x
+        # Conditions for this case
+        v = [str(x[k][i]) for k in x.cols]
+        # Get the base type
+        btyp = self.cntl.opts.get_SubfigBaseType(sfig)
+        # Check for iteration dependence
+        if btyp in ITER_INDEPENDENT_SUBFIG_TYPES:
+            return self.GetSubfigHash(sfig, v)
+        else:
+            return self.GetSubfigHash(sfig, v, n)
+
+    # Get hash for a sweep subfigure
+    def GetSweepSubfigHash(self, sfig, fruns, DBc, J):
+        r"""Get a content hash for a sweep subfigure
+
+        The data part of the hash is the list of cases, the values of
+        each column of each data book component of the subfigure for
+        those cases, and all data of each target of the subfigure.
+        Updating other cases in the data book does not change it.
+
+        :Call:
+            >>> h = R.GetSweepSubfigHash(sfig, fruns, DBc, J)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *sfig*: :class:`str`
+                Name of subfigure
+            *fruns*: :class:`list`\ [:class:`str`]
+                List of cases in the co-sweep
+            *DBc*: :class:`cape.cfdx.dataBook.DBBase`
+                Reference data book component
+            *J*: :class:`np.ndarray`\ [:class:`int`]
+                Indices of co-sweep cases in *DBc*
+        :Outputs:
+            *h*: :class:`str`
+                SHA-1 hex digest
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 1.1; all comps and targets
+        """
+        # Values of each column at the co-sweep cases
+        V = self._get_hash_cols(DBc, J)
+        # Get the list of components
+        comps = self.cntl.opts.get_SubfigOpt(sfig, "Component")
+        # Check type
+        if comps is None:
+            # Only reference component
+            comps = []
+        elif not isinstance(comps, (list, np.ndarray)):
+            # Single component
+            comps = [comps]
+        # Get list of targets
+        targs = self.SubfigTargets(sfig)
+        # Data books already included
+        dbids = {id(DBc)}
+        # Loop through components
+        for comp in comps:
+            # Get component
+            DBk = self.GetDBComp(comp)
+            # Check for new component
+            if DBk is not None and id(DBk) not in dbids:
+                # Match up trajectory
+                DBk.UpdateRunMatrix()
+                # Indices of each case
+                kfrun = {
+                    frun: k
+                    for k, frun in enumerate(DBk.x.GetFullFolderNames())
+                }
+                # Indices of co-sweep cases in *DBk*
+                Jk = np.array(
+                    [kfrun[frun] for frun in fruns if frun in kfrun],
+                    dtype="int")
+                # Values of each column at those cases
+                V.append(comp)
+                V.extend(self._get_hash_cols(DBk, Jk))
+                dbids.add(id(DBk))
+            # Loop through targets
+            for targ in targs:
+                # Get the target handle
+                DBTc = self.GetDBComp(comp, targ=targ)
+                # Check for new target
+                if DBTc is None or id(DBTc) in dbids:
+                    continue
+                # Values of all target data
+                V.append(targ)
+                V.extend(self._get_hash_cols(DBTc))
+                dbids.add(id(DBTc))
+        # Calculate hash
+        return self.GetSubfigHash(sfig, fruns, *V)
+
+    # Get columns of a data book for content hash
+    def _get_hash_cols(self, DBc, J=None):
+        r"""Get the values of each data column of a data book
+
+        :Call:
+            >>> V = R._get_hash_cols(DBc, J=None)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *DBc*: :class:`cape.cfdx.dataBook.DBBase`
+                Data book component or target
+            *J*: {``None``} | :class:`np.ndarray`\ [:class:`int`]
+                Indices of cases to include; default is all
+        :Outputs:
+            *V*: :class:`list`\ [:class:`np.ndarray`]
+                Values of each 1D column, sliced by *J*
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Values of each column
+        V = []
+        for col in getattr(DBc, "cols", []):
+            # Get values
+            v = DBc.get(col)
+            # Skip anything that isn't a column
+            if not isinstance(v, np.ndarray) or v.ndim != 1:
+                continue
+            # Save slice
+            V.append(v if J is None else v[J])
+        # Output
+        return V
+
+    # Check if subfigure is unchanged
+    def CheckSubfigHash(self, sfig, rc, h):
+        r"""Check if a subfigure's content hash matches previous version
+
+        :Call:
+            >>> q = R.CheckSubfigHash(sfig, rc, h)
+        :Inputs:
+            *R*: :class:`cape.cfdx.report.Report`
+                Automated report interface
+            *sfig*: :class:`str`
+                Name of subfigure
+            *rc*: :class:`dict`
+                Dictionary from ``report.json``
+            *h*: ``None`` | :class:`str`
+                Current content hash
+        :Outputs:
+            *q*: ``True`` | ``False``
+                Whether previous subfigure can be reused as-is
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Check for forced update or no hash
+        if self.force_update or h is None:
+            return False
+        # Compare to previous hash
+        if h != rc.get("Hashes", {}).get(sfig):
+            return False
+        # Previous LaTeX lines for this subfigure
+        lines = getattr(self, "subfigs", {}).get(sfig)
+        # Must have previous lines
+        if not lines:
+            return False
+        # Check for images
+        if any("includegraphics" in line for line in lines):
+            # Make sure an image file for this subfigure is present
+            if len(glob.glob("%s.*" % sfig)) == 0:
+                return False
+        # Reuse the previous subfigure
+        print("  %s: Unchanged" % sfig)
+        return True
+  # >
+
   # =============
   # Sweep Indices
   # =============
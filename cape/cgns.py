@@ -12,11 +12,59 @@ the data from each node, and constructs a sub-node table.
 In order to create a triangulation interface from a CGNS file, see
 :class:`cape.tri.Tri`, and use the *cgns* keyword argument.
 
+The node headers and sub-node tables are scanned when the file is
+opened, but the data arrays themselves are not read at that time.
+Instead, the location and type of each node's *DaTa* field is recorded,
+and the data is only read (from a memory map of the file) when it is
+accessed through :attr:`CGNS.Data` or :func:`CGNS.GetNodeData`. For
+numeric data in the native byte order, the returned arrays are views
+into that memory map, so no copy is made.
+
 """
 
 # Required modules
 import numpy as np
 
+
+# Data types for each ADF two-char code
+ADF_DTYPES = {
+    "I4": "i4",
+    "I8": "i8",
+    "U4": "u4",
+    "U8": "u8",
+    "R4": "f4",
+    "R8": "f8",
+    "X4": "c8",
+    "X8": "c16",
+}
+
+# Native byte order character
+if np.little_endian:
+    NATIVE_BYTEORDER = "<"
+else:
+    NATIVE_BYTEORDER = ">"
+
+
+# Read a fixed-width string from a binary file
+def _readstr(f, n):
+    r"""Read *n* bytes from a binary file and decode to :class:`str`
+
+    :Call:
+        >>> s = _readstr(f, n)
+    :Inputs:
+        *f*: :class:`file`
+            File open for binary reading
+        *n*: :class:`int`
+            Number of bytes to read
+    :Outputs:
+        *s*: :class:`str`
+            Decoded string
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    return f.read(n).decode("ascii", "replace")
+
+
 # Convert a 12-byte ADF string into and address
 def ADFAddress2Pos(addr):
     r"""Convert ADF 12-byte code into position index
@@ -34,8 +82,67 @@ def ADFAddress2Pos(addr):
     :Versions:
         * 2018-03-02 ``@ddalle``: Version 1.0
     """
-    # Use '0x' to signify hex and convert to integer
-    return eval('0x' + addr[:8] + addr[9:])
+    # Convert bytes to string
+    if isinstance(addr, bytes):
+        addr = addr.decode("ascii")
+    # Skip the 9th character and convert hex code to integer
+    return int(addr[:8] + addr[9:], 16)
+
+
+# Lazy list of node data
+class CGNSNodeData(object):
+    r"""Lazy list of data for each node of a CGNS file
+
+    Each entry is read from the memory-mapped file the first time it is
+    requested and then cached.
+
+    :Call:
+        >>> data = CGNSNodeData(cgns)
+    :Inputs:
+        *cgns*: :class:`cape.cgns.CGNS`
+            CGNS file interface
+    :Outputs:
+        *data*: :class:`CGNSNodeData`
+            Lazy sequence; ``data[k]`` is the same as
+            ``cgns.GetNodeData(k)``
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Initialization method
+    def __init__(self, cgns):
+        r"""Initialization method
+
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        self.cgns = cgns
+
+    # Number of nodes
+    def __len__(self):
+        return self.cgns.nNode
+
+    # Get data for one node
+    def __getitem__(self, k):
+        r"""Read data for node *k*
+
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Allow single-entry index arrays from GetNodeIndex()
+        if isinstance(k, np.ndarray):
+            # Check size
+            if k.size != 1:
+                raise IndexError(
+                    "CGNS node data requires one index; got %i" % k.size)
+            # Convert to scalar
+            k = k.flat[0]
+        # Read it
+        return self.cgns.GetNodeData(int(k))
+
+    # Iterate through all nodes
+    def __iter__(self):
+        for k in range(self.cgns.nNode):
+            yield self.cgns.GetNodeData(k)
 
 
 # CGNS class
@@ -60,12 +167,15 @@ class CGNS(object):
             File position of the beginning of each node
         *cgns.DataTypes*: :class:`list` (:class:`str`)
             Data type for each node
-        *cgns.Data*: :class:`list`\ [:class:`np.ndarray` | :class:`str`]
-            Data set for each node
+        *cgns.DataPos*: :class:`list`\ [``None`` | :class:`tuple`]
+            Start position and byte count of each node's data
+        *cgns.Data*: :class:`CGNSNodeData`
+            Lazy sequence of data set for each node
         *cgns.SubNodeTables*: :class:`list`\ [:class:`list` | ``None``]
             List of any child nodes for each node
     :Versions:
         * 2018-03-02 ``@ddalle``: Version 1.0
+        * 2026-10-18 ``@ddalle``: Version 2.0; lazy mmap data reads
     """
   # ========
   # Config
@@ -77,6 +187,7 @@ class CGNS(object):
 
         :Versions:
             * 2018-03-02 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 2.0; lazy data
         """
         # Open the file for binary reading
         try:
@@ -92,7 +203,18 @@ class CGNS(object):
         self.NodeAddresses = []
         self.SubNodeTables = []
         self.DataTypes = []
-        self.Data = []
+        self.DataPos = []
+        # Lazy data interface and cache of data already read
+        self.Data = CGNSNodeData(self)
+        self._data = {}
+        # Memory map (created on first data read)
+        self._mmap = None
+        # Byte order of numeric data
+        self.byteorder = "<"
+        # Index of nodes by name, label, and address
+        self._name_index = {}
+        self._label_index = {}
+        self._addr_index = {}
         # Node count
         self.nNode = 0
 
@@ -151,12 +273,13 @@ class CGNS(object):
                 Open file currently at the beginning of *NoDe* field
         :Versions:
             * 2018-03-02 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 1.1; build node indices
         """
        # --- Header ---
         # Go to beginning of file, but skip first four characters
         f.seek(4)
         # Read next 28 chars, should be database version
-        s = f.read(28)
+        s = _readstr(f, 28)
         # Check for error
         if not s.startswith("ADF"):
             raise ValueError("File is not in ADF format")
@@ -166,20 +289,25 @@ class CGNS(object):
             # Header read counter
             ih += 1
             # Read the next four characters
-            s = f.read(4).lower()
+            s = _readstr(f, 4).lower()
             # Check against known list
             if s == "fcte":
                 # End; start data
                 break
             elif s == "adf0":
                 # Read date
-                self.date = f.read(28).rstrip()
+                self.date = _readstr(f, 28).rstrip()
             elif s == "adf1":
                 # This is also date
-                self.date = f.read(28).rstrip()
+                self.date = _readstr(f, 28).rstrip()
             elif s == "adf2":
-                # This is the characters "LB"
-                f.seek(2, 1)
+                # Machine format, e.g. "LB"; first char is byte order
+                fmt = _readstr(f, 2)
+                # Save byte order for numeric data
+                if fmt.upper().startswith("B"):
+                    self.byteorder = ">"
+                else:
+                    self.byteorder = "<"
             elif s == "adf3":
                 # This is some sort of 24-byte code
                 f.seek(24, 1)
@@ -237,6 +365,9 @@ class CGNS(object):
     def ReadADFNode(self, f):
         r"""Read a (new) node from an open CGNS/ADF file
 
+        The *DaTa* field of the node is skipped; only its location is
+        saved to *cgns.DataPos*.
+
         :Call:
             >>> cgns.ReadADFNode(f)
         :Inputs:
@@ -246,30 +377,31 @@ class CGNS(object):
                 Open file currently at the beginning of *NoDe* field
         :Versions:
             * 2018-03-02 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 2.0; skip data, add index
         """
         # Save current location to store if valid node
         ia = f.tell()
         # Read the next four bytes
-        s = f.read(4)
+        s = _readstr(f, 4)
         # Check for error
         if s.lower() != "node":
             return 0
         # Read the node name
-        NodeName  = f.read(32).rstrip()
-        NodeLabel = f.read(32).rstrip()
+        NodeName  = _readstr(f, 32).rstrip()
+        NodeLabel = _readstr(f, 32).rstrip()
         # Ignore next 16 bytes (no idea... mostly zeros)
         f.seek(16, 1)
         # Read the address of the end except for data (I guess?)
         # It seems to get you to 'DaTa' or be an invalid address...
         ib = ADFAddress2Pos(f.read(12))
         # Read data format
-        DataType = f.read(2)
+        DataType = _readstr(f, 2)
         # Skip the next 108 bytes of nonsense
         f.seek(132, 1)
         # Here's another address, which seems to get you to 'TaiL'
         ic = ADFAddress2Pos(f.read(12))
         # Read the next four characters, which should hopefully be 'TaiL'
-        s = f.read(4)
+        s = _readstr(f, 4)
         # Check
         if s.lower() != "tail":
             return
@@ -277,17 +409,23 @@ class CGNS(object):
         self.ReadADFFree(f)
         # Read SubNodeTable (if any)
         sntb = self.ReadADFSubNodeTable(f)
-        # Read Data (if any)
-        data = self.ReadADFData(f, DataType)
+        # Locate Data (if any)
+        pos = self.ReadADFDataPos(f, DataType)
         # Any "zzzzzzzzz" nonsense?
         self.ReadADFZs(f)
+        # Node index
+        k = self.nNode
         # Save node information
         self.NodeNames.append(NodeName)
         self.NodeLabels.append(NodeLabel)
         self.NodeAddresses.append(ia)
         self.DataTypes.append(DataType)
         self.SubNodeTables.append(sntb)
-        self.Data.append(data)
+        self.DataPos.append(pos)
+        # Update indices
+        self._name_index.setdefault(NodeName, []).append(k)
+        self._label_index.setdefault(NodeLabel, []).append(k)
+        self._addr_index[ia] = k
         # Node count
         self.nNode += 1
         # Output successful read
@@ -310,15 +448,46 @@ class CGNS(object):
         # Read the next four bytes
         s = f.read(4)
         # Deal with "z"s (I have no idea WTF this is about)
-        if s == "zzzz":
+        if s == b"zzzz":
             # Read until the next character is NOT a "z"
-            while f.read(1) == "z":
+            while f.read(1) == b"z":
                 continue
             # Go back one character
             f.seek(-1, 1)
         else:
             # Go back to original position by seeking backward 4 chars
-            f.seek(-4, 1)
+            f.seek(-len(s), 1)
+
+    # Read the next four-character field code
+    def _read_adf_code(self, f):
+        r"""Read the next field code, skipping any "zzzz" padding
+
+        :Call:
+            >>> s = cgns._read_adf_code(f)
+        :Inputs:
+            *cgns*: :class:`cape.cgns.CGNS`
+                CGNS file interface
+            *f*: :class:`file`
+                Open file
+        :Outputs:
+            *s*: :class:`str`
+                Next four characters (fewer at EOF)
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Read the next four bytes
+        s = f.read(4)
+        # Deal with "z"s (I have no idea WTF this is about)
+        if s == b"zzzz":
+            # Read until the next character is NOT a "z"
+            while f.read(1) == b"z":
+                continue
+            # Go back one character
+            f.seek(-1, 1)
+            # Reread next four characters
+            s = f.read(4)
+        # Output
+        return s.decode("ascii", "replace")
 
     # Read annoying "FreE" block
     def ReadADFFree(self, f):
@@ -338,19 +507,8 @@ class CGNS(object):
         :Versions:
             * 2018-03-05 ``@ddalle``: Version 1.0
         """
-        # Save current location
-        ja = f.tell()
         # Read the next four bytes
-        s = f.read(4)
-        # Deal with "z"s (I have no idea WTF this is about)
-        if s == "zzzz":
-            # Read until the next character is NOT a "z"
-            while f.read(1) == "z":
-                continue
-            # Go back one character
-            f.seek(-1, 1)
-            # Reread next four characters
-            s = f.read(4)
+        s = self._read_adf_code(f)
         # Check for error
         if len(s) < 4:
             # EOF
@@ -364,7 +522,7 @@ class CGNS(object):
         # Go to that position
         f.seek(jb)
         # Read the tail
-        s = f.read(4)
+        s = _readstr(f, 4)
         # Check the correct end-of-subnodetable
         if s.lower() != "endc":
             raise ValueError("FreE field must end with string 'EndC'; " +
@@ -391,19 +549,8 @@ class CGNS(object):
         :Versions:
             * 2018-03-02 ``@ddalle``: Version 1.0
         """
-        # Save current location
-        ja = f.tell()
         # Read the next four bytes
-        s = f.read(4)
-        # Deal with "z"s (I have no idea WTF this is about)
-        if s == "zzzz":
-            # Read until the next character is NOT a "z"
-            while f.read(1) == "z":
-                continue
-            # Go back one character
-            f.seek(-1, 1)
-            # Reread next four characters
-            s = f.read(4)
+        s = self._read_adf_code(f)
         # Check for error
         if len(s) < 4:
             # EOF
@@ -419,7 +566,7 @@ class CGNS(object):
         # Loop until reaching *jb*
         while f.tell() < jb:
             # Read node name and address
-            SubZone = f.read(32).rstrip()
+            SubZone = _readstr(f, 32).rstrip()
             SubAddr = ADFAddress2Pos(f.read(12))
             # Check for "unused" subnode
             if SubZone.startswith("unused entry"):
@@ -427,7 +574,7 @@ class CGNS(object):
             # Save
             sntb.append([SubZone, SubAddr])
         # Read the tail
-        s = f.read(4)
+        s = _readstr(f, 4)
         # Check the correct end-of-subnodetable
         if s.lower() != "snte":
             raise ValueError("Data field must end with string 'snTE'; " +
@@ -435,16 +582,16 @@ class CGNS(object):
         # Output
         return sntb
 
-    # Read data
-    def ReadADFData(self, f, dt):
-        r"""Read one *DaTa* entry from an open CGNS/ADF file
+    # Locate data
+    def ReadADFDataPos(self, f, dt):
+        r"""Locate one *DaTa* entry from an open CGNS/ADF file
 
         The next four bytes must be the string ``"DaTa"``, and the
         following 12 bytes must give the address of the end of the field
-        as a hex code string.
+        as a hex code string. The data itself is skipped.
 
         :Call:
-            >>> data = cgns.ReadADFData(f, dt)
+            >>> pos = cgns.ReadADFDataPos(f, dt)
         :Inputs:
             *cgns*: :class:`cape.cgns.CGNS`
                 CGNS file interface
@@ -453,22 +600,13 @@ class CGNS(object):
             *dt*: ``"MT"`` | ``"C1"`` | ``"I4"`` | ``"R4"`` | ``"R8"``
                 Data type, two-digit code
         :Outputs:
-            *data*: :class:`np.ndarray` | :class:`str`
-                Data read from file
+            *pos*: ``None`` | (:class:`int`, :class:`int`)
+                Position of start of data and number of bytes
         :Versions:
-            * 2018-03-02 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 1.0
         """
         # Read the next four bytes
-        s = f.read(4)
-        # Deal with "z"s (I have no idea WTF this is about)
-        if s == "zzzz":
-            # Read until the next character is NOT a "z"
-            while f.read(1) == "z":
-                continue
-            # Go back one character
-            f.seek(-1, 1)
-            # Reread next four characters
-            s = f.read(4)
+        s = self._read_adf_code(f)
         # Check for error
         if len(s) < 4:
             # EOF
@@ -477,63 +615,182 @@ class CGNS(object):
             # Some other field...
             f.seek(-4, 1)
             return
+        # Check data type
+        if dt not in ADF_DTYPES and dt not in ("MT", "C1"):
+            raise ValueError("Unrecognized data type '%s'" % dt)
         # Read the next 12 bytes to get the address of the end of the field
         addr = f.read(12)
         # Get current address
         ja = f.tell()
         # Convert end address to a hex
         jb = ADFAddress2Pos(addr)
-        # Number of bytes
-        nb = jb - ja
-        # Read the data
-        if dt == "MT":
-            # No data
-            data = None
-            f.seek(jb)
-        elif dt == "C1":
-            # String
-            data = f.read(nb)
-        elif dt == "I4":
-            # Regular integer
-            data = np.fromfile(f, dtype="i4", count=nb/4)
-        elif dt == "I8":
-            # Long integer
-            data = np.fromfile(f, dtype="i8", count=nb/8)
-        elif dt == "U4":
-            # Unsigned integer
-            data = np.fromfile(f, dtype="u4", count=nb/4)
-        elif dt == "U8":
-            # Signed integer
-            data = np.fromfile(f, dtype="u8", count=nb/8)
-        elif dt == "R4":
-            # Single-precision real
-            data = np.fromfile(f, dtype="f4", count=nb/4)
-        elif dt == "R8":
-            # Double-precision real
-            data = np.fromfile(f, dtype="f8", count=nb/8)
-        elif dt == "X4":
-            # Single-precision complex
-            data = np.fromfile(f, dtype="f4", count=nb/2)
-            # Convert floats to complex
-            data = data[::2] + 1j*data[1::2]
-        elif dt == "X8":
-            # Double-precision complex
-            data = np.fromfile(f, dtype="f8", count=nb/4)
-            # Convert floats to complex
-            data = data[::2] + 1j*data[1::2]
-        else:
-            raise ValueError("Unrecognized data type '%s'" % dt)
+        # Skip the data
+        f.seek(jb)
         # Read the tail
-        s = f.read(4)
+        s = _readstr(f, 4)
         # Check the correct end-of-data
         if s.lower() != "dend":
             raise ValueError("Data field must end with string 'dEnD'; " +
                 ("file contains '%s'" % s))
         # Output
+        return ja, jb - ja
+
+    # Read data
+    def ReadADFData(self, f, dt):
+        r"""Read one *DaTa* entry from an open CGNS/ADF file
+
+        The next four bytes must be the string ``"DaTa"``, and the
+        following 12 bytes must give the address of the end of the field
+        as a hex code string.
+
+        :Call:
+            >>> data = cgns.ReadADFData(f, dt)
+        :Inputs:
+            *cgns*: :class:`cape.cgns.CGNS`
+                CGNS file interface
+            *f*: :class:`file`
+                Open file currently at the beginning of *DaTa* field
+            *dt*: ``"MT"`` | ``"C1"`` | ``"I4"`` | ``"R4"`` | ``"R8"``
+                Data type, two-digit code
+        :Outputs:
+            *data*: :class:`np.ndarray` | :class:`str`
+                Data read from file
+        :Versions:
+            * 2018-03-02 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 2.0; use ReadADFDataPos()
+        """
+        # Locate the data
+        pos = self.ReadADFDataPos(f, dt)
+        # Check for no data field
+        if pos is None:
+            return
+        # Unpack
+        ja, nb = pos
+        # Save position after "dEnD"
+        jc = f.tell()
+        # Read the data
+        f.seek(ja)
+        data = self._decode_data(f.read(nb), dt)
+        # Make sure the result doesn't depend on a temporary buffer
+        if isinstance(data, np.ndarray):
+            data = data.copy()
+        # Return to end of field
+        f.seek(jc)
+        # Output
+        return data
+
+    # Convert raw bytes to data
+    def _decode_data(self, buf, dt, offset=0, nb=None):
+        r"""Convert raw *DaTa* bytes to a string or array
+
+        :Call:
+            >>> data = cgns._decode_data(buf, dt, offset=0, nb=None)
+        :Inputs:
+            *cgns*: :class:`cape.cgns.CGNS`
+                CGNS file interface
+            *buf*: :class:`bytes` | :class:`np.memmap`
+                Buffer containing data
+            *dt*: :class:`str`
+                Two-char ADF data type code
+            *offset*: {``0``} | :class:`int`
+                Position of first byte of data in *buf*
+            *nb*: {``None``} | :class:`int`
+                Number of bytes (defaults to rest of *buf*)
+        :Outputs:
+            *data*: ``None`` | :class:`np.ndarray` | :class:`str`
+                Data, as view of *buf* if byte order is native
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Default size
+        if nb is None:
+            nb = len(buf) - offset
+        # Check type
+        if dt == "MT":
+            # No data
+            return
+        elif dt == "C1":
+            # String
+            return bytes(buf[offset:offset+nb]).decode("ascii", "replace")
+        # Get data type including byte order
+        dtype = np.dtype(self.byteorder + ADF_DTYPES[dt])
+        # Number of entries
+        n = nb // dtype.itemsize
+        # Read the data w/o copying
+        data = np.frombuffer(buf, dtype=dtype, count=n, offset=offset)
+        # Convert byte order if necessary (makes a copy)
+        if self.byteorder != NATIVE_BYTEORDER:
+            data = data.astype(dtype.newbyteorder("="))
+        # Output
         return data
    # ]
   # >
 
+  # ===============
+  # Node Data
+  # ===============
+  # <
+    # Get data for one node
+    def GetNodeData(self, k):
+        r"""Get data for one node, reading it from file if necessary
+
+        Numeric data is a view into a memory map of the file if the byte
+        order of the file matches the native byte order.
+
+        :Call:
+            >>> data = cgns.GetNodeData(k)
+        :Inputs:
+            *cgns*: :class:`cape.cgns.CGNS`
+                CGNS file interface
+            *k*: :class:`int`
+                Node index (0-based)
+        :Outputs:
+            *data*: ``None`` | :class:`np.ndarray` | :class:`str`
+                Data set for node *k*
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Check cache
+        if k in self._data:
+            return self._data[k]
+        # Get location
+        pos = self.DataPos[k]
+        # Check for no data
+        if pos is None:
+            data = None
+        else:
+            # Unpack
+            ja, nb = pos
+            # Read
+            data = self._decode_data(
+                self.get_mmap(), self.DataTypes[k], ja, nb)
+        # Save
+        self._data[k] = data
+        # Output
+        return data
+
+    # Get memory map
+    def get_mmap(self):
+        r"""Get read-only memory map of the whole file
+
+        :Call:
+            >>> mm = cgns.get_mmap()
+        :Inputs:
+            *cgns*: :class:`cape.cgns.CGNS`
+                CGNS file interface
+        :Outputs:
+            *mm*: :class:`np.memmap`
+                Memory map of file, as bytes
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Create map if needed
+        if self._mmap is None:
+            self._mmap = np.memmap(self.fname, dtype="u1", mode="r")
+        # Output
+        return self._mmap
+  # >
+
   # ===============
   # Node Interface
   # ===============
@@ -561,33 +818,36 @@ class CGNS(object):
                 Node index list
         :Versions:
             * 2018-03-02 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 2.0; use dict indices
         """
         # Process inputs
         if name is not None:
-            # Check type
-            tn = name.__class__.__name__
             # Check string
-            if tn not in ["str", "unicode"]:
+            if not isinstance(name, str):
                 # Pass it on to address
                 addr = name
                 name = None
-        # Initialize
-        M = np.ones(self.nNode, dtype="bool")
+        # Candidate lists from each constraint
+        cands = []
         # Check for name constraint
         if name is not None:
-            # Filter *name*
-            M = np.logical_and(M, self.NodeNames==name)
+            cands.append(self._name_index.get(name, []))
         # Check for label constraint
         if label is not None:
-            # Filter *label*
-            M = np.logical_and(M, self.NodeLabels==label)
+            cands.append(self._label_index.get(label, []))
         # Check for address constraint
         if addr is not None:
-            M = np.logical_and(M, self.NodeAddresses==addr)
-        # Find matches
-        K = np.where(M)[0]
+            k = self._addr_index.get(addr)
+            cands.append([] if k is None else [k])
+        # Check for no constraints
+        if len(cands) == 0:
+            return np.arange(self.nNode)
+        # Intersect candidates
+        K = set(cands[0])
+        for cand in cands[1:]:
+            K.intersection_update(cand)
         # Output
-        return K
+        return np.array(sorted(K), dtype="int")
 
     # Get node by address only
     def GetNodeByAddress(self, addr):
@@ -605,14 +865,15 @@ class CGNS(object):
                 Node index
         :Versions:
             * 2018-03-02 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 1.1; use dict index
         """
         # Find matching address
-        k = np.where(self.NodeAddresses == addr)[0]
+        k = self._addr_index.get(addr)
         # Check for match
-        if len(k) != 1:
+        if k is None:
             raise ValueError("No match for address '%s'" % addr)
         # Output
-        return k[0]
+        return k
 
     # Get *IndexRange_t* node index for a named zone
     def GetCompIDInfo(self, comp):
@@ -114,13 +114,11 @@ def expand_json(*a, **kw):
     if ifile == ofile:
         # Copy original file
         shutil.copy(ifile, ifile + ".old")
-    # Read the file
-    lines = open(ifile).readlines()
     # Strip the comments and expand subfiles
-    lines = expandJSONFile(lines)
+    txt, _, _ = expandJSONFile(ifile)
     # Write to the output file
     with open(ofile, "w") as fp:
-        fp.write(lines)
+        fp.write(txt)
 
 
 # CLI functions
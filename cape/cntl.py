@@ -48,6 +48,7 @@ import numpy as np
 from .cfdx import options
 from .cfdx import queue
 from .cfdx import case
+from .cfdx import monitor
 from . import convert
 from . import console
 from . import argread
@@ -57,9 +58,8 @@ from . import manage
 from .config import ConfigXML, ConfigJSON
 from .runmatrix import RunMatrix
 
-# Import triangulation
+# Geometry utilities
 from .geom import RotatePoints
-from .tri import ReadTriFile
 
 
 # Decorator for moving directories
@@ -517,6 +517,8 @@ class Cntl(object):
             return
         except AttributeError:
             pass
+        # Import triangulation module only when needed (slow to import)
+        from .tri import ReadTriFile
         # Get the list of tri files.
         ftri = self.opts.get_TriFile()
         # Status update.
@@ -533,18 +535,14 @@ class Cntl(object):
         # Ensure list
         if not isinstance(ftri, (list, np.ndarray)):
             ftri = [ftri]
-        # Read first file
-        tri = ReadTriFile(ftri[0])
-        # Apply configuration
-        if cfg is not None:
-            tri.ApplyConfig(cfg)
-        # Initialize number of nodes in each file
-        tri.iTri = [tri.nTri]
-        tri.iQuad = [tri.nQuad]
+        # Read each file
+        tris = []
+        # Surface (1) or non-surface (-1) flag for each file
+        qsurfs = []
         # Loop through files
-        for f in ftri[1:]:
+        for j, f in enumerate(ftri):
             # Check for non-surface tri file
-            if f.startswith('-'):
+            if j > 0 and f.startswith('-'):
                 # Not for writing in "VolTri"; don't intersect it
                 qsurf = -1
                 # Strip leading "-"
@@ -557,11 +555,20 @@ class Cntl(object):
             # Apply configuration
             if cfg is not None:
                 trii.ApplyConfig(cfg)
-            # Append the triangulation
-            tri.Add(trii)
-            # Save the face counts
-            tri.iTri.append(qsurf*tri.nTri)
-            tri.iQuad.append(qsurf*tri.nQuad)
+            # Save it
+            tris.append(trii)
+            qsurfs.append(qsurf)
+        # Combine them all at once
+        if len(tris) == 1:
+            # Just one file
+            tri = tris[0]
+        else:
+            # Preallocate and fill combined triangulation
+            tri = tris[0].__class__.concatenate(tris)
+        # Save the cumulative face counts
+        nTris = np.cumsum([trii.nTri for trii in tris])
+        tri.iTri = [int(qsurf*n) for qsurf, n in zip(qsurfs, nTris)]
+        tri.iQuad = [qsurf*tris[0].nQuad for qsurf in qsurfs]
         # Save the triangulation and config.
         self.tri = tri
         self.tri.config = cfg
@@ -1650,6 +1657,9 @@ class Cntl(object):
                     else:
                         # It's in the queue.
                         sts = "QUEUE"
+                elif self.CheckConverged(i):
+                    # Stopped early by convergence monitor
+                    sts = "DONE"
                 elif j < jLast:
                     # Not enough phases
                     sts = "INCOMP"
@@ -1970,6 +1980,41 @@ class Cntl(object):
         # Output
         return q
 
+    # Check for convergence monitor stop
+    @run_rootdir
+    def CheckConverged(self, i):
+        r"""Check if a case was stopped by the convergence monitor
+
+        :Call:
+            >>> q = cntl.CheckConverged(i)
+        :Inputs:
+            *cntl*: :class:`cape.cntl.Cntl`
+                Overall CAPE control instance
+            *i*: :class:`int`
+                Run index
+        :Outputs:
+            *q*: :class:`bool`
+                If ``True``, case has ``CONVERGED`` file from its last
+                phase and its target iteration has not been raised
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 1.1; last phase only
+        """
+        # Get run name
+        frun = self.x.GetFullFolderNames(i)
+        # Marker file
+        fconv = os.path.join(frun, monitor.CONVERGED_FILE)
+        # Check for the CONVERGED file.
+        if not os.path.isfile(fconv):
+            return False
+        # Read the case's run control options
+        rc = self.ReadCaseJSON(i)
+        # Use global options if missing
+        if rc is None:
+            rc = self.opts
+        # Check phase and target iteration
+        return monitor.CheckConverged(rc, fconv)
+
     # Check for no unchanged files
     @run_rootdir
     def CheckZombie(self, i):
@@ -21,6 +21,8 @@ See also:
 """
 
 # Standard library
+import multiprocessing
+import os
 import re
 
 # Third-party
@@ -49,6 +51,9 @@ FEPOLYHEDRON = 7
 # Other options
 N_AUX_MAX = 100
 
+# Shared grid information for batch conversion workers
+_BATCH_SKELETON = None
+
 
 # Convert a PLT to TRIQ
 def Plt2Triq(fplt, ftriq=None, **kw):
@@ -89,6 +94,115 @@ def Plt2Triq(fplt, ftriq=None, **kw):
     # Write triangulation
     triq.Write(ftriq, **kw)
 
+
+# Convert several PLT files to TRIQ
+def Plt2TriqBatch(fplts, ftriqs=None, nProc=1, cls=None, **kw):
+    r"""Convert several Tecplot PLT files on the same grid to TRIQ files
+
+    The triangles and component IDs are created only once from the
+    first PLT file.  Only the node coordinates and states are extracted
+    from each other file, unless its zone sizes differ from the first
+    file.
+
+    :Call:
+        >>> ftriqs = Plt2TriqBatch(fplts, ftriqs=None, nProc=1, **kw)
+    :Inputs:
+        *fplts*: :class:`list`\ [:class:`str`]
+            Names of Tecplot PLT files
+        *ftriqs*: {``None``} | :class:`list`\ [:class:`str`]
+            Names of output files (default: replace ``.plt`` with
+            ``.triq``)
+        *nProc*: {``1``} | :class:`int`
+            Number of files to convert simultaneously
+        *cls*: {:class:`Plt`} | :class:`type`
+            Tecplot PLT interface class to use for reading
+        *kw*: :class:`dict`
+            Options to :func:`Plt.CreateTriq` and :func:`trifile.Triq.Write`
+    :Outputs:
+        *ftriqs*: :class:`list`\ [:class:`str`]
+            Names of TRIQ files written
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    global _BATCH_SKELETON
+    # Default class
+    if cls is None:
+        cls = Plt
+    # Default output file names
+    if ftriqs is None:
+        ftriqs = [fplt.rstrip('plt').rstrip('dat') + 'triq' for fplt in fplts]
+    # Check for empty list
+    if len(fplts) == 0:
+        return []
+    # Read the first PLT file to create the grid information
+    plt = cls(fplts[0])
+    Tris, CompID = plt.GetTriqSkeleton(**kw)
+    # Save for workers
+    _BATCH_SKELETON = (cls, plt.nPt, plt.nElem, Tris, CompID, kw)
+    # List of jobs
+    jobs = list(zip(fplts, ftriqs))
+    # Number of processes
+    nProc = min(int(nProc or 1), len(jobs))
+    # Get "fork" context; workers need a copy of the grid
+    try:
+        ctx = multiprocessing.get_context("fork")
+    except (AttributeError, ValueError):
+        ctx = None
+    # Check for serial
+    try:
+        if nProc <= 1 or ctx is None:
+            return [_plt2triq_worker(job) for job in jobs]
+        # Create pool of workers
+        pool = ctx.Pool(nProc)
+        try:
+            # Convert files; output is in order of *jobs*
+            return pool.map(_plt2triq_worker, jobs, chunksize=1)
+        finally:
+            # Clean up workers
+            pool.close()
+            pool.join()
+    finally:
+        # Release the grid
+        _BATCH_SKELETON = None
+
+
+# Worker function to convert one PLT file
+def _plt2triq_worker(job):
+    r"""Convert one PLT file using grid from :func:`Plt2TriqBatch`
+
+    :Call:
+        >>> ftriq = _plt2triq_worker((fplt, ftriq))
+    :Inputs:
+        *fplt*: :class:`str`
+            Name of Tecplot PLT file
+        *ftriq*: :class:`str`
+            Name of TRIQ file to write
+    :Outputs:
+        *ftriq*: :class:`str`
+            Name of TRIQ file written
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Unpack job and shared grid
+    fplt, ftriq = job
+    cls, nPt, nElem, Tris, CompID, kw = _BATCH_SKELETON
+    # Read the PLT file
+    plt = cls(fplt)
+    # Check if the zone sizes match
+    if np.array_equal(plt.nPt, nPt) and np.array_equal(plt.nElem, nElem):
+        # Only compute the nodes and states
+        Nodes = plt.GetTriqNodes(**kw)
+        q = plt.GetTriqState(**kw)
+        triq = trifile.Triq(Nodes=Nodes, Tris=Tris, q=q, CompID=CompID)
+    else:
+        # Different grid; full conversion
+        triq = plt.CreateTriq(**kw)
+    # Write triangulation
+    triq.Write(ftriq, **kw)
+    # Output
+    return ftriq
+
+
 # Get an object from a list
 def getind(V, k, j=None):
     """Get an index of a variable in a list if possible
@@ -116,9 +230,168 @@ def getind(V, k, j=None):
         # Return ``None``
         return j
 
+
+# Memory-map a file
+def _map_file(fname):
+    r"""Memory-map a file as a copy-on-write buffer of bytes
+
+    :Call:
+        >>> buf = _map_file(fname)
+    :Inputs:
+        *fname*: :class:`str`
+            Name of file to map
+    :Outputs:
+        *buf*: :class:`np.ndarray`\ [:class:`np.uint8`]
+            Contents of file; empty array if file is empty
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Check for empty file, which cannot be mapped
+    if os.path.getsize(fname) == 0:
+        return np.zeros(0, dtype="u1")
+    # Map the file
+    return np.memmap(fname, dtype="u1", mode="c")
+
+
+# Read values from a buffer
+def _read_buf(buf, pos, dtype, count):
+    r"""Read an array from a buffer at a given offset without copying
+
+    :Call:
+        >>> v, pos = _read_buf(buf, pos, dtype, count)
+    :Inputs:
+        *buf*: :class:`np.ndarray`\ [:class:`np.uint8`]
+            Contents of file
+        *pos*: :class:`int`
+            Offset of first byte to read
+        *dtype*: :class:`str`
+            Data type to read
+        *count*: :class:`int`
+            Number of values to read
+    :Outputs:
+        *v*: :class:`np.ndarray`
+            View of *count* values from *buf*
+        *pos*: :class:`int`
+            Offset of first byte after *v*
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Create view
+    v = np.frombuffer(buf, dtype=dtype, count=count, offset=pos)
+    # Output
+    return v, pos + v.nbytes
+
+
+# Read one value from a buffer
+def _read_buf1(buf, pos, dtype):
+    r"""Read a scalar from a buffer at a given offset
+
+    :Call:
+        >>> v, pos = _read_buf1(buf, pos, dtype)
+    :Inputs:
+        *buf*: :class:`np.ndarray`\ [:class:`np.uint8`]
+            Contents of file
+        *pos*: :class:`int`
+            Offset of first byte to read
+        *dtype*: :class:`str`
+            Data type to read
+    :Outputs:
+        *v*: :class:`int` | :class:`float`
+            Value read from *buf*
+        *pos*: :class:`int`
+            Offset of first byte after *v*
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Read array
+    v, pos = _read_buf(buf, pos, dtype, 1)
+    # Output
+    return v[0], pos
+
+
+# Read string from a buffer
+def _read_buf_lb4_s(buf, pos):
+    r"""Read C-style string with 4 little-endian bytes per char
+
+    This is the buffer-based version of :func:`cape.io.read_lb4_s`.
+
+    :Call:
+        >>> s, pos = _read_buf_lb4_s(buf, pos)
+    :Inputs:
+        *buf*: :class:`np.ndarray`\ [:class:`np.uint8`]
+            Contents of file
+        *pos*: :class:`int`
+            Offset of first byte to read
+    :Outputs:
+        *s*: :class:`str`
+            String read from *buf*
+        *pos*: :class:`int`
+            Offset of first byte after terminating null character
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Number of characters remaining in buffer
+    nmax = (buf.size - pos) // 4
+    # Search for terminating character in chunks
+    n = 0
+    while n < nmax:
+        # Next chunk of characters
+        v = np.frombuffer(
+            buf, dtype="<i4", count=min(64, nmax - n), offset=pos + 4*n)
+        # Look for null character
+        j = np.where(v == 0)[0]
+        # Check for end of string
+        if j.size > 0:
+            n += j[0]
+            break
+        # Move on to next chunk
+        n += v.size
+    # Read the characters
+    v = np.frombuffer(buf, dtype="<i4", count=n, offset=pos)
+    # Convert to string
+    s = v.astype("u1").tobytes().decode("utf-8")
+    # Skip null character
+    return s, min(pos + 4*n + 4, buf.size)
+
+
+# Number of nodes per element
+def _get_zone_nelem(zt, n=0):
+    r"""Get number of node indices per element for a zone type
+
+    :Call:
+        >>> melem = _get_zone_nelem(zt, n=0)
+    :Inputs:
+        *zt*: :class:`int`
+            Tecplot zone type
+        *n*: {``0``} | :class:`int`
+            Zone index, for error messages
+    :Outputs:
+        *melem*: :class:`int`
+            Number of nodes per element
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Number of nodes per face
+    if zt == FETRIANGLE:
+        # Triangles
+        return 3
+    elif zt == FEQUADRILATERAL:
+        # Quads (often used for tris, too, w/ repeated node)
+        return 4
+    elif zt == FETETRAHEDRON:
+        # Tetrahedra, 4 nodes
+        return 4
+    elif zt == FEBRICK:
+        # Hex; also used for pyramids and prisms
+        return 8
+    else:
+        raise ValueError(
+            "Zone type %i (zone %i) is unsupported" % (zt, n + 1))
+
+
 # Tecplot class
 class Plt(object):
-    """Interface for Tecplot PLT files
+    r"""Interface for Tecplot PLT files
     
     :Call:
         >>> plt = cape.plt.Plt(fname=None, dat=None, triq=None, **kw)
@@ -129,6 +402,10 @@ class Plt(object):
             Name of ASCII file to read
         *triq*: {``None``} | :class:`trifile.Triq`
             Annotated triangulation interface
+        *zones*: {``None``} | :class:`list`\ [:class:`str` | :class:`int`]
+            Names or indices of zones to read from *fname*; default all
+        *Vars*: {``None``} | :class:`list`\ [:class:`str`]
+            Names of variables to read from *fname*; default all
     :Outputs:
         *plt*: :class:`cape.plt.Plt`
             Tecplot PLT interface
@@ -160,8 +437,8 @@ class Plt(object):
         """
         # Check for an input file
         if fname is not None:
-            # Read the file
-            self.Read(fname)
+            # Read the file, possibly only some zones and variables
+            self.Read(fname, zones=kw.get("zones"), Vars=kw.get("Vars"))
         elif dat is not None:
             # Read an ASCII file
             self.ReadDat(dat)
@@ -177,46 +454,85 @@ class Plt(object):
             self.Tris = []
     
     # Tec Boundary reader
-    def Read(self, fname):
-        """Read a Fun3D boundary Tecplot binary file
-        
+    def Read(self, fname, zones=None, Vars=None):
+        r"""Read a Fun3D boundary Tecplot binary file
+
+        The file is memory-mapped once, and the header is parsed using
+        offsets into that buffer.  The state variables and node indices
+        of each zone are strided views into the same buffer (mapped
+        copy-on-write, so they can be modified without changing the
+        file) rather than separate copies.
+
+        If *zones* or *Vars* is given, only those zones and variables
+        are loaded, and all zone and variable attributes are reduced
+        accordingly.  The coordinates ``x``, ``y``, and ``z`` are always
+        kept.
+
         :Call:
-            >>> plt.Read(fname)
+            >>> plt.Read(fname, zones=None, Vars=None)
         :Inputs:
             *plt*: :class:`pyFun.plt.Plt`
                 Tecplot PLT interface
             *fname*: :class:`str`
                 Name of file to read
+            *zones*: {``None``} | :class:`list`
+                Names (:class:`str`) or indices (:class:`int`) of zones
+            *Vars*: {``None``} | :class:`list`\ [:class:`str`]
+                Names of variables to read
         :Versions:
             * 2016-11-22 ``@ddalle``: Version 1.0
             * 2022-09-16 ``@ddalle``: Version 2.0; unstruc volume
+            * 2026-10-18 ``@ddalle``: Version 3.0; single memory map
+            * 2026-10-18 ``@ddalle``: Version 3.1; *zones* and *Vars*
         """
-        # Open the file
-        f = open(fname, 'rb')
+        # Index the zones and variables
+        self.ReadIndex(fname)
+        # Load the requested data
+        self.ReadZones(zones, Vars)
+
+    # Index zones and variables of a PLT file
+    def ReadIndex(self, fname):
+        """Read header of a Tecplot binary file and index zone data
+
+        This reads all the header information, *plt.fmt*, *plt.qmin*,
+        and *plt.qmax* but only records the byte offset of each
+        variable and the node indices in each zone.
+
+        :Call:
+            >>> plt.ReadIndex(fname)
+        :Inputs:
+            *plt*: :class:`pyFun.plt.Plt`
+                Tecplot PLT interface
+            *fname*: :class:`str`
+                Name of file to read
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0; from :func:`Read`
+        """
+        # Memory-map the whole file
+        buf = _map_file(fname)
         # Read the opening string
-        s = np.fromfile(f, count=1, dtype='|S8')
-        # Get string
-        if len(s) == 0:
+        if buf.size < 8:
             # No string
             header = None
         else:
             # Get and convert
-            header = s[0].decode("ascii")
+            header = buf[:8].tobytes().decode("ascii", "replace")
         # Check it
         if header != '#!TDV112':
-            f.close()
             raise ValueError("File '%s' must start with '#!TDV112'" % fname)
+        pos = 8
         # Throw away the next two integers
-        self.line2 = np.fromfile(f, count=2, dtype='i4')
+        self.line2, pos = _read_buf(buf, pos, 'i4', 2)
         # Read the title
-        self.title = capeio.read_lb4_s(f)
-        # Get number of variables (, unpacks the list)
-        self.nVar, = np.fromfile(f, count=1, dtype='i4')
+        self.title, pos = _read_buf_lb4_s(buf, pos)
+        # Get number of variables
+        self.nVar, pos = _read_buf1(buf, pos, 'i4')
         # Loop through variables
         self.Vars = []
         for i in range(self.nVar):
             # Read the name of variable *i*
-            self.Vars.append(capeio.read_lb4_s(f))
+            var, pos = _read_buf_lb4_s(buf, pos)
+            self.Vars.append(var)
         # Initialize zones
         self.nZone = 0
         self.Zones = []
@@ -230,7 +546,7 @@ class Plt(object):
         self.nPt = []
         self.nElem = []
         # This number should be 299.0
-        marker, = np.fromfile(f, dtype='f4', count=1)
+        marker, pos = _read_buf1(buf, pos, 'f4')
         # Read until no more zones
         while True:
             # Test the marker
@@ -241,20 +557,18 @@ class Plt(object):
                 # Increase zone count
                 self.nZone += 1
                 # Read zone name
-                zone = capeio.read_lb4_s(f).strip('"')
+                zone, pos = _read_buf_lb4_s(buf, pos)
                 # Save it
-                self.Zones.append(zone)
-                # Parent zone
-                i, = np.fromfile(f, count=1, dtype='i4')
+                self.Zones.append(zone.strip('"'))
+                # Parent zone and strand ID
+                (i, j), pos = _read_buf(buf, pos, 'i4', 2)
                 self.ParentZone.append(i)
-                # Strand ID
-                i, = np.fromfile(f, count=1, dtype='i4')
-                self.StrandID.append(i)
+                self.StrandID.append(j)
                 # Solution time
-                v, = np.fromfile(f, count=1, dtype='f8')
+                v, pos = _read_buf1(buf, pos, 'f8')
                 self.t.append(v)
                 # Read a -1 and then the zone type
-                i, zt = np.fromfile(f, count=2, dtype='i4')
+                (i, zt), pos = _read_buf(buf, pos, 'i4', 2)
                 self.ZoneType.append(zt)
                 # Check zone type
                 if zt == ORDERED:
@@ -262,7 +576,7 @@ class Plt(object):
                 # Read option related fo variable location
                 # 0: data at notes
                 # 1: specify for each var
-                vl, = np.fromfile(f, count=1, dtype='i4')
+                vl, pos = _read_buf1(buf, pos, 'i4')
                 # Check for var location
                 self.QVarLoc.append(vl)
                 if vl == 0:
@@ -270,22 +584,22 @@ class Plt(object):
                     self.VarLocs.append([])
                 else:
                     # Read variable locations... {0: "node", 1: "cell"}
-                    self.VarLocs.append(
-                        np.fromfile(f, dtype='i4', count=self.nVar))
+                    vls, pos = _read_buf(buf, pos, 'i4', self.nVar)
+                    self.VarLocs.append(vls)
                 # Two options about face neighbors
-                neighbor_opt, n_neighbor = np.fromfile(f, dtype='i4', count=2)
+                (neighbor_opt, n_neighbor), pos = _read_buf(buf, pos, 'i4', 2)
                 if n_neighbor > 0:
                     raise ValueError("Local face neighbors not implemented")
                 # Number of points
-                nPt, = np.fromfile(f, count=1, dtype="i4")
+                nPt, pos = _read_buf1(buf, pos, 'i4')
                 # Check polygon/polyhedron
                 if zt in (FEPOLYGON, FEPOLYHEDRON):
                     raise ValueError(
                         "Arbitrary polygon/polyhedron zones not implemented")
                 # Number of elements
-                nElem, = np.fromfile(f, count=1, dtype="i4")
+                nElem, pos = _read_buf1(buf, pos, 'i4')
                 # Cell dims
-                celldims = np.fromfile(f, count=3, dtype="i4")
+                celldims, pos = _read_buf(buf, pos, 'i4', 3)
                 if np.any(celldims):
                     raise ValueError(
                         "In zone %i, expected cell dims to be zero" % self.nZone)
@@ -298,55 +612,55 @@ class Plt(object):
                 # Check optio nfor aux name/value paris
                 for naux in range(N_AUX_MAX):
                     # Read aux flag
-                    aux, = np.fromfile(f, count=1, dtype="i4")
+                    aux, pos = _read_buf1(buf, pos, 'i4')
                     # Check flag
                     if aux == 0:
                         break
                     # Read name
-                    auxname = capeio.read_lb4_s(f)
+                    auxname, pos = _read_buf_lb4_s(buf, pos)
                     # Read data type (must be 0)
-                    auxtype = np.fromfile(f, count=1, dtype="i4")
+                    auxtype, pos = _read_buf1(buf, pos, 'i4')
                     if auxtype != 0:
                         raise ValueError(
                             "Aux data type %i in zone %i not supported"
                             % (auxtype, self.nZone))
                     # Read string property
-                    auxval = capeio.read_lb4_s(f)
+                    auxval, pos = _read_buf_lb4_s(buf, pos)
                     # Save it
                     auxdict[auxname] = auxval
-                # Read some zeros at the end.
             elif marker == 799.0:
                 # Auxiliary data
-                name = capeio.read_lb4_s(f).strip('"')
+                name, pos = _read_buf_lb4_s(buf, pos)
                 # Read format
-                fmt, = np.fromfile(f, count=1, dtype='i4')
+                fmt, pos = _read_buf1(buf, pos, 'i4')
                 # Check value of *fmt*
                 if fmt != 0:
                     raise ValueError(
                         ("Dataset Auxiliary data value format is %i; " % fmt) +
                         ("expected 0"))
                 # Read value
-                val = capeio.read_lb4_s(f).strip('"')
+                val, pos = _read_buf_lb4_s(buf, pos)
             else:
                 # Unknown marker
                 raise ValueError(
                     "Expecting end-of-header marker 357.0\n" +
                     ("  Found: %s" % marker))
             # This number should be 299.0
-            marker, = np.fromfile(f, dtype='f4', count=1)
+            marker, pos = _read_buf1(buf, pos, 'f4')
         # Convert arrays
         self.nPt = np.array(self.nPt)
         self.nElem = np.array(self.nElem)
         # This number should be 299.0
-        marker, = np.fromfile(f, dtype='f4', count=1)
+        marker, pos = _read_buf1(buf, pos, 'f4')
         # Initialize format list
         self.fmt = np.zeros((self.nZone, self.nVar), dtype='i4')
         # Initialize values and min/max
         self.qmin = np.zeros((self.nZone, self.nVar))
         self.qmax = np.zeros((self.nZone, self.nVar))
-        self.q = []
-        # Initialize node numbers
-        self.Tris = []
+        # Initialize offsets for each variable and node indices
+        self._buf = buf
+        self._qpos = []
+        self._tpos = []
         # Read until no more zones
         n = -1
         while marker == 299.0:
@@ -355,62 +669,177 @@ class Plt(object):
             npt = self.nPt[n]
             nelem = self.nElem[n]
             # Read zone type
-            self.fmt[n] = np.fromfile(f, dtype='i4', count=self.nVar)
+            self.fmt[n], pos = _read_buf(buf, pos, 'i4', self.nVar)
             # Check for passive variables
-            ipass, = np.fromfile(f, dtype='i4', count=1)
+            ipass, pos = _read_buf1(buf, pos, 'i4')
             if ipass != 0:
-                np.fromfile(f, dtype='i4', count=self.nVar)
+                pos += 4*self.nVar
             # Check for variable sharing
-            ishare, = np.fromfile(f, dtype='i4', count=1)
+            ishare, pos = _read_buf1(buf, pos, 'i4')
             if ishare != 0:
-                np.fromfile(f, dtype='i4', count=self.nVar)
+                pos += 4*self.nVar
             # Zone number to share with
-            zshare, = np.fromfile(f, dtype='i4', count=1)
+            zshare, pos = _read_buf1(buf, pos, 'i4')
             # Read the min and max variables
-            qi = np.fromfile(f, dtype='f8', count=(self.nVar*2))
+            qi, pos = _read_buf(buf, pos, 'f8', self.nVar*2)
             self.qmin[n] = qi[0::2]
             self.qmax[n] = qi[1::2]
-            # Read the actual data
-            if self.fmt[n][0] == 2:
-                # Read doubles
-                qi = np.fromfile(f, dtype="f8", count=self.nVar*npt)
+            # Size of each variable (fmt 2 is double)
+            nbytes = np.where(self.fmt[n] == 2, 8, 4) * npt
+            # Offset of each variable
+            qpos = pos + np.hstack(([0], np.cumsum(nbytes[:-1])))
+            self._qpos.append(qpos)
+            pos += int(np.sum(nbytes))
+            # Offset of node indices
+            self._tpos.append(pos)
+            # Skip the node indices
+            pos += 4*nelem*_get_zone_nelem(self.ZoneType[n], n)
+            # Read the next marker
+            if pos + 4 <= buf.size:
+                marker, pos = _read_buf1(buf, pos, 'f4')
             else:
-                # Read floats
-                qi = np.fromfile(f, dtype='f4', count=self.nVar*npt)
-            # Reshape
-            qi = np.transpose(np.reshape(qi, (self.nVar, npt)))
-            self.q.append(qi)
-            # Get zone type
-            zt = self.ZoneType[n]
-            # Number of nodes per face
-            if zt == FETRIANGLE:
-                # Triangles
-                melem = 3
-            elif zt == FEQUADRILATERAL:
-                # Quads (often used for tris, too, w/ repeated node)
-                melem = 4
-            elif zt == FETETRAHEDRON:
-                # Tetrahedra, 4 nodes
-                melem = 4
-            elif zt == FEBRICK:
-                # Hex; also used for pyramids and prisms
-                melem = 8
+                break
+
+    # Load zones from indexed PLT file
+    def ReadZones(self, zones=None, Vars=None):
+        r"""Load state and node indices of some or all indexed zones
+
+        :Call:
+            >>> plt.ReadZones(zones=None, Vars=None)
+        :Inputs:
+            *plt*: :class:`pyFun.plt.Plt`
+                Tecplot PLT interface
+            *zones*: {``None``} | :class:`list`
+                Names (:class:`str`) or indices (:class:`int`) of zones
+            *Vars*: {``None``} | :class:`list`\ [:class:`str`]
+                Names of variables to read
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Reduce list of zones
+        if zones is not None:
+            # Get indices
+            I = [self.GetZoneIndex(zone) for zone in zones]
+            # Subset zone attributes
+            self.nZone = len(I)
+            for k in ("Zones", "ParentZone", "StrandID", "QVarLoc",
+                    "VarLocs", "t", "ZoneType", "ZoneAux", "_qpos", "_tpos"):
+                v = getattr(self, k)
+                setattr(self, k, [v[i] for i in I])
+            for k in ("nPt", "nElem", "fmt", "qmin", "qmax"):
+                setattr(self, k, getattr(self, k)[I])
+        # Reduce list of variables
+        if Vars is not None:
+            # Always keep coordinates
+            J = [j for j, v in enumerate(self.Vars)
+                if v in Vars or v in ("x", "y", "z")]
+            # Subset variable attributes
+            self.Vars = [self.Vars[j] for j in J]
+            self.nVar = len(J)
+            self.fmt = self.fmt[:, J]
+            self.qmin = self.qmin[:, J]
+            self.qmax = self.qmax[:, J]
+            # Subset offsets and variable locations
+            for n in range(self.nZone):
+                self._qpos[n] = self._qpos[n][J]
+                if len(self.VarLocs[n]) > 0:
+                    self.VarLocs[n] = self.VarLocs[n][J]
+        # Initialize state and node indices
+        self.q = []
+        self.Tris = []
+        # Loop through zones found in data section
+        for n in range(len(self._qpos)):
+            # Check for contiguous block w/ a single data type
+            qpos = self._qpos[n]
+            nbytes = np.diff(qpos)
+            dt = "f8" if self.fmt[n][0] == 2 else "f4"
+            npt = self.nPt[n]
+            if np.all(self.fmt[n] == self.fmt[n][0]) and np.all(
+                    nbytes == npt*np.dtype(dt).itemsize):
+                # Strided view with one column per variable
+                qi, _ = _read_buf(self._buf, qpos[0], dt, self.nVar*npt)
+                self.q.append(qi.reshape((self.nVar, npt)).T)
             else:
-                raise ValueError(
-                    "Zone type %i (zone %i) is unsupported" % (zt, n + 1))
+                # Stack the requested variables
+                self.q.append(np.stack(
+                    [self.ReadZoneVar(n, j) for j in range(self.nVar)],
+                    axis=1))
+            # Number of nodes per face
+            melem = _get_zone_nelem(self.ZoneType[n], n)
             # Read the tris
-            ii = np.fromfile(f, dtype='i4', count=(melem*nelem))
+            ii, _ = _read_buf(
+                self._buf, self._tpos[n], 'i4', melem*self.nElem[n])
             # Reshape and save
-            self.Tris.append(np.reshape(ii, (nelem, melem)))
-            # Read the next marker
-            i = np.fromfile(f, dtype='f4', count=1)
-            # Check length
-            if len(i) == 1:
-                marker = i[0]
-            else:
-                break
-        # Close the file
-        f.close()
+            self.Tris.append(ii.reshape((self.nElem[n], melem)))
+
+    # Get index of a zone
+    def GetZoneIndex(self, zone):
+        """Get index of a zone by name or index
+
+        :Call:
+            >>> n = plt.GetZoneIndex(zone)
+        :Inputs:
+            *plt*: :class:`pyFun.plt.Plt`
+                Tecplot PLT interface
+            *zone*: :class:`str` | :class:`int`
+                Name or index of zone
+        :Outputs:
+            *n*: :class:`int`
+                Index of zone
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Check type
+        if isinstance(zone, str):
+            # Find zone by name
+            if zone not in self.Zones:
+                raise KeyError("No zone named '%s'" % zone)
+            return self.Zones.index(zone)
+        else:
+            # Already an index
+            return int(zone)
+
+    # Read one variable from one zone
+    def ReadZoneVar(self, zone, var):
+        r"""Read one variable from one zone of an indexed PLT file
+
+        The result is a view into the memory-mapped file, so only that
+        part of the file is read. Variables that are not in the file,
+        such as *cp_tavg* from :func:`cape.pyfun.plt.Plt.GetCpTAvg`,
+        have a negative offset and are taken from *plt.q*.
+
+        :Call:
+            >>> v = plt.ReadZoneVar(zone, var)
+        :Inputs:
+            *plt*: :class:`pyFun.plt.Plt`
+                Tecplot PLT interface
+            *zone*: :class:`str` | :class:`int`
+                Name or index of zone
+            *var*: :class:`str` | :class:`int`
+                Name or index of variable
+        :Outputs:
+            *v*: :class:`np.ndarray`\ (*plt.nPt[n]*)
+                Values of *var* at each point in zone
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 1.1; calculated variables
+        """
+        # Get zone index
+        n = self.GetZoneIndex(zone)
+        # Get variable index
+        if isinstance(var, str):
+            j = self.Vars.index(var)
+        else:
+            j = var
+        # Check for variable that is not in the file
+        if self._qpos[n][j] < 0:
+            return self.q[n][:, j]
+        # Data type (fmt 2 is double)
+        dt = "f8" if self.fmt[n][j] == 2 else "f4"
+        # Read the values
+        v, _ = _read_buf(self._buf, self._qpos[n][j], dt, self.nPt[n])
+        # Output
+        return v
     
     # Write Tec Boundary
     def Write(self, fname, Vars=None, **kw):
@@ -982,28 +1411,117 @@ class Plt(object):
         :Versions:
             * 2016-12-19 ``@ddalle``: First version
         """
-        # Inputs
-        triload = kw.get('triload', True)
+        # Create the triangles without nodes or states
+        Tris, CompID = self.GetTriqSkeleton(**kw)
+        # Get the coordinates and states at each node
+        Nodes = self.GetTriqNodes(**kw)
+        q = self.GetTriqState(**kw)
+        # Create the triangulation
+        triq = trifile.Triq(Nodes=Nodes, Tris=Tris, q=q, CompID=CompID)
+        # Output
+        return triq
+
+    # Create tris of a triq file
+    def GetTriqSkeleton(self, **kw):
+        r"""Get triangles and component IDs for a triq file
+
+        These depend only on the zone connectivity, so they can be reused
+        for several PLT files with the same zones.
+
+        :Call:
+            >>> Tris, CompID = plt.GetTriqSkeleton(**kw)
+        :Inputs:
+            *plt*: :class:`pyFun.plt.Plt`
+                Tecplot PLT interface
+            *CompID*: {``range(len(plt.nZone))``} | :class:`list`
+                Optional list of zone numbers to use
+            *mapbc*: {``None``} | :class:`cape.pyfun.mapbc.MapBC`
+                Optional map from boundary number to component ID
+        :Outputs:
+            *Tris*: :class:`np.ndarray`\ [:class:`int`]
+                One-based node indices of each triangle, (*nTri*, 3)
+            *CompID*: :class:`np.ndarray`\ [:class:`int`]
+                Component ID of each triangle
+        :Versions:
+            * 2016-12-19 ``@ddalle``: Version 1.0; :func:`CreateTriq`
+            * 2026-10-18 ``@ddalle``: Version 1.1; split from states
+        """
         # Boundary number map?
         mapbc = kw.get('mapbc', True)
-        # Averaging?
-        avg = kw.get('avg', True)
-        # Write RMS values?
-        rms = kw.get('rms', False)
-        # Freestream Mach number; FUN3D writes cf/1.4*pinf instead of cf/qinf
-        mach = float(kw.get('mach', kw.get('m', kw.get('minf', 1.0))))
-        # Total number of points (if no emissions)
-        nNode = np.sum(self.nPt)
         # Rough number of tris
         nElem = np.sum(self.nElem)
         # Initialize
-        Nodes = np.zeros((nNode, 3))
         Tris  = np.zeros((2*nElem, 3), dtype=int)
         # Initialize component IDs
         CompID = np.zeros(2*nElem, dtype=int)
         # Counters
         iNode = 0
         iTri  = 0
+        # Check for CompID list
+        IZone = kw.get("CompID", range(self.nZone))
+        # Loop through the components
+        for k in IZone:
+            # Extract tris
+            T = self.Tris[k]
+            # Number of points and elements
+            kNode = self.nPt[k]
+            kTri  = self.nElem[k]
+            # Check for quads
+            iQuad = np.where(T[:,-1] != T[:,-2])[0]
+            kQuad = len(iQuad)
+            # Save the node numbers
+            Tris[iTri:iTri+kTri,:] = (T[:,:3] + iNode + 1)
+            # Save the quads
+            if kQuad > 0:
+                # Select the elements first; cannot combine operations
+                TQ = T[iQuad,:]
+                # Select nodes 1,3,4 to get second triangle
+                Tris[iTri+kTri:iTri+kTri+kQuad,:] = TQ[:,[0,2,3]]+iNode+1
+            # Increase the running node count
+            iNode += kNode
+            # Try to read the component ID
+            try:
+                # Name of the zone should be 'boundary 9 CORE_Body' or similar
+                comp = int(self.Zones[k].split()[1])
+            except Exception:
+                # Otherwise just number 1 to *n*
+                comp = np.max(CompID) + 1
+            # Check for converting the compID (e.g. FUN3D 'mapbc' file)
+            if mapbc is not None:
+                try:
+                    comp = mapbc.CompID[comp-1]
+                except Exception:
+                    pass
+            # Number of elements
+            kElem = kTri + kQuad
+            # Save the component IDs
+            CompID[iTri:iTri+kElem] = comp
+            # Increase the running tri count
+            iTri += kElem
+        # Downselect Tris and CompID
+        Tris = Tris[:iTri,:]
+        CompID = CompID[:iTri]
+        # Output
+        return Tris, CompID
+
+    # Create nodes of a triq file
+    def GetTriqNodes(self, **kw):
+        r"""Get node coordinates for a triq file
+
+        :Call:
+            >>> Nodes = plt.GetTriqNodes(**kw)
+        :Inputs:
+            *plt*: :class:`pyFun.plt.Plt`
+                Tecplot PLT interface
+            *CompID*: {``range(len(plt.nZone))``} | :class:`list`
+                Optional list of zone numbers to use
+        :Outputs:
+            *Nodes*: :class:`np.ndarray`\ [:class:`float`]
+                Coordinates of each node, (*nNode*, 3)
+        :Versions:
+            * 2016-12-19 ``@ddalle``: Version 1.0; :func:`CreateTriq`
+            * 2026-10-18 ``@ddalle``: Version 1.1; split from tris
+        """
         # Error message for coordinates
         msgx = ("  Warning: triq file conversion requires '%s'; " +
             "not found in this PLT file")
@@ -1012,6 +1530,54 @@ class Plt(object):
             # Check for the state
             if v not in self.Vars:
                 raise ValueError(msgx % v)
+        # Find the states in the variable list
+        J = [self.Vars.index('x'), self.Vars.index('y'), self.Vars.index('z')]
+        # Check for CompID list
+        IZone = kw.get("CompID", range(self.nZone))
+        # Check for empty list
+        if len(IZone) == 0:
+            return np.zeros((0, 3))
+        # Save the nodes
+        return np.vstack([self.q[k][:,J] for k in IZone]).astype("f8")
+
+    # Create states of a triq file
+    def GetTriqState(self, **kw):
+        r"""Get state variables at each node for a triq file
+
+        :Call:
+            >>> q = plt.GetTriqState(mach=1.0, triload=True, **kw)
+        :Inputs:
+            *plt*: :class:`pyFun.plt.Plt`
+                Tecplot PLT interface
+            *mach*: {``1.0``} | positive :class:`float`
+                Freestream Mach number for skin friction coeff conversion
+            *CompID*: {``range(len(plt.nZone))``} | :class:`list`
+                Optional list of zone numbers to use
+            *triload*: {``True``} | ``False``
+                Whether or not to write a triq tailored for ``triloadCmd``
+            *avg*: {``True``} | ``False``
+                Use time-averaged states if available
+            *rms*: ``True`` | {``False``}
+                Use root-mean-square variation instead of nominal value
+        :Outputs:
+            *q*: :class:`np.ndarray`\ [:class:`float`]
+                States at each node, (*nNode*, *nq*)
+        :Versions:
+            * 2016-12-19 ``@ddalle``: Version 1.0; :func:`CreateTriq`
+            * 2026-10-18 ``@ddalle``: Version 1.1; split from nodes
+        """
+        # Inputs
+        triload = kw.get('triload', True)
+        # Averaging?
+        avg = kw.get('avg', True)
+        # Write RMS values?
+        rms = kw.get('rms', False)
+        # Freestream Mach number; FUN3D writes cf/1.4*pinf instead of cf/qinf
+        mach = float(kw.get('mach', kw.get('m', kw.get('minf', 1.0))))
+        # Total number of points (if no emissions)
+        nNode = np.sum(self.nPt)
+        # Counters
+        iNode = 0
         # Process the states
         if triload:
             # Select states appropriate for ``triload``
@@ -1040,10 +1606,6 @@ class Plt(object):
         else:
             # Use the states that are present
             qtype = 0
-        # Find the states in the variable list
-        jx = self.Vars.index('x')
-        jy = self.Vars.index('y')
-        jz = self.Vars.index('z')
         # Check for nominal states
         jcp  = getind(self.Vars, 'cp')
         jrho = getind(self.Vars, 'rho')
@@ -1092,31 +1654,12 @@ class Plt(object):
             nq = 9
         # Initialize state
         q = np.zeros((nNode, nq))
-        # Reset node count
-        npt = 0
         # Check for CompID list
         IZone = kw.get("CompID", range(self.nZone))
         # Loop through the components
         for k in IZone:
-            # Extract tris
-            T = self.Tris[k]
-            # Number of points and elements
+            # Number of points
             kNode = self.nPt[k]
-            kTri  = self.nElem[k]
-            # Increment node count
-            npt += kNode
-            # Check for quads
-            iQuad = np.where(T[:,-1] != T[:,-2])[0]
-            kQuad = len(iQuad)
-            # if np.any(self.Tris[k][:,-1] != self.Tris[k][:,-2]):
-            #     raise ValueError(
-            #         ("Detected a quad face in zone %s " % k) +
-            #         ("(%s); not yet supported " % self.Zones[k]) +
-            #         "for converting PLT files for line loads")
-            # Save the nodes
-            Nodes[iNode:iNode+kNode,0] = self.q[k][:,jx]
-            Nodes[iNode:iNode+kNode,1] = self.q[k][:,jy]
-            Nodes[iNode:iNode+kNode,2] = self.q[k][:,jz]
             # Save the states
             if qtype == 0:
                 # Save all states appropriately
@@ -1185,45 +1728,10 @@ class Plt(object):
                 q[iNode:iNode+kNode,6] = cfx
                 q[iNode:iNode+kNode,7] = cfy
                 q[iNode:iNode+kNode,8] = cfz
-            # Save the node numbers
-            Tris[iTri:iTri+kTri,:] = (T[:,:3] + iNode + 1)
-            # Save the quads
-            if kQuad > 0:
-                # Select the elements first; cannot combine operations
-                TQ = T[iQuad,:]
-                # Select nodes 1,3,4 to get second triangle
-                Tris[iTri+kTri:iTri+kTri+kQuad,:] = TQ[:,[0,2,3]]+iNode+1
             # Increase the running node count
             iNode += kNode
-            # Try to read the component ID
-            try:
-                # Name of the zone should be 'boundary 9 CORE_Body' or similar
-                comp = int(self.Zones[k].split()[1])
-            except Exception:
-                # Otherwise just number 1 to *n*
-                comp = np.max(CompID) + 1
-            # Check for converting the compID (e.g. FUN3D 'mapbc' file)
-            if mapbc is not None:
-                try:
-                    comp = mapbc.CompID[comp-1]
-                except Exception:
-                    pass
-            # Number of elements
-            kElem = kTri + kQuad
-            # Save the component IDs
-            CompID[iTri:iTri+kElem] = comp
-            # Increase the running tri count
-            iTri += kElem
-        # Downselect Tris and CompID
-        Tris = Tris[:iTri,:]
-        CompID = CompID[:iTri]
-        # Downselect nodes
-        Nodes = Nodes[:npt,:]
-        q = q[:npt,:]
-        # Create the triangulation
-        triq = trifile.Triq(Nodes=Nodes, Tris=Tris, q=q, CompID=CompID)
         # Output
-        return triq
+        return q[:iNode,:]
 
     # Create a triq file
     def CreateTri(self, **kw):
@@ -65,6 +65,9 @@ Modules included within this one are outlined below.
 # System
 import os
 
+# Local imports
+from .._lazy import lazy_getattr
+
 
 # Save version number
 version = "1.0"
@@ -76,11 +79,20 @@ _fname = os.path.abspath(__file__)
 # Saved folder names
 PyCartFolder = os.path.split(_fname)[0]
 
-# Import classes and methods from the submodules
-from .cntl import Cntl, RunMatrix
-from .inputCntl   import InputCntl
-from .aeroCsh     import AeroCsh
-from .preSpecCntl import PreSpecCntl
-from .dataBook    import CaseFM, CaseResid
+# Classes imported from submodules on first access
+_LAZY_ATTRS = {
+    "Cntl": "cntl",
+    "RunMatrix": "cntl",
+    "InputCntl": "inputCntl",
+    "AeroCsh": "aeroCsh",
+    "PreSpecCntl": "preSpecCntl",
+    "CaseFM": "dataBook",
+    "CaseResid": "dataBook",
+}
+
+
+# Import classes and submodules only when needed
+def __getattr__(name):
+    return lazy_getattr(__name__, _LAZY_ATTRS, name)
 
 
@@ -31,6 +31,7 @@ from . import pointSensor
 from .. import argread
 from .. import text as textutils
 from ..cfdx import case as cc
+from ..cfdx import monitor
 from ..cfdx import queue
 from .tri import Tri, Triq
 from .options.runControl import RunControl
@@ -290,6 +291,8 @@ def RunPhase(rc, i):
     :Versions:
         * 2016-03-04 ``@ddalle``: Version 1.0
     """
+    # Remove convergence marker from previous phase or run
+    monitor.ClearConverged()
     # Mesh generation
     CaseAutoInputs(rc, i)
     CaseCubes(rc, i)
@@ -346,8 +349,7 @@ def RunAdaptive(rc, i):
     if os.path.isfile(os.path.join('BEST', 'pointSensors.dat')):
         # Collect point sensor data
         PS = pointSensor.CasePointSensor()
-        PS.UpdateIterations()
-        PS.WriteHist()
+        PS.AppendHistBin()
 
 # Run one phase with *it_avg*
 def RunWithRestarts(rc, i):
@@ -381,6 +383,8 @@ def RunWithRestarts(rc, i):
     n1 = n + it_fc
     # Get verbose option
     v_fc = rc.get_Verbose()
+    # Convergence monitor, if any
+    mon = GetMonitor(rc, i)
     # Loop through iterations.
     for j in range(it_fc):
         # flowCart command automatically accepts *it_avg*; update *n*
@@ -417,20 +421,20 @@ def RunWithRestarts(rc, i):
             triq.WeightedAverage(triqj)
         # Update history
         PS.UpdateIterations()
+        # Append new iterations to history file
+        if PS.nIter > 0:
+            PS.AppendHistBin()
         # Check for completion
         if (n>=n1) or (j+1==it_fc):
             break
+        # Check for convergence
+        if (mon is not None) and mon.Poll():
+            break
         # Clear check files as appropriate.
         manage.ClearCheck_iStart(nkeep=1, istart=n0)
     # Write the averaged triq file
     if rc.get_clic(i):
         triq.WriteTri_lr4('Components.%i.%i.%i.triq' % (j+1, n0, n))
-    # Write the point sensor history file.
-    try:
-        if PS.nIter > 0:
-            PS.WriteHist()
-    except Exception:
-        pass
 
 # Run the nominal mode
 def RunFixed(rc, i):
@@ -457,15 +461,43 @@ def RunFixed(rc, i):
     v_fc = rc.get_Verbose()
     # Call flowCart directly.
     cmdi = cmd.flowCart(fc=rc, i=i, n=n)
+    # Convergence monitor, if any
+    mon = GetMonitor(rc, i)
     # Run the command.
-    bin.callf(cmdi, f='flowCart.out', v=v_fc)
+    bin.callf(cmdi, f='flowCart.out', v=v_fc, monitor=mon)
     # Check for point sensors
     if os.path.isfile('pointSensors.dat'):
         # Collect point sensor data
         PS = pointSensor.CasePointSensor()
-        PS.UpdateIterations()
-        PS.WriteHist()
+        PS.AppendHistBin()
             
+
+# Create convergence monitor
+def GetMonitor(rc, i):
+    """Create convergence monitor for a phase, if requested
+    
+    :Call:
+        >>> mon = GetMonitor(rc, i)
+    :Inputs:
+        *rc*: :Class:`pyCart.options.runControl.RunControl`
+            Options interface from ``case.json``
+        *i*: :class:`int`
+            Phase number
+    :Outputs:
+        *mon*: :class:`cape.cfdx.monitor.CaseMonitor` | ``None``
+            Convergence monitor, if *Monitor* option is set
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Check option
+    if not rc.get_Monitor(i):
+        return None
+    # Import history readers (dataBook imports this module)
+    from .dataBook import CaseFM, CaseResid
+    # Create monitor
+    return monitor.CaseMonitor(rc, i, fm=CaseFM, resid=CaseResid)
+            
+
 # Check if a case was run successfully
 def CheckSuccess(rc=None, i=None):
     """Check iteration counts and residual change for most recent run
@@ -617,6 +649,9 @@ def RestartCase(i0=None):
     # Check current iteration count.
     if n >= rc.get_LastIter():
         return
+    # Check if stopped by convergence monitor
+    if monitor.CheckConverged(rc):
+        return
     # Check qsub status.
     if not (qpbs or qslr):
         # Run the case.
@@ -907,6 +942,8 @@ def GetPhaseNumber(rc):
     """
     # Get the run index.
     n = GetCheckResubIter()
+    # Phase stopped early by convergence monitor, if any
+    jconv = monitor.GetConvergedPhase()
     # Loop through possible input numbers.
     for j in range(rc.get_nSeq()):
         # Get the actual run number
@@ -916,7 +953,7 @@ def GetPhaseNumber(rc):
             # This run has not been completed yet.
             return i
         # Check the iteration number.
-        if n < rc.get_PhaseIters(j):
+        if n < rc.get_PhaseIters(j) and i != jconv:
             # This case has been run, but hasn't reached the min iter cutoff
             return i
     # Case completed; just return the last value.
@@ -23,6 +23,7 @@ solution file (``"TriqPoint"`` data book type).
 
 # File interface
 import os, glob
+import struct
 # Basic numerics
 import numpy as np
 # Date processing
@@ -42,6 +43,17 @@ import cape.cfdx.pointSensor
 # Placeholder variables for plotting functions.
 plt = 0
 
+# Point sensor history files
+HIST_FILE = "pointSensors.hist.dat"
+HIST_BIN = "pointSensors.hist.bin"
+# Binary history header: magic, nPoint, nCol, nd, iSteady
+HIST_MAGIC = b"CAPEPSH1"
+HIST_HEADER = struct.Struct("<8s3iq")
+# Size of header, padded for alignment of records
+HIST_HEADER_SIZE = 64
+# Minimum number of iterations to allocate in history buffer
+HIST_BUFFER_MIN = 16
+
 # Dedicated function to load Matplotlib only when needed.
 def ImportPyPlot():
     """Import :mod:`matplotlib.pyplot` if not loaded
@@ -170,6 +182,97 @@ def get_nStatsPS():
     line = readline(f)
     # Output
     return nStats
+
+
+# Read binary point sensor history header
+def read_hist_bin_header(fname=HIST_BIN):
+    """Read the header of a binary point sensor history file
+
+    :Call:
+        >>> nPoint, nCol, nd, iSteady = read_hist_bin_header(fname)
+    :Inputs:
+        *fname*: {``"pointSensors.hist.bin"``} | :class:`str`
+            Name of binary point sensor history file
+    :Outputs:
+        *nPoint*: :class:`int`
+            Number of point sensors
+        *nCol*: :class:`int`
+            Number of columns for each point and iteration
+        *nd*: ``2`` | ``3``
+            Number of dimensions
+        *iSteady*: :class:`int`
+            Maximum steady-state iteration number
+    :Versions:
+        * 2026-10-18 ``@ddalle``: First version
+    """
+    # Read fixed-size header
+    with open(fname, 'rb') as f:
+        header = f.read(HIST_HEADER.size)
+    # Check it
+    if len(header) < HIST_HEADER.size or not header.startswith(HIST_MAGIC):
+        raise ValueError(
+            "File '%s' is not a binary point sensor history" % fname)
+    # Unpack
+    _, nPoint, nCol, nd, iSteady = HIST_HEADER.unpack(header)
+    # Output
+    return nPoint, nCol, nd, iSteady
+
+
+# Get the most recent point sensor history file
+def get_hist_file():
+    """Get name of the most recently modified point sensor history
+
+    :Call:
+        >>> fname = get_hist_file()
+    :Outputs:
+        *fname*: ``None`` | :class:`str`
+            Either ``"pointSensors.hist.bin"`` or
+            ``"pointSensors.hist.dat"``, whichever is newer
+    :Versions:
+        * 2026-10-18 ``@ddalle``: First version
+    """
+    # Modification time of each history file, if any
+    tbin = os.path.getmtime(HIST_BIN) if os.path.isfile(HIST_BIN) else None
+    tdat = os.path.getmtime(HIST_FILE) if os.path.isfile(HIST_FILE) else None
+    # Pick the newer one; binary wins a tie
+    if tbin is not None and (tdat is None or tbin >= tdat):
+        return HIST_BIN
+    elif tdat is not None:
+        return HIST_FILE
+
+
+# Get last iteration of point sensor history
+def get_hist_iter():
+    """Get last iteration in the most recent point sensor history
+
+    :Call:
+        >>> i = get_hist_iter()
+    :Outputs:
+        *i*: :class:`float`
+            Last iteration number or time; ``0`` if no history
+    :Versions:
+        * 2026-10-18 ``@ddalle``: First version
+    """
+    # Get history file
+    fname = get_hist_file()
+    # Check for ASCII file
+    if fname != HIST_BIN:
+        return get_iter(HIST_FILE)
+    # Safely read last record of binary file
+    try:
+        # Read header
+        nPoint, nCol, _, _ = read_hist_bin_header(fname)
+        # Size of one iteration
+        nrec = 8 * nPoint * nCol
+        # Number of complete records
+        nIter = (os.path.getsize(fname) - HIST_HEADER_SIZE) // nrec
+        # Read the iteration column of the last record
+        with open(fname, 'rb') as f:
+            f.seek(HIST_HEADER_SIZE + nIter*nrec - 8)
+            return float(np.fromfile(f, dtype="<f8", count=1)[0])
+    except Exception:
+        # No iterations
+        return 0
 # end functions
 
 # Data book for group of point sensors
@@ -458,7 +561,7 @@ class DBPointSensor(cape.cfdx.pointSensor.DBPointSensor):
             # Up-to-date
             print("  Databook up-to-date.")
             os.chdir(fpwd); return False, None
-        elif self['nIter'][j] == get_iter('pointSensors.hist.dat'):
+        elif self['nIter'][j] == get_hist_iter():
             # Up-to-date
             print("  Databook up-to-date.")
             os.chdir(fpwd); return False, None
@@ -523,8 +626,15 @@ class CasePointSensor(cape.cfdx.dataBook.CaseData):
     # Initialization method
     def __init__(self):
         """Initialization method"""
+        # Get most recent history file
+        fhist = get_hist_file()
+        # Files already checked by :func:`UpdateIterations`
+        self._fmtime = {}
         # Check for history file
-        if os.path.isfile('pointSensors.hist.dat'):
+        if fhist == HIST_BIN:
+            # Memory-map the binary file
+            self.ReadHistBin()
+        elif fhist == HIST_FILE:
             # Read the file
             self.ReadHist()
         else:
@@ -554,6 +664,7 @@ class CasePointSensor(cape.cfdx.dataBook.CaseData):
                 Iterative point sensor history
         :Versions:
             * 2015-11-30 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Skip unchanged steady-state files
         """
         # Get latest iteration.
         if self.nPoint is None:
@@ -568,6 +679,10 @@ class CasePointSensor(cape.cfdx.dataBook.CaseData):
         fglob.sort()
         # Loop through steady-state iterations
         for f in fglob:
+            # Skip files that have not changed since last check
+            mtime = os.path.getmtime(f)
+            if self._fmtime.get(f) == mtime: continue
+            self._fmtime[f] = mtime
             # Check if it's up-to-date
             if get_iter(f) <= imax: continue
             # Read the file.
@@ -659,6 +774,7 @@ class CasePointSensor(cape.cfdx.dataBook.CaseData):
                 Name of point sensor history file
         :Versions:
             * 2015-12-01 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Write all rows with one call
         """
         # Open the file
         f = open(fname, 'w')
@@ -683,12 +799,9 @@ class CasePointSensor(cape.cfdx.dataBook.CaseData):
         else:
             # Point, 3 coordinates, 6 states, refinements, iteration
             fflag = '%4i' + (' %15.8e'*9) + ' %2i %9.3f\n'
-        # Loop through points
-        for k in range(self.nPoint):
-            # Loop through iterations
-            for i in range(self.nIter):
-                # Write the info.
-                f.write(fflag % tuple(self.data[k,i,:]))
+        # Write all points and iterations at once
+        np.savetxt(f, self.data.reshape((-1, self.data.shape[2])),
+            fmt=fflag[:-1])
         # Close the file.
         f.close()
         
@@ -705,6 +818,7 @@ class CasePointSensor(cape.cfdx.dataBook.CaseData):
                 Point sensor
         :Versions:
             * 2015-11-30 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Use growable buffer
         """
         # Check compatibility
         if self.nPoint is None:
@@ -728,15 +842,200 @@ class CasePointSensor(cape.cfdx.dataBook.CaseData):
                 "History is %-D; point sensor is %i-D." % (self.nd, PS.nd))
         # Get data from point sensor and add point number
         A = np.hstack((np.array([range(self.nPoint)]).transpose(), PS.data))
-        # Number of columns
-        nCol = A.shape[1]
-        # Append to history.
-        self.data = np.hstack(
-            (self.data, A.reshape((self.nPoint,1,nCol))))
+        # Make sure buffer has room for another iteration
+        self._ReserveIterations(self.nIter + 1)
+        # Save new iteration
+        self._buf[:, self.nIter, :] = A
         # Increase iteration count.
         self.nIter += 1
-        
-    
+        # Update views of history
+        self.data = self._buf[:, :self.nIter, :]
+        self.i = self.data[0,:,-1]
+
+    # Make sure history buffer is large enough
+    def _ReserveIterations(self, n):
+        """Ensure the history buffer has room for *n* iterations
+
+        The capacity is at least doubled each time the buffer grows, so
+        appending one iteration at a time takes amortized constant time.
+
+        :Call:
+            >>> P._ReserveIterations(n)
+        :Inputs:
+            *P*: :class:`pyCart.pointSensor.CasePointSensor`
+                Iterative point sensor history
+            *n*: :class:`int`
+                Number of iterations needed
+        :Versions:
+            * 2026-10-18 ``@ddalle``: First version
+        """
+        # Current buffer; data read from file is not a growable buffer
+        buf = getattr(self, "_buf", None)
+        # Check capacity
+        if buf is not None and buf.shape[1] >= n and self.data.base is buf:
+            return
+        # New capacity
+        m = max(n, 2*self.nIter, HIST_BUFFER_MIN)
+        # Allocate
+        buf = np.zeros((self.nPoint, m, self.data.shape[2]))
+        # Copy existing history
+        buf[:, :self.nIter, :] = self.data[:, :self.nIter, :]
+        # Save
+        self._buf = buf
+        self.data = buf[:, :self.nIter, :]
+
+    # Read binary history file
+    def ReadHistBin(self, fname=HIST_BIN):
+        """Read binary point sensor history file using a memory map
+
+        The file has a fixed header followed by one record of
+        *nPoint* x *nCol* little-endian doubles per iteration. The
+        number of iterations is determined from the size of the file,
+        and any partially written final record is ignored.
+
+        :Call:
+            >>> P.ReadHistBin(fname='pointSensors.hist.bin')
+        :Inputs:
+            *P*: :class:`pyCart.pointSensor.CasePointSensor`
+                Iterative point sensor history
+            *fname*: :class:`str`
+                Name of binary point sensor history file
+        :Versions:
+            * 2026-10-18 ``@ddalle``: First version
+        """
+        # Read header
+        nPoint, nCol, nd, iSteady = read_hist_bin_header(fname)
+        # Size of one iteration
+        nrec = 8 * nPoint * nCol
+        # Number of complete records
+        nIter = (os.path.getsize(fname) - HIST_HEADER_SIZE) // max(nrec, 1)
+        # Save
+        self.nPoint  = nPoint
+        self.nIter   = nIter
+        self.nd      = nd
+        self.iSteady = iSteady
+        # Check for empty history
+        if nIter == 0 or nPoint == 0:
+            # Null data
+            self.data = np.zeros((nPoint, 0, nCol))
+        else:
+            # Map iterations (copy-on-write)
+            A = np.memmap(fname, dtype="<f8", mode="c",
+                offset=HIST_HEADER_SIZE, shape=(nIter, nPoint, nCol))
+            # Index by point, then iteration
+            self.data = A.transpose((1, 0, 2))
+        # Save the iterations at which samples are recorded
+        self.i = self.data[0,:,-1] if nPoint else np.zeros(0)
+
+    # Write binary history file
+    def WriteHistBin(self, fname=HIST_BIN):
+        """Write entire binary point sensor history file
+
+        :Call:
+            >>> P.WriteHistBin(fname='pointSensors.hist.bin')
+        :Inputs:
+            *P*: :class:`pyCart.pointSensor.CasePointSensor`
+                Iterative point sensor history
+            *fname*: :class:`str`
+                Name of binary point sensor history file
+        :Versions:
+            * 2026-10-18 ``@ddalle``: First version
+        """
+        # Write to a new file
+        with open(fname + ".tmp", 'wb') as f:
+            # Write header
+            f.write(self._get_hist_bin_header())
+            # Write iterations
+            self._get_hist_bin_records(0).tofile(f)
+        # Replace any existing file
+        os.replace(fname + ".tmp", fname)
+
+    # Append to binary history file
+    def AppendHistBin(self, fname=HIST_BIN):
+        """Append iterations not yet in binary point sensor history file
+
+        Only the new iterations are written, and the header is updated
+        in place, so the cost does not depend on the length of the
+        history. A new file is written if *fname* does not exist or
+        has different dimensions.
+
+        :Call:
+            >>> P.AppendHistBin(fname='pointSensors.hist.bin')
+        :Inputs:
+            *P*: :class:`pyCart.pointSensor.CasePointSensor`
+                Iterative point sensor history
+            *fname*: :class:`str`
+                Name of binary point sensor history file
+        :Versions:
+            * 2026-10-18 ``@ddalle``: First version
+        """
+        # Check for empty history
+        if self.nPoint is None:
+            return
+        # Check for existing file
+        if not os.path.isfile(fname):
+            return self.WriteHistBin(fname)
+        # Read its header
+        nPoint, nCol, nd, _ = read_hist_bin_header(fname)
+        # Check compatibility
+        if (nPoint, nCol, nd) != (self.nPoint, self.data.shape[2], self.nd):
+            return self.WriteHistBin(fname)
+        # Size of one iteration
+        nrec = 8 * nPoint * nCol
+        # Number of complete records in file
+        n0 = (os.path.getsize(fname) - HIST_HEADER_SIZE) // max(nrec, 1)
+        # Check for file with more iterations than this history
+        if n0 > self.nIter:
+            return self.WriteHistBin(fname)
+        # Open file for update
+        with open(fname, 'r+b') as f:
+            # Update header (*iSteady* may have changed)
+            f.write(self._get_hist_bin_header())
+            # Go to end of last complete record
+            f.seek(HIST_HEADER_SIZE + n0*nrec)
+            # Write new iterations
+            self._get_hist_bin_records(n0).tofile(f)
+            # Remove any partial record
+            f.truncate()
+
+    # Get iteration index
+    def GetIterIndex(self, i):
+        """Get index of the record for a given iteration
+
+        :Call:
+            >>> j = P.GetIterIndex(i)
+        :Inputs:
+            *P*: :class:`pyCart.pointSensor.CasePointSensor`
+                Iterative point sensor history
+            *i*: :class:`float`
+                Iteration number
+        :Outputs:
+            *j*: :class:`int` | ``None``
+                Index such that ``P.data[:,j,:]`` is iteration *i*
+        :Versions:
+            * 2026-10-18 ``@ddalle``: First version
+        """
+        # Iterations are recorded in increasing order
+        j = np.searchsorted(self.i, i)
+        # Check for match
+        if j < self.nIter and self.i[j] == i:
+            return int(j)
+
+    # Create binary header
+    def _get_hist_bin_header(self):
+        # Pack values
+        header = HIST_HEADER.pack(HIST_MAGIC, self.nPoint,
+            self.data.shape[2], self.nd, int(self.iSteady))
+        # Pad
+        return header.ljust(HIST_HEADER_SIZE, b"\0")
+
+    # Get records to write
+    def _get_hist_bin_records(self, n0):
+        # Get iterations after *n0*, ordered by iteration, then point
+        A = self.data[:, n0:self.nIter, :].transpose((1, 0, 2))
+        # Convert to little-endian double
+        return np.ascontiguousarray(A, dtype="<f8")
+
     # Get point sensor by name
     def GetPointSensorIndex(self, name):
         """Get the index of a point sensor by its name in ``input.cntl``
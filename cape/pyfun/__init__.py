@@ -66,7 +66,17 @@ Modules included within this one are outlined below.
 import os
 
 # Local imports
-from .cntl import Cntl
+from .._lazy import lazy_getattr
+
+# Classes imported from submodules on first access
+_LAZY_ATTRS = {
+    "Cntl": "cntl",
+}
+
+
+# Import classes and submodules only when needed
+def __getattr__(name):
+    return lazy_getattr(__name__, _LAZY_ATTRS, name)
 
 
 # Save version number
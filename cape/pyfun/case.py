@@ -34,6 +34,7 @@ from . import cmd
 from .. import argread
 from .. import text as textutils
 from ..cfdx import case as cc
+from ..cfdx import monitor
 from ..cfdx import queue
 from .options.runControl import RunControl
 from .namelist import Namelist
@@ -230,8 +231,12 @@ def RunPhase(rc, i):
     if nprev == 0 or n0 < nj:
         # Get the `nodet` or `nodet_mpi` command
         cmdi = cmd.nodet(rc, i=i)
+        # Remove convergence marker from previous phase or run
+        monitor.ClearConverged()
+        # Convergence monitor, if any
+        mon = GetMonitor(rc, i)
         # Call the command.
-        bin.callf(cmdi, f='fun3d.out')
+        bin.callf(cmdi, f='fun3d.out', monitor=mon)
         # Get new iteration number
         n1 = GetCurrentIter()
         # Check for lack of progress
@@ -414,6 +419,37 @@ def StartCase():
         run_fun3d()
 
 
+# Create convergence monitor
+def GetMonitor(rc, i):
+    r"""Create convergence monitor for a phase, if requested
+
+    :Call:
+        >>> mon = case.GetMonitor(rc, i)
+    :Inputs:
+        *rc*: :class:`cape.pyfun.options.runControl.RunControl`
+            Run control options
+        *i*: :class:`int`
+            Phase number
+    :Outputs:
+        *mon*: :class:`cape.cfdx.monitor.CaseMonitor` | ``None``
+            Convergence monitor, if *Monitor* option is set
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Check option
+    if not rc.get_Monitor(i):
+        return None
+    # Import history readers (dataBook imports this module)
+    from .dataBook import CaseFM, CaseResid
+    # Project name
+    proj = GetProjectRootname(rc, i)
+    # Create monitor
+    return monitor.CaseMonitor(
+        rc, i,
+        fm=lambda comp: CaseFM(proj, comp),
+        resid=lambda: CaseResid(proj))
+
+
 # Function to call script or submit.
 def RestartCase(i0=None):
     r"""Restart a case by either submitting it or calling with a system
@@ -442,6 +478,9 @@ def RestartCase(i0=None):
     # Check for exit
     if n and n >= rc.get_LastIter():
         return
+    # Check if stopped by convergence monitor
+    if monitor.CheckConverged(rc):
+        return
     # Check qsub status.
     if not (qpbs or qslr):
         # Run the case.
@@ -570,6 +609,8 @@ def GetPhaseNumber(rc):
     """
     # Get the run index.
     n = GetRestartIter()
+    # Phase stopped early by convergence monitor, if any
+    jconv = monitor.GetConvergedPhase()
     # Global options
     qdual = rc.get_Dual()
     qadpt = rc.get_Adaptive()
@@ -588,6 +629,9 @@ def GetPhaseNumber(rc):
         elif n is None:
             # No iters yet
             return i
+        elif i == jconv:
+            # Phase stopped early by convergence monitor
+            pass
         elif n < rc.get_PhaseIters(j):
             # This case has been run, but hasn't reached the min iter cutoff
             return i
@@ -93,6 +93,48 @@ def Plt2Triq(fplt, ftriq=None, **kw):
     triq.Write(ftriq, **kw)
 
 
+# Convert several PLTs to TRIQs
+def Plt2TriqBatch(fplts, ftriqs=None, nProc=1, **kw):
+    r"""Convert several FUN3D PLT files on the same grid to TRIQ files
+
+    :Call:
+        >>> ftriqs = Plt2TriqBatch(fplts, ftriqs=None, nProc=1, **kw)
+    :Inputs:
+        *fplts*: :class:`list`\ [:class:`str`]
+            Names of Tecplot PLT files
+        *ftriqs*: {``None``} | :class:`list`\ [:class:`str`]
+            Names of output files (default: replace ``.plt`` with
+            ``.triq``)
+        *nProc*: {``1``} | :class:`int`
+            Number of files to convert simultaneously
+        *mach*: {``1.0``} | positive :class:`float`
+            Freestream Mach number for skin friction coeff conversion
+        *triload*: {``True``} | ``False``
+            Whether or not to write a triq tailored for ``triloadCmd``
+        *avg*: {``True``} | ``False``
+            Use time-averaged states if available
+        *rms*: ``True`` | {``False``}
+            Use root-mean-square variation instead of nominal value
+    :Outputs:
+        *ftriqs*: :class:`list`\ [:class:`str`]
+            Names of TRIQ files written
+    :See also:
+        * :func:`cape.plt.Plt2TriqBatch`
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Check for mapbc file
+    fglob = glob.glob("*.mapbc")
+    # Check for more than one
+    if len(fglob) > 0:
+        # Make a crude attempt at sorting
+        fglob.sort()
+        # Import the alphabetically last one (should be the same anyway)
+        kw["mapbc"] = mapbc.MapBC(fglob[0])
+    # Convert files
+    return capeplt.Plt2TriqBatch(fplts, ftriqs, nProc=nProc, cls=Plt, **kw)
+
+
 # Tecplot class
 class Plt(capeplt.Plt):
     r"""Interface for Tecplot PLT files
@@ -123,6 +165,33 @@ class Plt(capeplt.Plt):
         * 2016-11-22 ``@ddalle``: First version
         * 2017-03-30 ``@ddalle``: Subclassed to :class:`cape.plt.Plt`
     """
+    # Get states for triq file
+    def GetTriqState(self, **kw):
+        r"""Get state variables at each node for a triq file
+
+        This adds *cp_tavg* using :func:`GetCpTAvg` if *mach* is given.
+
+        :Call:
+            >>> q = plt.GetTriqState(mach=1.0, triload=True, **kw)
+        :Inputs:
+            *plt*: :class:`cape.pyfun.plt.Plt`
+                Tecplot PLT interface
+            *mach*: {``None``} | positive :class:`float`
+                Freestream Mach number
+        :Outputs:
+            *q*: :class:`np.ndarray`\ [:class:`float`]
+                States at each node, (*nNode*, *nq*)
+        :See also:
+            * :func:`cape.plt.Plt.GetTriqState`
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Attempt to get *cp_tavg* state
+        if "mach" in kw:
+            self.GetCpTAvg(float(kw["mach"]))
+        # Call parent method
+        return capeplt.Plt.GetTriqState(self, **kw)
+
     # Calculate cp_tavg
     def GetCpTAvg(self, mach, gam=1.4):
         r"""Calculate *cp_tavg* if *p_tavg* exists
@@ -138,6 +207,7 @@ class Plt(capeplt.Plt):
                 Ratio of specific heats
         :Versions:
             * 2017-05-16 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Version 1.1; update offsets
         """
         # Check if already present
         if 'cp_tavg' in self.Vars:
@@ -162,6 +232,9 @@ class Plt(capeplt.Plt):
             cp = (self.q[n][:,k] - 1/gam)/(0.5*mach*mach)
             # Append state
             self.q[n] = np.hstack((self.q[n], np.transpose([cp])))
+            # Mark new variable as not in file for ReadZoneVar()
+            if hasattr(self, "_qpos"):
+                self._qpos[n] = np.append(self._qpos[n], -1)
             # Update min/max
             self.qmin[n,-1] = np.min(cp)
             self.qmax[n,-1] = np.max(cp)
@@ -17,7 +17,7 @@ import numpy as np
 # Local imprts
 from .. import argread
 from .. import text as textutils
-from .plt import Plt2Triq
+from .plt import Plt2Triq, Plt2TriqBatch
 
 
 # Template help messages
@@ -55,6 +55,7 @@ Convert a Tecplot ``.plt`` file from FUN3D
     
         $ pyfun-plt2triq PLT [TRIQ] [OPTIONS]
         $ pyfun-plt2triq -i PLT [-o TRIQ] [OPITONS] 
+        $ pyfun-plt2triq PLT1 PLT2 ... --batch [OPTIONS]
 
 :Inputs:
     * *PLT*: Name of FUN3D Tecplot ``.plt`` file
@@ -81,6 +82,12 @@ Convert a Tecplot ``.plt`` file from FUN3D
         
     --rms
         Write RMS of each variable instead of nominal/average value
+
+    --batch
+        Convert each *PLT* listed; they must be on the same grid
+
+    --nproc NPROC
+        Convert up to *NPROC* files at once with ``--batch``
     
 If the name of the output file is not specified, it will just add ``triq`` as
 the extension to the input (replacing ``.plt`` if possible).
@@ -112,12 +119,23 @@ def plt2triq(*a, **kw):
             Use time-averaged states if available
         *rms*: ``True`` | {``False``}
             Use root-mean-square variation instead of nominal value
+        *batch*: ``True`` | {``False``}
+            Convert each file in *a* using :func:`Plt2TriqBatch`
+        *nproc*: {``1``} | :class:`int`
+            Number of files to convert at once if *batch*
     :See also:
         * :func:`cape.pyfun.plt.Plt2Triq`
+        * :func:`cape.pyfun.plt.Plt2TriqBatch`
     :Versions:
         * 2016-12-19 ``@ddalle``: Version 1.0; :func:`Plt2Triq`
         * 2021-10-01 ``@ddalle``: Version 2.0
+        * 2026-10-18 ``@ddalle``: Version 2.1; add *batch*
     """
+    # Check for batch of input files
+    if kw.get("batch"):
+        # Convert files
+        Plt2TriqBatch(list(a), nProc=int(kw.get("nproc", 1)), **kw)
+        return
     # Get input file name
     fplt = _get_i(*a, **kw)
     # Get output file name
@@ -30,6 +30,7 @@ from .. import text as textutils
 from .jobxml import JobXML
 from ..cfdx import bin
 from ..cfdx import case as cc
+from ..cfdx import monitor
 from ..cfdx import queue
 from ..tnakit import fileutils
 from .options.runcontrol import RunControl
@@ -178,8 +179,12 @@ def run_phase(rc, j):
         xml.write()
         # Get the ``csi`` command
         cmdi = cmdgen.csi(rc, j)
+        # Remove convergence marker from previous phase or run
+        monitor.ClearConverged()
+        # Convergence monitor, if any
+        mon = get_monitor(rc, j)
         # Run the command
-        bin.callf(cmdi, f="kestrel.out")
+        bin.callf(cmdi, f="kestrel.out", monitor=mon)
         # Check new iteration number
         n1 = get_current_iter()
         # Check for lack of progress
@@ -188,6 +193,31 @@ def run_phase(rc, j):
                 "Running phase %i did not advance iteration count" % j)
 
 
+def get_monitor(rc, j):
+    r"""Create convergence monitor for a phase, if requested
+
+    :Call:
+        >>> mon = get_monitor(rc, j)
+    :Inputs:
+        *rc*: :class:`RunControl`
+            Options interface from ``case.json``
+        *j*: :class:`int`
+            Phase number
+    :Outputs:
+        *mon*: :class:`cape.cfdx.monitor.CaseMonitor` | ``None``
+            Convergence monitor, if *Monitor* option is set
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Check option
+    if not rc.get_Monitor(j):
+        return None
+    # Import history readers (dataBook imports this module)
+    from .dataBook import CaseFM, CaseResid
+    # Create monitor
+    return monitor.CaseMonitor(rc, j, fm=CaseFM, resid=CaseResid)
+
+
 def resubmit_case(rc, j0):
     r"""Resubmit a case as a new job if appropriate
 
@@ -293,6 +323,9 @@ def check_complete(rc):
     :Versions:
         * 2022-01-20 ``@ddalle``: Version 1.0
     """
+    # Check if stopped by convergence monitor
+    if monitor.CheckConverged(rc):
+        return True
     # Determine current phase
     j = get_phase(rc)
     # Check if last phase
@@ -435,6 +468,8 @@ def get_phase(rc):
         # Check iteration count
         if n >= rc.get_PhaseIters(j):
             return j
+    # Phase stopped early by convergence monitor, if any
+    jconv = monitor.GetConvergedPhase()
     # Loop through phases
     for j in rc.get_PhaseSequence():
         # Target iterations for this phase
@@ -444,8 +479,8 @@ def get_phase(rc):
             # This phase has not been run
             return j
         # Check the iteration- numbers
-        if nt is None:
-            # Don't check null phases
+        if nt is None or j == jconv:
+            # Don't check null phases or phases stopped by monitor
             pass
         elif n < nt:
             # Case has been run but hasn't reached target
@@ -35,6 +35,7 @@ from .. import argread
 from .. import text as textutils
 from ..cfdx import queue
 from ..cfdx import case as cc
+from ..cfdx import monitor
 from .options.runControl import RunControl
 from .overNamelist import OverNamelist
 
@@ -128,8 +129,12 @@ def run_overflow():
     shutil.copy("%s.%02i.inp" % (fproj, i+1), "over.namelist")
     # Get the ``overrunmpi`` command
     cmdi = cmd.overrun(rc, i=i)
+    # Remove convergence marker from previous phase or run
+    monitor.ClearConverged()
+    # Convergence monitor, if any
+    mon = GetMonitor(rc, i)
     # Call the command
-    bin.callf(cmdi, f="overrun.out", check=False)
+    bin.callf(cmdi, f="overrun.out", check=False, monitor=mon)
     # Get the most recent iteration number
     n = GetCurrentIter()
     # Check for "PostCmds"
@@ -179,6 +184,9 @@ def run_overflow():
     elif (nstop is not None) and (n >= nstop):
         # Stop requested externally
         return
+    elif monitor.CheckConverged(rc):
+        # Stopped by convergence monitor
+        return
     elif (n is None) or ((n0 is not None) and n <= n0):
         # Failed to advance
         with open("FAIL", "w") as fp:
@@ -271,6 +279,42 @@ def WriteStopIter(n=0):
     # Close the file
     f.close()
         
+
+# Create convergence monitor
+def GetMonitor(rc, i):
+    """Create convergence monitor for a phase, if requested
+    
+    The monitor stops OVERFLOW by writing a ``STOP`` file unless the
+    *StopFile* option says otherwise.
+    
+    :Call:
+        >>> mon = GetMonitor(rc, i)
+    :Inputs:
+        *rc*: :class:`pyOver.options.runControl.RunControl`
+            Options interface from ``case.json``
+        *i*: :class:`int`
+            Phase number
+    :Outputs:
+        *mon*: :class:`cape.cfdx.monitor.CaseMonitor` | ``None``
+            Convergence monitor, if *Monitor* option is set
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Check option
+    if not rc.get_Monitor(i):
+        return None
+    # Import history readers (dataBook imports this module)
+    from .dataBook import CaseFM, CaseResid
+    # Project name
+    proj = GetPrefix(rc, i)
+    # Create monitor
+    return monitor.CaseMonitor(
+        rc, i,
+        fm=lambda comp: CaseFM(proj, comp),
+        resid=lambda: CaseResid(proj),
+        stopfile="STOP")
+        
+
 # Function to call script or submit
 def RestartCase(i0=None):
     """Restart a case by either submitting it or calling with a system command
@@ -304,6 +348,9 @@ def RestartCase(i0=None):
     print("   Previous phase: %.2f hrs" % (dtwall/3600.0))
     # Don't check time if moving to new phase
     qtime = qtime or (i0 is not None and i0!=i)
+    # Check if stopped by convergence monitor
+    if monitor.CheckConverged(rc):
+        return
     # Check qsub status.
     if not (qpbs or qslr):
         # Run the case.
@@ -496,6 +543,8 @@ def GetPhaseNumber(rc):
     """
     # Get the run index.
     n = GetRestartIter(rc)
+    # Phase stopped early by convergence monitor, if any
+    jconv = monitor.GetConvergedPhase()
     # Initialize list of phases with adequate iters
     JIter = []
     # Initialize list of phases with detected STDOUT files
@@ -511,7 +560,7 @@ def GetPhaseNumber(rc):
             # This run has an output file
             JRun.append(j)
         # Check the iteration number.
-        if n >= rc.get_PhaseIters(j):
+        if n >= rc.get_PhaseIters(j) or i == jconv:
             # The iterations are adequate for this phase
             JIter.append(j)
     # Get phase numbers from the two types
@@ -26,6 +26,38 @@ import cape.plot3d
 import cape.tnakit.typeutils as typeutils
 
 
+# Convert grid indices to a slice that covers them
+def _grid_slice(I):
+    r"""Convert zero-based grid indices to a bounding slice
+
+    :Call:
+        >>> s, I1 = _grid_slice(I)
+    :Inputs:
+        *I*: :class:`int` | :class:`np.ndarray`\ [:class:`int`]
+            Scalar index or array of indices
+    :Outputs:
+        *s*: :class:`int` | :class:`slice`
+            Scalar index or slice from ``min(I)`` to ``max(I)``
+        *I1*: ``None`` | :class:`np.ndarray`\ [:class:`int`]
+            Indices relative to *s* if *I* is not a contiguous range
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Check for scalar
+    if np.ndim(I) == 0:
+        return int(I), None
+    # Ensure array
+    I = np.asarray(I, dtype="int")
+    # Range
+    i0 = int(np.min(I))
+    i1 = int(np.max(I)) + 1
+    # Check for contiguous range
+    if I.size == i1 - i0 and np.all(np.diff(I) == 1):
+        return slice(i0, i1), None
+    # Bounding slice and relative indices
+    return slice(i0, i1), I - i0
+
+
 # OVERFLOW Plot3D template
 class P3D(cape.plot3d.X):
     """
@@ -84,7 +116,7 @@ class P3D(cape.plot3d.X):
             * 2019-05-24 ``@ddalle``: First version
         """
         # Check if the file is open
-        if isinstance(self.f, file) and (not self.f.closed):
+        if typeutils.isfile(self.f) and (not self.f.closed):
             # Close the file
             self.f.close()
 
@@ -275,9 +307,9 @@ class P3D(cape.plot3d.X):
         KDEF = KS if KS==KE else np.arange(KS,KE+1)
         LDEF = LS if LS==LE else np.arange(LS,LE+1)
         # Process direct indices
-        J = kw.get("J", JDEF) - 1
-        K = kw.get("K", KDEF) - 1
-        L = kw.get("L", LDEF) - 1
+        J = np.asarray(kw.get("J", JDEF)) - 1
+        K = np.asarray(kw.get("K", KDEF)) - 1
+        L = np.asarray(kw.get("L", LDEF)) - 1
         # Output
         return J, K, L
 
@@ -291,24 +323,31 @@ class Q(P3D):
     General OVERFLOW ``q`` file interface
 
     :Call:
-        >>> q = pyOver.plot3d.Q(fname, endian=None)
+        >>> q = pyOver.plot3d.Q(fname, endian=None, lazy=False, index=False)
     :Inputs:
         *fname*: :class:`str`
             Name of file to read
         *endian*: {``None``} | "big" | "little"
             Manually-specified byte order
+        *lazy*: ``True`` | {``False``}
+            Only scan grid offsets; read grids on demand using
+            memory-mapped views
+        *index*: ``True`` | {``False``}
+            Whether or not to use/write sidecar index file if *lazy*
     :Outputs:
         *q*: :class:`pyOver.plot3d.Q`
             General OVERFLOW q-file interface
     :Versions:
         * 2016-02-26 ``@ddalle``: First version
+        * 2026-10-18 ``@ddalle``: Add *lazy* and *index*
     """
     # Initialization method
-    def __init__(self, fname, endian=None):
+    def __init__(self, fname, endian=None, lazy=False, index=False):
         """Initialization method
 
         :Versions:
             * 2016-02-26 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Add *lazy* and *index*
         """
         # Save the file name
         self.fname = fname
@@ -325,8 +364,15 @@ class Q(P3D):
         self.get_byteorder(endian)
         # Get flags
         self.get_dtypes()
+        # Memory-mapped grids
+        self._QMap = {}
         # Read the file
-        self.Read()
+        if lazy:
+            # Just find where each grid is
+            self.ScanGrids(index=index)
+        else:
+            # Read all grids
+            self.Read()
 
     # Read the file
     def Read(self):
@@ -364,6 +410,81 @@ class Q(P3D):
 
         # Close the file
         self.close()
+        # Calculate dimensional freestream states
+        self.GetFreestream()
+
+    # Scan the file for grid locations
+    def ScanGrids(self, index=False):
+        r"""Read headers and find the location of each grid's data
+
+        This reads the header record of each grid but skips over the
+        solution data, so that individual grids can later be accessed
+        using :func:`GetQGrid` or :func:`ReadQGrid` without reading the
+        whole file.
+
+        :Call:
+            >>> q.ScanGrids(index=False)
+        :Inputs:
+            *q*: :class:`pyOver.plot3d.Q`
+                General OVERFLOW q-file interface
+            *index*: ``True`` | {``False``}
+                Use sidecar index file if valid; write it otherwise
+        :Data members:
+            *q.Q*: :class:`list`\ [``None``]
+                Placeholder for each grid's solution array
+            *q.GridHeaderOffset*: :class:`np.ndarray`\ [:class:`int`]
+                Byte offset of header record for each grid
+            *q.GridOffset*: :class:`np.ndarray`\ [:class:`int`]
+                Byte offset of first value of each grid's solution
+            *q.GridPrec*: :class:`np.ndarray`\ [:class:`int`]
+                Bytes per value (``4`` or ``8``) for each grid
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Try the sidecar index
+        if index and self.ReadGridIndex():
+            # Read each grid's header directly
+            for i in range(self.nGrid):
+                # Go to header record
+                self.f.seek(self.GridHeaderOffset[i])
+                # Read it
+                self.ReadQHeader(i+1)
+        else:
+            # Open file if necessary
+            self.open()
+            # Get number of grids
+            nGrid = self.GetNGrid()
+            # Read grid dimensions
+            self.GetGridDims()
+            # Initialize header quantities
+            self.InitHeaders()
+            # Loop through grids
+            for i in range(nGrid):
+                # Read header but skip data
+                self.ReadQHeader(i+1)
+                self.SkipQData(i+1)
+            # Save index
+            if index:
+                self.WriteGridIndex()
+        # Close the file
+        self.close()
+        # Empty solution list
+        self.Q = [None for i in range(self.nGrid)]
+        # Calculate dimensional freestream states
+        self.GetFreestream()
+
+    # Calculate freestream states
+    def GetFreestream(self):
+        """Calculate dimensional freestream states from header values
+
+        :Call:
+            >>> q.GetFreestream()
+        :Inputs:
+            *q*: :class:`pyOver.plot3d.Q`
+                General OVERFLOW q-file interface
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Split from :func:`Read`
+        """
         # Freestream viscosity
         self.MUINF = self.mu0 * self.TINF**1.5 / (self.TINF+self.TREF)
         # Freestream speed of sound
@@ -494,6 +615,10 @@ class Q(P3D):
         self._FSMACH  = np.zeros(nGrid, dtype=self.ftype)
         self._TVREF   = np.zeros(nGrid, dtype=self.ftype)
         self._DTVREF  = np.zeros(nGrid, dtype=self.ftype)
+        # Location and precision of each grid
+        self.GridHeaderOffset = np.zeros(nGrid, dtype="i8")
+        self.GridOffset = np.zeros(nGrid, dtype="i8")
+        self.GridPrec = np.full(nGrid, 8, dtype="i4")
 
     # Read the header info
     def ReadQHeader(self, IG=None):
@@ -508,6 +633,7 @@ class Q(P3D):
                 Grid number to read, defaults to ``len(q.Q)+1``
         :Versions:
             * 2016-02-26 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Save offset; allow single precision
         """
         # Expected number of *RGAS* values
         nRGAS = max(2, self.NQC)
@@ -516,19 +642,28 @@ class Q(P3D):
         n2 = 6 + nRGAS
         # Expected number of bytes in the record
         i1 = (n1+n2)*8 + 4
+        # Save location of record
+        if IG is not None:
+            self.GridHeaderOffset[IG-1] = self.f.tell()
         # Read start-of-record
         i0 = self.read_int()
         # Check it
-        if i0 != i1:
+        if i0 == i1:
+            # Double precision
+            ftype = self.ftype
+        elif i0 == (n1+n2)*4 + 4:
+            # Single precision
+            ftype = self.ftype[0] + "f4"
+        else:
             self.close()
             raise ValueError(
                 "Header record contains %i bytes; expecting %i" % (i0, i1))
         # Read the first block of header data
-        F1 = self.read_float(n1)
+        F1 = np.fromfile(self.f, count=n1, dtype=ftype)
         # Read the IGAM setting
         self.IGAMMA = self.read_int()
         # Read the second block of header data
-        F2 = self.read_float(n2)
+        F2 = np.fromfile(self.f, count=n2, dtype=ftype)
         # Unpack the headers
         self.REFMACH = F1[0]
         self.ALPHA   = F1[1]
@@ -583,6 +718,7 @@ class Q(P3D):
                 Solution array
         :Versions:
             * 2016-02-26 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Save offset; allow single precision
         """
         # Make sure there is a solution vector
         try:
@@ -598,29 +734,271 @@ class Q(P3D):
         elif IG > len(self.Q):
             # Append to the solution list
             self.Q += [None for i in range(len(self.Q),IG)]
+        # Find data record and precision
+        NQ, LD, KD, JD = self._read_qdata_marker(IG)
+        # Read the values
+        qi = np.fromfile(
+            self.f, count=NQ*LD*KD*JD, dtype=self._get_grid_dtype(IG))
+        # Reshape and save
+        self.Q[IG-1] = np.reshape(qi, (NQ, LD, KD, JD))
+        # Read end-of-record
+        self.read_int()
+
+    # Skip data
+    def SkipQData(self, IG):
+        """Skip a grid's solution data, saving its location
+
+        :Call:
+            >>> q.SkipQData(IG)
+        :Inputs:
+            *q*: :class:`pyOver.plot3d.Q`
+                General OVERFLOW q-file interface
+            *IG*: :class:`int`
+                Grid number (one-based index)
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Find data record and precision
+        NQ, LD, KD, JD = self._read_qdata_marker(IG)
+        # Skip values and end-of-record
+        self.f.seek(NQ*LD*KD*JD*self.GridPrec[IG-1] + 4, 1)
+
+    # Read start-of-record for grid data
+    def _read_qdata_marker(self, IG):
         # Total number of states
         NQ = self.NQ + self.NQC
         # Get dimensions
         JD = self.JD[IG-1]
         KD = self.KD[IG-1]
         LD = self.LD[IG-1]
-        # Total number of points
-        NPT = JD*KD*LD
-        # Expected length
-        i1 = NPT * NQ * 8
+        # Total number of values
+        N = int(NQ*LD*KD*JD)
         # Read record length
         i0 = self.read_int()
         # Check consistency
-        if i0 != i1:
+        if i0 == N*8:
+            # Double precision
+            self.GridPrec[IG-1] = 8
+        elif i0 == N*4:
+            # Single precision
+            self.GridPrec[IG-1] = 4
+        else:
             self.close()
             raise ValueError(
                 "Record for grid %i has incorrect length" % (IG))
-        # Read the values
-        qi = self.read_float(NPT*NQ)
-        # Reshape and save
-        self.Q[IG-1] = np.reshape(qi, (NQ, LD, KD, JD))
-        # Read end-of-record
-        self.read_int()
+        # Save location of first value
+        self.GridOffset[IG-1] = self.f.tell()
+        # Output
+        return NQ, LD, KD, JD
+
+    # Get data type for a grid
+    def _get_grid_dtype(self, IG):
+        return "%sf%i" % (self.ftype[0], self.GridPrec[IG-1])
+
+    # Default index file name
+    def get_index_file(self, fidx=None):
+        """Get name of sidecar grid index file
+
+        :Call:
+            >>> fidx = q.get_index_file(fidx=None)
+        :Inputs:
+            *q*: :class:`pyOver.plot3d.Q`
+                General OVERFLOW q-file interface
+            *fidx*: {``None``} | :class:`str`
+                Manually specified index file name
+        :Outputs:
+            *fidx*: :class:`str`
+                Index file name, defaults to ``q.fname + ".idx"``
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Check for manual name
+        if fidx is None:
+            return self.fname + ".idx"
+        else:
+            return fidx
+
+    # Write index file
+    def WriteGridIndex(self, fidx=None):
+        """Write table of grid dimensions and offsets to index file
+
+        :Call:
+            >>> q.WriteGridIndex(fidx=None)
+        :Inputs:
+            *q*: :class:`pyOver.plot3d.Q`
+                General OVERFLOW q-file interface
+            *fidx*: {``None``} | :class:`str`
+                Index file name, defaults to ``q.fname + ".idx"``
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Get file name
+        fidx = self.get_index_file(fidx)
+        # Table of grid info
+        A = np.stack((
+            self.JD, self.KD, self.LD,
+            self.GridHeaderOffset, self.GridOffset, self.GridPrec), axis=1)
+        # Try to write it (folder might not be writable)
+        try:
+            with open(fidx, "w") as fp:
+                # File info
+                fp.write("# nGrid NQ NQC mGrid endian size\n")
+                fp.write("%i %i %i %i %s %i\n" % (
+                    self.nGrid, self.NQ, self.NQC, self.mGrid, self.endian,
+                    os.path.getsize(self.fname)))
+                # Grid table
+                fp.write("# JD KD LD header_offset offset prec\n")
+                np.savetxt(fp, A, fmt="%i")
+        except (IOError, OSError):
+            pass
+
+    # Read index file
+    def ReadGridIndex(self, fidx=None):
+        """Read table of grid dimensions and offsets from index file
+
+        The index is ignored if it is older than the ``q`` file or
+        refers to a file of a different size.
+
+        :Call:
+            >>> q_ok = q.ReadGridIndex(fidx=None)
+        :Inputs:
+            *q*: :class:`pyOver.plot3d.Q`
+                General OVERFLOW q-file interface
+            *fidx*: {``None``} | :class:`str`
+                Index file name, defaults to ``q.fname + ".idx"``
+        :Outputs:
+            *q_ok*: ``True`` | ``False``
+                Whether or not a valid index was read
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Get file name
+        fidx = self.get_index_file(fidx)
+        # Check for file
+        if not os.path.isfile(fidx):
+            return False
+        # Check if index is out of date
+        if os.path.getmtime(fidx) < os.path.getmtime(self.fname):
+            return False
+        # Read it
+        with open(fidx, "r") as fp:
+            # Skip comment
+            fp.readline()
+            # Read file info
+            V = fp.readline().split()
+            # Read table
+            A = np.loadtxt(fp, dtype="i8", ndmin=2)
+        # Check file info
+        if len(V) != 6 or V[4] != self.endian:
+            return False
+        elif int(V[5]) != os.path.getsize(self.fname):
+            return False
+        elif A.shape != (int(V[0]), 6):
+            return False
+        # Save file info
+        self.nGrid = int(V[0])
+        self.mGrid = bool(int(V[3]))
+        self.NQ = int(V[1])
+        self.NQC = int(V[2])
+        # Save dimensions
+        self.JD = np.asarray(A[:,0], dtype=self.itype)
+        self.KD = np.asarray(A[:,1], dtype=self.itype)
+        self.LD = np.asarray(A[:,2], dtype=self.itype)
+        # Initialize header quantities
+        self.InitHeaders()
+        # Save locations
+        self.GridHeaderOffset[:] = A[:,3]
+        self.GridOffset[:] = A[:,4]
+        self.GridPrec[:] = A[:,5]
+        # Open the file for header reads
+        self.open()
+        # Output
+        return True
+
+    # Get a grid
+    def GetQGrid(self, IG):
+        """Get solution array for one grid, memory-mapped if not read
+
+        :Call:
+            >>> Q = q.GetQGrid(IG)
+        :Inputs:
+            *q*: :class:`pyOver.plot3d.Q`
+                General OVERFLOW q-file interface
+            *IG*: :class:`int`
+                Grid number (one-based index)
+        :Outputs:
+            *Q*: :class:`numpy.ndarray` | :class:`numpy.memmap`
+                Solution array, shape (*NQ*, *LD*, *KD*, *JD*)
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Check for grid already read
+        if self.Q[IG-1] is not None:
+            return self.Q[IG-1]
+        # Check for existing map
+        if IG in self._QMap:
+            return self._QMap[IG]
+        # Dimensions
+        shape = (
+            self.NQ + self.NQC, self.LD[IG-1], self.KD[IG-1], self.JD[IG-1])
+        # Map the grid's data
+        Q = np.memmap(
+            self.fname, dtype=self._get_grid_dtype(IG), mode="r",
+            offset=self.GridOffset[IG-1], shape=shape)
+        # Save it
+        self._QMap[IG] = Q
+        # Output
+        return Q
+
+    # Get subset of a grid
+    def ReadQGrid(self, IG, **kw):
+        """Get solution for a subset of one grid
+
+        Contiguous index ranges are returned as views of the (possibly
+        memory-mapped) solution array, so only the requested portion of
+        the file is read.
+
+        :Call:
+            >>> Q = q.ReadQGrid(IG, **kw)
+        :Inputs:
+            *q*: :class:`pyOver.plot3d.Q`
+                General OVERFLOW q-file interface
+            *IG*: :class:`int`
+                Grid number (one-based index)
+        :Keyword arguments:
+            *J*, *JS*, *JE*, *K*, *KS*, *KE*, *L*, *LS*, *LE*: :class:`int`
+                Grid indices; see :func:`expand_grid_indices`
+        :Outputs:
+            *Q*: :class:`numpy.ndarray`
+                Solution subset, shape (*NQ*, *nL*, *nK*, *nJ*) with
+                dimensions for scalar indices removed
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Expand grid indices
+        J, K, L = self.expand_grid_indices(IG, **kw)
+        # Get whole grid
+        Q = self.GetQGrid(IG)
+        # Convert indices to bounding slices
+        sJ, iJ = _grid_slice(J)
+        sK, iK = _grid_slice(K)
+        sL, iL = _grid_slice(L)
+        # View of bounding box
+        Q = Q[:, sL, sK, sJ]
+        # Current axis
+        ax = 1
+        # Apply any non-contiguous indices
+        for s, I in ((sL, iL), (sK, iK), (sJ, iJ)):
+            # Check for dropped dimension
+            if not isinstance(s, slice):
+                continue
+            # Take subset
+            if I is not None:
+                Q = np.take(Q, I, axis=ax)
+            # Next axis
+            ax += 1
+        # Output
+        return Q
 
     # Extract CP
     def get_Cp(self, IG, **kw):
@@ -659,26 +1037,25 @@ class Q(P3D):
             :func:`expand_grid_indices`
         :Versions:
             * 2016-02-26 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Only read requested subset
         """
-        # Expand grid indices
-        J, K, L = self.expand_grid_indices(IG, **kw)
         # Extract freestream states
         M_inf = self.FSMACH
         g_inf = self.GAMINF
-        # Extract the *q* grid
-        Q = self.Q[IG-1]
+        # Extract the *q* grid or subset (only reads requested points)
+        Q = self.ReadQGrid(IG, **kw)
         # Get normalized density and energy
-        rhostar = Q[0,J,K,L]
+        rhostar = Q[0]
         # Get the velocity components
-        ustar = Q[1,J,K,L] / rhostar
-        vstar = Q[2,J,K,L] / rhostar
-        wstar = Q[3,J,K,L] / rhostar
+        ustar = Q[1] / rhostar
+        vstar = Q[2] / rhostar
+        wstar = Q[3] / rhostar
         # Velocity
         U2star = ustar*ustar + vstar*vstar + wstar*wstar
         # Get internal energy
-        estar = Q[4,J,K,L]/rhostar - 0.5*U2star
+        estar = Q[4]/rhostar - 0.5*U2star
         # Ratios of specific heats
-        gam = Q[5,J,K,L]
+        gam = Q[5]
         # Non-dimensional pressures
         pstar = (gam-1)*rhostar*estar
         # Pressure coefficient
@@ -723,26 +1100,25 @@ class Q(P3D):
             :func:`expand_grid_indices`
         :Versions:
             * 2016-03-07 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Only read requested subset
         """
-        # Expand grid indices
-        J, K, L = self.expand_grid_indices(IG, **kw)
         # Extract freestream states
         M_inf = self.FSMACH
         g_inf = self.GAMINF
-        # Extract the *q* grid
-        Q = self.Q[IG-1]
+        # Extract the *q* grid or subset (only reads requested points)
+        Q = self.ReadQGrid(IG, **kw)
         # Get normalized density and energy
-        rhostar = Q[0,J,K,L]
+        rhostar = Q[0]
         # Get the velocity components
-        ustar = Q[1,J,K,L] / rhostar
-        vstar = Q[2,J,K,L] / rhostar
-        wstar = Q[3,J,K,L] / rhostar
+        ustar = Q[1] / rhostar
+        vstar = Q[2] / rhostar
+        wstar = Q[3] / rhostar
         # Velocity
         U2star = ustar*ustar + vstar*vstar + wstar*wstar
         # Get internal energy
-        estar = Q[4,J,K,L]/rhostar - 0.5*U2star
+        estar = Q[4]/rhostar - 0.5*U2star
         # Ratios of specific heats
-        gam = Q[5,J,K,L]
+        gam = Q[5]
         # Non-dimensional pressures
         pstar = (gam-1)*rhostar*estar
         # Sound speed
@@ -789,27 +1165,26 @@ class Q(P3D):
             :func:`expand_grid_indices`
         :Versions:
             * 2016-03-07 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Only read requested subset
         """
-        # Expand grid indices
-        J, K, L = self.expand_grid_indices(IG, **kw)
         # Extract freestream states
         M_inf = self.FSMACH
         g_inf = self.GAMINF
         p_inf = self.PINF
-        # Extract the *q* grid
-        Q = self.Q[IG-1]
+        # Extract the *q* grid or subset (only reads requested points)
+        Q = self.ReadQGrid(IG, **kw)
         # Get normalized density and energy
-        rhostar = Q[0,J,K,L]
+        rhostar = Q[0]
         # Get the velocity components
-        ustar = Q[1,J,K,L] / rhostar
-        vstar = Q[2,J,K,L] / rhostar
-        wstar = Q[3,J,K,L] / rhostar
+        ustar = Q[1] / rhostar
+        vstar = Q[2] / rhostar
+        wstar = Q[3] / rhostar
         # Velocity
         U2star = ustar*ustar + vstar*vstar + wstar*wstar
         # Get internal energy
-        estar = Q[4,J,K,L]/rhostar - 0.5*U2star
+        estar = Q[4]/rhostar - 0.5*U2star
         # Ratios of specific heats
-        gam = Q[5,J,K,L]
+        gam = Q[5]
         # Non-dimensional pressures
         pstar = (gam-1)*rhostar*estar
         # Dimensional pressures
@@ -852,17 +1227,16 @@ class Q(P3D):
             :func:`expand_grid_indices`
         :Versions:
             * 2016-03-07 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Only read requested subset
         """
-        # Expand grid indices
-        J, K, L = self.expand_grid_indices(IG, **kw)
         # Extract freestream states
         M_inf = self.FSMACH
         g_inf = self.GAMINF
         T_inf = self.TINF
-        # Extract the *q* grid
-        Q = self.Q[IG-1]
+        # Extract the *q* grid or subset (only reads requested points)
+        Q = self.ReadQGrid(IG, **kw)
         # Get normalized density and energy
-        rhostar = Q[0,J,K,L]
+        rhostar = Q[0]
         # Number of species
         NQC = max(1, self.NQC)
         # Check for nontrivial gas constant
@@ -878,19 +1252,19 @@ class Q(P3D):
             Rstar = 0.0
             # Loop through species
             for i in range(NQC):
-                Rstar += self.RGAS[i] * Q[NQ-NQC-1+i,J,K,L]/rhostar
+                Rstar += self.RGAS[i] * Q[NQ-NQC-1+i]/rhostar
         # Get the velocity components
-        ustar = Q[1,J,K,L] / rhostar
-        vstar = Q[2,J,K,L] / rhostar
-        wstar = Q[3,J,K,L] / rhostar
+        ustar = Q[1] / rhostar
+        vstar = Q[2] / rhostar
+        wstar = Q[3] / rhostar
         # Velocity
         U2star = ustar*ustar + vstar*vstar + wstar*wstar
         # Get internal energy
-        estar = Q[4,J,K,L]/rhostar - 0.5*U2star
+        estar = Q[4]/rhostar - 0.5*U2star
         # Temperature
         return estar
         # Ratios of specific heats
-        gam = Q[5,J,K,L]
+        gam = Q[5]
         # Non-dimensional pressures
         Tstar = (gam-1)*estar / Rstar
         # Dimensional pressures
@@ -292,6 +292,31 @@ class Report(capereport.Report):
         # Output
         return R
         
+    # Get key for residual reads
+    def GetCaseResidKey(self, sfig=None):
+        r"""Get key for subfigure options that affect residual reads
+
+        :Call:
+            >>> key = R.GetCaseResidKey(sfig=None)
+        :Inputs:
+            *R*: :class:`cape.pyover.report.Report`
+                Automated report interface
+            *sfig*: {``None``} | :class:`str`
+                Name of subfigure
+        :Outputs:
+            *key*: :class:`tuple`
+                Subfigure type, *Residual*, and *Grid* options
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Options
+        opts = self.cntl.opts
+        # Options used in ReadCaseResid()
+        return (
+            opts.get_SubfigBaseType(sfig),
+            opts.get_SubfigOpt(sfig, "Residual"),
+            str(opts.get_SubfigOpt(sfig, "Grid")))
+
     # Read a Tecplot script
     def ReadTecscript(self, fsrc):
         """Read a Tecplot script interface
@@ -59,8 +59,19 @@ Modules included within this one are outlined below.
 # Standard library
 import os
 
-# Import Control module
-from .cntl import Cntl, RunMatrix
+# Local imports
+from .._lazy import lazy_getattr
+
+# Classes imported from submodules on first access
+_LAZY_ATTRS = {
+    "Cntl": "cntl",
+    "RunMatrix": "cntl",
+}
+
+
+# Import classes and submodules only when needed
+def __getattr__(name):
+    return lazy_getattr(__name__, _LAZY_ATTRS, name)
 
 # Save version number
 version = "1.0"
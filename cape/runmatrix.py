@@ -78,6 +78,7 @@ before creating the run matrix conditions.
 import os
 import re
 import fnmatch
+import hashlib
 
 # Standard third-party libraries
 import numpy as np
@@ -102,6 +103,21 @@ regex_float = re.compile(
     r"[+-]?[0-9]*\.(?P<dec>[0-9]+)(?P<exp>[DdEe][+-][0-9]{1,3})")
 
 
+# MKS units of each state in the freestream condition table
+CONDITION_UNITS = {
+    "M": "1",
+    "U": "m/s",
+    "T": "K",
+    "T0": "K",
+    "p": "Pa",
+    "p0": "Pa",
+    "q": "Pa",
+    "rho": "kg/m^3",
+    "mu": "kg/m/s",
+    "Re": "1/m",
+}
+
+
 # RunMatrix class
 class RunMatrix(dict):
     r"""Read a list of configuration variables
@@ -306,6 +322,18 @@ class RunMatrix(dict):
         return '<%s.%s(nCase=%i, cols=%s)>' % (
             modname, clsname, self.nCase, self.cols)
 
+    # Save a column
+    def __setitem__(self, k, v):
+        r"""Save a run matrix column and reset condition table
+
+        :Versions:
+            * 2026-10-19 ``@ddalle``: Version 1.0
+        """
+        # Save the values
+        dict.__setitem__(self, k, v)
+        # Condition table is out of date
+        self._conditions_sig = None
+
     # Copy the trajectory
     def Copy(self):
         """Return a copy of the trajectory
@@ -583,6 +611,8 @@ class RunMatrix(dict):
                 self[k] = V
         # Save that value to the data
         V[i] = v
+        # Condition table is out of date
+        self._conditions_sig = None
 
     # Pass a case
     def MarkPASS(self, i, flag="p"):
@@ -4144,6 +4174,96 @@ class RunMatrix(dict):
             return p0 / mks(units)
    # ]
 
+   # ----------------
+   # Condition Table
+   # ----------------
+   # [
+    # Calculate all freestream states at once
+    def GetConditions(self):
+        r"""Get table of freestream conditions for all cases
+
+        Each state is calculated once for the whole run matrix using
+        the same methods as :func:`GetPressure`, :func:`GetReynoldsNumber`,
+        etc., and the result is saved.  The table is recalculated if
+        the values of any run matrix column or the ``"Freestream"`` gas
+        properties change.  Use this instead of calling a getter like
+        ``x.GetReynoldsNumber(i)`` for each case *i*.
+
+        :Call:
+            >>> conds = x.GetConditions()
+        :Inputs:
+            *x*: :class:`cape.runmatrix.RunMatrix`
+                Run matrix interface
+        :Outputs:
+            *conds*: :class:`dict`\ [:class:`np.ndarray` | ``None``]
+                MKS value of each state in :data:`CONDITION_UNITS` for
+                every case, or ``None`` if it cannot be calculated
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Current signature of inputs
+        sig = self._get_conditions_sig()
+        # Check for valid saved table
+        if getattr(self, "_conditions_sig", None) == sig:
+            return self._conditions
+        # Functions to calculate each state
+        funcs = {
+            "M": self.GetMach,
+            "U": self.GetVelocity,
+            "T": self.GetTemperature,
+            "T0": self.GetTotalTemperature,
+            "p": self.GetPressure,
+            "p0": self.GetTotalPressure,
+            "q": self.GetDynamicPressure,
+            "rho": self.GetDensity,
+            "mu": self.GetViscosity,
+            "Re": self.GetReynoldsNumber,
+        }
+        # Initialize table
+        conds = {}
+        # Loop through states
+        for col, u in CONDITION_UNITS.items():
+            # Calculate for all cases at once
+            try:
+                # Mach number has no units
+                if col == "M":
+                    v = funcs[col]()
+                else:
+                    v = funcs[col](units=u)
+            except Exception:
+                # Not enough keys to define this state
+                v = None
+            # Save as a full-length array
+            if v is not None:
+                v = np.asarray(v, dtype="float") * np.ones(self.nCase)
+            conds[col] = v
+        # Save table and signature
+        self._conditions = conds
+        self._conditions_sig = sig
+        # Output
+        return conds
+
+    # Signature to check if condition table is out of date
+    def _get_conditions_sig(self):
+        # Initialize hash
+        h = hashlib.sha1()
+        # Number of cases and gas properties
+        h.update(("%s %r" % (self.nCase, self.gas)).encode())
+        # Loop through columns
+        for k in self.cols:
+            # Get values
+            v = np.asarray(self[k])
+            # Include name, type, and shape
+            h.update(("%s %s %s" % (k, v.dtype.str, v.shape)).encode())
+            # Hash contents
+            if v.dtype.kind in "biufc":
+                h.update(np.ascontiguousarray(v).tobytes())
+            else:
+                h.update(repr(v.tolist()).encode())
+        # Output
+        return h.hexdigest()
+   # ]
+
    # -------------------------
    # Thermodynamic Properties
    # -------------------------
@@ -19,6 +19,7 @@ import sys
 import numpy as np
 # B-spline interpolation
 from scipy.interpolate import splev
+from scipy.special import comb
 # Detailed string processing
 import re
 
@@ -222,7 +223,40 @@ class STEP(object):
         # Get curve list
         I = self.icrv[j]
         # Form array
-        return np.array([self.pts[self.ipt==i][0] for i in I])
+        return self.pts[self.GetPointIndex(I)]
+        
+    # Get indices of points
+    def GetPointIndex(self, I):
+        """Get indices in *stp.pts* of a list of point entity numbers
+        
+        :Call:
+            >>> K = stp.GetPointIndex(I)
+        :Inputs:
+            *stp*: :class:`cape.step.STEP`
+                STEP file interface
+            *I*: :class:`np.ndarray` (:class:`int`)
+                Entity numbers of points
+        :Outputs:
+            *K*: :class:`np.ndarray` (:class:`int`)
+                Indices such that *stp.ipt[K]* is *I*
+        :Versions:
+            * 2026-10-18 ``@ddalle``: First version
+        """
+        # Sort the point entity numbers once
+        isort = getattr(self, "_ipt_sort", None)
+        if isort is None or isort.size != self.ipt.size:
+            isort = np.argsort(self.ipt, kind="stable")
+            self._ipt_sort = isort
+        # Sorted entity numbers
+        ipt = self.ipt[isort]
+        # Find each requested entity (first match)
+        I = np.asarray(I, dtype=ipt.dtype)
+        K = np.fmin(np.searchsorted(ipt, I), max(ipt.size - 1, 0))
+        # Check for missing points
+        if ipt.size == 0 or np.any(ipt[K] != I):
+            raise IndexError("Point entity not found in STEP file")
+        # Output
+        return isort[K]
         
     # Evaluate the spline of a curve
     def EvaluateCurve(self, j, u):
@@ -242,7 +276,129 @@ class STEP(object):
                 Points along the spline
         :Versions:
             * 2016-05-10 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Use :func:`EvaluateCurvesFlat`
+        """
+        # Parameter values
+        u = np.asarray(u, dtype="float")
+        # Evaluate
+        Y = self.EvaluateCurvesFlat([j], np.zeros(u.size, dtype="int"), u)
+        # Check for scalar
+        if u.ndim == 0:
+            return Y[0]
+        # Output
+        return Y
+        
+    # Evaluate several curves
+    def EvaluateCurves(self, J, U):
+        """Evaluate B-splines of several curves
+        
+        :Call:
+            >>> Y = stp.EvaluateCurves(J, U)
+        :Inputs:
+            *stp*: :class:`cape.step.STEP`
+                STEP file interface
+            *J*: :class:`list` (:class:`int`)
+                Curve numbers
+            *U*: :class:`list` (:class:`np.ndarray`)
+                Values of input parameter for each curve in *J*
+        :Outputs:
+            *Y*: :class:`list` (:class:`np.ndarray`)
+                Points along each spline
+        :Versions:
+            * 2026-10-18 ``@ddalle``: First version
+        """
+        # Parameter values for each curve
+        U = [np.asarray(u, dtype="float").flatten() for u in U]
+        # Number of values for each curve
+        nu = np.array([u.size for u in U], dtype="int")
+        # Curve index of each parameter value
+        cid = np.repeat(np.arange(len(U)), nu)
+        # Evaluate all curves at once
+        Y = self.EvaluateCurvesFlat(J, cid, np.hstack(U + [np.zeros(0)]))
+        # Split into curves
+        return np.split(Y, np.cumsum(nu)[:-1])
+        
+    # Evaluate several curves
+    def EvaluateCurvesFlat(self, J, cid, u):
+        """Evaluate B-splines of several curves from one parameter array
+        
+        The splines in STEP files have a knot of multiplicity *k* at each
+        integer value of the parameter, so each interval is a Bezier
+        curve.  This evaluates the Bernstein basis functions for all
+        values of *u* for curves of the same order at once.
+        
+        :Call:
+            >>> Y = stp.EvaluateCurvesFlat(J, cid, u)
+        :Inputs:
+            *stp*: :class:`cape.step.STEP`
+                STEP file interface
+            *J*: :class:`list` (:class:`int`)
+                Curve numbers
+            *cid*: :class:`np.ndarray` (:class:`int`)
+                Index in *J* of curve for each parameter value
+            *u*: :class:`np.ndarray` (:class:`float`)
+                Values of input parameter
+        :Outputs:
+            *Y*: :class:`np.ndarray` (:class:`float`) shape=(*u.size*,3)
+                Points along the splines
+        :Versions:
+            * 2026-10-18 ``@ddalle``: First version
         """
+        # Ensure arrays
+        J = list(J)
+        cid = np.asarray(cid, dtype="int").flatten()
+        u = np.asarray(u, dtype="float").flatten()
+        # Initialize output
+        Y = np.zeros((u.size, 3))
+        # Check for empty evaluation
+        if u.size == 0:
+            return Y
+        # Order of each curve
+        kc = np.array([self.ocrv[j] for j in J], dtype="int")
+        # Number of control points of each curve
+        nc = np.array([len(self.icrv[j]) for j in J], dtype="int")
+        # Index of first control point of each curve
+        ic = np.cumsum(nc) - nc
+        # Number of intervals of each curve
+        Nc = (nc - 1) // kc
+        # Check for curves that are piecewise Bezier curves
+        qc = ((nc - 1) % kc == 0) & (Nc > 0)
+        # Control points of all curves
+        P = self.pts[self.GetPointIndex(np.hstack(
+            [self.icrv[j] for j in J]))]
+        # Loop through orders
+        for k in np.unique(kc[qc]):
+            # Values of *u* for curves with this order
+            I = np.where((kc[cid] == k) & qc[cid])[0]
+            # Curves
+            c = cid[I]
+            # Interval containing each value (extrapolate at ends)
+            s = np.clip(np.floor(u[I]), 0, Nc[c] - 1).astype("int")
+            # Local parameter
+            t = u[I] - s
+            # Index of first control point of each interval
+            ip = ic[c] + s*k
+            # Sum the Bernstein polynomials times control points
+            Yk = np.zeros((I.size, 3))
+            for i in range(k + 1):
+                # Basis function
+                b = comb(k, i, exact=True) * t**i * (1.0 - t)**(k - i)
+                # Add contribution of control point
+                Yk += b[:, None] * P[ip + i]
+            # Save
+            Y[I] = Yk
+        # Use general B-splines for any other curves
+        for jc in np.where(~qc)[0]:
+            # Values of *u* for this curve
+            I = (cid == jc)
+            # Evaluate
+            if np.any(I):
+                Y[I] = self._EvaluateCurveSplev(J[jc], u[I])
+        # Output
+        return Y
+        
+    # Evaluate the spline of a curve
+    def _EvaluateCurveSplev(self, j, u):
         # Get the knots
         c = np.transpose(self.GetCurveKnots(j))
         # Number of points
@@ -282,86 +438,10 @@ class STEP(object):
                 Uniformly spaced points along the spline
         :Versions:
             * 2016-05-10 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Use :func:`SampleCurves`
         """
-        # Default turning angle
-        if dth is None: dth = 180.0
-        # Order of the spline
-        k = self.ocrv[j]
-        # Number of knots
-        n0 = len(self.icrv[j])
-        # Number of intervals
-        N = (n0-1) // k
-        # Evaluate curve on a fine grid.
-        u = np.linspace(0, N, 100*N+1)
-        # Evaluate
-        X = self.EvaluateCurve(j, u)
-        # Calculate step size of those curves
-        dL = np.sqrt(np.sum((X[1:]-X[:-1])**2, 1))
-        # Cumulative length array
-        L = np.insert(np.cumsum(dL), 0, 0.0)
-        # Get requested spacing
-        if ds and n:
-            # Minimum number of points
-            nl1 = max(n, int(np.ceil(L[-1] / ds))) + 1
-            L1 = np.linspace(0, L[-1], nl1)
-        elif ds is not None:
-            # Uniform lengths based on spacing; *ds* is upper limit
-            nl1 = int(np.ceil(L[-1] / ds)) + 1
-            L1 = np.linspace(0, L[-1], nl1)
-        elif n is not None:
-            # Uniform lengths based on *n* points
-            L1 = np.linspace(0, L[-1], n+1)
-        else:
-            # No spacing
-            raise ValueError("Please specify either *ds* or *n*.")
-        # Redistribute input parameter in order to get requested spacing
-        w = np.interp(L1, L, u)
-        # Reevaluate.
-        self.crvs[j] = self.EvaluateCurve(j, w)
-        # Loop until turning angle criterion is met
-        kth = 0
-        while dth is not None and kth < 5:
-            # Evaluation counter
-            kth += 1
-            # Get current turning angles
-            th = self.GetTurningAngle(j)
-            # Find turning angle exceedances
-            ith = np.where(th > dth)[0]
-            # Exit if no exceedances
-            if len(ith) == 0: break
-            # Loop through the exceedances in reverse order
-            for i in ith[::-1]:
-                # Add a point before and after the angle
-                w = np.insert(w, i+2, (w[i+1]+w[i+2])/2)
-                w = np.insert(w, i+1, (w[i]+w[i+1])/2)
-            # Reevaluate.
-            self.crvs[j] = self.EvaluateCurve(j, w)
-        # Loop until weighted turning angle criterion is met
-        kth = 0
-        while da is not None and kth < 5:
-            # Evaluation counter
-            kth += 1
-            # Reevaluate.
-            self.crvs[j] = self.EvaluateCurve(j, w)
-            # Exit if no test
-            if dth is None: break
-            # Get current turning angles
-            th = self.GetWeightedTurningAngle(j)
-            # Find turning angle exceedances
-            ith = np.where(th > da)[0]
-            # Exit if no exceedances
-            if len(ith) == 0: break
-            # Finer points
-            w2 = (w[:-1] + w[1:]) / 2
-            # Loop through the exceedances in reverse order
-            for i in ith[::-1]:
-                # Check if the following segment has already been refined.
-                if i+1 not in ith:
-                    w = np.insert(w, i+2, (w[i+1]+w[i+2])/2)
-                # Add a point before and after the angle
-                w = np.insert(w, i+1, (w[i]+w[i+1])/2)
-            # Reevaluate.
-            self.crvs[j] = self.EvaluateCurve(j, w)
+        # Sample this curve
+        self.SampleCurves([j], n=n, ds=ds, dth=dth, da=da)
         # Output
         return self.crvs[j]
         
@@ -386,13 +466,121 @@ class STEP(object):
                 Maximum allowed length-weighted turning angle
         :Versions:
             * 2016-05-10 ``@ddalle``: First version
+            * 2026-10-18 ``@ddalle``: Sample all curves at once
         """
         # Default list: all
         if J is None:
             J = range(self.ncrv)
-        # Sample each curve
-        for j in J:
-            self.SampleCurve(j, n=n, ds=ds, dth=dth, da=da)
+        # Ensure list
+        J = list(J)
+        # Check for spacing
+        if ds is None and n is None:
+            raise ValueError("Please specify either *ds* or *n*.")
+        # Check for empty list
+        if len(J) == 0:
+            return
+        # Default turning angle
+        if dth is None: dth = 180.0
+        # Number of intervals of each curve
+        N = np.array([(len(self.icrv[j])-1) // self.ocrv[j] for j in J])
+        # Evaluate curves on a fine grid (100 points per interval)
+        nu = 100*N + 1
+        # Curve index and start of each curve
+        cid = np.repeat(np.arange(len(J)), nu)
+        iu = np.cumsum(nu) - nu
+        # Fine grid of parameter values
+        u = (np.arange(cid.size) - iu[cid]) / 100.0
+        # Evaluate
+        X = self.EvaluateCurvesFlat(J, cid, u)
+        # Cumulative length array, starting at 0 for each curve
+        L = np.zeros(cid.size)
+        # Loop through curves with the same number of intervals
+        for Nj in np.unique(N):
+            # Indices of fine grid points, one row per curve
+            i = iu[N == Nj][:, None] + np.arange(100*Nj + 1)
+            # Calculate step size of those curves
+            dL = np.sqrt(np.sum((X[i[:, 1:]] - X[i[:, :-1]])**2, 2))
+            # Cumulative length
+            L[i[:, 1:]] = np.cumsum(dL, axis=1)
+        # Length of each curve
+        Lc = L[iu + nu - 1]
+        # Get requested number of intervals
+        if ds and n:
+            # Minimum number of points
+            m = np.fmax(n, np.ceil(Lc / ds)).astype("int")
+        elif ds is not None:
+            # Uniform lengths based on spacing; *ds* is upper limit
+            m = np.ceil(Lc / ds).astype("int")
+        else:
+            # Uniform lengths based on *n* points
+            m = np.full(len(J), n, dtype="int")
+        # Curve index and start of each curve for new points
+        cid1 = np.repeat(np.arange(len(J)), m + 1)
+        iu1 = np.cumsum(m + 1) - (m + 1)
+        # Fraction of length of each curve
+        f1 = (np.arange(cid1.size) - iu1[cid1]) / np.fmax(m, 1)[cid1]
+        # Fraction of length on fine grid (curve *i* from 2*i to 2*i+1)
+        f = 2*cid + L / np.where(Lc > 0, Lc, 1.0)[cid]
+        # Redistribute input parameter in order to get requested spacing
+        w = np.interp(2*cid1 + f1, f, u)
+        # Reevaluate
+        X = self.EvaluateCurvesFlat(J, cid1, w)
+        # Refine until turning angle criterion is met
+        if dth is not None:
+            cid1, w, X = self._RefineCurves(J, cid1, w, X, dth)
+        # Refine until weighted turning angle criterion is met
+        if da is not None:
+            cid1, w, X = self._RefineCurves(J, cid1, w, X, da, True)
+        # Split into curves
+        Y = np.split(X, np.cumsum(np.bincount(cid1, minlength=len(J)))[:-1])
+        # Save curves
+        for (jc, j) in enumerate(J):
+            self.crvs[j] = Y[jc]
+            
+    # Add points to sampled curves with large turning angles
+    def _RefineCurves(self, J, cid, w, X, tol, weighted=False):
+        # Loop up to five times
+        for kth in range(5):
+            # Get segments
+            dx = X[1:] - X[:-1]
+            # Lengths of each segment
+            L = np.sqrt(np.sum(dx**2, axis=1))
+            # Dot products
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cth = np.sum(dx[:-1]*dx[1:], axis=1) / (L[:-1]*L[1:])
+            # Trim
+            cth = np.fmin(1, np.fmax(-1, cth))
+            # Angles at interior points
+            th = 180/np.pi * np.arccos(cth)
+            # Weight by length of neighboring segments
+            if weighted:
+                th *= L[:-1] + L[1:]
+            # Ignore pairs of segments from different curves
+            th[(cid[:-2] != cid[1:-1]) | (cid[1:-1] != cid[2:])] = 0.0
+            # Find turning angle exceedances
+            ith = np.where(th > tol)[0]
+            # Exit if no exceedances
+            if len(ith) == 0: break
+            # Split the segment before and after each exceedance
+            i = np.union1d(ith, ith+1)
+            # New parameter values
+            wi = (w[i] + w[i+1]) / 2
+            # Check for unweighted angle criterion
+            if not weighted:
+                # Segments split from both sides get an extra point
+                i2 = np.intersect1d(ith, ith+1)
+                # Midpoint of first half of segment
+                w2 = (w[i2] + (w[i2] + w[i2+1])/2) / 2
+                # Sort by segment, with extra point first
+                k = np.argsort(np.hstack((i2, i)), kind="stable")
+                i = np.hstack((i2, i))[k]
+                wi = np.hstack((w2, wi))[k]
+            # Insert new points
+            X = np.insert(X, i+1, self.EvaluateCurvesFlat(J, cid[i], wi), 0)
+            w = np.insert(w, i+1, wi)
+            cid = np.insert(cid, i+1, cid[i])
+        # Output
+        return cid, w, X
             
     # Evaluate turning angle
     def GetWeightedTurningAngle(self, j):
@@ -23,12 +23,31 @@ libraries.
 # Common third-party modules
 import numpy as np
 
-# Statistics modules from SciPy
-try:
-    from scipy.stats import norm
-    from scipy.stats import t as student
-except ImportError:
-    pass
+# Distributions from :mod:`scipy.stats`, which is slow to import
+_STATS_DISTS = {
+    "norm": "norm",
+    "student": "t",
+}
+
+
+# Get a distribution from SciPy only when needed
+def __getattr__(name):
+    r"""Load *norm* or *student* from :mod:`scipy.stats` on first use
+
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Check for lazily loaded names
+    if name not in _STATS_DISTS:
+        raise AttributeError(
+            "module '%s' has no attribute '%s'" % (__name__, name))
+    # Import SciPy statistics module
+    import scipy.stats
+    # Get distribution
+    v = getattr(scipy.stats, _STATS_DISTS[name])
+    # Save it so this only happens once
+    globals()[name] = v
+    return v
 
 
 # Calculate range
@@ -60,6 +79,8 @@ def get_range(R, cov, **kw):
         * 2019-02-13 ``@ddalle``: Moved to :mod:`stats`
     """
    # --- Setup ---
+    # Student's t-distribution
+    student = __getattr__("student")
     # Enforce array
     R = np.asarray(np.abs(R))
     # Degrees of freedom
@@ -146,6 +167,8 @@ def get_cov_interval(dx, cov, **kw):
         * 2019-02-13 ``@ddalle``: Moved to :mod:`stats`
     """
    # --- Setup ---
+    # Student's t-distribution
+    student = __getattr__("student")
     # Enforce array
     dx = np.asarray(dx)
     # Degrees of freedom
@@ -230,6 +253,8 @@ def check_outliers(dx, cov, **kw):
         * 2019-02-13 ``@ddalle``: Moved to :mod:`stats`
     """
    # --- Setup ---
+    # Student's t-distribution
+    student = __getattr__("student")
     # Enforce array
     dx = np.asarray(dx)
     # Degrees of freedom
@@ -273,3 +298,186 @@ def check_outliers(dx, cov, **kw):
     # Output
     return I
 
+
+# Calculate intervals for many windows at once
+def get_cov_interval_batch(DX, M, cov, **kw):
+    r"""Calculate :func:`get_cov_interval` for each row of an array
+
+    Each row of *DX* holds the deltas of one window, and *M* marks which
+    entries of that row are actually in the window. All rows are
+    processed together, which is much faster than calling
+    :func:`get_cov_interval` once per window.
+
+    :Call:
+        >>> a, b = get_cov_interval_batch(DX, M, cov, **kw)
+    :Inputs:
+        *DX*: :class:`np.ndarray`\ [:class:`float`]\ (*nw*, *nx*)
+            Array of signed deltas for each of *nw* windows
+        *M*: :class:`np.ndarray`\ [:class:`bool`]\ (*nw*, *nx*)
+            Flags for entries of *DX* that are in each window
+        *cov*: 0 < :class:`float` < 1
+            Coverage percentage
+        *cdf*, *CoverageCDF*: {*cov*} | 0 < :class:`float` < 1
+            CDF if no extra coverage needed
+        *osig*, *OutlierSigma*: {``1.5*ksig``} | :class:`float` |
+        :class:`np.ndarray`\ (*nw*)
+            Multiple of standard deviation to identify outliers, either
+            for all windows or for each window
+    :Outputs:
+        *a*: :class:`np.ndarray`\ [:class:`float`]\ (*nw*)
+            Lower bound of coverage interval for each window
+        *b*: :class:`np.ndarray`\ [:class:`float`]\ (*nw*)
+            Upper bound of coverage interval for each window
+    :Versions:
+        * 2026-10-18 ``@ddalle``: First version
+    """
+   # --- Setup ---
+    # Student's t-distribution
+    student = __getattr__("student")
+    # Enforce arrays
+    DX = np.asarray(DX, dtype="float")
+    M = np.array(M, dtype="bool")
+    # Probability
+    cdf = kw.get("CoverageCDF", kw.get("cdf", cov))
+    # Degrees of freedom
+    df = np.count_nonzero(M, axis=1)
+    # Outlier cutoff
+    osig = kw.get('OutlierSigma', kw.get("osig"))
+    # Default cutoff is based on initial window sizes
+    if osig is None:
+        osig = 1.5*student.ppf(0.5+0.5*cdf, df)
+    # Cutoff for each row
+    osig = np.broadcast_to(osig, df.shape).reshape(-1, 1)
+   # --- Outliers ---
+    # Rows that still have outliers
+    K = np.arange(df.size)
+    # Initial stats
+    vmu, vstd = _masked_stats(DX, M)
+    # Loop until no outliers remain
+    while K.size > 0:
+        # Find outliers in active rows
+        I = M[K] & (np.abs(DX[K] - vmu[K, None])/vstd[K, None] > osig[K])
+        # Rows with any outliers
+        J = np.any(I, axis=1)
+        K = K[J]
+        # Filter
+        M[K] &= np.logical_not(I[J])
+        # Recalculate statistics
+        vmu[K], vstd[K] = _masked_stats(DX[K], M[K])
+    # Final degrees of freedom
+    df = np.count_nonzero(M, axis=1)
+    # Nominal bounds (like 3-sigma for 99.5% coverage, etc.)
+    ksig = student.ppf(0.5+0.5*cdf, df)
+    kcov = student.ppf(0.5+0.5*cov, df)
+    # Nominal width
+    width = ksig*vstd
+   # --- Coverage Check ---
+    # Margin due to difference between *cov* and *cdf*
+    ai = vmu - kcov/ksig*width
+    bi = vmu + kcov/ksig*width
+    # Filter cases that are outside bounds
+    J = M & (ai[:, None] <= DX) & (DX <= bi[:, None])
+    # Count cases inside the bounds
+    ncov = np.count_nonzero(J, axis=1)
+    # Check coverage
+    with np.errstate(divide="ignore", invalid="ignore"):
+        K = np.where(ncov/df < cov)[0]
+    # Expand any windows that don't cover enough
+    if K.size > 0:
+        # Distances of uncovered cases from mean, others sent to end
+        Ro = np.where(
+            M[K] & np.logical_not(J[K]),
+            np.abs(DX[K] - vmu[K, None]), np.inf)
+        # Sort each row
+        Ro.sort(axis=1)
+        # Number of additional cases that must be covered
+        n1 = np.ceil(cov*df[K]).astype("int") - ncov[K]
+        # The new width is the delta to the last newly included point
+        width[K] = Ro[np.arange(K.size), n1 - 1]*ksig[K]/kcov[K]
+   # --- Output ---
+    return vmu - width, vmu + width
+
+
+# Filter outliers from many windows at once
+def check_outliers_batch(DX, M, cov, **kw):
+    r"""Calculate :func:`check_outliers` for each row of an array
+
+    :Call:
+        >>> I = check_outliers_batch(DX, M, cov, **kw)
+    :Inputs:
+        *DX*: :class:`np.ndarray`\ [:class:`float`]\ (*nw*, *nx*)
+            Array of signed deltas for each of *nw* windows
+        *M*: :class:`np.ndarray`\ [:class:`bool`]\ (*nw*, *nx*)
+            Flags for entries of *DX* that are in each window
+        *cov*: ``0.95`` | 0 < :class:`float` < 1
+            Coverage percentage
+        *cdf*, *CoverageCDF*: {*cov*} | 0 < :class:`float` < 1
+            CDF if no extra coverage needed
+        *osig*, *OutlierSigma*: {``1.5*ksig``} | :class:`float` |
+        :class:`np.ndarray`\ (*nw*)
+            Multiple of standard deviation to identify outliers, either
+            for all windows or for each window
+    :Outputs:
+        *I*: :class:`np.ndarray` (:class:`bool`)\ (*nw*, *nx*)
+            Flags for non-outlier cases, ``False`` if case is an outlier
+            or not in the window
+    :Versions:
+        * 2026-10-18 ``@ddalle``: First version
+    """
+   # --- Setup ---
+    # Student's t-distribution
+    student = __getattr__("student")
+    # Enforce arrays
+    DX = np.asarray(DX, dtype="float")
+    M = np.asarray(M, dtype="bool")
+    # Probability
+    cdf = kw.get("CoverageCDF", kw.get("cdf", cov))
+    # Degrees of freedom
+    df = np.count_nonzero(M, axis=1)
+    # Outlier cutoff
+    osig = kw.get('OutlierSigma', kw.get("osig"))
+    # Default cutoff is based on window sizes
+    if osig is None:
+        osig = 1.5*student.ppf(0.5+0.5*cdf, df)
+    # Cutoff for each row
+    osig = np.broadcast_to(osig, df.shape).reshape(-1, 1)
+   # --- Outliers ---
+    # Initial stats
+    vmu, vstd = _masked_stats(DX, M)
+    # Find outliers
+    I = M & (np.abs(DX - vmu[:, None])/vstd[:, None] <= osig)
+    # Number of outliers
+    n0 = np.zeros_like(df)
+    n1 = df - np.count_nonzero(I, axis=1)
+    # Rows where outlier count is changing
+    K = np.where(n1 > n0)[0]
+    # Check outliers
+    while K.size > 0:
+        # Save old outlier count
+        n0[K] = n1[K]
+        # Recalculate statistics
+        vmu[K], vstd[K] = _masked_stats(DX[K], I[K])
+        # Find outliers
+        I[K] = M[K] & (
+            np.abs(DX[K] - vmu[K, None])/vstd[K, None] <= osig[K])
+        # Count outliers
+        n1[K] = df[K] - np.count_nonzero(I[K], axis=1)
+        # Update active rows
+        K = K[n1[K] > n0[K]]
+    # Output
+    return I
+
+
+# Mean and standard deviation of each row of masked array
+def _masked_stats(DX, M):
+    # Number of entries in each row
+    n = np.count_nonzero(M, axis=1)
+    # Ignore empty rows; they get NaN like np.mean([])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Mean
+        vmu = np.sum(np.where(M, DX, 0.0), axis=1) / n
+        # Standard deviation, as in :func:`np.std`
+        vstd = np.sqrt(np.sum(
+            np.where(M, np.abs(DX - vmu[:, None])**2, 0.0), axis=1) / n)
+    # Output
+    return vmu, vstd
@@ -22,6 +22,7 @@ a method like :func:`TriBase.WriteFast` for the compiled version and
 
 # Standard library
 import getpass
+import heapq
 import os
 import subprocess as sp
 import sys
@@ -45,6 +46,8 @@ from .cgns import CGNS
 
 # Constants
 INT_TYPES = (int, np.int64, np.int32)
+# Number of candidate points or intervals to process at once
+CHUNK_SIZE = 2**20
 
 # Default tolerances for mapping triangulations
 atoldef = options.rc.get("atoldef", 1e-2)
@@ -70,6 +73,587 @@ except ImportError:
     _cape = None
 
 
+# Get entries of several rows of a compressed-sparse-row table
+def _csr_gather(ptr, ind, I):
+    r"""Get entries of several rows of a compressed-sparse-row table
+
+    :Call:
+        >>> J = _csr_gather(ptr, ind, I)
+    :Inputs:
+        *ptr*: :class:`np.ndarray`\ [:class:`int`]
+            Row *i* is *ind[ptr[i]:ptr[i+1]]*
+        *ind*: :class:`np.ndarray`\ [:class:`int`]
+            Concatenated entries of all rows
+        *I*: :class:`np.ndarray`\ [:class:`int`]
+            Indices of rows to get
+    :Outputs:
+        *J*: :class:`np.ndarray`\ [:class:`int`]
+            Concatenated entries of rows *I*
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Start and number of entries in each row
+    i0 = ptr[I]
+    n = ptr[I + 1] - i0
+    # Index of each entry relative to start of output rows
+    j = np.arange(np.sum(n)) - np.repeat(np.cumsum(n) - n, n)
+    # Output
+    return ind[np.repeat(i0, n) + j]
+
+
+# Mark grid points covered by projected triangles
+def _raster_tris(x, y, T, xg, yg):
+    r"""Mark points of a 2D grid covered by any of a set of triangles
+
+    Each triangle is only tested against the grid points inside its
+    bounding box, and the candidate points of many triangles are tested
+    at once in chunks of up to :data:`CHUNK_SIZE` points.
+
+    :Call:
+        >>> mask = _raster_tris(x, y, T, xg, yg)
+    :Inputs:
+        *x*: :class:`np.ndarray`\ [:class:`float`]
+            Projected *x*-coordinate of each node
+        *y*: :class:`np.ndarray`\ [:class:`float`]
+            Projected *y*-coordinate of each node
+        *T*: :class:`np.ndarray`\ [:class:`int`]
+            Node indices [0-based] of counterclockwise triangles
+        *xg*: :class:`np.ndarray`\ [:class:`float`]
+            Sorted *x*-coordinates of grid
+        *yg*: :class:`np.ndarray`\ [:class:`float`]
+            Sorted *y*-coordinates of grid
+    :Outputs:
+        *mask*: :class:`np.ndarray`\ [:class:`bool`]
+            Whether each grid point is covered, point *(i,j)* is
+            *mask[i*yg.size+j]*
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Grid size
+    ny = yg.size
+    # Initialize mask
+    mask = np.zeros(xg.size*ny, dtype="bool")
+    # Coordinates of vertices
+    X = x[T]
+    Y = y[T]
+    # Range of grid points in the bounding box of each triangle
+    i0 = np.searchsorted(xg, np.min(X, axis=1), side="left")
+    i1 = np.searchsorted(xg, np.max(X, axis=1), side="right")
+    j0 = np.searchsorted(yg, np.min(Y, axis=1), side="left")
+    j1 = np.searchsorted(yg, np.max(Y, axis=1), side="right")
+    # Number of grid points in each box
+    mj = np.maximum(j1 - j0, 0)
+    m = np.maximum(i1 - i0, 0) * mj
+    # Only process triangles with candidate points
+    K = np.where(m > 0)[0]
+    # Cumulative number of candidate points
+    M = np.cumsum(m[K])
+    # Loop through chunks of triangles
+    ka = 0
+    while ka < K.size:
+        # Find end of chunk
+        kb = np.searchsorted(M, M[ka] - m[K[ka]] + CHUNK_SIZE, side="right")
+        kb = max(kb, ka + 1)
+        # Triangles in chunk
+        k = K[ka:kb]
+        mk = m[k]
+        # Triangle of each candidate point
+        kr = np.repeat(k, mk)
+        # Index of each candidate point within its bounding box
+        p = np.arange(kr.size) - np.repeat(np.cumsum(mk) - mk, mk)
+        # Grid indices
+        i = i0[kr] + p // mj[kr]
+        j = j0[kr] + p % mj[kr]
+        # Grid coordinates
+        xj = xg[i]
+        yj = yg[j]
+        # Initialize points inside all three edges
+        q = np.ones(kr.size, dtype="bool")
+        # Loop through edges
+        for a in range(3):
+            # Start and end of edge
+            b = (a + 1) % 3
+            xa = X[kr, a]
+            ya = Y[kr, a]
+            # Edge tangent
+            xt = X[kr, b] - xa
+            yt = Y[kr, b] - ya
+            # Keep points left of edge, i.e. (-yt, xt) dot (xj-xa, yj-ya)
+            q &= -yt*(xj - xa) + xt*(yj - ya) >= 0.0
+        # Update global mask
+        mask[i[q]*ny + j[q]] = True
+        # Move to next chunk
+        ka = kb
+    # Output
+    return mask
+
+
+# Find where edges cross each other
+def _edge_crossings_x(x, y, E):
+    r"""Find *x*-coordinates of crossings between 2D line segments
+
+    Candidate pairs are found by hashing the bounding box of each
+    segment into a uniform grid of cells. Segments that share a node
+    and collinear segments are not considered to cross.
+
+    :Call:
+        >>> xc = _edge_crossings_x(x, y, E)
+    :Inputs:
+        *x*: :class:`np.ndarray`\ [:class:`float`]
+            *x*-coordinate of each node
+        *y*: :class:`np.ndarray`\ [:class:`float`]
+            *y*-coordinate of each node
+        *E*: :class:`np.ndarray`\ [:class:`int`]
+            Node indices [0-based] of each segment, shape (*n*, 2)
+    :Outputs:
+        *xc*: :class:`np.ndarray`\ [:class:`float`]
+            *x*-coordinate of each crossing
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Number of segments
+    n = E.shape[0]
+    # Check for trivial case
+    if n < 2:
+        return np.zeros(0)
+    # Bounding box of each segment
+    xmin = np.minimum(x[E[:,0]], x[E[:,1]])
+    xmax = np.maximum(x[E[:,0]], x[E[:,1]])
+    ymin = np.minimum(y[E[:,0]], y[E[:,1]])
+    ymax = np.maximum(y[E[:,0]], y[E[:,1]])
+    # Cell size based on mean segment size
+    h = np.mean(np.maximum(xmax - xmin, ymax - ymin))
+    # Check for all-degenerate segments
+    if h <= 0.0:
+        return np.zeros(0)
+    # Range of cells covered by each segment
+    ia = ((xmin - np.min(xmin)) / h).astype("int64")
+    ib = ((xmax - np.min(xmin)) / h).astype("int64")
+    ja = ((ymin - np.min(ymin)) / h).astype("int64")
+    jb = ((ymax - np.min(ymin)) / h).astype("int64")
+    # Number of cells covered by each segment
+    nj = jb - ja + 1
+    m = (ib - ia + 1) * nj
+    # Segment for each (cell, segment) entry
+    e = np.repeat(np.arange(n), m)
+    # Index of cell within bounding box of segment
+    p = np.arange(e.size) - np.repeat(np.cumsum(m) - m, m)
+    # Key for each cell
+    key = (ia[e] + p // nj[e]) * (np.max(jb) + 1) + (ja[e] + p % nj[e])
+    # Sort by cell
+    I = np.argsort(key, kind="stable")
+    key = key[I]
+    e = e[I]
+    # Find start of each cell's group and end of group for each entry
+    Q = np.hstack(([True], key[1:] != key[:-1]))
+    iend = np.hstack((np.where(Q)[0][1:], key.size))[np.cumsum(Q) - 1]
+    # Number of later entries in same cell
+    c = iend - np.arange(key.size) - 1
+    # Pairs of entries in the same cell
+    pa = np.repeat(np.arange(key.size), c)
+    pb = np.arange(pa.size) - np.repeat(np.cumsum(c) - c, c) + pa + 1
+    # Pairs of segments, without duplicates
+    ea = np.minimum(e[pa], e[pb])
+    eb = np.maximum(e[pa], e[pb])
+    pkey = np.unique(ea.astype("int64")*n + eb)
+    ea = pkey // n
+    eb = pkey % n
+    # Discard pairs that share a node
+    A = E[ea]
+    B = E[eb]
+    Q = np.all(A[:,[0,0,1,1]] != B[:,[0,1,0,1]], axis=1)
+    A = A[Q]
+    B = B[Q]
+    # Coordinates of endpoints
+    xa, ya = x[A[:,0]], y[A[:,0]]
+    xb, yb = x[A[:,1]], y[A[:,1]]
+    xc, yc = x[B[:,0]], y[B[:,0]]
+    xd, yd = x[B[:,1]], y[B[:,1]]
+    # Side of first segment for each end of second
+    d1 = (xb - xa)*(yc - ya) - (yb - ya)*(xc - xa)
+    d2 = (xb - xa)*(yd - ya) - (yb - ya)*(xd - xa)
+    # Side of second segment for each end of first
+    d3 = (xd - xc)*(ya - yc) - (yd - yc)*(xa - xc)
+    d4 = (xd - xc)*(yb - yc) - (yd - yc)*(xb - xc)
+    # Proper crossings
+    Q = (d1*d2 < 0) & (d3*d4 < 0)
+    # Fraction along first segment
+    t = d3[Q] / (d3[Q] - d4[Q])
+    # Output
+    return xa[Q] + t*(xb[Q] - xa[Q])
+
+
+# Area of union of 2D triangles
+def _tri_union_area(x, y, T):
+    r"""Calculate area of union of 2D triangles
+
+    The plane is divided into vertical slabs at the *x*-coordinate of
+    each vertex and each crossing between two triangle edges. Within
+    each slab, the width of the union is a linear function of *x*, so
+    the area of the slab is its width times the length of the union of
+    the triangles' cross-sections at its midline.
+
+    :Call:
+        >>> A = _tri_union_area(x, y, T)
+    :Inputs:
+        *x*: :class:`np.ndarray`\ [:class:`float`]
+            *x*-coordinate of each node
+        *y*: :class:`np.ndarray`\ [:class:`float`]
+            *y*-coordinate of each node
+        *T*: :class:`np.ndarray`\ [:class:`int`]
+            Node indices [0-based] of each triangle
+    :Outputs:
+        *A*: :class:`float`
+            Area covered by at least one triangle
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Coordinates of vertices
+    X = x[T]
+    Y = y[T]
+    # Sort vertices of each triangle by *x*
+    I = np.argsort(X, axis=1, kind="stable")
+    X = np.take_along_axis(X, I, axis=1)
+    Y = np.take_along_axis(Y, I, axis=1)
+    # Discard triangles with no width
+    Q = X[:,2] > X[:,0]
+    X = X[Q]
+    Y = Y[Q]
+    T = T[Q]
+    # Check for trivial case
+    if T.shape[0] == 0:
+        return 0.0
+    # Unique edges
+    E = np.vstack((T[:,[0,1]], T[:,[1,2]], T[:,[2,0]]))
+    E = np.unique(np.sort(E, axis=1), axis=0)
+    # Boundaries of slabs
+    xs = np.unique(np.hstack((X.flatten(), _edge_crossings_x(x, y, E))))
+    # Number of slabs
+    ns = xs.size - 1
+    # Width and midline of each slab
+    dx = np.diff(xs)
+    xm = 0.5*(xs[:-1] + xs[1:])
+    # Range of slabs spanned by each triangle
+    s0 = np.searchsorted(xs, X[:,0])
+    s1 = np.searchsorted(xs, X[:,2])
+    # Number of triangles spanning each slab
+    cs = np.cumsum(
+        np.bincount(s0, minlength=ns+1) - np.bincount(s1, minlength=ns+1))
+    # Cumulative number of (slab, triangle) pairs
+    C = np.cumsum(cs[:ns])
+    # Initialize area
+    A = 0.0
+    # Loop through chunks of slabs
+    sa = 0
+    while sa < ns:
+        # Find end of chunk
+        sb = np.searchsorted(C, C[sa] - cs[sa] + CHUNK_SIZE, side="right")
+        sb = max(sb, sa + 1)
+        # Range of slabs in chunk for each triangle
+        a = np.maximum(s0, sa)
+        b = np.minimum(s1, sb)
+        # Triangles in this chunk
+        K = np.where(b > a)[0]
+        m = b[K] - a[K]
+        # Triangle of each (slab, triangle) pair
+        k = np.repeat(K, m)
+        # Slab of each pair
+        s = np.repeat(a[K] - np.cumsum(m) + m, m) + np.arange(k.size)
+        # Vertices
+        x0, x1, x2 = X[k,0], X[k,1], X[k,2]
+        y0, y1, y2 = Y[k,0], Y[k,1], Y[k,2]
+        # Midline coordinate
+        xk = xm[s]
+        # Avoid dividing by zero for vertical short edges
+        dx01 = np.where(x1 > x0, x1 - x0, 1.0)
+        dx12 = np.where(x2 > x1, x2 - x1, 1.0)
+        # Fraction along each edge; midline may round onto a vertex
+        f02 = np.clip((xk - x0)/(x2 - x0), 0.0, 1.0)
+        f01 = np.clip((xk - x0)/dx01, 0.0, 1.0)
+        f12 = np.clip((xk - x1)/dx12, 0.0, 1.0)
+        # Intersect midline with long edge from vertex 0 to vertex 2
+        ya = y0 + (y2 - y0)*f02
+        # Intersect midline with edge 0->1 or 1->2
+        yb = np.where(xk < x1, y0 + (y1 - y0)*f01, y1 + (y2 - y1)*f12)
+        # Start (+1) and end (-1) of each cross-section
+        ss = np.hstack((s, s))
+        ys = np.hstack((np.minimum(ya, yb), np.maximum(ya, yb)))
+        ds = np.hstack((np.ones(k.size, "int"), -np.ones(k.size, "int")))
+        # Sort by slab, then coordinate
+        I = np.lexsort((ds, ys, ss))
+        ss = ss[I]
+        ys = ys[I]
+        # Number of cross-sections covering each gap between events
+        c = np.cumsum(ds[I])
+        # Add length of covered gaps (never spans two slabs)
+        A += np.sum(dx[ss[:-1]] * (ys[1:] - ys[:-1]) * (c[:-1] > 0))
+        # Move to next chunk
+        sa = sb
+    # Output
+    return A
+
+
+# Sum triangle quantities onto nodes
+def _tri2node(T, V, n):
+    r"""Sum quantities of each triangle onto each of its three nodes
+
+    All components are accumulated in a single :func:`np.bincount`
+    pass, so repeated node indices are always counted and the result
+    does not depend on the order of the triangles.
+
+    :Call:
+        >>> W = _tri2node(T, V, n)
+    :Inputs:
+        *T*: :class:`np.ndarray`\ [:class:`int`]
+            Node indices [0-based] of each triangle, shape (*nTri*, 3)
+        *V*: :class:`np.ndarray`\ [:class:`float`]
+            Value(s) for each triangle, shape (*nTri*,) or (*nTri*, *m*)
+        *n*: :class:`int`
+            Number of nodes
+    :Outputs:
+        *W*: :class:`np.ndarray`\ [:class:`float`]
+            Sum of *V* over triangles using each node, shape (*n*,) or
+            (*n*, *m*)
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Ensure array
+    V = np.asarray(V)
+    # Check for empty triangle set
+    if V.shape[0] == 0:
+        return np.zeros((n,) + V.shape[1:])
+    # Number of components
+    m = V[0].size
+    # Combined node and component index for each vertex of each tri
+    J = (np.reshape(T, (-1, 1))*m + np.arange(m)).flatten()
+    # Values for each vertex
+    W = np.repeat(np.reshape(V, (-1, m)), 3, axis=0).flatten()
+    # Accumulate
+    W = np.bincount(J, weights=W, minlength=n*m)
+    # Output with same number of dimensions as *V*
+    return np.reshape(W, (n,) + V.shape[1:])
+
+
+# Distance from points to a polyline
+def _polyline_distance(X, Y, r):
+    r"""Get distance from each point to a polyline, if within *r*
+
+    :Call:
+        >>> D = _polyline_distance(X, Y, r)
+    :Inputs:
+        *X*: :class:`np.ndarray`\ [:class:`float`]
+            Coordinates of test points, shape (*n*, 3)
+        *Y*: :class:`np.ndarray`\ [:class:`float`]
+            Vertices of piecewise linear curve, shape (*m*, 3)
+        *r*: :class:`float`
+            Maximum distance of interest
+    :Outputs:
+        *D*: :class:`np.ndarray`\ [:class:`float`]
+            Distance from each point to curve; ``inf`` if greater than *r*
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Initialize distances
+    D = np.full(X.shape[0], np.inf)
+    # Sort points by *x* to find candidates for each segment quickly
+    I = np.argsort(X[:,0], kind="stable")
+    xs = X[I,0]
+    # Loop through segments
+    for j in range(max(1, Y.shape[0] - 1)):
+        # End points of segment
+        a = Y[j]
+        b = Y[min(j + 1, Y.shape[0] - 1)]
+        # Bounding box of segment, padded by *r*
+        bmin = np.minimum(a, b) - r
+        bmax = np.maximum(a, b) + r
+        # Points in *x* range
+        ka = np.searchsorted(xs, bmin[0], side="left")
+        kb = np.searchsorted(xs, bmax[0], side="right")
+        K = I[ka:kb]
+        # Points in box
+        K = K[np.all((X[K] >= bmin) & (X[K] <= bmax), axis=1)]
+        # Segment vector
+        ab = b - a
+        L2 = np.dot(ab, ab)
+        # Fraction along segment of closest point
+        if L2 > 0:
+            t = np.clip(np.dot(X[K] - a, ab) / L2, 0.0, 1.0)
+        else:
+            t = np.zeros(K.size)
+        # Distance to closest point of segment
+        d = np.sqrt(np.sum((X[K] - a - t[:,None]*ab)**2, axis=1))
+        # Save closest segment
+        D[K] = np.minimum(D[K], d)
+    # Only keep points within tolerance
+    D[D > r] = np.inf
+    # Output
+    return D
+
+
+# Shortest path in a weighted graph
+def _astar(ptr, nbr, wts, X, i0, i1, mask=None):
+    r"""Find shortest path between two nodes using A* search
+
+    The heuristic is the straight-line distance to *i1*, so the weight
+    of each edge must be at least its length.
+
+    :Call:
+        >>> I = _astar(ptr, nbr, wts, X, i0, i1, mask=None)
+    :Inputs:
+        *ptr*: :class:`np.ndarray`\ [:class:`int`]
+            Neighbors of node *i* are *nbr[ptr[i]:ptr[i+1]]*
+        *nbr*: :class:`np.ndarray`\ [:class:`int`]
+            Neighbor node indices [0-based]
+        *wts*: :class:`np.ndarray`\ [:class:`float`]
+            Weight of each edge in *nbr*
+        *X*: :class:`np.ndarray`\ [:class:`float`]
+            Coordinates of each node
+        *i0*: :class:`int`
+            Start node [0-based]
+        *i1*: :class:`int`
+            End node [0-based]
+        *mask*: {``None``} | :class:`np.ndarray`\ [:class:`bool`]
+            Nodes that may not be used
+    :Outputs:
+        *I*: :class:`list`\ [:class:`int`] | ``None``
+            Nodes [0-based] from *i0* to *i1*; ``None`` if no path
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Number of nodes
+    n = ptr.size - 1
+    # Cost to reach each node and previous node along best path
+    G = np.full(n, np.inf)
+    P = np.full(n, -1)
+    G[i0] = 0.0
+    # Nodes that are finished
+    done = np.zeros(n, dtype="bool")
+    if mask is not None:
+        done[mask] = True
+    done[i0] = False
+    done[i1] = False
+    # Target location
+    xt = X[i1]
+    # Initialize queue
+    queue = [(0.0, i0)]
+    # Loop until target is reached
+    while queue:
+        # Get lowest estimated total cost
+        _, i = heapq.heappop(queue)
+        # Skip nodes that are already finished
+        if done[i]:
+            continue
+        # Check for target
+        if i == i1:
+            break
+        done[i] = True
+        # Neighbors and cost through *i*
+        J = nbr[ptr[i]:ptr[i+1]]
+        g = G[i] + wts[ptr[i]:ptr[i+1]]
+        # Only keep improved unfinished neighbors
+        Q = (g < G[J]) & ~done[J]
+        J = J[Q]
+        g = g[Q]
+        # Update costs
+        G[J] = g
+        P[J] = i
+        # Estimated total cost
+        f = g + np.sqrt(np.sum((X[J] - xt)**2, axis=1))
+        # Add to queue
+        for fj, j in zip(f.tolist(), J.tolist()):
+            heapq.heappush(queue, (fj, j))
+    else:
+        # Target not reached
+        return None
+    # Follow path back from target
+    I = [i1]
+    while I[-1] != i0:
+        I.append(P[I[-1]])
+    # Output in forward order
+    return I[::-1]
+
+
+# Offsets of cells on the surface of a cube
+def _cube_shell(r):
+    r"""Get offsets of cells with Chebyshev distance *r* from a cell
+
+    :Call:
+        >>> O = _cube_shell(r)
+    :Inputs:
+        *r*: :class:`int` >= 0
+            Ring number
+    :Outputs:
+        *O*: :class:`np.ndarray`\ [:class:`int`]
+            Offsets *(di, dj, dk)* with ``max(|di|,|dj|,|dk|) == r``
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Check for center cell
+    if r == 0:
+        return np.zeros((1, 3), dtype="int64")
+    # Full and interior ranges of one face
+    a = np.arange(-r, r+1)
+    b = np.arange(1-r, r)
+    # Faces normal to *k* (full), *j* (full *i*), and *i* (interior)
+    F = [
+        np.meshgrid(a, a, [-r, r], indexing="ij"),
+        np.meshgrid(a, [-r, r], b, indexing="ij"),
+        np.meshgrid([-r, r], b, b, indexing="ij"),
+    ]
+    # Combine
+    return np.vstack([np.stack([x.ravel() for x in f], axis=1) for f in F])
+
+
+# Find connected groups of nodes
+def _union_find_max(n, A, B):
+    r"""Map each node to the highest node index connected to it
+
+    This is a vectorized union-find: each pass hooks the root of each
+    pair to the higher root, and then pointer jumping flattens every
+    chain so that each node points directly to its root.
+
+    :Call:
+        >>> I = _union_find_max(n, A, B)
+    :Inputs:
+        *n*: :class:`int`
+            Number of nodes
+        *A*: :class:`np.ndarray`\ [:class:`int`]
+            First node index [0-based] of each connected pair
+        *B*: :class:`np.ndarray`\ [:class:`int`]
+            Second node index [0-based] of each connected pair
+    :Outputs:
+        *I*: :class:`np.ndarray`\ [:class:`int`]
+            Highest node index [0-based] connected to each node
+    :Versions:
+        * 2026-10-18 ``@ddalle``: Version 1.0
+    """
+    # Initialize each node as its own root
+    I = np.arange(n)
+    # Loop until each pair has the same root
+    while True:
+        # Current roots of each pair
+        IA = I[A]
+        IB = I[B]
+        # Pairs not yet merged
+        Q = IA != IB
+        # Check for completion
+        if not np.any(Q):
+            return I
+        # Higher root of each pair
+        IM = np.maximum(IA[Q], IB[Q])
+        # Hook both roots to the higher one
+        np.maximum.at(I, IA[Q], IM)
+        np.maximum.at(I, IB[Q], IM)
+        # Pointer jumping until each node points to a root
+        while True:
+            # Take one step
+            I1 = I[I]
+            # Check for completion
+            if np.all(I1 == I):
+                break
+            I = I1
+
+
 # Function to get a non comment line
 def _readline(f, comment='#'):
     r"""Read line that is nonempty and not a comment
@@ -2415,14 +2999,14 @@ class TriBase(object):
         nElem = data[1]
        # --- Coordinates ---
         # Get *GridCoordinates_t* node
-        kx = cgns.GetNodeIndex("CoordinateX", "DataArray_t")
-        ky = cgns.GetNodeIndex("CoordinateY", "DataArray_t")
-        kz = cgns.GetNodeIndex("CoordinateZ", "DataArray_t")
+        kx = cgns.GetNodeIndex("CoordinateX", "DataArray_t")[0]
+        ky = cgns.GetNodeIndex("CoordinateY", "DataArray_t")[0]
+        kz = cgns.GetNodeIndex("CoordinateZ", "DataArray_t")[0]
         # Get data type
         dtx = cgns.DataTypes[kx].replace("R", "f")
         # Initialize nodes
         Nodes = np.zeros((nNode, 3), dtype=dtx)
-        # Read the coordinates
+        # Read the coordinates (only these arrays are read from file)
         Nodes[:,0] = cgns.Data[kx]
         Nodes[:,1] = cgns.Data[ky]
         Nodes[:,2] = cgns.Data[kz]
@@ -2994,6 +3578,167 @@ class TriBase(object):
   # Multiple File Reading
   # =====================
   # <
+    # Combine several triangulations at once
+    @classmethod
+    def concatenate(cls, tris):
+        r"""Combine a list of triangulations into a new one
+
+        The result is the same as starting with the first triangulation
+        and calling :func:`Add` with each of the others, including the
+        offsets applied to overlapping component IDs.  However, the
+        output arrays are allocated once and filled in, so the cost is
+        linear in the total size instead of quadratic.
+
+        :Call:
+            >>> tri = TriBase.concatenate(tris)
+            >>> tri = Tri.concatenate(tris)
+        :Inputs:
+            *tris*: :class:`list`\ [:class:`cape.tri.TriBase`]
+                List of triangulations to combine
+        :Outputs:
+            *tri*: :class:`cape.tri.TriBase` | subclass
+                New triangulation of the class used to call the method
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 1.1; keep *tris[0]* metadata
+        """
+        # Check for empty list
+        if len(tris) == 0:
+            raise ValueError("Cannot concatenate empty list of triangulations")
+        # Sizes of each triangulation
+        nNodes = np.array([trii.nNode for trii in tris])
+        nTris = np.array([trii.nTri for trii in tris])
+        # Offsets of each triangulation's nodes and tris
+        iNode = np.hstack(([0], np.cumsum(nNodes)))
+        iTri = np.hstack(([0], np.cumsum(nTris)))
+        # Total sizes
+        nNode = int(iNode[-1])
+        nTri = int(iTri[-1])
+        # Initialize output arrays
+        Nodes = np.zeros((nNode, 3), dtype=tris[0].Nodes.dtype)
+        Tris = np.zeros((nTri, 3), dtype=tris[0].Tris.dtype)
+        CompID = np.zeros(nTri, dtype=tris[0].CompID.dtype)
+        # Check for states on every triangulation
+        qq = all(getattr(trii, "q", None) is not None for trii in tris)
+        # Initialize states
+        if qq:
+            q = np.zeros((nNode, tris[0].q.shape[1]), dtype=tris[0].q.dtype)
+        # Component IDs used so far and current max
+        comps = set()
+        cmax = 0
+        # Loop through triangulations
+        for k, trii in enumerate(tris):
+            # Index ranges
+            ia, ib = iNode[k], iNode[k+1]
+            ja, jb = iTri[k], iTri[k+1]
+            # Copy nodes and offset-adjusted tris
+            Nodes[ia:ib] = trii.Nodes
+            Tris[ja:jb] = trii.Tris + ia
+            # Copy states
+            if qq:
+                q[ia:ib] = trii.q
+            # Unique component IDs of this triangulation
+            compsk = np.unique(trii.CompID)
+            # Offset if any nonzero CompID is already used (like Add)
+            if any((c != 0) and (c in comps) for c in compsk):
+                # Avoid overlap
+                dc = cmax
+            else:
+                # Use raw CompIDs
+                dc = 0
+            # Save component IDs
+            CompID[ja:jb] = trii.CompID + dc
+            # Update list of used components
+            comps.update(compsk + dc)
+            # Update max CompID
+            if compsk.size > 0:
+                cmax = max(cmax, compsk[-1] + dc)
+        # Create new triangulation
+        tri = cls()
+        # Copy metadata (*ext*, *filetype*, etc.) from first triangulation
+        for k, v in tris[0].__dict__.items():
+            # Skip arrays, which are sized for just that triangulation
+            if not isinstance(v, np.ndarray):
+                setattr(tri, k, v)
+        # Keep quads of first triangulation, like :func:`Add`
+        for k in ("Quads", "CompIDQuad", "BCsQuad"):
+            # Check for array
+            v = getattr(tris[0], k, None)
+            if isinstance(v, np.ndarray):
+                setattr(tri, k, v.copy())
+        # Save sizes and arrays
+        tri.nNode = nNode
+        tri.nTri = nTri
+        tri.Nodes = Nodes
+        tri.Tris = Tris
+        tri.CompID = CompID
+        # Save states
+        if qq:
+            tri.q = q
+            tri.nq = q.shape[1]
+            tri.n = getattr(tris[0], "n", 1)
+        # Merge *config* faces
+        if getattr(tris[0], "config", None) is not None:
+            # Copy first configuration
+            tri.config = tris[0].config.Copy()
+            # Collect the values of each face from all triangulations
+            faces = {}
+            # Loop through triangulations
+            for trii in tris:
+                # Check for a configuration
+                cfg = getattr(trii, "config", None)
+                if cfg is None:
+                    continue
+                # Loop through faces
+                for face, v in cfg.faces.items():
+                    faces.setdefault(face, []).append(v)
+            # Combine values
+            for face, V in faces.items():
+                # Check for only one value, or all the same integer
+                if len(V) == 1:
+                    # Use value as is
+                    tri.config.faces[face] = V[0]
+                elif all(np.ndim(v) == 0 and v == V[0] for v in V):
+                    # Same single component everywhere
+                    tri.config.faces[face] = V[0]
+                else:
+                    # Union the values
+                    u = np.unique(np.hstack([np.ravel(v) for v in V]))
+                    # Save as a list
+                    tri.config.faces[face] = list(u)
+        # Merge *Conf* maps
+        if getattr(tris[0], "Conf", None) is not None:
+            # Collect values of each component from all triangulations
+            conf = {}
+            # Loop through triangulations
+            for trii in tris:
+                # Loop through components
+                for face, v in getattr(trii, "Conf", {}).items():
+                    conf.setdefault(face, []).append(v)
+            # Combine values
+            tri.Conf = {}
+            for face, V in conf.items():
+                # Check for one value
+                if len(V) == 1:
+                    # Use value as is
+                    tri.Conf[face] = V[0]
+                    continue
+                # Ordered list of unique components
+                vals = []
+                for v in V:
+                    # Loop through each value as a list
+                    for c in np.ravel(v):
+                        # Append if new
+                        if c not in vals:
+                            vals.append(c)
+                # Save integer if all values are the same integer
+                if len(vals) == 1 and np.ndim(V[0]) == 0:
+                    tri.Conf[face] = V[0]
+                else:
+                    tri.Conf[face] = vals
+        # Output
+        return tri
+
     # Add a second triangulation without destroying component numbers.
     def Add(self, tri):
         """Add a second triangulation file.
@@ -3370,6 +4115,181 @@ class TriBase(object):
         # Write the triangulation to file.
         tri.Write(fname)
 
+    # Get spatial hash of triangle centers
+    def GetCenterHash(self):
+        r"""Sort triangle centroids into cells of a uniform grid
+
+        The hash is only recomputed if *tri.Tris* has been replaced.
+
+        :Call:
+            >>> tri.GetCenterHash()
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+        :Effects:
+            *tri.CenterHashPoints*: :class:`np.ndarray`\ [:class:`float`]
+                Centroid of each triangle, shape (*nTri*, 3)
+            *tri.CenterHashOrigin*: :class:`np.ndarray`\ [:class:`float`]
+                Minimum coordinates of grid
+            *tri.CenterHashScale*: :class:`float`
+                Size of each (cubic) cell
+            *tri.CenterHashShape*: :class:`np.ndarray`\ [:class:`int`]
+                Number of cells in each direction
+            *tri.CenterHashKeys*: :class:`np.ndarray`\ [:class:`int`]
+                Sorted flat index of each nonempty cell
+            *tri.CenterHashPtr*: :class:`np.ndarray`\ [:class:`int`]
+                Start of each nonempty cell in *tri.CenterHashIndex*
+            *tri.CenterHashIndex*: :class:`np.ndarray`\ [:class:`int`]
+                Triangle indices [0-based] for each cell
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Check for hash of current triangles
+        if getattr(self, "_CenterHashTris", None) is self.Tris:
+            return
+        # Centroid of each triangle
+        X = np.mean(self.Nodes[self.Tris-1], axis=1)
+        # Use cells a few times larger than the typical triangle
+        self.GetNormals()
+        h = 2.0 * np.sqrt(np.mean(self.Areas))
+        # Check for degenerate triangulation
+        if not (h > 0.0):
+            h = max(np.max(np.ptp(X, axis=0)), 1.0)
+        # Cell of each centroid
+        x0 = np.min(X, axis=0)
+        C = np.floor((X - x0) / h).astype("int64")
+        # Number of cells in each direction
+        shape = np.max(C, axis=0) + 1
+        # Flat index of each cell
+        key = (C[:,0]*shape[1] + C[:,1])*shape[2] + C[:,2]
+        # Sort by cell
+        I = np.argsort(key, kind="stable")
+        # Unique cells and number of tris in each
+        ukey, n = np.unique(key[I], return_counts=True)
+        # Save hash
+        self.CenterHashPoints = X
+        self.CenterHashOrigin = x0
+        self.CenterHashScale = h
+        self.CenterHashShape = shape
+        self.CenterHashKeys = ukey
+        self.CenterHashPtr = np.hstack(([0], np.cumsum(n)))
+        self.CenterHashIndex = I
+        # Save triangles used to make hash
+        self._CenterHashTris = self.Tris
+
+    # Find nearest triangle centers
+    def GetNearestTriCenters(self, X, K=None):
+        r"""Find the triangle whose centroid is closest to each point
+
+        The grid cells from :func:`GetCenterHash` are searched in
+        rings of increasing size around the cell of each point until
+        the nearest centroid found is closer than any unsearched cell.
+        Unresolved points are processed in blocks so that at most
+        :data:`CHUNK_SIZE` candidate cells are considered at once.
+
+        :Call:
+            >>> J = tri.GetNearestTriCenters(X, K=None)
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+            *X*: :class:`np.ndarray`\ [:class:`float`]
+                Coordinates of points, shape (*n*, 3)
+            *K*: {``None``} | :class:`np.ndarray`\ [:class:`int`]
+                Indices [0-based] of triangles to consider; default all
+        :Outputs:
+            *J*: :class:`np.ndarray`\ [:class:`int`]
+                Index [0-based] of nearest triangle to each point;
+                ``-1`` if no triangles are considered
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 1.1; process in blocks
+        """
+        # Get hash
+        self.GetCenterHash()
+        # Handles
+        X0 = self.CenterHashPoints
+        h = self.CenterHashScale
+        shape = self.CenterHashShape
+        ukey = self.CenterHashKeys
+        # Mask of triangles to consider
+        if K is None:
+            M = None
+        else:
+            M = np.zeros(self.nTri, dtype="bool")
+            M[K] = True
+        # Points to search
+        X = np.reshape(X, (-1, 3))
+        n = X.shape[0]
+        # Cell of each point; may be outside grid
+        c = np.floor((X - self.CenterHashOrigin) / h).astype("int64")
+        # Smallest ring that reaches the grid
+        rmin = np.max(np.maximum(np.maximum(-c, c - shape + 1), 0), axis=1)
+        # Largest ring needed to cover whole grid
+        rmax = np.max(np.maximum(c, shape - 1 - c), axis=1)
+        # Initialize nearest tri and squared distance
+        J = np.full(n, -1)
+        D = np.full(n, np.inf)
+        # Points not yet resolved
+        Q = np.arange(n)
+        # Loop through rings
+        r = 0
+        while Q.size > 0:
+            # Skip rings that are outside the grid for all points
+            r = max(r, np.min(rmin[Q]))
+            # Offsets of cells on the surface of a cube of size *r*
+            O = _cube_shell(r)
+            # Number of points per block to bound candidate count
+            nb = max(1, CHUNK_SIZE // O.shape[0])
+            # Loop through blocks of unresolved points
+            for ib in range(0, Q.size, nb):
+                # Current block of points
+                QB = Q[ib:ib+nb]
+                # Candidate cells for each unresolved point
+                CC = np.reshape(c[QB,None,:] + O, (-1, 3))
+                qq = np.repeat(QB, O.shape[0])
+                # Only keep cells in grid
+                I = np.all((CC >= 0) & (CC < shape), axis=1)
+                CC = CC[I]
+                qq = qq[I]
+                # Flat index of each cell
+                key = (CC[:,0]*shape[1] + CC[:,1])*shape[2] + CC[:,2]
+                # Find nonempty cells
+                j = np.minimum(np.searchsorted(ukey, key), ukey.size - 1)
+                I = ukey[j] == key
+                j = j[I]
+                qq = qq[I]
+                # Triangles in each cell
+                kk = _csr_gather(self.CenterHashPtr, self.CenterHashIndex, j)
+                qq = np.repeat(qq, np.diff(self.CenterHashPtr)[j])
+                # Only keep requested triangles
+                if M is not None:
+                    I = M[kk]
+                    kk = kk[I]
+                    qq = qq[I]
+                # Squared distance to each candidate
+                d = np.sum((X0[kk] - X[qq])**2, axis=1)
+                # Sort by point, then distance
+                I = np.lexsort((d, qq))
+                qq = qq[I]
+                d = d[I]
+                kk = kk[I]
+                # Closest candidate in this ring for each point
+                I = np.hstack(([True], qq[1:] != qq[:-1]))[:qq.size]
+                qq = qq[I]
+                d = d[I]
+                kk = kk[I]
+                # Only keep candidates closer than those from previous rings
+                I = d < D[qq]
+                D[qq[I]] = d[I]
+                J[qq[I]] = kk[I]
+            # Resolved if no unsearched cell could be closer
+            I = (D[Q] <= (r*h)**2) | (r >= rmax[Q])
+            Q = Q[~I]
+            # Next ring
+            r += 1
+        # Output
+        return J
+
     # Function to map each face's CompID to the closest match from another tri
     def MapSubCompID(self, tric, compID, kc=None):
         """
@@ -3377,7 +4297,7 @@ class TriBase(object):
         triangulation.  This is a common step after running `intersect`.
 
         :Call:
-            >>> tri.MapSubCompID(tric, compID, iA=0, iB=-1)
+            >>> tri.MapSubCompID(tric, compID, kc=None)
         :Inputs:
             *tri*: :class:`cape.tri.TriBase`
                 Triangulation instance
@@ -3385,10 +4305,13 @@ class TriBase(object):
                 Triangulation with more desirable CompIDs to be copied
             *compID*: :class:`int`
                 Component ID to map from *tric*
-            *k1*: :class:`numpy.ndarray` (:class:`int`)
-                Indices of faces in *tric* to considerider
+            *kc*: {``None``} | :class:`numpy.ndarray` (:class:`int`)
+                Indices of faces in *tric* to consider
         :Versions:
             * 2015-02-24 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 2.0
+                - Use :func:`GetNearestTriCenters` for all faces at once
+                - Remove sweep over matching vertices
         """
         # Default last index.
         if kc is None: kc = np.arange(tric.nTri)
@@ -3400,74 +4323,12 @@ class TriBase(object):
             self.CompID[K1] = tric.CompID[kc[0]]
             # That's it.
             return
-        # Make copy of the target indices.
-        K0 = kc.copy()
-        # Extract target triangle vertices
-        x0 = tric.Nodes[tric.Tris[K0]-1,0]
-        y0 = tric.Nodes[tric.Tris[K0]-1,1]
-        z0 = tric.Nodes[tric.Tris[K0]-1,2]
-        # Current vertices
-        x1 = self.Nodes[self.Tris[K1]-1,0]
-        y1 = self.Nodes[self.Tris[K1]-1,1]
-        z1 = self.Nodes[self.Tris[K1]-1,2]
-        # Length scale
-        tol = 1e-6 * np.sqrt(np.sum(
-            (np.max(self.Nodes,0)-np.min(self.Nodes,0))**2))
-        # Start with the first tri.
-        k0 = 0
-        k1 = 0
-        # Loop until one of the two sets of faces is exhausted.
-        while (k0<len(K0)-1) and (k1<len(K1)-1):
-            # Current point from intersected geometry.
-            xk = x1[k1]; yk = y1[k1]; zk = z1[k1]
-            # Distance to current intersected triangle.
-            d0 = np.sqrt(
-                (x0[k0:,0]-xk[0])**2 + (x0[k0:,1]-xk[1])**2 +
-                (x0[k0:,2]-xk[2])**2 + (y0[k0:,0]-yk[0])**2 +
-                (y0[k0:,1]-yk[1])**2 + (y0[k0:,2]-yk[2])**2 +
-                (z0[k0:,0]-zk[0])**2 + (z0[k0:,1]-zk[1])**2 +
-                (z0[k0:,2]-zk[2])**2)
-            # Find the index of this tri in the target set.
-            i0 = np.where(d0 <= tol)[0]
-            # Check for match.
-            if len(i0) == 0:
-                # No match.
-                k1 += 1
-            else:
-                # Take the first point.
-                k0 += i0[0]
-            # Try to match all the remaining points.
-            n = min(len(K0)-k0, len(K1)-k1)
-            # Calculate total of distances between vertices.
-            dk = np.sqrt(np.sum((x1[k1:k1+n]-x0[k0:k0+n])**2 +
-                (y1[k1:k1+n]-y0[k0:k0+n])**2 +
-                (z1[k1:k1+n]-z0[k0:k0+n])**2, 1))
-            # Check for a match.
-            if not np.any(dk<=tol): continue
-            # Find the first tri that does _not_ match.
-            j = np.where(dk<=tol)[0][-1] + 1
-            # Copy these *j* CompIDs.
-            self.CompID[K1[k1:k1+j]] = tric.CompID[K0[k0:k0+j]]
-            # Move to next tri in intersected surface.
-            k1 += j; k0 += j
-
-        # Find the triangles that are _still_ the old CompID
-        K = np.where(self.CompID == compID)[0]
-
-        # Calculate the centroids of the target components.
-        x0 = np.mean(tric.Nodes[tric.Tris[K0]-1, 0], 1)
-        y0 = np.mean(tric.Nodes[tric.Tris[K0]-1, 1], 1)
-        z0 = np.mean(tric.Nodes[tric.Tris[K0]-1, 2], 1)
         # Calculate centroids of current tris.
-        x1 = np.mean(self.Nodes[self.Tris-1,0], 1)
-        y1 = np.mean(self.Nodes[self.Tris-1,1], 1)
-        z1 = np.mean(self.Nodes[self.Tris-1,2], 1)
-        # Loop through components.
-        for i in K:
-            # Find the closest centroid from *tric*.
-            j = np.argmin((x0-x1[i])**2 + (y0-y1[i])**2 + (z0-z1[i])**2)
-            # Map it.
-            self.CompID[i] = tric.CompID[K0[j]]
+        X = np.mean(self.Nodes[self.Tris[K1]-1], axis=1)
+        # Find the closest centroid from *tric*
+        J = tric.GetNearestTriCenters(X, kc)
+        # Map it.
+        self.CompID[K1] = tric.CompID[J]
 
     # Function to fully map component IDs
     def MapCompID(self, tric, tri0):
@@ -4155,25 +5016,18 @@ class TriBase(object):
                 Array of triangle indices
         :Versions:
             * 2019-05-14 ``@ddalle``: Version 1.0
-        """
-        # Initialize True|{False} array of each triangle
-        Q = np.arange(self.nTri) < 0
-        # Handle to triangle indices
-        T = self.Tris
-        # Loop through nodes
-        for i in I[::skip]:
-            # Status update
-            sys.stdout.write("   %5i/%5i\r" % (i, np.max(I)))
-            sys.stdout.flush()
-            # Process three columns of *Tris*
-            Q[T[:,0] == i] = True
-            Q[T[:,1] == i] = True
-            Q[T[:,2] == i] = True
-        # Clean up prompt
-        sys.stdout.write("%14s\r" % "")
-        sys.stdout.flush()
+            * 2026-10-18 ``@ddalle``: Version 2.0; use :func:`GetNodeTris`
+        """
+        # Get node -> triangle table
+        self.GetNodeTris()
+        # Handles
+        ptr = self.NodeTriPtr
+        # Nodes to analyze
+        I = np.asarray(I, dtype="int")[::skip]
+        # Ignore nodes not in any triangle
+        I = I[(I >= 0) & (I < ptr.size - 1)]
         # Get indices
-        return np.where(Q)[0]
+        return np.unique(_csr_gather(ptr, self.NodeTriIndex, I))
 
     # Get components from compIDs
     def GetFacesFromTris(self, K, nmin=10):
@@ -4412,6 +5266,45 @@ class TriBase(object):
                 Whether or not to remove newly created small tris
         :Versions:
             * 2017-06-19 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 2.0
+                - Use :func:`CollapseSmallTris` for each pass
+                - Repeat passes in a loop instead of recursion
+        """
+        # Loop until no small triangles remain
+        while True:
+            # Remove small triangles once
+            ndel = self.CollapseSmallTris(smalltri, v=v)
+            # Check for completion
+            if (not recurse) or (ndel == 0):
+                break
+            # Status update
+            if v:
+                print("Checking for *new* small triangles")
+
+    # Remove small triangles in one pass
+    def CollapseSmallTris(self, smalltri=1e-5, v=False):
+        r"""Collapse the short edges of small triangles in a single pass
+
+        The shortest edge of each triangle with area no larger than
+        *smalltri* is collapsed, and all three edges are collapsed if
+        the whole triangle is smaller than ``sqrt(smalltri)``. Chains of
+        collapsed edges are merged into the highest node index in each
+        group, and any triangle that loses a node is removed.
+
+        :Call:
+            >>> ndel = tri.CollapseSmallTris(smalltri=1e-5, v=False)
+        :Inputs:
+            *tri*: :class:`cape.tri.Tri`
+                Triangulation instance
+            *smalltri*: {``1e-5``} | :class:`float` > 0
+                Minimum allowable triangle area
+            *v*: ``True`` | {``False``}
+                Verbosity flag
+        :Outputs:
+            *ndel*: :class:`int`
+                Number of triangles removed
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
         """
         # Calculate areas
         self.GetNormals()
@@ -4421,108 +5314,63 @@ class TriBase(object):
         nsmall = K.size
         # Check for nothing to do
         if nsmall == 0:
-            return
+            return 0
         # Status update
         if v:
             print("Removing %i small triangles (A<=%.2e)"
                 % (nsmall, smalltri))
         # Get the node indices of the small tris
         I = self.Tris[K] - 1
-        # Get the coordinates of all nodes involved in small triangles
-        X = self.Nodes[I, 0]
-        Y = self.Nodes[I, 1]
-        Z = self.Nodes[I, 2]
-        # Edge distance components
-        dx = X[:,[1,2,0]] - X
-        dy = Y[:,[1,2,0]] - Y
-        dz = Z[:,[1,2,0]] - Z
-        # Distances
-        D = np.sqrt(dx*dx + dy*dy + dz*dz)
+        # Coordinates of nodes of each small triangle
+        X = self.Nodes[I]
+        # Edge lengths
+        D = np.sqrt(np.sum((X[:,[1,2,0]] - X)**2, axis=2))
         # Estimate edge tolerance
         dmin = np.sqrt(smalltri)
         # Find the shortest edge of each small triangle
         J = np.argmin(D, axis=1)
-        # Combine start/end node indices
-        I0 = np.array([I[i][[j, (j + 1) % 3]] for (i, j) in enumerate(J)])
-        # Additional node replacements
-        I2 = []
-        # Loop through the tri to check for neighbor-neighbor issues
-        for (i, k) in enumerate(K):
-            # Check maximum length
-            if np.max(D[i]) <= dmin:
-                # Get the nodes
-                i1, i2, i3 = I[i]
-                # Just shift the triangle to a point
-                I2.append([i1, i2])
-                I2.append([i1, i3])
-                I2.append([i2, i3])
-        # Append additional deletions
-        if len(I2) > 0:
-            I0 = np.vstack((I0, I2))
-        # Sort the node pairs so we mark the same node for deletion
-        # regardless of order
-        I0.sort(axis=1)
-        # Each node in the left column is replaced by node in right
-        # To avoid loops, we sort in dictionary order; higher node
-        # indices are favored
-        O1 = np.lexsort((I0[:,1], I0[:,0]))
-        # Apply sorting
-        I0 = I0[O1]
-        # Initialize node index map; node i --> node I1[i] (0-based)
-        I1 = np.arange(self.nNode)
-        # Loop through node replacements
-        for (ia, ib) in I0:
-            # Make assignment
-            I1[ia] = ib
-        # Outgoing nodes
-        IA = np.unique(I0[:,0])
+        k = np.arange(nsmall)
+        # Start/end node indices of shortest edges
+        I0 = np.stack((I[k, J], I[k, (J + 1) % 3]), axis=1)
+        # Triangles whose edges are all short collapse to a point
+        Q = np.max(D, axis=1) <= dmin
+        # Append those edges
+        I0 = np.vstack((I0, I[Q][:,[0,1]], I[Q][:,[1,2]]))
+        # Merge each group of connected nodes into highest index
+        I1 = _union_find_max(self.nNode, I0[:,0], I0[:,1])
         # Make new triangle index array with replacements
         T = I1[self.Tris - 1] + 1
         # Once the nodes have been updated, look for tris with repeats
         # This can happen if a (sufficiently) large triangle has an
         # edge removed by being adjacent to a small tri
-        # First we find the delta-node-index for each edge
-        DI = T[:,[1,2,0]] - T
-        # Find the smallest node-delta in absolute terms for each tri
-        DImin = np.min(np.abs(DI), axis=1)
-        # Any time there's a zero in a row marks a trivialized tri
-        K1 = np.where(DImin == 0)[0]
+        Q = (T[:,0] == T[:,1]) | (T[:,1] == T[:,2]) | (T[:,2] == T[:,0])
         # Let's be safe and make sure the original tris are removed
-        K2 = np.union1d(K, K1)
+        Q[K] = True
         # Total removal count
-        ndel = K2.size
+        ndel = np.count_nonzero(Q)
         # Final removal count
         if v:
             print("Removing %i additional tris trivialized by edge removal"
                 % (ndel - nsmall))
-        # Remove the small or trivialized tris from orig and remapped
-        T1 = np.delete(self.Tris, K2, axis=0)
-        T2 = np.delete(T, K2, axis=0)
-        # Save triangles
-        self.Tris = T2
+        # Save remaining triangles
+        self.Tris = T[~Q]
         # Update number of triangles
         self.nTri = self.Tris.shape[0]
         # Delete area calculations, some of which will need updating
         delattr(self, "Areas")
         delattr(self, "Normals")
-        #delattr(self, "EdgeTable")
         # Final removal count
         if v:
             print("Removing %i triangles in total" % ndel)
         # Component IDs should be there, but let's be safe
         try:
-            self.CompID = np.delete(self.CompID, K2, axis=0)
+            self.CompID = self.CompID[~Q]
         except AttributeError:
             pass
         # Remove those removed nodes
         self.RemoveUnusedNodes(v=v)
-        # Recurse if needed
-        if recurse and (ndel > 0):
-            # Status update
-            if v:
-                print("Recursing to check for *new* small triangles")
-            # Recursive call
-            self.RemoveSmallTris(smalltri, v=v)
+        # Output
+        return ndel
 
 
     # Map triangles to components based on another file
@@ -5495,17 +6343,14 @@ class TriBase(object):
                 Unit normal at each node averaged from neighboring triangles
         :Versions:
             * 2016-01-23 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 1.1; use :func:`_tri2node`
         """
         # Ensure normals are present
         self.GetNormals()
-        # Initialize node normals
-        NN = np.zeros((self.nNode, 3))
         # Get areas
         TA = np.transpose([self.Areas, self.Areas, self.Areas])
-        # Add in the weighted tri areas for each column of nodes in the tris
-        NN[self.Tris[:,0]-1,:] += (self.Normals*TA)
-        NN[self.Tris[:,1]-1,:] += (self.Normals*TA)
-        NN[self.Tris[:,2]-1,:] += (self.Normals*TA)
+        # Add in the weighted tri areas for each node of the tris
+        NN = _tri2node(self.Tris - 1, self.Normals*TA, self.nNode)
         # Calculate the length of each of these vectors
         L = np.fmax(1e-10, np.sqrt(np.sum(NN**2, 1)))
         # Normalize.
@@ -5565,13 +6410,13 @@ class TriBase(object):
                 Array of node indices defining each edge
         :Versions:
             * 2019-06-20 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 1.1; recompute if new *Tris*
         """
-        # Check for edges
-        try:
-            self.EdgeTable
+        # Check for edges of current triangles
+        if getattr(self, "_EdgeTableTris", None) is self.Tris:
             return
-        except Exception:
-            pass
+        # Save triangles used to make table
+        self._EdgeTableTris = self.Tris
         # Groups: edges from 0->1, 1->2, 2->0
         i0 = 0
         i1 = self.nTri
@@ -5617,22 +6462,144 @@ class TriBase(object):
                 if no match, returns ``0``
         :Versions:
             * 2019-06-20 ``@ddalle``: Version 1.0
-        """
-        # Get edge table
-        self.GetEdgeTable()
-        # Get handle
-        ET = self.EdgeTable
-        # Find edges starting with node *i0*
-        j0 = np.where(ET[:,0] == i0)[0]
-        # Of these, find the one with *i1* as the end
-        j1 = np.where(ET[j0,1] == i1)[0]
+            * 2026-10-18 ``@ddalle``: Version 2.0; use :func:`GetEdgeTris`
+        """
+        # Triangles containing edge in either direction
+        K = self.GetTrisFromEdge(i0, i1)
+        # Nodes of those triangles
+        T = self.Tris[K]
+        # Check for edge *i0* -> *i1* in each triangle
+        Q = np.any((T == i0) & (np.roll(T, -1, axis=1) == i1), axis=1)
         # Check validity
-        if j1.size != 1:
+        if np.count_nonzero(Q) != 1:
             return 0
-        # Get edge index
-        j = j0[j1[0]]
-        # Get triangle index from table
-        return ET[j, 2]
+        # Get triangle index [1-based]
+        return K[Q][0] + 1
+
+    # Get node -> triangle table
+    def GetNodeTris(self):
+        r"""Get compressed-sparse-row table of triangles using each node
+
+        The table is only recomputed if *tri.Tris* has been replaced.
+
+        :Call:
+            >>> tri.GetNodeTris()
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+        :Effects:
+            *tri.NodeTriPtr*: :class:`np.ndarray`\ [:class:`int`]
+                Triangles using node *i* [1-based] are
+                ``tri.NodeTriIndex[tri.NodeTriPtr[i]:tri.NodeTriPtr[i+1]]``
+            *tri.NodeTriIndex*: :class:`np.ndarray`\ [:class:`int`]
+                Triangle indices [0-based] for each node
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Check for table of current triangles
+        if getattr(self, "_NodeTriTris", None) is self.Tris:
+            return
+        # Node index of each triangle vertex
+        I = np.asarray(self.Tris, dtype="int").flatten()
+        # Number of rows (node indices are 1-based)
+        n = max(self.nNode, np.max(I) if I.size else 0) + 1
+        # Sort vertices by node; tris remain in order for each node
+        J = np.argsort(I, kind="stable")
+        # Triangle of each vertex
+        self.NodeTriIndex = J // 3
+        # Start of each row
+        self.NodeTriPtr = np.zeros(n + 1, dtype="int")
+        self.NodeTriPtr[1:] = np.cumsum(np.bincount(I, minlength=n))
+        # Save triangles used to make table
+        self._NodeTriTris = self.Tris
+
+    # Get edge -> triangle table
+    def GetEdgeTris(self):
+        r"""Get unique edges and table of triangles using each edge
+
+        The table is only recomputed if *tri.Tris* has been replaced.
+
+        :Call:
+            >>> tri.GetEdgeTris()
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+        :Effects:
+            *tri.EdgeNodes*: :class:`np.ndarray`\ [:class:`int`]
+                Sorted unique edges; *EdgeNodes[j,0] < EdgeNodes[j,1]*
+            *tri.EdgeTriPtr*: :class:`np.ndarray`\ [:class:`int`]
+                Triangles using edge *j* are
+                ``tri.EdgeTriIndex[tri.EdgeTriPtr[j]:tri.EdgeTriPtr[j+1]]``
+            *tri.EdgeTriIndex*: :class:`np.ndarray`\ [:class:`int`]
+                Triangle indices [0-based] for each edge
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Check for table of current triangles
+        if getattr(self, "_EdgeTriTris", None) is self.Tris:
+            return
+        # Triangle nodes
+        T = np.asarray(self.Tris, dtype="int")
+        # Edges from 0->1, 1->2, 2->0 of each tri
+        E = np.vstack((T[:,[0,1]], T[:,[1,2]], T[:,[2,0]]))
+        # Ignore direction
+        E.sort(axis=1)
+        # Triangle of each edge
+        K = np.tile(np.arange(T.shape[0]), 3)
+        # Combine nodes into one key for each edge
+        n = np.max(E) + 1 if E.size else 1
+        key = E[:,0].astype("int64")*n + E[:,1]
+        # Unique edges
+        ukey, J, I = np.unique(key, return_index=True, return_inverse=True)
+        # Save edges
+        self.EdgeNodes = E[J]
+        self._EdgeKeys = ukey
+        self._EdgeKeyScale = n
+        # Sort by edge; tris remain in order for each edge
+        J = np.argsort(I, kind="stable")
+        # Triangle of each edge
+        self.EdgeTriIndex = K[J]
+        # Start of each row
+        self.EdgeTriPtr = np.zeros(ukey.size + 1, dtype="int")
+        self.EdgeTriPtr[1:] = np.cumsum(np.bincount(I, minlength=ukey.size))
+        # Save triangles used to make table
+        self._EdgeTriTris = self.Tris
+
+    # Find triangles using an edge
+    def GetTrisFromEdge(self, i0, i1):
+        r"""Find the triangles that contain an edge in either direction
+
+        :Call:
+            >>> K = tri.GetTrisFromEdge(i0, i1)
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+            *i0*: :class:`int` > 0
+                Edge start node index [1-based]
+            *i1*: :class:`int` > 0
+                Edge end node index [1-based]
+        :Outputs:
+            *K*: :class:`np.ndarray`\ [:class:`int`]
+                Indices [0-based] of triangles containing the edge
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
+        """
+        # Get edge -> triangle table
+        self.GetEdgeTris()
+        # Sort the nodes
+        i0, i1 = min(i0, i1), max(i0, i1)
+        # Check for nodes not in any edge
+        if i0 < 0 or i1 >= self._EdgeKeyScale:
+            return np.zeros(0, dtype="int")
+        # Key for this edge
+        key = i0*self._EdgeKeyScale + i1
+        # Find it
+        j = np.searchsorted(self._EdgeKeys, key)
+        # Check for match
+        if j >= self._EdgeKeys.size or self._EdgeKeys[j] != key:
+            return np.zeros(0, dtype="int")
+        # Output
+        return self.EdgeTriIndex[self.EdgeTriPtr[j]:self.EdgeTriPtr[j+1]]
 
 
     # Find neighbors of a triangle
@@ -5966,6 +6933,10 @@ class TriBase(object):
                 Resolution of projection plane 
             *img*: {``None``} | :class:`str`
                 Optional file name for projection figure
+            *method*: {``"grid"``} | ``"exact"``
+                Count points of a grid with spacing *ds* covered by the
+                projected triangles or calculate the exact area of the
+                union of the projected triangles
         :Outputs:
             *A*: :class:`float`
                 Projected area 
@@ -5979,6 +6950,10 @@ class TriBase(object):
                 - Remove debug hooks
                 - Add *img* for output fig generation
                 - Clean up unit vectors and docstring
+
+            * 2026-10-18 ``@ddalle``: Version 3.0
+                - Only test grid points in bounding box of each tri
+                - Add *method* ``"exact"`` for area of polygon union
         """
         # Check for trivial *nhat*
         if not isinstance(nhat, np.ndarray):
@@ -5990,6 +6965,12 @@ class TriBase(object):
         elif np.max(np.abs(nhat)) < 1e-8:
             raise ValueError(
                 "Projection vector has zero or near-zero magnitude")
+        # Area calculation method
+        method = kw.get("method", "grid")
+        # Check it
+        if method not in ("grid", "exact"):
+            raise ValueError(
+                "Unrecognized projected area method '%s'" % method)
         # Get the bounding box of the component
         bbox = self.GetCompBBox(compID)
         # Exit if *compID* not found
@@ -6023,6 +7004,29 @@ class TriBase(object):
         e1p = np.dot(self.Nodes, e1)
         e2p = np.dot(self.Nodes, e2)
 
+        # Get the triangles in *compID*
+        K = self.GetTrisFromCompID(compID)
+        # Unpack the triangles using zero-based indexing
+        T = self.Tris[K] - 1
+        # Get the edges of the triangles
+        xt1 = e1p[T[:,1]] - e1p[T[:,0]]
+        xt2 = e1p[T[:,2]] - e1p[T[:,1]]
+        xt3 = e1p[T[:,0]] - e1p[T[:,2]]
+        yt1 = e2p[T[:,1]] - e2p[T[:,0]]
+        yt2 = e2p[T[:,2]] - e2p[T[:,1]]
+        yt3 = e2p[T[:,0]] - e2p[T[:,2]]
+        # Assemble edge vectors?
+        # Get the normals
+        zt = xt1*yt2 - xt2*yt1
+        # Figure out which triangles need to be flipped
+        tmask = zt < 0
+        # Flip them
+        T[tmask,:] = T[tmask,::-1]
+
+        # Check for exact area of union
+        if method == "exact":
+            return _tri_union_area(e1p, e2p, T)
+
         # Find the bounds for the projection plane, add some pad
         pad = 2.0 * ds 
         # Only count nodes in *compID*
@@ -6041,70 +7045,13 @@ class TriBase(object):
         # Switch to midpoints
         e1p_dis = 0.5*(e1p_dis[:-1] + e1p_dis[1:])
         e2p_dis = 0.5*(e2p_dis[:-1] + e2p_dis[1:])
-        # Create a 2D mesh
-        e1grid, e2grid = np.meshgrid(e1p_dis, e2p_dis, indexing='ij')
-        # Flatten back into longer 1D arrays
-        e1grid = e1grid.flatten()
-        e2grid = e2grid.flatten()
-
         # Area of a single square on the projection plane
         de1p = e1p_dis[1] - e1p_dis[0]
         de2p = e2p_dis[1] - e2p_dis[0]
         a = de1p * de2p
 
-        # Create a mask for the discretized projection plane
-        mask = np.zeros(e1p_np*e2p_np, dtype="bool")
-
-        # Get the triangles in *compID*
-        K = self.GetTrisFromCompID(compID)
-        # Unpack the triangles using zero-based indexing
-        T = self.Tris[K] - 1
-        # Get the edges of the triangles
-        xt1 = e1p[T[:,1]] - e1p[T[:,0]]
-        xt2 = e1p[T[:,2]] - e1p[T[:,1]]
-        xt3 = e1p[T[:,0]] - e1p[T[:,2]]
-        yt1 = e2p[T[:,1]] - e2p[T[:,0]]
-        yt2 = e2p[T[:,2]] - e2p[T[:,1]]
-        yt3 = e2p[T[:,0]] - e2p[T[:,2]]
-        # Assemble edge vectors?
-        # Get the normals
-        zt = xt1*yt2 - xt2*yt1
-        # Figure out which triangles need to be flipped
-        tmask = zt < 0
-        # Flip them
-        T[tmask,:] = T[tmask,::-1]
-
-        # Loop through triangles
-        for t in T:
-            # Calculate the vector from node 0 to the whole discr mesh
-            xj = e1grid - e1p[t[0]]
-            yj = e2grid - e2p[t[0]]
-            # Get the first tangent vector
-            xtj = e1p[t[1]] - e1p[t[0]]
-            ytj = e2p[t[1]] - e2p[t[0]]
-            # Calculate dot product and flag positive ones
-            # Here (xtj, ytj) is the vector along edge0
-            # And then (-ytj, xtj) is the vector that points left of it
-            # *maskj* marks points in the discretized plane left of edge
-            maskj = -ytj*xj + xtj*yj >= 0.0
-            # Calculate the vector from node 1 to mesh
-            xj = e1grid - e1p[t[1]]
-            yj = e2grid - e2p[t[1]]
-            # Tangent of edge 1
-            xtj = e1p[t[2]] - e1p[t[1]]
-            ytj = e2p[t[2]] - e2p[t[1]]
-            # Calculate points to the left of edge 1 (and edge 0)
-            maskj = np.logical_and(maskj, -ytj*xj + xtj*yj >= 0.0)
-            # Now node 2 to mesh
-            xj = e1grid - e1p[t[2]]
-            yj = e2grid - e2p[t[2]]
-            # Tangent of edge 2
-            xtj = e1p[t[0]] - e1p[t[2]]
-            ytj = e2p[t[0]] - e2p[t[2]]
-            # Calculate points to the left of edge 2 (and edges 0 and 1)
-            maskj = np.logical_and(maskj, -ytj*xj + xtj*yj >= 0.0)
-            # Update the global mask
-            mask = np.logical_or(mask, maskj)
+        # Mark grid points inside any triangle
+        mask = _raster_tris(e1p, e2p, T, e1p_dis, e2p_dis)
 
         # Output file name
         img = kw.get("img")
@@ -6114,6 +7061,11 @@ class TriBase(object):
             pmpl.mpl._import_pyplot()
             # Handle to usual PyPlot module
             plt = pmpl.mpl.plt
+            # Create a 2D mesh
+            e1grid, e2grid = np.meshgrid(e1p_dis, e2p_dis, indexing='ij')
+            # Flatten back into longer 1D arrays
+            e1grid = e1grid.flatten()
+            e2grid = e2grid.flatten()
             # Reverse mask
             mask_ = np.logical_not(mask)
             # Get new figure
@@ -6181,6 +7133,8 @@ class TriBase(object):
                 Triangulation instance
             *Y*: :class:`np.ndarray` shape=(n,3)
                 List of points defining piecewise linear curve
+            *method*: {``"graph"``} | ``"walk"``
+                Use :func:`TraceCurveGraph` or :func:`TraceCurveWalk`
             *dtol*: {``0.05``} | :class:`float`
                 Maximum distance from curve as fraction of reference length
             *atol*: {``60.0``} | :class:`float`
@@ -6190,9 +7144,140 @@ class TriBase(object):
                 Sequential list of nodes that trace a curve
         :Versions:
             * 2016-09-29 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 2.0; add *method*
+        """
+        # Tracing method
+        method = kw.get("method", "graph")
+        # Check it
+        if method == "graph":
+            return self.TraceCurveGraph(Y, **kw)
+        elif method == "walk":
+            return self.TraceCurveWalk(Y, **kw)
+        else:
+            raise ValueError("Unrecognized curve tracing method '%s'" % method)
+
+    # Trace a curve using shortest path
+    def TraceCurveGraph(self, Y, **kw):
+        """Extract nodes along a curve using a shortest-path search
+
+        The search uses the edges of the triangulation whose nodes and
+        midpoints are within *dtol* times the size of the curve from the
+        curve. The weight of each edge is its length, increased in
+        proportion to its distance from the curve, and the path from the
+        node closest to the start of the curve to the node closest to
+        its end is found using A* search. Closed curves are traced in
+        two halves.
+
+        :Call:
+            >>> X = tri.TraceCurveGraph(Y, **kw)
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+            *Y*: :class:`np.ndarray` shape=(n,3)
+                List of points defining piecewise linear curve
+            *dtol*: {``0.05``} | :class:`float`
+                Maximum distance from curve as fraction of reference length
+        :Outputs:
+            *X*: :class:`np.ndarray` shape=(m,3)
+                Sequential list of nodes that trace a curve
+        :Versions:
+            * 2026-10-18 ``@ddalle``: Version 1.0
         """
         # Spatial tolerance
         dtol = kw.get('dtol', 0.05)
+        # Curve
+        Y = np.asarray(Y, dtype="float")
+        # Characteristic length of the curve
+        dy = np.max(np.max(Y, axis=0) - np.min(Y, axis=0))
+        # Radius of tube around curve
+        r = dtol * dy
+        # Find the nodes closest to the start and end of the curve
+        i0, d0 = self.GetClosestNode(Y[0])
+        i1, d1 = self.GetClosestNode(Y[-1])
+        # Check for acceptable tolerance
+        if max(d0, d1) > r:
+            return np.array([], dtype='int')
+        # Distance from each node to curve
+        D = _polyline_distance(self.Nodes, Y, r)
+        # Get unique edges
+        self.GetEdgeTris()
+        E = self.EdgeNodes - 1
+        # Only keep edges with both ends in tube
+        E = E[np.isfinite(D[E[:,0]]) & np.isfinite(D[E[:,1]])]
+        # Distance from midpoint of each edge to curve
+        XM = 0.5*(self.Nodes[E[:,0]] + self.Nodes[E[:,1]])
+        DM = _polyline_distance(XM, Y, r)
+        # Only keep edges with midpoint in tube, too
+        E = E[np.isfinite(DM)]
+        DM = DM[np.isfinite(DM)]
+        # Edge lengths
+        L = np.sqrt(np.sum((self.Nodes[E[:,1]] - self.Nodes[E[:,0]])**2, 1))
+        # Penalize edges away from curve
+        W = L * (1.0 + 0.25*(D[E[:,0]] + 2*DM + D[E[:,1]])/r)
+        # Edges in both directions
+        A = np.hstack((E[:,0], E[:,1]))
+        B = np.hstack((E[:,1], E[:,0]))
+        # Sort by start node
+        O = np.argsort(A, kind="stable")
+        # Node -> neighbor table
+        ptr = np.zeros(self.nNode + 1, dtype="int")
+        ptr[1:] = np.cumsum(np.bincount(A, minlength=self.nNode))
+        nbr = B[O]
+        wts = np.hstack((W, W))[O]
+        # Check for closed curve
+        if i0 == i1:
+            # Node closest to middle of curve
+            im, _ = self.GetClosestNode(Y[Y.shape[0] // 2])
+            # Trace first half
+            I = _astar(ptr, nbr, wts, self.Nodes, i0-1, im-1)
+            # Check for success
+            if I is None:
+                return np.array([], dtype='int')
+            # Don't retrace first half
+            mask = np.zeros(self.nNode, dtype="bool")
+            mask[I] = True
+            # Trace second half
+            I2 = _astar(ptr, nbr, wts, self.Nodes, im-1, i1-1, mask)
+            # Check for success
+            if I2 is None:
+                return np.array([], dtype='int')
+            # Combine
+            I = I + I2[1:]
+        else:
+            # Trace whole curve
+            I = _astar(ptr, nbr, wts, self.Nodes, i0-1, i1-1)
+        # Check for trivial curves
+        if I is None or len(I) == 1:
+            return np.array([], dtype='int')
+        # Return coordinates of all nodes
+        return self.Nodes[I,:]
+
+    # Trace a curve one node at a time
+    def TraceCurveWalk(self, Y, **kw):
+        """Extract nodes along a curve by walking from node to node
+
+        :Call:
+            >>> X = tri.TraceCurveWalk(Y, **kw)
+        :Inputs:
+            *tri*: :class:`cape.tri.TriBase`
+                Triangulation instance
+            *Y*: :class:`np.ndarray` shape=(n,3)
+                List of points defining piecewise linear curve
+            *dtol*: {``0.05``} | :class:`float`
+                Maximum distance from curve as fraction of reference length
+            *atol*: {``60.0``} | :class:`float`
+                Maximum dot product between triangle edge and curve segment
+        :Outputs:
+            *X*: :class:`np.ndarray` shape=(m,3)
+                Sequential list of nodes that trace a curve
+        :Versions:
+            * 2016-09-29 ``@ddalle``: Version 1.0 (:func:`TraceCurve`)
+            * 2026-10-18 ``@ddalle``: Version 1.1; no limit on length
+        """
+        # Spatial tolerance
+        dtol = kw.get('dtol', 0.05)
+        # Make sure edges are present
+        self.GetEdges()
         # Find the node closest to the start of the curve
         icur, d0 = self.GetClosestNode(Y[0])
         # Characteristic length of the curve
@@ -6208,11 +7293,13 @@ class TriBase(object):
         # Loop through the curve until no matching node on curve is found
         jcur = 0
         while icur is not None:
-            # Set previous tolerance
             # Find the next node that lies on or near the curve
             icur, jcur = self.TraceCurve_NextNode(icur, Y, jcur, **kw)
             # Check for match
             if icur is None: break
+            # Grow buffer if needed
+            if ni >= I.size:
+                I = np.resize(I, 2*I.size)
             # Save the node and increase the count
             I[ni] = icur
             ni += 1
@@ -7130,6 +8217,7 @@ class Triq(TriBase):
                 *z*-component of skin friction coefficient
         :Versions:
             * 2017-04-03 ``@ddalle``: Version 1.0
+            * 2026-10-18 ``@ddalle``: Version 1.1; use :func:`_tri2node`
         """
        # --------------
        # Viscous Forces
@@ -7176,6 +8264,9 @@ class Triq(TriBase):
         # Number of nodes and tris
         nNode = I.shape[0]
         nTri = K.shape[0]
+        # Check for empty component
+        if nTri == 0:
+            return np.zeros(nNode), np.zeros(nNode), np.zeros(nNode)
         # Store node indices for each tri
         T = self.Tris[K,:] - 1
         v0 = T[:,0]
@@ -7256,33 +8347,16 @@ class Triq(TriBase):
         Fv[IV,0] = (TXX*VAX + TXY*VAY + TXZ*VAZ)/A[IV]
         Fv[IV,1] = (TXY*VAX + TYY*VAY + TYZ*VAZ)/A[IV]
         Fv[IV,2] = (TXZ*VAX + TYZ*VAY + TZZ*VAZ)/A[IV]
-        # Initialize friction coefficients
-        cf_x = np.zeros(self.nNode)
-        cf_y = np.zeros(self.nNode)
-        cf_z = np.zeros(self.nNode)
-        # Initialize areas
-        Af = np.zeros(self.nNode)
-        # Add friction values weighted by areas
-        cf_x[T[:,0]] += (Fv[:,0] * A)
-        cf_x[T[:,1]] += (Fv[:,0] * A)
-        cf_x[T[:,2]] += (Fv[:,0] * A)
-        cf_y[T[:,0]] += (Fv[:,1] * A)
-        cf_y[T[:,1]] += (Fv[:,1] * A)
-        cf_y[T[:,2]] += (Fv[:,1] * A)
-        cf_z[T[:,0]] += (Fv[:,2] * A)
-        cf_z[T[:,1]] += (Fv[:,2] * A)
-        cf_z[T[:,2]] += (Fv[:,2] * A)
-        # Accumulate areas
-        Af[T[:,0]] += A
-        Af[T[:,1]] += A
-        Af[T[:,2]] += A
+        # Accumulate friction values weighted by areas, and areas
+        CF = _tri2node(
+            T, np.hstack((Fv*A[:,None], A[:,None])), self.nNode)
         # Filter small areas
-        Af = Af[I]
+        Af = CF[I,3]
         IA = (Af > SMALLTRI)
         # Downselect
-        cf_x = cf_x[I]
-        cf_y = cf_y[I]
-        cf_z = cf_z[I]
+        cf_x = CF[I,0]
+        cf_y = CF[I,1]
+        cf_z = CF[I,2]
         # Divide by area
         cf_x[IA] /= Af[IA]
         cf_y[IA] /= Af[IA]
@@ -14,12 +14,6 @@ import shutil
 # Third-party
 import numpy as np
 
-# Would like to use scipy, but let's not have a strict dependency
-try:
-    import scipy.signal
-except ImportError:
-    pass
-
 
 # CAPE folder
 CAPE_FOLDER = os.path.dirname(os.path.abspath(__file__))
@@ -351,6 +345,9 @@ def GetBestFrequency(y, fs=1.0, **kw):
     nperseg = kw.get("nperseg", min(n, 256))
     # Attempt to use Welch's method from SciPy method
     try:
+        # Would like to use scipy, but let's not have a strict dependency
+        # (and it is slow to import, so only load it when needed)
+        import scipy.signal
         # Estimate power spectral density
         f, a = scipy.signal.welch(y, fs=fs, nperseg=nperseg)
         # Return the peak frequency (disallow w==0)
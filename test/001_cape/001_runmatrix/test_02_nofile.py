@@ -126,3 +126,55 @@ def test_07_reynolds():
     assert abs(x.GetReynoldsNumber(0) - 23996.4884) <= TOL
 
 
+# Test 08: condition table for all cases
+@testutils.run_testdir(__file__)
+def test_08_conditions():
+    # Create run matrix
+    x = cape.runmatrix.RunMatrix(
+        Keys=["mach", "alpha", "beta", "q", "T"],
+        mach=np.array([0.8, 2.0, 3.0]),
+        alpha=0.0,
+        beta=0.0,
+        q=np.array([100.0, 250.0, 300.0]),
+        T=450.0)
+    # Calculate states for all cases
+    conds = x.GetConditions()
+    # Compare to vectorized getters
+    assert np.allclose(conds["Re"], x.GetReynoldsNumber(units="1/m"))
+    assert np.allclose(conds["p0"], x.GetTotalPressure(units="Pa"))
+    # Table is saved
+    assert x.GetConditions() is conds
+    # Changing a value updates the table
+    x.SetValue("q", 1, 500.0)
+    assert abs(x.GetPressure(1) - 2*89.2857) <= 2*TOL
+    p = x.GetPressure(1, units="Pa")
+    assert abs(x.GetConditions()["p"][1] - p) <= TOL
+
+
+# Test 09: single-case getters after changing columns
+@testutils.run_testdir(__file__)
+def test_09_update():
+    # Create run matrix
+    x = cape.runmatrix.RunMatrix(
+        Keys=["mach", "alpha", "beta", "q"],
+        mach=2.0,
+        alpha=0.0,
+        beta=0.0,
+        q=np.array([100.0, 250.0, 300.0]))
+    # Calculate table
+    x.GetConditions()
+    assert abs(x.GetPressure(1) - 89.2857) <= TOL
+    # Replace a column twice
+    x["q"] = np.array([100.0, 500.0, 300.0])
+    x["q"] = np.array([100.0, 750.0, 300.0])
+    assert abs(x.GetPressure(1) - 3*89.2857) <= 3*TOL
+    p = x.GetPressure(1, units="Pa")
+    assert abs(x.GetConditions()["p"][1] - p) <= TOL
+    # Edit in place
+    x["q"][1] = 500.0
+    assert abs(x.GetPressure(1) - 2*89.2857) <= 2*TOL
+    p = x.GetPressure(1, units="Pa")
+    assert abs(x.GetConditions()["p"][1] - p) <= TOL
+    # Scalar and vector calls agree
+    for i in range(x.nCase):
+        assert abs(x.GetPressure(i) - x.GetPressure()[i]) <= TOL
@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+# Third-party
+import numpy as np
+
 # Local imports
 from cape import atm
 
@@ -39,3 +42,17 @@ def test_enthalpy():
     Tref = atm.get_T(href)
     # Check results
     assert abs(Tref - 1184.5) <= 0.1
+
+
+def test_h_array():
+    # Altitudes spanning all layers (in km)
+    h = np.array([0.0, 2.0, 15.0, 26.0, 40.0, 49.0, 60.0, 80.0, 90.0])
+    # Call the standard atmosphere once
+    s = atm.atm76(h)
+    # Compare to scalar calls
+    for j, hj in enumerate(h):
+        sj = atm.atm76(hj)
+        assert abs(s.p[j] - sj.p) <= 1e-10 * sj.p
+        assert abs(s.T[j] - sj.T) <= 1e-10
+    # Check a known value
+    assert abs(s.p[1] - 79498.14) <= 0.01
@@ -1,9 +1,13 @@
 
+# Standard library
+import os
+
 # Third-party
 import testutils
 
 # Local imports
 import cape.cntl
+from cape.cfdx.options import util
 
 
 # Files to copy
@@ -29,3 +33,25 @@ def test_01_cntl():
     # Test hook import
     assert "dac" in cntl.modules
 
+
+# Cached JSON expansion
+@testutils.run_sandbox(__file__, TEST_FILES, TEST_DIRS)
+def test_02_json_cache():
+    # Read file with ``JSONFile()`` inclusion
+    opts1 = util.loadJSONFile("cape.json")
+    txt, fnames, linenos = util.expandJSONFile("cape.json")
+    # Check included files and line numbers
+    assert fnames == ["cape.json", "BatchShell.json"]
+    assert linenos.shape == (len(txt.rstrip().split("\n")), 2)
+    assert linenos[:, 1].max() == 6
+    # Read again from cache; should be a separate copy
+    opts2 = util.loadJSONFile("cape.json")
+    assert opts2 == opts1
+    assert opts2 is not opts1
+    # Modify the included file
+    with open("BatchShell.json", "a") as fp:
+        fp.write("\n// extra comment\n")
+    os.utime("BatchShell.json", (0, 0))
+    # Check that the cache is not used
+    txt, fnames, linenos = util.expandJSONFile("cape.json")
+    assert linenos[:, 1].max() == 7
@@ -8,6 +8,14 @@ import cape.cntl
 import cape.cfdx.dataBook as databook
 
 
+TEST_FILES = (
+    "matrix.csv",
+    "cape.json",
+    "arrow.xml",
+    "data/*"
+)
+
+
 # Test DataBook Class
 @testutils.run_testdir(__file__)
 def test_01_databook():
@@ -60,7 +68,30 @@ def test_01_databook():
     assert abs(stats["CN_std"] - 0.3095) <= 1e-4
     assert abs(stats["CN_err"] - 0.0190) <= 1e-4
 
+
+# Test binary column format
+@testutils.run_sandbox(__file__, TEST_FILES)
+def test_02_databook_npy():
+    # Read settings
+    cntl = cape.cntl.Cntl()
+    # Write binary columns alongside CSV files
+    cntl.opts.set_DataBookFormat("both")
+    # Read data book and write one component
+    db = databook.DataBook(cntl)
+    dbc = db["fuselage"]
+    dbc.Write(unlock=True)
+    # Read it again
+    db = databook.DataBook(cntl)
+    dbc1 = db["fuselage"]
+    # Check that columns were memory-mapped
+    assert isinstance(dbc1["CA"], np.memmap)
+    # Compare
+    assert dbc1.n == dbc.n
+    assert np.allclose(dbc1["CA"], dbc["CA"])
+    assert list(dbc1["config"]) == list(dbc["config"])
+
  
 if __name__ == "__main__":
     test_01_databook()
+    test_02_databook_npy()
 
@@ -0,0 +1,42 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Standard library
+import sys
+import time
+
+# Third-party
+import numpy as np
+
+
+# Maximum number of iterations
+NMAX = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+
+# Write synthetic force history that settles exponentially
+def main():
+    # Seed the random number generator
+    np.random.seed(34)
+    # Open history file
+    with open("fake_fm_body.dat", "w") as fp:
+        # Loop through iterations
+        for i in range(1, NMAX + 1):
+            # Coefficients settling to (0.3, 1.2)
+            ca = 0.3 + 0.1*np.exp(-i/50.0) + 1e-5*np.random.randn()
+            cn = 1.2 - 0.2*np.exp(-i/50.0) + 1e-5*np.random.randn()
+            # Write the line
+            fp.write("%i %.8f %.8f\n" % (i, ca, cn))
+            fp.flush()
+            # Stop file
+            if i % 10 == 0:
+                try:
+                    open("STOP").close()
+                    return
+                except IOError:
+                    pass
+            # Pretend to do some work
+            time.sleep(0.0005)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+
+# Standard library
+import os
+import sys
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+import cape.cfdx.dataBook as databook
+from cape.cfdx import bin
+from cape.cfdx import monitor
+from cape.cfdx.options.runControl import RunControl
+
+
+# Files to copy
+TEST_FILES = (
+    "fake_solver.py",
+)
+
+# Maximum iterations for fake solver
+NMAX = 20000
+
+
+# Read force history written by fake solver
+def read_fm(comp):
+    # Create empty history
+    fm = databook.CaseFM(comp)
+    # Read data
+    A = np.loadtxt("fake_fm_%s.dat" % comp, ndmin=2)
+    # Ignore partial last line
+    fm.i = A[:-1, 0]
+    fm.CA = A[:-1, 1]
+    fm.CN = A[:-1, 2]
+    # Save properties
+    fm.cols = ["i", "CA", "CN"]
+    fm.coeffs = ["CA", "CN"]
+    return fm
+
+
+# Options for monitor
+def get_rc(**kw):
+    # Create options
+    rc = RunControl(PhaseSequence=[0], PhaseIters=[NMAX], Monitor=dict(
+        Components=["body"],
+        nStats=50,
+        Tol=1e-4,
+        StdTol=1e-3,
+        dt=0.05,
+        **kw))
+    return rc
+
+
+# Stop fake solver with SIGINT
+@testutils.run_sandbox(__file__, TEST_FILES)
+def test_01_interrupt():
+    # Options
+    rc = get_rc()
+    # Check default flag
+    assert rc.get_Monitor(0)
+    assert rc.get_Monitor_Coeffs() == ["CA", "CY", "CN", "CLL", "CLM", "CLN"]
+    # Create monitor
+    mon = monitor.CaseMonitor(rc, 0, fm=read_fm)
+    # Run fake solver
+    cmdi = [sys.executable, "fake_solver.py", str(NMAX)]
+    bin.callf(cmdi, f="fake.out", v=False, monitor=mon)
+    # Check that the monitor stopped the solver
+    assert mon.stopped
+    assert monitor.CheckConverged(rc)
+    assert monitor.GetConvergedPhase() == 0
+    assert monitor.ReadConverged().startswith("iteration")
+    # Check that it stopped early
+    fm = read_fm("body")
+    assert fm.i[-1] < NMAX
+
+
+# Stop fake solver with STOP file
+@testutils.run_sandbox(__file__, TEST_FILES)
+def test_02_stopfile():
+    # Options
+    rc = get_rc(StopFile="STOP")
+    # Create monitor
+    mon = monitor.CaseMonitor(rc, 0, fm=read_fm)
+    # Run fake solver
+    cmdi = [sys.executable, "fake_solver.py", str(NMAX)]
+    ierr = bin.calli(cmdi, f="fake.out", v=False, monitor=mon)
+    # Solver should exit cleanly
+    assert ierr == 0
+    assert mon.stopped
+    # Stop file removed so it doesn't stop next run
+    assert not os.path.isfile("STOP")
+    # Check that it stopped early
+    fm = read_fm("body")
+    assert fm.i[-1] < NMAX
+
+
+# Loose tolerances never satisfied by too few iterations
+@testutils.run_sandbox(__file__, TEST_FILES)
+def test_03_short():
+    # Options
+    rc = get_rc(nMin=1000)
+    # Create monitor
+    mon = monitor.CaseMonitor(rc, 0, fm=read_fm)
+    # Run fake solver for only a few iterations
+    cmdi = [sys.executable, "fake_solver.py", "200"]
+    ierr = bin.calli(cmdi, f="fake.out", v=False, monitor=mon)
+    # Solver finished normally
+    assert ierr == 0
+    assert not mon.stopped
+    assert not monitor.CheckConverged(rc)
+    assert monitor.GetConvergedPhase() is None
+
+
+# Marker only ends the case for last phase and current target
+@testutils.run_sandbox(__file__)
+def test_04_phase():
+    # Options with two phases
+    rc = RunControl(PhaseSequence=[0, 1], PhaseIters=[200, 500])
+    # Earlier phase converged
+    monitor.WriteConverged(0, 500, "iteration 150: test")
+    assert monitor.GetConvergedPhase() == 0
+    assert not monitor.CheckConverged(rc)
+    # Last phase converged
+    monitor.WriteConverged(1, 500, "iteration 350: test")
+    assert monitor.CheckConverged(rc)
+    assert monitor.ReadConverged() == "iteration 350: test"
+    # Target raised, e.g. by ``--extend``
+    rc["PhaseIters"] = [200, 1000]
+    assert not monitor.CheckConverged(rc)
+    # Starting a phase removes the marker
+    monitor.ClearConverged()
+    assert monitor.GetConvergedPhase() is None
+
+
+# Solver that ignores the stop request is terminated
+@testutils.run_sandbox(__file__, TEST_FILES)
+def test_05_timeout():
+    # Options
+    rc = get_rc(StopFile="NOSTOP")
+    # Create monitor
+    mon = monitor.CaseMonitor(rc, 0, fm=read_fm)
+    # Run fake solver
+    cmdi = [sys.executable, "fake_solver.py", str(NMAX)]
+    # Don't wait long for fake solver, which ignores "NOSTOP"
+    timeout = monitor.STOP_TIMEOUT
+    monitor.STOP_TIMEOUT = 0.5
+    try:
+        ierr = bin.calli(cmdi, f="fake.out", v=False, monitor=mon)
+    finally:
+        monitor.STOP_TIMEOUT = timeout
+    # Solver was terminated
+    assert ierr == 0
+    assert mon.stopped
+    assert not os.path.isfile("NOSTOP")
+    # Check that it stopped early
+    fm = read_fm("body")
+    assert fm.i[-1] < NMAX
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+from cape.step import STEP
+
+
+# File names
+STPFILE = "curves.stp"
+
+
+# Test batched curve evaluation
+@testutils.run_testdir(__file__)
+def test_01_evaluate():
+    # Read STEP file
+    stp = STEP(STPFILE)
+    # Two splines and a line
+    assert stp.ncrv == 3
+    assert stp.ocrv == [3, 2, 1]
+    # Parameter values, including extrapolation
+    U = [np.linspace(-0.1, 2.1, 23), np.linspace(0, 1, 5), [0.0, 0.4, 1.0]]
+    # Evaluate all curves at once
+    Y = stp.EvaluateCurves(range(3), U)
+    # Compare to general B-spline evaluation
+    for j, u in enumerate(U):
+        assert np.allclose(Y[j], stp._EvaluateCurveSplev(j, u))
+        assert np.allclose(Y[j], stp.EvaluateCurve(j, u))
+    # End points
+    assert np.allclose(Y[0][1], [0.0, 0.0, 0.0])
+    assert np.allclose(Y[2][-1], [6.0, 0.0, 3.5])
+
+
+# Test sampling
+@testutils.run_testdir(__file__)
+def test_02_sample():
+    # Read STEP file
+    stp = STEP(STPFILE)
+    # Sample all curves
+    stp.SampleCurves(ds=0.1, dth=10.0)
+    # Check line
+    assert stp.crvs[2].shape == (26, 3)
+    assert np.allclose(np.diff(stp.crvs[2][:, 2]), 0.1)
+    # Check turning angle criterion
+    assert np.max(stp.GetTurningAngle(1)) <= 10.0
+    # Sample one curve
+    X0 = stp.crvs[0]
+    X1 = stp.SampleCurve(0, ds=0.1, dth=10.0)
+    assert np.allclose(X0, X1)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+
+# Local imports
+from cape.tri import Tri
+
+
+# Make a structured triangulation of a flat rectangle
+def make_tri(nx=6, ny=5):
+    # Node coordinates
+    X, Y = np.meshgrid(np.arange(nx), np.arange(ny), indexing="ij")
+    P = np.vstack((X.ravel(), Y.ravel(), np.zeros(nx*ny))).T
+    # Two triangles per quad
+    T = []
+    for i in range(nx - 1):
+        for j in range(ny - 1):
+            # Corner nodes [1-based]
+            a = i*ny + j + 1
+            b = a + ny
+            T.append([a, b, b + 1])
+            T.append([a, b + 1, a + 1])
+    # Output
+    return Tri(Nodes=P.astype("float"), Tris=np.array(T))
+
+
+# Test node -> tri table
+def test_01_nodetris():
+    # Create triangulation
+    tri = make_tri()
+    T = tri.Tris
+    # Compare to brute force for each node
+    for i in range(1, tri.nNode + 1):
+        K = tri.GetTrisFromNodes([i])
+        assert np.all(K == np.where(np.any(T == i, axis=1))[0])
+    # Several nodes at once
+    K = tri.GetTrisFromNodes([1, 7, 30])
+    assert np.all(K == np.where(np.any(np.isin(T, [1, 7, 30]), axis=1))[0])
+
+
+# Test edge -> tri table
+def test_02_edgetris():
+    # Create triangulation
+    tri = make_tri()
+    T = tri.Tris
+    # Get edges
+    tri.GetEdgeTris()
+    # Number of edges: V - E + F = 1 for a flat sheet
+    assert tri.EdgeNodes.shape[0] == tri.nNode + tri.nTri - 1
+    # Each edge is used by one or two tris
+    n = np.diff(tri.EdgeTriPtr)
+    assert np.all((n >= 1) & (n <= 2))
+    # Directed edge lookup, 1-based
+    for k in range(tri.nTri):
+        # Each edge of tri *k* in its own direction
+        for i0, i1 in zip(T[k], np.roll(T[k], -1)):
+            assert tri.FindTriFromEdge(i0, i1) == k + 1
+            assert k in tri.GetTrisFromEdge(i1, i0)
+    # Missing edge
+    assert tri.FindTriFromEdge(1, 30) == 0
+    # Replacing the tris resets the tables
+    tri.Tris = tri.Tris[:, [0, 2, 1]]
+    assert tri.FindTriFromEdge(T[0, 1], T[0, 0]) == 1
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+
+# Local imports
+from cape.tri import Tri
+
+
+# Make a triangulation of squares in the *z*=0 plane
+def make_squares(theta=0.0, dx=0.0, dy=0.0):
+    # Corners of unit square centered on origin
+    P0 = np.array([
+        [-0.5, -0.5, 0.0],
+        [0.5, -0.5, 0.0],
+        [0.5, 0.5, 0.0],
+        [-0.5, 0.5, 0.0]])
+    # Rotation matrix for second square
+    c = np.cos(theta)
+    s = np.sin(theta)
+    R = np.array([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]])
+    # Second square
+    P1 = np.dot(P0, R.T) + [dx, dy, 0.0]
+    # Two triangles per square
+    T = np.array([[1, 2, 3], [1, 3, 4], [5, 6, 7], [5, 7, 8]])
+    # Output
+    return Tri(Nodes=np.vstack((P0, P1)), Tris=T)
+
+
+# Test projected area of overlapping squares
+def test_01_shifted():
+    # Squares shifted diagonally by half their width
+    tri = make_squares(dx=0.5, dy=0.5)
+    # Projection direction
+    nhat = np.array([0.0, 0.0, 1.0])
+    # Exact area
+    A = tri.GetCompProjectedArea(nhat, method="exact")
+    assert abs(A - 1.75) <= 1e-12
+    # Grid approximation
+    A = tri.GetCompProjectedArea(nhat, ds=0.01)
+    assert abs(A - 1.75) <= 0.02
+
+
+# Test projected area of squares with crossing edges
+def test_02_rotated():
+    # Second square rotated 45 degrees
+    tri = make_squares(theta=0.25*np.pi)
+    # Projection direction; flips orientation of triangles
+    nhat = np.array([0.0, 0.0, -1.0])
+    # Overlap is a regular octagon
+    A0 = 2.0 - 2.0*np.tan(0.125*np.pi)
+    # Exact area
+    A = tri.GetCompProjectedArea(nhat, method="exact")
+    assert abs(A - A0) <= 1e-12
+    # Grid approximation
+    A = tri.GetCompProjectedArea(nhat, ds=0.01)
+    assert abs(A - A0) <= 0.02
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+
+# Local imports
+from cape.tri import Tri
+
+
+# Make a structured triangulation with some very thin rows
+def make_tri(x, y):
+    # Node coordinates
+    X, Y = np.meshgrid(x, y, indexing="ij")
+    P = np.vstack((X.ravel(), Y.ravel(), np.zeros(X.size))).T
+    # Lower-left corner of each quad [1-based]
+    ny = y.size
+    i = np.arange(x.size - 1)[:, None]
+    j = np.arange(ny - 1)[None, :]
+    a = (i*ny + j + 1).ravel()
+    b = a + ny
+    # Two triangles per quad
+    T = np.vstack((
+        np.stack((a, b, b + 1), axis=1),
+        np.stack((a, b + 1, a + 1), axis=1)))
+    # Create triangulation
+    tri = Tri(Nodes=P, Tris=T)
+    tri.CompID = np.ones(tri.nTri, dtype="int")
+    # Output
+    return tri
+
+
+# Test removal of chains of short edges
+def test_01_removesmall():
+    # Coordinates with two thin columns and one thin row
+    x = np.arange(10.0)
+    y = np.arange(8.0)
+    x[4:] += 2e-3 - 1.0
+    x[5:] += 2e-3 - 1.0
+    y[3:] += 2e-3 - 1.0
+    # Create triangulation
+    tri = make_tri(x, y)
+    # Original area
+    tri.GetNormals()
+    A0 = np.sum(tri.Areas)
+    # Remove small tris in one pass
+    tri.CollapseSmallTris(1e-2)
+    # Thin columns and row should be collapsed completely
+    assert tri.nNode == (x.size - 2) * (y.size - 1)
+    assert tri.nTri == 2 * (x.size - 3) * (y.size - 2)
+    assert tri.CompID.size == tri.nTri
+    # Check new triangles
+    tri.GetNormals()
+    assert np.min(tri.Areas) > 1e-2
+    assert abs(np.sum(tri.Areas) - A0) < 1e-6 * A0
+    # Nothing left to remove
+    tri.RemoveSmallTris(1e-2)
+    assert tri.nTri == 2 * (x.size - 3) * (y.size - 2)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+
+# Local imports
+from cape.tri import Tri, _tri2node
+
+
+# Test node normals on a surface with nodes shared by many tris
+def test_01_nodenormals():
+    # Corners of a square pyramid with one apex node
+    P = np.array([
+        [0.0, 0.0, 1.0],
+        [1.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0],
+        [-1.0, 0.0, 0.0],
+        [0.0, -1.0, 0.0]])
+    # Every tri uses apex as vertex 0
+    T = np.array([[1, 2, 3], [1, 3, 4], [1, 4, 5], [1, 5, 2]])
+    # Create triangulation
+    tri = Tri(Nodes=P, Tris=T)
+    # Calculate node normals
+    tri.GetNodeNormals()
+    # Apex normal sums all four tris
+    assert np.allclose(tri.NodeNormals[0], [0.0, 0.0, 1.0])
+    # Base node shared by two tris
+    n = np.array([1.0, 1.0, 1.0]) + np.array([1.0, -1.0, 1.0])
+    assert np.allclose(tri.NodeNormals[1], n / np.linalg.norm(n))
+
+
+# Test node accumulation with no tris
+def test_02_empty():
+    # Accumulate nothing onto three nodes
+    W = _tri2node(np.zeros((0, 3), dtype="int"), np.zeros((0, 4)), 3)
+    # Should be all zeros with one row per node
+    assert W.shape == (3, 4)
+    assert np.all(W == 0.0)
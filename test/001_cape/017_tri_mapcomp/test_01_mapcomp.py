@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+
+# Local imports
+import cape.tri
+from cape.tri import Tri
+
+
+# Make a structured triangulation of a wavy rectangle
+def make_tri(nx, ny):
+    # Node coordinates
+    x = np.linspace(0.0, 4.0, nx)
+    y = np.linspace(0.0, 3.0, ny)
+    X, Y = np.meshgrid(x, y, indexing="ij")
+    Z = 0.2 * np.sin(X) * np.cos(Y)
+    P = np.vstack((X.ravel(), Y.ravel(), Z.ravel())).T
+    # Lower-left corner of each quad [1-based]
+    i = np.arange(nx - 1)[:, None]
+    j = np.arange(ny - 1)[None, :]
+    a = (i*ny + j + 1).ravel()
+    b = a + ny
+    # Two triangles per quad
+    T = np.vstack((
+        np.stack((a, b, b + 1), axis=1),
+        np.stack((a, b + 1, a + 1), axis=1)))
+    # Create triangulation
+    tri = Tri(Nodes=P, Tris=T)
+    tri.CompID = np.ones(tri.nTri, dtype="int")
+    # Output
+    return tri
+
+
+# Test nearest-centroid mapping of component IDs
+def test_01_mapcompid():
+    # Labeled and unlabeled surfaces
+    tric = make_tri(13, 11)
+    tri0 = make_tri(13, 11)
+    tri = make_tri(29, 17)
+    # Label the faces of *tric* in a pattern
+    tric.CompID = 1 + np.arange(tric.nTri) % 5
+    # Map components
+    tri.MapCompID(tric, tri0)
+    # Compare to brute-force nearest centroid
+    X0 = np.mean(tric.Nodes[tric.Tris - 1], axis=1)
+    X1 = np.mean(tri.Nodes[tri.Tris - 1], axis=1)
+    for k, x in enumerate(X1):
+        # Distance to each centroid of *tric*
+        d = np.sum((X0 - x)**2, axis=1)
+        # Check for matching component with nearest triangle
+        assert np.min(d[tric.CompID == tri.CompID[k]]) == np.min(d)
+
+
+# Test search limited to a subset of triangles
+def test_02_subset():
+    # Triangulation
+    tri = make_tri(13, 11)
+    # Subset and points, including one far from the surface
+    K = np.arange(20, 60)
+    X = np.array([[0.5, 0.5, 0.0], [2.0, 2.5, 0.1], [40.0, -10.0, 3.0]])
+    # Find nearest centroids
+    J = tri.GetNearestTriCenters(X, K)
+    # Brute force
+    X0 = np.mean(tri.Nodes[tri.Tris[K] - 1], axis=1)
+    for j, x in zip(J, X):
+        # Distance to each centroid in subset
+        d = np.sum((X0 - x)**2, axis=1)
+        assert np.sum((X0[j - 20] - x)**2) == np.min(d)
+
+
+# Test search with points split into many blocks
+def test_03_blocks(monkeypatch):
+    # Triangulation
+    tri = make_tri(13, 11)
+    # Scattered points
+    X = np.random.RandomState(3).uniform(-1.0, 5.0, (200, 3))
+    # Find nearest centroids in one block
+    J1 = tri.GetNearestTriCenters(X)
+    # Force small blocks
+    monkeypatch.setattr(cape.tri, "CHUNK_SIZE", 64)
+    J2 = tri.GetNearestTriCenters(X)
+    # Brute force
+    X0 = np.mean(tri.Nodes[tri.Tris - 1], axis=1)
+    D = np.sum((X0[None, :, :] - X[:, None, :])**2, axis=2)
+    # Check distances
+    assert np.all(D[np.arange(200), J2] == np.min(D, axis=1))
+    assert np.all(D[np.arange(200), J1] == D[np.arange(200), J2])
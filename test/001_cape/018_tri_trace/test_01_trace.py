@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+
+# Local imports
+from cape.tri import Tri
+
+
+# Make a structured triangulation of a flat rectangle
+def make_tri(nx, ny):
+    # Node coordinates
+    X, Y = np.meshgrid(np.arange(nx), np.arange(ny), indexing="ij")
+    P = np.vstack((X.ravel(), Y.ravel(), np.zeros(nx*ny))).T
+    # Lower-left corner of each quad [1-based]
+    i = np.arange(nx - 1)[:, None]
+    j = np.arange(ny - 1)[None, :]
+    a = (i*ny + j + 1).ravel()
+    b = a + ny
+    # Two triangles per quad
+    T = np.vstack((
+        np.stack((a, b, b + 1), axis=1),
+        np.stack((a, b + 1, a + 1), axis=1)))
+    # Output
+    return Tri(Nodes=P.astype("float"), Tris=T)
+
+
+# Test tracing a curve through grid nodes
+def test_01_line():
+    # Create triangulation
+    tri = make_tri(21, 11)
+    # Curve along row of nodes, sampled between the nodes
+    Y = np.array([[0.0, 4.0, 0.0], [7.5, 4.0, 0.0], [20.0, 4.0, 0.0]])
+    # Trace with both methods
+    X1 = tri.TraceCurve(Y)
+    X2 = tri.TraceCurve(Y, method="walk")
+    # Should get every node in row
+    assert X1.shape == (21, 3)
+    assert np.allclose(X1[:, 0], np.arange(21))
+    assert np.allclose(X1[:, 1], 4.0)
+    assert np.allclose(X1, X2)
+
+
+# Test tracing a curve longer than the old buffer
+def test_02_long():
+    # Long, thin strip
+    tri = make_tri(6001, 3)
+    # Curve along middle
+    Y = np.array([[0.0, 1.0, 0.0], [6000.0, 1.0, 0.0]])
+    # Trace it
+    X = tri.TraceCurve(Y)
+    # Should get every node in middle row
+    assert X.shape == (6001, 3)
+    assert np.allclose(X[:, 1], 1.0)
+
+
+# Test tracing a closed curve
+def test_03_closed():
+    # Create triangulation
+    tri = make_tri(11, 11)
+    # Square loop through grid nodes
+    Y = np.array([
+        [2.0, 2.0, 0.0],
+        [8.0, 2.0, 0.0],
+        [8.0, 8.0, 0.0],
+        [2.0, 8.0, 0.0],
+        [2.0, 2.0, 0.0]])
+    # Trace it
+    X = tri.TraceCurve(Y)
+    # Should get 24 nodes plus repeated start point
+    assert X.shape == (25, 3)
+    assert np.allclose(X[0], X[-1])
+    assert np.unique(X, axis=0).shape[0] == 24
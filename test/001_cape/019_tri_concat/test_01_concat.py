@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+
+# Local imports
+from cape.tri import Tri
+
+
+# Create a small strip of tris with given CompIDs
+def make_tri(x0, comps, conf):
+    # Number of tris
+    n = len(comps)
+    # Nodes along two rows
+    X = x0 + np.arange(n + 2, dtype="float")
+    Nodes = np.vstack((
+        np.array([X, np.zeros_like(X), np.zeros_like(X)]).T,
+        np.array([X, np.ones_like(X), np.zeros_like(X)]).T))
+    # Tris using both rows
+    I = np.arange(1, n + 1)
+    Tris = np.array([I, I + 1, I + n + 2]).T
+    # Create triangulation
+    tri = Tri(Nodes=Nodes, Tris=Tris, CompID=np.array(comps))
+    # Save component map
+    tri.Conf = conf
+    # Output
+    return tri
+
+
+# Test bulk concatenation against repeated Add()
+def test_01_concat():
+    # Triangulations, including overlapping and disjoint CompIDs
+    tris = [
+        make_tri(0.0, [1, 2, 2], {"a": 1, "b": 2}),
+        make_tri(10.0, [1, 3], {"a": 1, "c": 3}),
+        make_tri(20.0, [7, 8, 8, 7], {"d": [7, 8]}),
+        make_tri(30.0, [2], {"b": 2, "d": 9}),
+    ]
+    # Combine all at once
+    tri = Tri.concatenate(tris)
+    # Combine one at a time
+    tri0 = tris[0].Copy()
+    for trii in tris[1:]:
+        tri0.Add(trii)
+    # Compare
+    assert isinstance(tri, Tri)
+    assert tri.nNode == tri0.nNode
+    assert tri.nTri == tri0.nTri
+    assert np.all(tri.Nodes == tri0.Nodes)
+    assert np.all(tri.Tris == tri0.Tris)
+    assert np.all(tri.CompID == tri0.CompID)
+    # Merged component map
+    assert tri.Conf["a"] == 1
+    assert tri.Conf["b"] == 2
+    assert tri.Conf["c"] == 3
+    assert tri.Conf["d"] == [7, 8, 9]
+
+
+# Test that file format metadata of first triangulation is kept
+def test_02_metadata():
+    # Triangulations
+    tri1 = make_tri(0.0, [1, 2], {"a": 1, "b": 2})
+    tri2 = make_tri(10.0, [3], {"c": 3})
+    # Pretend first one was read from a little-endian binary file
+    tri1.ext = "lb4"
+    tri1.filetype = "binary"
+    # Combine
+    tri = Tri.concatenate([tri1, tri2])
+    # Check format
+    assert tri.ext == "lb4"
+    assert tri.filetype == "binary"
+    assert tri.GetOutputFileType() == "lb4"
+    # Quads of first triangulation
+    assert tri.nQuad == tri1.nQuad
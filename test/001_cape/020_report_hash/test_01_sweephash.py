@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+
+# Local imports
+from cape.cfdx.report import Report
+
+
+# Case folder names
+FRUNS = ["poweroff/m0.8a0.0", "poweroff/m0.8a2.0", "poweroff/m0.8a4.0"]
+
+
+# Minimal run matrix for a data book component
+class FakeRunMatrix(object):
+    def __init__(self, fruns):
+        self.fruns = fruns
+
+    def GetFullFolderNames(self, I=None):
+        if I is None:
+            return list(self.fruns)
+        return [self.fruns[i] for i in I]
+
+
+# Minimal data book component or target
+class FakeDBComp(dict):
+    def __init__(self, fruns, **kw):
+        dict.__init__(self, **kw)
+        self.cols = list(kw.keys())
+        self.x = FakeRunMatrix(fruns)
+
+    def UpdateRunMatrix(self):
+        pass
+
+
+# Minimal options interface
+class FakeOpts(object):
+    def __init__(self, sfigs):
+        self.sfigs = sfigs
+
+    def get_SubfigOpt(self, sfig, opt):
+        return self.sfigs[sfig].get(opt)
+
+    def get_SubfigCascade(self, sfig):
+        return self.sfigs[sfig]
+
+
+# Minimal run interface
+class FakeCntl(object):
+    def __init__(self, sfigs):
+        self.opts = FakeOpts(sfigs)
+        self.DataBook = []
+
+
+# Create report with two components and a target
+def make_report():
+    # Subfigure definition
+    sfigs = {
+        "CN": {
+            "Type": "SweepCoeff",
+            "Component": ["fin1", "fin2"],
+            "Target": "wt",
+        },
+    }
+    # Data for each component and target
+    dbs = {
+        ("fin1", None): FakeDBComp(
+            FRUNS, alpha=np.array([0.0, 2.0, 4.0]),
+            CN=np.array([0.0, 0.1, 0.2])),
+        ("fin2", None): FakeDBComp(
+            FRUNS[::-1], alpha=np.array([4.0, 2.0, 0.0]),
+            CN=np.array([0.4, 0.2, 0.0])),
+        ("fin1", "wt"): FakeDBComp(
+            FRUNS, alpha=np.array([0.0, 4.0]), CN=np.array([0.0, 0.2])),
+    }
+    # Create report without reading any files
+    R = Report.__new__(Report)
+    R.cntl = FakeCntl(sfigs)
+    R.GetDBComp = lambda comp, targ=None: dbs.get((comp, targ))
+    # Output
+    return R, dbs
+
+
+# Test that every component and target affects the hash
+def test_01_sweephash():
+    # Create report
+    R, dbs = make_report()
+    # Reference component
+    DBc = dbs[("fin1", None)]
+    J = np.arange(3)
+    # Initial hash
+    h0 = R.GetSweepSubfigHash("CN", FRUNS, DBc, J)
+    assert R.GetSweepSubfigHash("CN", FRUNS, DBc, J) == h0
+    # Change second component
+    dbs[("fin2", None)]["CN"][0] = 0.5
+    h1 = R.GetSweepSubfigHash("CN", FRUNS, DBc, J)
+    assert h1 != h0
+    # Change target
+    dbs[("fin1", "wt")]["CN"][1] = 0.25
+    h2 = R.GetSweepSubfigHash("CN", FRUNS, DBc, J)
+    assert h2 != h1
+    # Change a case that is not in the sweep
+    R, dbs = make_report()
+    DBc = dbs[("fin1", None)]
+    h0 = R.GetSweepSubfigHash("CN", FRUNS[:2], DBc, J[:2])
+    dbs[("fin2", None)]["CN"][0] = 0.5
+    assert R.GetSweepSubfigHash("CN", FRUNS[:2], DBc, J[:2]) == h0
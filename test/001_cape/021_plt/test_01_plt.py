@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+from cape.plt import Plt
+
+
+# Local file
+PLT_FILE = "surf.plt"
+
+# Expected states for each zone
+Q = [
+    np.array([
+        [0.0, 0.0, 0.0, 0.0, 0.70, 0.00],
+        [1.0, 0.0, 0.0, 0.1, 0.71, 0.25],
+        [2.0, 0.0, 0.0, 0.2, 0.72, 1.00],
+        [0.0, 1.0, 0.0, 0.5, 0.75, 6.25],
+        [1.0, 1.0, 0.5, 0.6, 0.76, 9.00]], dtype="f4"),
+    np.array([
+        [2.0, 0.0, 0.0, 0.2, 0.72, 1.00],
+        [3.0, 0.0, 0.0, 0.3, 0.73, 2.25],
+        [2.0, 1.0, 1.0, 0.7, 0.77, 12.25]], dtype="f4"),
+]
+# Expected node indices for each zone
+TRIS = [
+    np.array([[0, 1, 3, 3], [1, 2, 4, 4]]),
+    np.array([[0, 1, 2, 2]]),
+]
+
+
+# Test reading a PLT file
+@testutils.run_testdir(__file__)
+def test_01_read():
+    # Read file
+    plt = Plt(PLT_FILE)
+    # Test header
+    assert plt.title == "tecplot geometry and solution file"
+    assert plt.Vars == ["x", "y", "z", "cp", "p", "mach"]
+    assert plt.nVar == 6
+    assert plt.Zones == ["boundary 1", "boundary 2"]
+    assert plt.nZone == 2
+    assert list(plt.nPt) == [5, 3]
+    assert list(plt.nElem) == [2, 1]
+    assert list(plt.StrandID) == [1000, 1001]
+    assert list(plt.ParentZone) == [-1, -1]
+    assert list(plt.ZoneType) == [3, 3]
+    assert list(plt.t) == [1.0, 1.0]
+    assert np.all(plt.fmt == 1)
+    # Test data
+    for n in range(plt.nZone):
+        assert plt.q[n].dtype == np.dtype("f4")
+        assert np.all(plt.q[n] == Q[n])
+        assert np.all(plt.Tris[n] == TRIS[n])
+        assert np.allclose(plt.qmin[n], np.min(Q[n], axis=0))
+        assert np.allclose(plt.qmax[n], np.max(Q[n], axis=0))
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+# Standard library
+import filecmp
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+from cape import plt
+
+
+# Local files
+PLT_FILE = "fun3d.plt"
+TRIQ_FILE = "fun3d.triq"
+TEST_FILES = [PLT_FILE, TRIQ_FILE]
+# Freestream Mach number
+MACH = 0.8
+
+
+# Test single conversion against reference TRIQ file
+@testutils.run_sandbox(__file__, TEST_FILES)
+def test_01_plt2triq():
+    # Convert
+    plt.Plt2Triq(PLT_FILE, "out.triq", mach=MACH)
+    # Compare to reference
+    assert filecmp.cmp("out.triq", TRIQ_FILE, shallow=False)
+
+
+# Test batch conversion
+@testutils.run_sandbox(__file__, TEST_FILES)
+def test_02_batch():
+    # Read file
+    pltq = plt.Plt(PLT_FILE)
+    # Move the nodes, as for a moving-body case
+    for n in range(pltq.nZone):
+        pltq.q[n] = np.array(pltq.q[n])
+        pltq.q[n][:, 2] += 1.0
+    pltq.Write("moved.plt")
+    # Expected output for moved grid
+    plt.Plt2Triq("moved.plt", "moved.triq", mach=MACH)
+    # Convert in serial and in parallel
+    for nProc in (1, 2):
+        # Output files
+        ftriqs = ["out1.triq", "out2.triq"]
+        # Convert
+        fout = plt.Plt2TriqBatch(
+            [PLT_FILE, "moved.plt"], ftriqs, nProc=nProc, mach=MACH)
+        assert fout == ftriqs
+        # Compare to reference
+        assert filecmp.cmp(ftriqs[0], TRIQ_FILE, shallow=False)
+        assert filecmp.cmp(ftriqs[1], "moved.triq", shallow=False)
+        assert not filecmp.cmp(ftriqs[1], TRIQ_FILE, shallow=False)
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+import cape.tri
+from cape.cgns import ADF_DTYPES, CGNS
+from cape.tri import Tri
+
+
+# Local file
+CGNS_FILE = "surf.cgns"
+
+# Node coordinates
+NODES = np.array([
+    [0.0, 0.0, 0.0],
+    [1.0, 0.0, 0.0],
+    [1.0, 1.0, 0.0],
+    [0.0, 1.0, 0.0],
+    [2.0, 0.0, 0.5],
+    [2.0, 1.0, 0.5],
+])
+# Triangles and quads (1-based), in element order
+TRIS = np.array([[1, 2, 3], [1, 3, 4], [2, 5, 3]])
+QUADS = np.array([[2, 5, 6, 3]])
+# Component for each element
+COMPIDS = np.array([1, 1, 2, 3])
+
+
+# Convert position to 12-char ADF address
+def _adf_addr(pos):
+    # Hex code, with an extra character after the first eight
+    h = "%011X" % pos
+    return (h[:8] + "0" + h[8:]).encode("ascii")
+
+
+# Write one ADF node and its children
+def _write_adf_node(buf, name, label, dt, v=None, children=()):
+    # Start of node
+    ia = len(buf)
+    # Node header
+    buf += b"NoDe"
+    buf += name.ljust(32).encode("ascii")
+    buf += label.ljust(32).encode("ascii")
+    buf += b"\0" * 16 + _adf_addr(0) + dt.encode("ascii")
+    buf += b" " * 132 + _adf_addr(0) + b"TaiL"
+    # Sub-node table, filled in after writing the children
+    if children:
+        jt = len(buf) + 16
+        jb = jt + 44*len(children)
+        buf += b"SNTb" + _adf_addr(jb) + b"\0"*(jb - jt) + b"snTE"
+    # Data
+    if v is not None:
+        # Convert to bytes
+        if dt == "C1":
+            raw = v.encode("ascii")
+        else:
+            raw = np.asarray(v, dtype=ADF_DTYPES[dt]).tobytes()
+        # Start of data
+        ja = len(buf) + 16
+        buf += b"DaTa" + _adf_addr(ja + len(raw)) + raw + b"dEnD"
+    # Write children and their addresses
+    for j, child in enumerate(children):
+        ic = _write_adf_node(buf, *child)
+        entry = child[0].ljust(32).encode("ascii") + _adf_addr(ic)
+        buf[jt+44*j:jt+44*(j+1)] = entry
+    # Output
+    return ia
+
+
+# Write an ADF CGNS file with one surface zone
+def write_cgns(fname):
+    # Element nodes: name, type, range, connectivity
+    elems = [
+        ("wing_TRI", 5, [1, 2], TRIS[:2]),
+        ("tail_TRI", 5, [3, 3], TRIS[2:]),
+        ("fin_QUA", 7, [4, 4], QUADS),
+    ]
+    # Zone children
+    zone = [
+        ("ZoneType", "ZoneType_t", "C1", "Unstructured"),
+        ("GridCoordinates", "GridCoordinates_t", "MT", None, [
+            ("CoordinateX", "DataArray_t", "R8", NODES[:, 0]),
+            ("CoordinateY", "DataArray_t", "R8", NODES[:, 1]),
+            ("CoordinateZ", "DataArray_t", "R8", NODES[:, 2]),
+        ]),
+    ]
+    for name, elem_t, erange, conn in elems:
+        zone.append((name, "Elements_t", "I4", [elem_t, 0], [
+            ("ElementRange", "IndexRange_t", "I4", erange, [
+                ("ElementConnectivity", "DataArray_t", "I4", conn.ravel()),
+            ]),
+        ]))
+    # Solution that no reader asks for
+    zone.append(("FlowSolution", "FlowSolution_t", "MT", None, [
+        ("Density", "DataArray_t", "R8", np.ones(NODES.shape[0])),
+    ]))
+    # Base node
+    base = (
+        "Base", "CGNSBase_t", "I4", [2, 3], [
+            ("Zone", "Zone_t", "I4", [NODES.shape[0], COMPIDS.size, 0], zone),
+        ])
+    # Header
+    buf = bytearray(b"ADF ")
+    buf += b"ADF Database Version A02011".ljust(28)
+    buf += b"adf2LBfcte"
+    # Nodes
+    _write_adf_node(buf, *base)
+    # Write file
+    with open(fname, "wb") as fp:
+        fp.write(buf)
+
+
+# Read data for node *k* without using the memory map
+def read_eager(cgns, k):
+    # Open the file
+    with open(cgns.fname, "rb") as fp:
+        # Go to the beginning of the *DaTa* field
+        fp.seek(cgns.DataPos[k][0] - 16)
+        # Read it
+        return cgns.ReadADFData(fp, cgns.DataTypes[k])
+
+
+# CGNS interface that saves each instance
+class CGNSRecorder(CGNS):
+    # List of instances
+    instances = []
+
+    def __init__(self, fname):
+        CGNS.__init__(self, fname)
+        self.instances.append(self)
+
+
+# Test the node index and lazy data
+@testutils.run_sandbox(__file__)
+def test_01_cgns():
+    # Write file
+    write_cgns(CGNS_FILE)
+    # Read it
+    cgns = CGNS(CGNS_FILE)
+    # Opening the file does not read any data
+    assert cgns._data == {}
+    # Test node index
+    kx, = cgns.GetNodeIndex("CoordinateX", "DataArray_t")
+    assert cgns.NodeNames[kx] == "CoordinateX"
+    assert len(cgns.GetNodeIndex(label="Elements_t")) == 3
+    assert len(cgns.GetNodeIndex("ElementConnectivity")) == 3
+    assert len(cgns.GetNodeIndex("Pressure")) == 0
+    assert cgns.GetNodeByAddress(cgns.NodeAddresses[kx]) == kx
+    # Test sub-node tables
+    kz, = cgns.GetNodeIndex(label="Zone_t")
+    K = cgns.GetSubNodeByName(kz, "FlowSolution")
+    assert len(K) == 1
+    assert cgns.NodeLabels[K[0]] == "FlowSolution_t"
+    assert len(cgns.GetSubNodeByLabel(kz, "Elements_t")) == 3
+    assert len(cgns.GetSubNodeByName(kz, "Density")) == 0
+    # Read one array
+    x = cgns.Data[kx]
+    assert isinstance(x.base, np.memmap)
+    assert np.all(x == read_eager(cgns, kx))
+    assert list(cgns._data) == [kx]
+    # Element info
+    ka, kb, elems = cgns.GetCompIDInfo("fin_QUA")
+    assert (ka, kb) == (4, 4)
+    assert np.all(elems == QUADS)
+
+
+# Test reading a triangulation
+@testutils.run_sandbox(__file__)
+def test_02_tri():
+    # Write file
+    write_cgns(CGNS_FILE)
+    # Read triangulation, saving the CGNS interface
+    CGNSRecorder.instances = []
+    try:
+        cape.tri.CGNS = CGNSRecorder
+        tri = Tri(cgns=CGNS_FILE)
+    finally:
+        cape.tri.CGNS = CGNS
+    cgns, = CGNSRecorder.instances
+    # Compare to eager read of each array
+    kx, = cgns.GetNodeIndex("CoordinateX")
+    ky, = cgns.GetNodeIndex("CoordinateY")
+    kz, = cgns.GetNodeIndex("CoordinateZ")
+    assert np.all(tri.Nodes[:, 0] == read_eager(cgns, kx))
+    assert np.all(tri.Nodes[:, 1] == read_eager(cgns, ky))
+    assert np.all(tri.Nodes[:, 2] == read_eager(cgns, kz))
+    KC = cgns.GetNodeIndex("ElementConnectivity")
+    elems = [read_eager(cgns, k) for k in KC]
+    assert np.all(tri.Tris == np.reshape(np.hstack(elems[:2]), (-1, 3)))
+    assert np.all(tri.Quads == np.reshape(elems[2], (-1, 4)))
+    # Test against expected values
+    assert tri.nNode == NODES.shape[0]
+    assert np.all(tri.Nodes == NODES)
+    assert np.all(tri.CompID == COMPIDS[:3])
+    assert np.all(tri.CompIDQuad == COMPIDS[3:])
+    # Solution data was never read
+    kd, = cgns.GetNodeIndex("Density", "DataArray_t")
+    assert kd not in cgns._data
+    assert cgns.DataPos[kd] is not None
+    assert np.all(read_eager(cgns, kd) == 1.0)
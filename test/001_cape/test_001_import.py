@@ -1,7 +1,68 @@
 
+# Standard library
+import subprocess as sp
+import sys
+
+
+# Modules used by case runners and status checks
+FAST_MODULES = (
+    "cape.cntl",
+    "cape.pycart.case",
+    "cape.pyfun.case",
+    "cape.pyover.case",
+    "cape.pykes.case",
+)
+
+# Modules that should not be imported by *FAST_MODULES*
+SLOW_MODULES = (
+    "scipy",
+    "matplotlib",
+)
+
+# Budget for cumulative import time [us]
+IMPORT_BUDGET = 1000000
+
 
 # Basic sanity test
 def test_import_cape():
     import cape
     import cape.cfdx.options
 
+
+# Get modules and cumulative import time from ``-X importtime``
+def _importtime(modname):
+    # Import module in a fresh interpreter
+    cmd = [sys.executable, "-X", "importtime", "-c", "import " + modname]
+    proc = sp.Popen(cmd, stdout=sp.PIPE, stderr=sp.PIPE)
+    _, stderr = proc.communicate()
+    # Parse lines like "import time:   self |   cumulative | name"
+    mods = {}
+    for line in stderr.decode().split("\n"):
+        # Skip other lines
+        if not line.startswith("import time:"):
+            continue
+        # Split into parts
+        parts = line[12:].split("|")
+        # Skip header
+        try:
+            mods[parts[2].strip()] = int(parts[1])
+        except ValueError:
+            continue
+    # Output
+    return mods
+
+
+# Check that case runners don't import heavy optional modules
+def test_import_time():
+    # Loop through modules
+    for modname in FAST_MODULES:
+        # Import module
+        mods = _importtime(modname)
+        # Check that module was imported
+        assert modname in mods
+        # Check for slow modules
+        for slowmod in SLOW_MODULES:
+            assert slowmod not in mods, (
+                "'%s' imports '%s'" % (modname, slowmod))
+        # Check total time
+        assert mods[modname] < IMPORT_BUDGET
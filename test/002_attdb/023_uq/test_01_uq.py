@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+
+# Local imports
+import cape.attdb.rdb as rdb
+
+
+# Nominal function
+def f1(mach, alpha):
+    return 0.05*alpha + 0.1*mach*mach
+
+
+# Perturbed function
+def f2(mach, alpha):
+    return (
+        f1(mach, alpha) +
+        0.002*np.sin(37.0*alpha + 11.0*mach) +
+        0.001*np.cos(5.0*alpha*mach))
+
+
+# Create two databases to compare
+def make_dbs():
+    # Full-factorial conditions
+    mach, alpha = np.meshgrid(
+        np.linspace(0.5, 1.5, 6), np.linspace(-4.0, 10.0, 41),
+        indexing="ij")
+    # Initialize databases
+    db1 = rdb.DataKit()
+    db2 = rdb.DataKit()
+    # Save data
+    for db, fn in ((db1, f1), (db2, f2)):
+        db.save_col("mach", mach.flatten())
+        db.save_col("alpha", alpha.flatten())
+        db.save_col("CN", fn(mach, alpha).flatten())
+        db.save_col("CY", fn(mach, alpha).flatten())
+        db.make_responses(
+            ["CN", "CY"], "function", ["mach", "alpha"],
+            func=fn, use_self=False)
+    # Define UQ cols
+    db1.set_uq_col("CN", "UCN")
+    db1.set_uq_col("CY", "UCY")
+    db1.set_response_args("UCN", ["alpha"])
+    db1.set_response_args("UCY", ["mach", "alpha"])
+    # Output
+    return db1, db2
+
+
+# Test windows
+def test_01_windows():
+    # Create database
+    db1, _ = make_dbs()
+    # Random centers, some outside the data
+    rng = np.random.default_rng(1)
+    A = np.column_stack((
+        rng.uniform(0.0, 2.0, 50), rng.uniform(-6.0, 12.0, 50)))
+    # Loop through window sizes
+    for n in (1, 20, 60):
+        # Get all windows at once
+        windows = db1.genr8_windows(n, ["mach", "alpha"], A)
+        # Compare to one window at a time
+        for a, I in zip(A, windows):
+            J = db1.genr8_window(n, ["mach", "alpha"], *a)
+            assert np.array_equal(I, J)
+
+
+# Test UQ for one col
+def test_02_uq_col():
+    # Create databases
+    db1, db2 = make_dbs()
+    # Loop through UQ cols
+    for col, ucol in (("CN", "UCN"), ("CY", "UCY")):
+        # Estimate UQ for all windows
+        A, U = db1.est_uq_col(db2, col, ucol, nmin=20)
+        # Compare to one window at a time
+        for a, u in zip(A, U):
+            u1 = db1.est_uq_point(db2, col, ucol, *a, nmin=20)
+            assert np.allclose(u, u1, rtol=1e-10, atol=0.0)
+
+
+# Test parallel UQ
+def test_03_uq_db():
+    # Create databases
+    db1, db2 = make_dbs()
+    # Estimate UQ in serial and parallel
+    db1.est_uq_db(db2, nmin=20)
+    U1 = db1["UCY"].copy()
+    db1.est_uq_db(db2, nmin=20, nproc=2)
+    # Compare
+    assert np.array_equal(U1, db1["UCY"])
+    assert db1["UCN"].size == 41
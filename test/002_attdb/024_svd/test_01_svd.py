@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+# Third-party
+import numpy as np
+
+# Local imports
+import cape.attdb.dbll as dbll
+
+
+# Create line-load-like data with known modes
+def make_loads(ncut=60, ncase=500, nmode=12):
+    # Random amplitudes
+    rng = np.random.RandomState(1)
+    # Cut positions
+    x = np.linspace(0.0, 1.0, ncut)
+    # Mean load
+    C = np.tile(np.sin(np.pi*x)[:, None], (1, ncase))
+    # Add modes with decaying amplitudes
+    for k in range(nmode):
+        C += np.outer(
+            np.sin((k + 2)*np.pi*x), rng.standard_normal(ncase)*0.5**k)
+    # Output
+    return C
+
+
+# Compare SVD methods
+def test_01_svd_methods():
+    # Data
+    C = make_loads()
+    # Reference SVD
+    U0, s0, V0 = dbll.svd(C, 5)
+    # Check sizes
+    assert U0.shape == (60, 5)
+    assert V0.shape == (5, 500)
+    # Loop through alternate methods
+    for method in ("randomized", "streaming"):
+        # Decompose
+        U, s, V = dbll.svd(C, 5, method, nblock=64)
+        # Compare singular values
+        assert np.allclose(s, s0, rtol=1e-8)
+        # Compare modes (up to sign)
+        assert np.allclose(np.abs(np.sum(U*U0, axis=0)), 1.0)
+        # Reconstruct the mean-centered data
+        B = np.dot(U*s, V)
+        B0 = np.dot(U0*s0, V0)
+        assert np.allclose(B, B0, atol=1e-8)
+
+
+# Energy threshold
+def test_02_svd_energy():
+    # Data
+    C = make_loads()
+    # Loop through methods
+    for method in ("full", "randomized", "streaming"):
+        # Decompose using threshold
+        U, s, V = dbll.svd(C, None, method, energy=0.99)
+        # Check number of modes; each mode has 1/4 energy of previous
+        assert s.size == 4
+        # Limit from *nPOD*
+        U, s, V = dbll.svd(C, 2, method, energy=0.99)
+        assert s.size == 2
+
+
+# Randomized SVD stops sampling once *nPOD* modes are found
+def test_03_svd_randomized_npod():
+    # Mean-centered data
+    C = make_loads()
+    B = C - np.mean(C, axis=1)[:, None]
+    # Energy target that two modes can't meet
+    U, s, V, e = dbll._svd_randomized(B, 2, energy=0.9999)
+    # Only *nPOD* plus oversampling columns should be sampled
+    assert U.shape[1] == 12
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+# Standard library
+import json
+import os
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+import cape.attdb.rdb as rdb
+from cape.attdb.datakithub import DataKitHub
+
+
+# File names
+MATFILE = "lazy.mat"
+CSVFILE = "lazy.csv"
+
+# Module for hub test
+DBMODULE = '''
+import os
+import cape.attdb.rdb as rdb
+
+def read_db():
+    return rdb.DataKit(os.path.join(os.path.dirname(__file__), "%s"))
+''' % MATFILE
+
+
+# Create a datakit and write it
+def make_db():
+    # Conditions
+    mach, alpha = np.meshgrid(
+        np.linspace(0.5, 1.5, 21), np.linspace(-4.0, 10.0, 57),
+        indexing="ij")
+    # Initialize datakit
+    db = rdb.DataKit()
+    # Save data
+    db.save_col("mach", mach.flatten())
+    db.save_col("alpha", alpha.flatten())
+    db.save_col("CN", 0.05*db["alpha"] + 0.1*db["mach"]**2)
+    db.save_col("config", ["poweroff"] * db["mach"].size)
+    # Output
+    return db
+
+
+# Test mapped MAT file
+@testutils.run_sandbox(__file__)
+def test_01_mat():
+    # Create datakit
+    db = make_db()
+    db.write_mat(MATFILE)
+    # Read it normally and lazily
+    db1 = rdb.DataKit(MATFILE)
+    db2 = rdb.DataKit(MATFILE, lazy=True)
+    # Test columns
+    assert db2.cols == db1.cols
+    # Large numeric arrays are mapped from file
+    assert isinstance(db2["CN"].base, np.memmap)
+    # Test values
+    for col in ("mach", "alpha", "CN"):
+        assert np.all(db2[col] == db1[col])
+    assert db2["config"] == db1["config"]
+
+
+# Test overwriting a mapped MAT file
+@testutils.run_sandbox(__file__)
+def test_02_rewrite():
+    # Create datakit
+    db = make_db()
+    db.write_mat(MATFILE)
+    # Read it lazily
+    db1 = rdb.DataKit(MATFILE, lazy=True)
+    # Modify one column and write back to same file
+    db1.save_col("CN", db1["CN"] + 1.0)
+    db1.write_mat(MATFILE)
+    # Mapped columns still valid
+    assert np.all(db1["mach"] == db["mach"])
+    # Read it back
+    db2 = rdb.DataKit(MATFILE)
+    # Test values
+    assert np.allclose(db2["CN"], db["CN"] + 1.0)
+    assert np.all(db2["alpha"] == db["alpha"])
+    # No temporary files left
+    assert os.listdir(".") == [MATFILE]
+
+
+# Test lazy CSV file
+@testutils.run_sandbox(__file__)
+def test_03_csv():
+    # Create datakit
+    db = make_db()
+    db.write_csv(CSVFILE)
+    # Read it normally and lazily
+    db1 = rdb.DataKit(CSVFILE)
+    db2 = rdb.DataKit(CSVFILE, lazy=True)
+    # Test columns
+    assert db2.cols == db1.cols
+    assert "CN" in db2
+    # Nothing read yet
+    assert all(db2.check_lazy_col(col) for col in db2.cols)
+    # Read one col
+    v = db2["CN"]
+    # Only that column has been loaded
+    assert dict.__contains__(db2, "CN")
+    assert not dict.__contains__(db2, "mach")
+    assert db2.check_lazy_col("mach")
+    # Test values
+    assert v.dtype == db1["CN"].dtype
+    assert np.allclose(v, db1["CN"])
+    assert db2.get("config") == db1["config"]
+    assert not dict.__contains__(db2, "alpha")
+    # Regular datakits are not affected
+    assert type(db1) is rdb.DataKit
+    assert isinstance(db2, rdb.DataKit)
+
+
+# Test lazy option in hub
+@testutils.run_sandbox(__file__)
+def test_03_hub():
+    # Create datakit
+    db = make_db()
+    db.write_mat(MATFILE)
+    # Create module to read it
+    with open("dblazy.py", "w") as fp:
+        fp.write(DBMODULE)
+    # Hub file
+    os.makedirs(os.path.join("data", "datakithub"))
+    opts = {
+        "DB-LAZY": {
+            "repo": os.getcwd(),
+            "module_regex": {
+                "DB-LAZY": "dblazy",
+            },
+        },
+    }
+    fjson = os.path.join("data", "datakithub", "datakithub.json")
+    with open(fjson, "w") as fp:
+        json.dump(opts, fp)
+    # Read it lazily
+    hub = DataKitHub()
+    db1 = hub.read_db("DB-LAZY", lazy=True)
+    # Test
+    assert isinstance(db1["CN"].base, np.memmap)
+    assert np.all(db1["CN"] == db["CN"])
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+from cape.pyfun import plt
+from cape.tri import Triq
+
+
+# Local file
+PLT_FILE = "surf.plt"
+# Freestream Mach number
+MACH = 0.8
+
+
+# Create a small PLT file with two zones
+def make_plt():
+    # Nodes along two rows
+    X = np.arange(5, dtype="float")
+    Nodes = np.vstack((
+        np.array([X, np.zeros_like(X), np.zeros_like(X)]).T,
+        np.array([X, np.ones_like(X), np.zeros_like(X)]).T))
+    # Tris using both rows
+    I = np.arange(1, 4)
+    Tris = np.array([I, I + 1, I + 5]).T
+    # States at each node
+    q = np.array([0.1*np.arange(10), 0.7 + 0.01*np.arange(10)]).T
+    # Create triangulation
+    triq = Triq(
+        Nodes=Nodes, Tris=Tris, CompID=np.array([1, 1, 2]), q=q, nq=2)
+    # Convert and write
+    plt.Plt(triq=triq, Vars=["cp", "p_tavg"]).Write(PLT_FILE)
+
+
+# Test reading zones and variables
+@testutils.run_sandbox(__file__)
+def test_01_read():
+    # Create file
+    make_plt()
+    # Read it
+    pltq = plt.Plt(PLT_FILE)
+    assert pltq.Vars == ["x", "y", "z", "cp", "p_tavg"]
+    assert pltq.nZone == 2
+    # Read single variable from each zone
+    for n in range(pltq.nZone):
+        assert np.all(pltq.ReadZoneVar(n, "cp") == pltq.q[n][:, 3])
+    # Read one zone and one variable
+    plt1 = plt.Plt(PLT_FILE, zones=[1], Vars=["p_tavg"])
+    assert plt1.nZone == 1
+    assert plt1.Vars == ["x", "y", "z", "p_tavg"]
+    assert plt1.nVar == 4
+    assert plt1.qmin.shape == (1, 4)
+    # Compare to full read
+    assert np.all(plt1.q[0] == pltq.q[1][:, [0, 1, 2, 4]])
+    assert np.all(plt1.Tris[0] == pltq.Tris[1])
+    assert np.all(plt1.ReadZoneVar(0, "p_tavg") == pltq.q[1][:, 4])
+
+
+# Test calculated *cp_tavg*
+@testutils.run_sandbox(__file__)
+def test_02_cptavg():
+    # Create file
+    make_plt()
+    # Read it
+    pltq = plt.Plt(PLT_FILE)
+    # Add *cp_tavg*
+    pltq.GetCpTAvg(MACH)
+    assert pltq.Vars[-1] == "cp_tavg"
+    assert pltq.nVar == 6
+    # Test values
+    for n in range(pltq.nZone):
+        # Expected value
+        p = pltq.ReadZoneVar(n, "p_tavg")
+        cp = (p - 1/1.4) / (0.5*MACH*MACH)
+        # Check variable by name and position
+        assert len(pltq._qpos[n]) == pltq.nVar
+        assert np.allclose(pltq.ReadZoneVar(n, "cp_tavg"), cp)
+        assert np.allclose(pltq.ReadZoneVar(n, 5), cp)
+        assert np.allclose(pltq.q[n][:, 5], cp)
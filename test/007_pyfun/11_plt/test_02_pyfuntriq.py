@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+
+# Standard library
+import filecmp
+import os
+import shutil
+
+# Third-party
+import testutils
+
+# Local imports
+from cape.pyfun import plt
+
+
+# Local files
+PLT_FILE = "fun3d.plt"
+TRIQ_FILE = "fun3d.triq"
+# PLT file shared with the :mod:`cape.plt` tests
+PLT_SRC = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..", "..", "001_cape", "021_plt", PLT_FILE)
+# Freestream Mach number
+MACH = 0.8
+
+
+# Test conversion using *cp_tavg*
+@testutils.run_sandbox(__file__, [TRIQ_FILE])
+def test_01_plt2triq():
+    # Copy input file
+    shutil.copy(PLT_SRC, PLT_FILE)
+    # Convert
+    plt.Plt2Triq(PLT_FILE, "out.triq", mach=MACH)
+    # Compare to reference
+    assert filecmp.cmp("out.triq", TRIQ_FILE, shallow=False)
+
+
+# Test batch conversion using *cp_tavg*
+@testutils.run_sandbox(__file__, [TRIQ_FILE])
+def test_02_batch():
+    # Copy input file
+    shutil.copy(PLT_SRC, PLT_FILE)
+    # Convert two copies of the same file
+    ftriqs = ["out1.triq", "out2.triq"]
+    plt.Plt2TriqBatch([PLT_FILE, PLT_FILE], ftriqs, nProc=2, mach=MACH)
+    # Compare to reference
+    for ftriq in ftriqs:
+        assert filecmp.cmp(ftriq, TRIQ_FILE, shallow=False)
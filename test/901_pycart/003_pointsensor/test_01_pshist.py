@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+
+# Standard library
+import os
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+from cape.pycart import pointSensor
+
+
+# Number of point sensors
+NPOINT = 4
+
+
+# Create a single-iteration point sensor
+def make_ps(i):
+    # Coordinates, states, refinement level, and iteration
+    A = np.zeros((NPOINT, 11))
+    A[:, 0] = np.arange(NPOINT)
+    A[:, 3:9] = 0.01*i + np.arange(6)
+    A[:, 9] = 2
+    A[:, 10] = i
+    # Output
+    return pointSensor.PointSensor(data=A)
+
+
+# Create a history
+def make_hist(n):
+    # Empty history
+    P = pointSensor.CasePointSensor()
+    # Add iterations
+    for i in range(n):
+        P.AppendIteration(make_ps(10*(i + 1)))
+    # Output
+    return P
+
+
+# Test binary history with appends
+@testutils.run_sandbox(__file__)
+def test_01_histbin():
+    # Create histories with more iterations than initial buffer
+    P0 = make_hist(25)
+    P = make_hist(40)
+    assert P.data.shape == (NPOINT, 40, 12)
+    assert np.all(P.i == 10*np.arange(1, 41))
+    # Write first 25 iterations
+    P0.WriteHistBin()
+    # Append the rest
+    P.iSteady = 200
+    P.AppendHistBin()
+    # File size
+    nrec = 8 * NPOINT * 12
+    fsize = os.path.getsize(pointSensor.HIST_BIN)
+    assert fsize == pointSensor.HIST_HEADER_SIZE + 40*nrec
+    # Read it back
+    P1 = pointSensor.CasePointSensor()
+    assert P1.nIter == 40
+    assert P1.iSteady == 200
+    assert isinstance(P1.data.base, np.memmap)
+    assert np.all(P1.data == P.data)
+    # Seek to iteration
+    j = P1.GetIterIndex(170)
+    assert j == 16
+    assert np.all(P1.data[:, j, -1] == 170)
+    assert P1.GetIterIndex(175) is None
+    # Add to history read from file
+    P1.AppendIteration(make_ps(410))
+    assert P1.nIter == 41
+    assert np.all(P1.data[:, :40, :] == P.data)
+    # Append one iteration to file
+    P1.AppendHistBin()
+    assert os.path.getsize(pointSensor.HIST_BIN) == fsize + nrec
+
+
+# Test ASCII history
+@testutils.run_sandbox(__file__)
+def test_02_hist():
+    # Create history
+    P = make_hist(5)
+    # Write ASCII file
+    P.WriteHist()
+    # Read it back
+    P1 = pointSensor.CasePointSensor()
+    assert P1.nIter == 5
+    assert np.allclose(P1.data, P.data)
+
+
+# Test choice of history file by modification time
+@testutils.run_sandbox(__file__)
+def test_03_newest():
+    # Short history and a longer one
+    P3 = make_hist(3)
+    P5 = make_hist(5)
+    # Write them as binary and ASCII files, respectively
+    P3.WriteHistBin()
+    P5.WriteHist()
+    # Make the ASCII file newer
+    t = os.path.getmtime(pointSensor.HIST_BIN)
+    os.utime(pointSensor.HIST_FILE, (t + 10.0, t + 10.0))
+    assert pointSensor.get_hist_file() == pointSensor.HIST_FILE
+    assert pointSensor.get_hist_iter() == 50
+    P = pointSensor.CasePointSensor()
+    assert P.nIter == 5
+    # Append the new iterations; binary file is now newer
+    P.AppendHistBin()
+    os.utime(pointSensor.HIST_BIN, (t + 20.0, t + 20.0))
+    assert pointSensor.get_hist_file() == pointSensor.HIST_BIN
+    assert pointSensor.get_hist_iter() == 50
+    P1 = pointSensor.CasePointSensor()
+    assert P1.nIter == 5
+    assert np.allclose(P1.data, P.data)
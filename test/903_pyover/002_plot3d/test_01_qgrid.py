@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Standard library
+import os
+
+# Third-party
+import numpy as np
+import testutils
+
+# Local imports
+from cape.pyover import plot3d
+
+
+# File name
+QFILE = "q.test"
+# Grid dimensions
+DIMS = [(5, 4, 3), (7, 2, 6), (3, 3, 3)]
+# Number of states
+NQ = 6
+
+
+# Write a record with start and end markers
+def write_record(fp, *V):
+    # Total size
+    n = sum(v.nbytes for v in V)
+    # Write record
+    np.array(n, dtype="<i4").tofile(fp)
+    for v in V:
+        v.tofile(fp)
+    np.array(n, dtype="<i4").tofile(fp)
+
+
+# Write a multiple-grid OVERFLOW q file
+def write_qfile():
+    # Solution for each grid
+    Q = []
+    with open(QFILE, "wb") as fp:
+        # Number of grids
+        write_record(fp, np.array([len(DIMS)], dtype="<i4"))
+        # Dimensions, NQ, and NQC
+        D = np.hstack((np.array(DIMS).flatten(), [NQ, 0]))
+        write_record(fp, np.array(D, dtype="<i4"))
+        # Loop through grids
+        for ig, (JD, KD, LD) in enumerate(DIMS):
+            # Header: REFMACH, ALPHA, REY, TIME, GAMINF, BETA, TINF
+            F1 = np.array([0.8, 2.0, 1e6, 0.0, 1.4, 0.0, 500.0], dtype="<f8")
+            # HTINF, HT1, HT2, RGAS(2), FSMACH, TVREF, DTVREF
+            F2 = np.array([0, 0, 0, 1, 1, 0.8, 0, 0], dtype="<f8")
+            write_record(fp, F1, np.array([0], dtype="<i4"), F2)
+            # Solution: density near 1, gamma 1.4
+            q = np.zeros((NQ, LD, KD, JD))
+            q[0] = 1.0 + 0.01*np.arange(LD*KD*JD).reshape(LD, KD, JD) + ig
+            q[1] = 0.8*q[0]
+            q[2] = 0.01*ig
+            q[4] = 1.8 + 0.001*np.arange(LD*KD*JD).reshape(LD, KD, JD)
+            q[5] = 1.4
+            write_record(fp, np.array(q, dtype="<f8"))
+            Q.append(q)
+    # Output
+    return Q
+
+
+# Test grid offsets and memory-mapped subsets
+@testutils.run_sandbox(__file__)
+def test_01_qgrid():
+    # Create file
+    Q = write_qfile()
+    # Read whole file and just scan it
+    q0 = plot3d.Q(QFILE)
+    q1 = plot3d.Q(QFILE, lazy=True, index=True)
+    # Index file should have been written
+    assert os.path.isfile(QFILE + ".idx")
+    # Offsets should match full read
+    assert np.all(q1.GridOffset == q0.GridOffset)
+    assert np.all(q1.GridPrec == 8)
+    assert q1.Q[1] is None
+    assert abs(q1.QINF - q0.QINF) <= 1e-8 * q0.QINF
+    # Whole grid
+    assert np.all(q1.GetQGrid(2) == Q[1])
+    assert isinstance(q1.GetQGrid(2), np.memmap)
+    # Subset: J=2..4, K=1, L=[1,3]
+    kw = dict(JS=2, JE=4, K=1, L=[1, 3])
+    Q2 = q1.ReadQGrid(2, **kw)
+    assert Q2.shape == (NQ, 2, 3)
+    assert np.all(Q2 == Q[1][:, [0, 2], 0, 1:4])
+    # Derived quantities on subset match full read
+    for fn in ("get_Cp", "get_M", "get_p"):
+        v0 = getattr(q0, fn)(3, **kw)
+        v1 = getattr(q1, fn)(3, **kw)
+        assert np.allclose(v0, v1)
+    # Reuse index file
+    q2 = plot3d.Q(QFILE, lazy=True, index=True)
+    assert np.all(q2.JD == q0.JD)
+    assert np.all(q2.GridHeaderOffset == q0.GridHeaderOffset)
+    assert np.all(q2.ReadQGrid(1, J=2) == Q[0][:, :, :, 1])